@@ -0,0 +1,44 @@
+"""Add composite indexes for keyset pagination
+
+Merges the single_tts and music provider_metadata heads.
+
+Revision ID: 20261018_100000
+Revises: 20260207_100000, 20260220_100000
+Create Date: 2026-10-18 10:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_100000"
+down_revision: tuple[str, str] = ("20260207_100000", "20260220_100000")
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # History lists page newest first by (timestamp, id)
+    op.create_index(
+        "idx_jobs_user_created_id",
+        "jobs",
+        ["user_id", "created_at", "id"],
+    )
+    op.create_index(
+        "idx_session_user_started_id",
+        "interaction_sessions",
+        ["user_id", "started_at", "id"],
+    )
+    op.create_index(
+        "idx_transcription_request_created_id",
+        "transcription_requests",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_transcription_request_created_id", table_name="transcription_requests")
+    op.drop_index("idx_session_user_started_id", table_name="interaction_sessions")
+    op.drop_index("idx_jobs_user_created_id", table_name="jobs")
@@ -0,0 +1,27 @@
+"""Add created_at index to latency_metrics
+
+Latency analytics filter and bucket metrics by recording time.
+
+Revision ID: 20261018_110000
+Revises: 20261018_100000
+Create Date: 2026-10-18 11:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_110000"
+down_revision: str | None = "20261018_100000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_latency_created_at", "latency_metrics", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_latency_created_at", table_name="latency_metrics")
@@ -0,0 +1,34 @@
+"""Add job type and total to voice_sync_jobs
+
+Voice sync jobs also track preview pre-generation runs, which report
+progress against the number of voices they cover.
+
+Revision ID: 20261018_120000
+Revises: 20261018_110000
+Create Date: 2026-10-18 12:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_120000"
+down_revision: str | None = "20261018_110000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "voice_sync_jobs",
+        sa.Column("job_type", sa.String(20), nullable=False, server_default="sync"),
+    )
+    op.add_column("voice_sync_jobs", sa.Column("voices_total", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("voice_sync_jobs", "voices_total")
+    op.drop_column("voice_sync_jobs", "job_type")
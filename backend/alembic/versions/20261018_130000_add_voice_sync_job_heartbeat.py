@@ -0,0 +1,32 @@
+"""Add heartbeat to voice_sync_jobs
+
+Running preview jobs refresh a heartbeat so that, on startup, a process
+only resumes jobs whose owner has stopped.
+
+Revision ID: 20261018_130000
+Revises: 20261018_120000
+Create Date: 2026-10-18 13:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_130000"
+down_revision: str | None = "20261018_120000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "voice_sync_jobs",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("voice_sync_jobs", "heartbeat_at")
@@ -1,7 +1,10 @@
 """Storage Service Interface (Port)."""
 
+import hashlib
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass
@@ -14,6 +17,17 @@ class StoredFile:
     content_type: str
 
 
+@dataclass(frozen=True)
+class StoredObject:
+    """Metadata needed to serve a stored file without reading it."""
+
+    key: str
+    size_bytes: int
+    content_type: str
+    etag: str
+    last_modified: datetime | None = None
+
+
 class IStorageService(ABC):
     """Abstract interface for file storage.
 
@@ -98,3 +112,59 @@ class IStorageService(ABC):
             True if file exists, False otherwise
         """
         pass
+
+    async def stat(self, key: str) -> StoredObject:
+        """Get size, ETag and modification time of a stored file.
+
+        Default implementation downloads the file; implementations
+        should override with a metadata-only lookup.
+
+        Args:
+            key: Storage key/path of the file
+
+        Returns:
+            Metadata of the stored file
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        data = await self.download(key)
+        if data is None:
+            raise FileNotFoundError(f"File not found: {key}")
+        return StoredObject(
+            key=key,
+            size_bytes=len(data),
+            content_type="application/octet-stream",
+            etag=f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"',
+        )
+
+    async def stream(
+        self,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = 256 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a stored file.
+
+        Default implementation downloads the file and slices it;
+        implementations should override to stream with constant memory.
+
+        Args:
+            key: Storage key/path of the file
+            start: First byte offset
+            end: Last byte offset, inclusive (None for end of file)
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            File content chunks
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        data = await self.download(key)
+        if data is None:
+            raise FileNotFoundError(f"File not found: {key}")
+        stop = len(data) if end is None else end + 1
+        for offset in range(start, stop, chunk_size):
+            yield data[offset : min(offset + chunk_size, stop)]
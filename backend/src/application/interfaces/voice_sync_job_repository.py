@@ -6,8 +6,13 @@ T007: Define VoiceSyncJobRepository protocol
 
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from datetime import timedelta
 
-from src.domain.entities.voice_sync_job import VoiceSyncJob, VoiceSyncStatus
+from src.domain.entities.voice_sync_job import (
+    VoiceSyncJob,
+    VoiceSyncJobType,
+    VoiceSyncStatus,
+)
 
 
 class IVoiceSyncJobRepository(ABC):
@@ -102,12 +107,15 @@ class IVoiceSyncJobRepository(ABC):
         self,
         status: VoiceSyncStatus,
         limit: int = 10,
+        *,
+        job_type: VoiceSyncJobType | None = None,
     ) -> Sequence[VoiceSyncJob]:
         """List jobs by status.
 
         Args:
             status: Job status to filter by
             limit: Maximum number of results
+            job_type: Optional job type filter
 
         Returns:
             Sequence of jobs with the given status
@@ -130,14 +138,55 @@ class IVoiceSyncJobRepository(ABC):
         pass
 
     @abstractmethod
-    async def has_running_job(self) -> bool:
+    async def has_running_job(self, job_type: VoiceSyncJobType | None = None) -> bool:
         """Check if there's a running sync job.
 
+        Args:
+            job_type: Only consider jobs of this type (default: any)
+
         Returns:
             True if there's a running job, False otherwise
         """
         pass
 
+    @abstractmethod
+    async def claim_stale_jobs(
+        self,
+        job_type: VoiceSyncJobType,
+        stale_after: timedelta,
+    ) -> Sequence[VoiceSyncJob]:
+        """Claim RUNNING jobs whose heartbeat is older than ``stale_after``.
+
+        Claiming refreshes the heartbeat, so concurrent callers never
+        claim the same job.
+
+        Args:
+            job_type: Job type to claim
+            stale_after: Heartbeat age after which a job is considered orphaned
+
+        Returns:
+            The claimed jobs
+        """
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, job_id: str) -> None:
+        """Record that the process running a job is still alive.
+
+        Args:
+            job_id: Job ID
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, job_id: str) -> None:
+        """Clear a job's heartbeat so the next process can claim it at once.
+
+        Args:
+            job_id: Job ID
+        """
+        pass
+
     @abstractmethod
     async def cleanup_old_jobs(
         self,
@@ -21,6 +21,7 @@ from src.domain.entities.dj import (
     DJTrackSource,
     DJTrackType,
 )
+from src.domain.services.audio_probe import probe_audio
 from src.infrastructure.persistence.dj_repository_impl import DJRepositoryImpl
 from src.infrastructure.storage.dj_audio_storage import DJAudioStorageService
 
@@ -697,9 +698,13 @@ class DJService:
     async def _get_audio_duration(self, audio_data: bytes, content_type: str) -> int:
         """Get audio duration in milliseconds.
 
-        Note: This is a placeholder. For accurate duration detection,
-        you would need to use a library like pydub or mutagen.
+        Reads the container headers; falls back to a bitrate estimate
+        for formats the probe doesn't understand.
         """
+        probe = probe_audio(audio_data)
+        if probe is not None:
+            return probe.duration_ms
+
         # Rough estimation based on file size and content type
         # Assumes ~128kbps for MP3, ~1411kbps for WAV
         size_bytes = len(audio_data)
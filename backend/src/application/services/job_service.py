@@ -9,6 +9,7 @@ from typing import Any
 from uuid import UUID
 
 from src.domain.entities.job import Job, JobStatus, JobType
+from src.domain.pagination import PageCursor
 from src.domain.repositories.job_repository import IJobRepository
 
 logger = logging.getLogger(__name__)
@@ -163,6 +164,35 @@ class JobService:
 
         return jobs, total
 
+    async def list_jobs_after(
+        self,
+        user_id: UUID,
+        status: JobStatus | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 20,
+    ) -> tuple[list[Job], PageCursor | None]:
+        """List jobs for a user with keyset pagination.
+
+        Args:
+            user_id: User ID
+            status: Optional status filter
+            cursor: Position after which the page starts (None for the first page)
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Tuple of (list of jobs, cursor for the next page or None)
+        """
+        return await self._job_repo.get_by_user_id_after(
+            user_id=user_id,
+            status=status,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    async def count_jobs(self, user_id: UUID, status: JobStatus | None = None) -> int:
+        """Count jobs for a user, optionally filtered by status."""
+        return await self._job_repo.count_by_user_and_status(user_id, status)
+
     async def cancel_job(self, job_id: UUID, user_id: UUID) -> Job:
         """Cancel a pending job.
 
@@ -0,0 +1,266 @@
+"""Event loop lag and blocking-call detection.
+
+A coroutine wakes up at a fixed interval and records how late it was
+(``voicelab_event_loop_lag_seconds``). Every wake-up is also a heartbeat
+for a watchdog thread: when the heartbeat stops for longer than the
+blocking threshold, some callback is holding the loop, and the watchdog
+captures the loop thread's stack while it is still stuck. The stack is
+logged together with the context of the blocked task (request ID, path,
+WebSocket session, job) and kept for ``/metrics/loop``.
+
+Tasks carry context set with :func:`set_task_context`; tasks they create
+inherit it through the monitor's task factory, so the context of a route
+running under ``BaseHTTPMiddleware`` is that of its request.
+"""
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from src.application.services.metrics import get_metrics_registry
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Blocking events kept for /metrics/loop
+BLOCKING_LOG_SIZE = 50
+
+# Innermost frames kept per captured stack
+MAX_STACK_FRAMES = 40
+
+LOOP_LAG_BUCKETS_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LOOP_LAG = get_metrics_registry().histogram(
+    "voicelab_event_loop_lag_seconds",
+    "How late the event loop ran a timer callback",
+    buckets=LOOP_LAG_BUCKETS_S,
+)
+LOOP_BLOCKED = get_metrics_registry().counter(
+    "voicelab_event_loop_blocked",
+    "Times a callback held the event loop longer than the blocking threshold",
+)
+
+_task_context: ContextVar[dict[str, Any] | None] = ContextVar("task_context", default=None)
+# Read by the watchdog thread, which cannot see the blocked task's context variables
+_contexts: "weakref.WeakKeyDictionary[asyncio.Task[Any], dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_task_context(**context: Any) -> None:
+    """Describe the work of the current task, for blocking reports.
+
+    Merges into the context the task already has (e.g. inherited from the
+    request that spawned it).
+    """
+    merged = {**(_task_context.get() or {}), **context}
+    _task_context.set(merged)
+    task = asyncio.current_task()
+    if task is not None:
+        _contexts[task] = merged
+
+
+@contextmanager
+def task_context(**context: Any) -> Iterator[None]:
+    """Like :func:`set_task_context`, for part of a long-lived task."""
+    previous = _task_context.get()
+    set_task_context(**context)
+    try:
+        yield
+    finally:
+        _task_context.set(previous)
+        task = asyncio.current_task()
+        if task is not None:
+            if previous is None:
+                _contexts.pop(task, None)
+            else:
+                _contexts[task] = previous
+
+
+def _context_of(task: "asyncio.Task[Any] | None") -> dict[str, Any]:
+    if task is None:
+        return {}
+    with contextlib.suppress(Exception):
+        return dict(_contexts.get(task) or {})
+    return {}
+
+
+@dataclass
+class BlockingEvent:
+    """A callback that held the loop past the threshold."""
+
+    at: datetime
+    blocked_ms: float
+    task: str | None
+    context: dict[str, Any]
+    stack: list[str] = field(default_factory=list)
+    # False while the loop is still blocked
+    finished: bool = False
+
+
+class LoopMonitor:
+    """Measures event loop lag and reports callbacks that block it."""
+
+    def __init__(self, interval_s: float = 0.1, block_threshold_s: float = 0.1) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval_s: Time between lag samples (the heartbeat)
+            block_threshold_s: Stall length reported as a blocking call
+        """
+        self.interval_s = interval_s
+        self.block_threshold_s = block_threshold_s
+        self.events: deque[BlockingEvent] = deque(maxlen=BLOCKING_LOG_SIZE)
+        self.max_lag_s = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._last_beat = 0.0
+        self._reported_beat = 0.0
+        self._pending: BlockingEvent | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._previous_factory: Any = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        """Start monitoring the running loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._previous_factory = self._loop.get_task_factory()
+        self._loop.set_task_factory(self._task_factory)
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Watchdog first, so the stopped heartbeat is not reported as a stall
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._loop is not None:
+            self._loop.set_task_factory(self._previous_factory)
+            self._loop = None
+
+    def _task_factory(
+        self, loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any], **kwargs: Any
+    ) -> "asyncio.Future[Any]":
+        if self._previous_factory is not None:
+            task = self._previous_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        # Runs in the creating task's context, so children inherit its description
+        context = _task_context.get()
+        if context is not None and isinstance(task, asyncio.Task):
+            _contexts[task] = context
+        return task
+
+    async def _heartbeat(self) -> None:
+        expected = time.perf_counter() + self.interval_s
+        while True:
+            await asyncio.sleep(self.interval_s)
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            LOOP_LAG.labels().observe(lag)
+            self.max_lag_s = max(self.max_lag_s, lag)
+            self._last_beat = now
+            pending = self._pending
+            if pending is not None:
+                pending.blocked_ms = max(pending.blocked_ms, lag * 1000)
+                pending.finished = True
+                self._pending = None
+            expected = now + self.interval_s
+
+    def _watch(self) -> None:
+        # Check often enough to catch a stall soon after it crosses the threshold
+        check_s = max(min(self.block_threshold_s, self.interval_s) / 2, 0.005)
+        while not self._stop.wait(check_s):
+            beat = self._last_beat
+            stalled_s = time.perf_counter() - beat - self.interval_s
+            if stalled_s >= self.block_threshold_s and beat != self._reported_beat:
+                self._reported_beat = beat
+                self._report(stalled_s)
+
+    def _report(self, stalled_s: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        stack = traceback.format_stack(frame, limit=MAX_STACK_FRAMES) if frame else []
+        del frame
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        event = BlockingEvent(
+            at=datetime.now(UTC),
+            blocked_ms=stalled_s * 1000,
+            task=task.get_name() if task is not None else None,
+            context=_context_of(task),
+            stack=[line.rstrip() for line in stack],
+        )
+        self._pending = event
+        self.events.append(event)
+        LOOP_BLOCKED.labels().inc()
+        logger.warning(
+            "Event loop blocked for %.0f ms+ (task=%s, %s)\n%s",
+            event.blocked_ms,
+            event.task,
+            ", ".join(f"{k}={v}" for k, v in event.context.items()) or "no context",
+            "".join(stack),
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Monitor state and recent blocking events as a JSON-friendly dict."""
+        return {
+            "running": self.running,
+            "interval_ms": self.interval_s * 1000,
+            "block_threshold_ms": self.block_threshold_s * 1000,
+            "max_lag_ms": round(self.max_lag_s * 1000, 1),
+            "blocking_events": [
+                {
+                    "at": e.at.isoformat(),
+                    "blocked_ms": round(e.blocked_ms, 1),
+                    "finished": e.finished,
+                    "task": e.task,
+                    "context": {k: str(v) for k, v in e.context.items()},
+                    "stack": e.stack,
+                }
+                for e in reversed(self.events)
+            ],
+        }
+
+
+_monitor: LoopMonitor | None = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """Process-wide loop monitor, configured from settings on first use."""
+    global _monitor
+    if _monitor is None:
+        settings = get_settings()
+        _monitor = LoopMonitor(
+            interval_s=settings.loop_lag_interval_ms / 1000,
+            block_threshold_s=settings.loop_block_threshold_ms / 1000,
+        )
+    return _monitor
@@ -0,0 +1,415 @@
+"""Process-wide metrics rendered in OpenMetrics text format.
+
+Providers, storage, the database layer and caches record into a single
+registry that GET /metrics exposes for Prometheus. Latencies go into
+fixed-bucket histograms, so a scrape sees the distribution rather than a
+running mean. Components that already keep their own state (concurrency
+limits, circuit breakers, connection pools) are read at scrape time
+through collectors instead of being updated on every call.
+
+Recording takes no locks: metrics are only updated from the event loop
+thread, where an update never interleaves with another one.
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar, cast
+
+from src.application.services.tracing import record_span, span
+from src.domain.utils.bounded_store import store_evictions, store_stats
+
+T = TypeVar("T")
+C = TypeVar("C")
+M = TypeVar("M", bound="_Metric[Any]")
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS_S = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass
+class MetricFamily:
+    """Samples of one metric, as produced by a collector at scrape time."""
+
+    name: str
+    type: str  # "counter" | "gauge"
+    documentation: str
+    samples: list[tuple[dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, **labels: str) -> None:
+        self.samples.append((labels, value))
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric(ABC, Generic[C]):
+    """A named metric with a fixed set of label names."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], C] = {}
+
+    @abstractmethod
+    def _new_child(self) -> C:
+        """A new series for one set of label values."""
+
+    def labels(self, *values: str) -> C:
+        """The series for these label values, created on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _labels(self, values: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, values, strict=True))
+
+    @abstractmethod
+    def render(self) -> Iterator[str]:
+        """Exposition lines for every series of this metric."""
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonically increasing count."""
+
+    type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def render(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            labels = _format_labels(self._labels(values))
+            yield f"{self.name}_total{labels} {_format_value(child.value)}"
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that goes up and down (e.g. requests in flight)."""
+
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def render(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            labels = _format_labels(self._labels(values))
+            yield f"{self.name}{labels} {_format_value(child.value)}"
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Distribution of observations over fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = LATENCY_BUCKETS_S,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def render(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            labels = self._labels(values)
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_count{_format_labels(labels)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(child.sum)}"
+
+
+class MetricsRegistry:
+    """Holds all metrics and collectors and renders them for a scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric[Any]] = {}
+        self._collectors: dict[str, Collector] = {}
+
+    def _register(self, metric: M) -> M:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} is already registered differently")
+            return cast(M, existing)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS_S,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """Add (or replace) a collector that is read on every scrape."""
+        self._collectors[name] = collector
+
+    def render(self) -> str:
+        """All metrics in OpenMetrics text format."""
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.extend(metric.render())
+
+        for collector in list(self._collectors.values()):
+            for family in collector():
+                lines.append(f"# TYPE {family.name} {family.type}")
+                lines.append(f"# HELP {family.name} {family.documentation}")
+                suffix = "_total" if family.type == "counter" else ""
+                for labels, value in family.samples:
+                    lines.append(
+                        f"{family.name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+                    )
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+PROVIDER_LATENCY = _registry.histogram(
+    "voicelab_provider_request_duration_seconds",
+    "Latency of provider calls; phase is total, ttfb (TTS) or ttft (LLM)",
+    ("kind", "provider", "phase"),
+)
+PROVIDER_IN_FLIGHT = _registry.gauge(
+    "voicelab_provider_requests_in_flight",
+    "Provider calls currently running",
+    ("kind", "provider"),
+)
+PROVIDER_ERRORS = _registry.counter(
+    "voicelab_provider_request_errors",
+    "Provider calls that raised an error",
+    ("kind", "provider"),
+)
+STORAGE_LATENCY = _registry.histogram(
+    "voicelab_storage_operation_duration_seconds",
+    "Latency of storage reads and writes",
+    ("backend", "operation"),
+)
+DB_QUERY_LATENCY = _registry.histogram(
+    "voicelab_db_query_duration_seconds",
+    "Latency of database statements",
+    ("engine",),
+)
+CACHE_REQUESTS = _registry.counter(
+    "voicelab_cache_requests",
+    "Cache lookups by result (hit, stale, miss)",
+    ("cache", "result"),
+)
+
+
+@contextmanager
+def _observe_provider_call(kind: str, provider: str, phase: str) -> Iterator[None]:
+    in_flight = PROVIDER_IN_FLIGHT.labels(kind, provider)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        PROVIDER_ERRORS.labels(kind, provider).inc()
+        raise
+    finally:
+        in_flight.dec()
+        PROVIDER_LATENCY.labels(kind, provider, phase).observe(time.perf_counter() - start)
+
+
+@contextmanager
+def track_provider_call(kind: str, provider: str, phase: str = "total") -> Iterator[None]:
+    """Time a provider call and count it as in flight while it runs.
+
+    The call is also recorded as a ``provider.<kind>`` span of the current trace.
+
+    Args:
+        kind: Call type (tts, stt, llm)
+        provider: Provider name
+        phase: Latency phase recorded for the call
+    """
+    with _observe_provider_call(kind, provider, phase), span(f"provider.{kind}", provider=provider):
+        yield
+
+
+async def track_provider_stream(
+    kind: str,
+    provider: str,
+    stream: AsyncIterator[T],
+    first_phase: str,
+) -> AsyncIterator[T]:
+    """Pass a provider stream through, timing the first item and the whole stream.
+
+    Args:
+        kind: Call type (tts, llm)
+        provider: Provider name
+        stream: The provider's output stream
+        first_phase: Phase name for time to first item (ttfb, ttft)
+    """
+    start = time.perf_counter()
+    first_s: float | None = None
+    error: str | None = None
+    try:
+        with _observe_provider_call(kind, provider, "total"):
+            async for item in stream:
+                if first_s is None:
+                    first_s = time.perf_counter() - start
+                    PROVIDER_LATENCY.labels(kind, provider, first_phase).observe(first_s)
+                yield item
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        # Recorded once finished: a span left open across yields would
+        # become the parent of whatever the consumer does in between
+        record_span(
+            f"provider.{kind}",
+            time.perf_counter() - start,
+            error=error,
+            provider=provider,
+            **{f"{first_phase}_ms": round(first_s * 1000, 1) if first_s is not None else None},
+        )
+
+
+@contextmanager
+def track_storage(backend: str, operation: str) -> Iterator[None]:
+    """Time a storage operation."""
+    start = time.perf_counter()
+    try:
+        with span(f"storage.{operation}", backend=backend):
+            yield
+    finally:
+        STORAGE_LATENCY.labels(backend, operation).observe(time.perf_counter() - start)
+
+
+def record_cache(cache: str, result: str) -> None:
+    """Count a cache lookup (hit, stale or miss)."""
+    CACHE_REQUESTS.labels(cache, result).inc()
+
+
+def collect_store_metrics() -> list[MetricFamily]:
+    """Size, memory use and evictions of the bounded in-memory stores, for /metrics."""
+    entries = MetricFamily(
+        "voicelab_store_entries", "gauge", "Entries held by in-memory state stores"
+    )
+    memory = MetricFamily(
+        "voicelab_store_memory_bytes", "gauge", "Estimated memory held by in-memory state stores"
+    )
+    for stats in store_stats():
+        entries.add(stats.entries, store=stats.name)
+        memory.add(stats.memory_bytes, store=stats.name)
+    evictions = MetricFamily(
+        "voicelab_store_evictions", "counter", "Entries dropped from in-memory state stores"
+    )
+    for (name, reason), count in sorted(store_evictions().items()):
+        evictions.add(count, store=name, reason=reason)
+    return [entries, memory, evictions]
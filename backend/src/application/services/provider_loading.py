@@ -0,0 +1,36 @@
+"""Loading providers without blocking the event loop.
+
+Use cases take their providers as a plain mapping. Some mappings build a
+provider on first access, which can mean importing a slow SDK; those
+expose an async ``load`` that does the work off the event loop.
+:func:`load_provider` uses it when available and falls back to ``get``.
+"""
+
+from collections.abc import Mapping
+from typing import Protocol, TypeVar, runtime_checkable
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+
+@runtime_checkable
+class IProviderLoader(Protocol[T_co]):
+    """A provider mapping that can load a provider asynchronously."""
+
+    async def load(self, name: str) -> T_co:
+        """Provider by name.
+
+        Raises:
+            KeyError: If the provider is not configured or failed to load
+        """
+        ...
+
+
+async def load_provider(providers: Mapping[str, T], name: str) -> T | None:
+    """``providers.get(name)``, awaiting ``load`` on mappings that support it."""
+    if isinstance(providers, IProviderLoader):
+        try:
+            return await providers.load(name)
+        except KeyError:
+            return None
+    return providers.get(name)
@@ -0,0 +1,118 @@
+"""Stale-while-revalidate cache for provider quota lookups.
+
+Quota lookups call the provider's API, which is slow and rate limited.
+Results are cached per credential: fresh entries are served directly,
+stale entries are served while a background refresh runs, and concurrent
+lookups for the same credential share a single upstream call.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from src.application.services.metrics import record_cache
+from src.application.services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Seconds a quota result is served without refreshing
+QUOTA_FRESH_TTL_S = 60.0
+
+# Seconds a stale result may still be served while it is refreshed
+QUOTA_STALE_TTL_S = 600.0
+
+QuotaData = dict[str, Any]
+
+
+@dataclass
+class _Entry:
+    value: QuotaData
+    fetched_at: datetime
+    fresh_until: float
+    stale_until: float
+
+
+class QuotaCache:
+    """Per-credential quota cache with background refresh and coalescing."""
+
+    def __init__(
+        self,
+        fresh_ttl_s: float = QUOTA_FRESH_TTL_S,
+        stale_ttl_s: float = QUOTA_STALE_TTL_S,
+    ) -> None:
+        self._fresh_ttl_s = fresh_ttl_s
+        self._stale_ttl_s = stale_ttl_s
+        self._entries: dict[Hashable, _Entry] = {}
+        self._in_flight: SingleFlight[QuotaData | None] = SingleFlight()
+
+    async def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[QuotaData | None]],
+    ) -> QuotaData | None:
+        """Return quota data for ``key``, fetching only when needed.
+
+        Args:
+            key: Cache key identifying the credential (never the raw key)
+            fetch: Upstream lookup; returns None when no data is available
+
+        Returns:
+            Cached or freshly fetched quota data, or None
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry.fresh_until > now:
+            record_cache("quota", "hit")
+            return entry.value
+        if entry is not None and entry.stale_until > now:
+            record_cache("quota", "stale")
+            self._in_flight.start(key, lambda: self._fetch_and_store(key, fetch))
+            return entry.value
+
+        record_cache("quota", "miss")
+        # A caller that gives up (latency budget) leaves the shared fetch
+        # running, so its result still lands in the cache
+        return await self._in_flight.do(key, lambda: self._fetch_and_store(key, fetch))
+
+    def fetched_at(self, key: Hashable) -> datetime | None:
+        """When the cached value for ``key`` was fetched from the provider."""
+        entry = self._entries.get(key)
+        return entry.fetched_at if entry is not None else None
+
+    async def _fetch_and_store(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[QuotaData | None]],
+    ) -> QuotaData | None:
+        try:
+            value = await fetch()
+        except Exception:
+            logger.warning("Quota refresh failed for %s", key, exc_info=True)
+            entry = self._entries.get(key)
+            return entry.value if entry is not None else None
+
+        # Failed lookups are not cached; the next load retries them
+        if value is not None:
+            now = time.monotonic()
+            self._entries[key] = _Entry(
+                value=value,
+                fetched_at=datetime.now(UTC),
+                fresh_until=now + self._fresh_ttl_s,
+                stale_until=now + self._stale_ttl_s,
+            )
+        return value
+
+    def clear(self) -> None:
+        """Forget all cached quota data."""
+        self._entries.clear()
+
+
+_quota_cache = QuotaCache()
+
+
+def get_quota_cache() -> QuotaCache:
+    """Get the process-wide quota cache."""
+    return _quota_cache
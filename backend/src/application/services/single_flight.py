@@ -0,0 +1,50 @@
+"""Keyed single-flight execution.
+
+Concurrent calls that share a key run the underlying coroutine once; every
+caller awaits the same task and receives the same result or exception.
+Once the task finishes the key is free again, so results are not cached.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces identical in-flight calls into one execution."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """Start ``fn`` for ``key`` unless a call is already running; return its task."""
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return task
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once for all concurrent callers with the same key.
+
+        The shared task is shielded: a caller that is cancelled stops
+        waiting, but the call keeps running for the others.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def _finish(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved when every waiter has gone away
+        if not task.cancelled():
+            task.exception()
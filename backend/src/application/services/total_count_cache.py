@@ -0,0 +1,58 @@
+"""Short-lived cache for paginated list totals.
+
+Cursor pagination doesn't need a COUNT(*) per page. When a client does ask
+for a total, it is served from this cache for a few seconds, so paging
+through a long history runs the count once rather than once per page.
+"""
+
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+from src.application.services.metrics import record_cache
+
+# Seconds a cached total stays valid
+TOTAL_COUNT_TTL_S = 30.0
+
+# Entries kept before expired ones are swept
+MAX_ENTRIES = 10_000
+
+
+class TotalCountCache:
+    """TTL cache of list totals keyed by (list name, user, filters)."""
+
+    def __init__(self, ttl_s: float = TOTAL_COUNT_TTL_S) -> None:
+        self._ttl_s = ttl_s
+        self._entries: dict[Hashable, tuple[float, int]] = {}
+
+    async def get_or_count(self, key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+        """Return the cached total for ``key``, counting on a miss."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            record_cache("total_count", "hit")
+            return entry[1]
+
+        record_cache("total_count", "miss")
+        total = await count()
+        if len(self._entries) >= MAX_ENTRIES:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+            if len(self._entries) >= MAX_ENTRIES:
+                self._entries.clear()
+        self._entries[key] = (now + self._ttl_s, total)
+        return total
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget a cached total (e.g. after a delete)."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all cached totals."""
+        self._entries.clear()
+
+
+_total_count_cache = TotalCountCache()
+
+
+def get_total_count_cache() -> TotalCountCache:
+    """Get the process-wide total count cache."""
+    return _total_count_cache
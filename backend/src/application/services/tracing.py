@@ -0,0 +1,209 @@
+"""Request-scoped tracing.
+
+A trace is opened per HTTP request by ``RequestIdMiddleware``; spans nest
+through context variables, so factories, providers, storage and database
+hooks add spans to the current request without the trace being passed
+around. Tasks spawned inside a request inherit it the same way; long-lived
+background work started from a request should use :func:`create_detached_task`
+so it does not keep adding spans to that request. Outside a trace,
+:func:`span` and :func:`record_span` do nothing.
+
+Finished traces are summarized in the ``Server-Timing`` response header and,
+when an exporter is installed (see ``OTLPSpanExporter``), shipped to a
+collector.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import re
+import secrets
+import time
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
+
+T = TypeVar("T")
+
+# Spans kept per trace; a runaway loop must not grow a request without bound
+MAX_SPANS_PER_TRACE = 512
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_unix_ns: int
+    duration_ms: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+@dataclass
+class Trace:
+    """The spans of one request."""
+
+    trace_id: str = field(default_factory=lambda: secrets.token_hex(16))
+    remote_parent_id: str | None = None
+    spans: list[Span] = field(default_factory=list)
+    dropped_spans: int = 0
+
+    def add(self, span: Span) -> None:
+        if len(self.spans) < MAX_SPANS_PER_TRACE:
+            self.spans.append(span)
+        else:
+            self.dropped_spans += 1
+
+    def server_timing(self, root: Span | None = None) -> str:
+        """Total time per span name, as a ``Server-Timing`` header value.
+
+        Spans with the same name are summed. Nested spans are listed on
+        their own too, so the entries overlap and do not add up to ``total``.
+        """
+        totals: dict[str, tuple[float, int]] = {}
+        for s in self.spans:
+            if s is root or s.duration_ms is None:
+                continue
+            duration, count = totals.get(s.name, (0.0, 0))
+            totals[s.name] = (duration + s.duration_ms, count + 1)
+
+        entries = []
+        for name, (duration, count) in totals.items():
+            entry = f"{name};dur={duration:.1f}"
+            if count > 1:
+                entry += f';desc="{count} calls"'
+            entries.append(entry)
+        if root is not None and root.duration_ms is not None:
+            entries.append(f"total;dur={root.duration_ms:.1f}")
+        return ", ".join(entries)
+
+
+class SpanExporter(Protocol):
+    """Receives every finished trace; must not block the event loop."""
+
+    def export(self, trace: Trace) -> None: ...
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_exporter: SpanExporter | None = None
+
+
+def set_span_exporter(exporter: SpanExporter | None) -> None:
+    """Install (or remove, with None) the process-wide trace exporter."""
+    global _exporter
+    _exporter = exporter
+
+
+def current_trace() -> Trace | None:
+    """The trace of the running request, if any."""
+    return _current_trace.get()
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str] | None:
+    """Trace and parent span IDs from a W3C ``traceparent`` header."""
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if match is None or match.group(1) == "0" * 32:
+        return None
+    return match.group(1), match.group(2)
+
+
+@contextmanager
+def start_trace(traceparent: str | None = None) -> Iterator[Trace]:
+    """Open a trace for the enclosed work and export it when done.
+
+    Args:
+        traceparent: Incoming W3C ``traceparent`` header to continue
+    """
+    parent = parse_traceparent(traceparent)
+    trace = Trace(trace_id=parent[0], remote_parent_id=parent[1]) if parent else Trace()
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        yield trace
+    finally:
+        _reset(_current_span, span_token)
+        _reset(_current_trace, trace_token)
+        if _exporter is not None:
+            _exporter.export(trace)
+
+
+def _reset(var: ContextVar[Any], token: Any) -> None:
+    # An async generator may finish in another task's context than it
+    # started in; the value then simply dies with that context
+    with contextlib.suppress(ValueError):
+        var.reset(token)
+
+
+def _new_span(trace: Trace, name: str, attributes: dict[str, Any]) -> Span:
+    parent = _current_span.get()
+    return Span(
+        name=name,
+        trace_id=trace.trace_id,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else trace.remote_parent_id,
+        start_unix_ns=time.time_ns(),
+        attributes=attributes,
+    )
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Time the enclosed block as a child of the current span.
+
+    Yields:
+        The span (to add attributes), or None outside a trace
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    s = _new_span(trace, name, attributes)
+    token = _current_span.set(s)
+    start = time.perf_counter()
+    try:
+        yield s
+    except BaseException as e:
+        s.error = type(e).__name__
+        raise
+    finally:
+        s.duration_ms = (time.perf_counter() - start) * 1000
+        _reset(_current_span, token)
+        trace.add(s)
+
+
+def record_span(name: str, duration_s: float, error: str | None = None, **attributes: Any) -> None:
+    """Add an already finished leaf span, for hooks that only see its end."""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+
+    s = _new_span(trace, name, attributes)
+    s.start_unix_ns -= int(duration_s * 1e9)
+    s.duration_ms = duration_s * 1000
+    s.error = error
+    trace.add(s)
+
+
+def create_detached_task(coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """Start ``coro`` as a task in a fresh context, outside any trace.
+
+    For work that outlives the request starting it (workers, profiling
+    windows); it also drops other request-scoped context such as the loop
+    monitor's task context.
+    """
+    return asyncio.create_task(coro, context=contextvars.Context())
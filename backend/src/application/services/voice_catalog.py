@@ -0,0 +1,356 @@
+"""In-memory voice catalog.
+
+Process-wide snapshot of the voice_cache table with prebuilt indexes, so
+voice listing and lookups are served without provider or database calls.
+The snapshot is loaded at startup (or on first use), replaced wholesale
+after every voice sync, and reloaded once it is older than ``CATALOG_TTL_S``
+so syncs made by other workers show up; readers always see a consistent
+index.
+
+Voice customizations (custom names, favorites, hidden flags) are cached
+alongside the voices. Local edits update the cached map directly; a short
+TTL bounds how long edits made by other workers take to show up.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
+from src.application.services.metrics import record_cache
+from src.domain.entities.voice import AgeGroup, VoiceProfile
+from src.domain.entities.voice_customization import VoiceCustomization
+from src.domain.repositories.voice_customization_repository import (
+    IVoiceCustomizationRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Page size used when loading the catalog from voice_cache
+LOAD_PAGE_SIZE = 1000
+
+# Voices tagged with this language match every language filter
+MULTILINGUAL = "multilingual"
+
+# Seconds a voice snapshot is trusted before it is reloaded
+CATALOG_TTL_S = 300.0
+
+# Seconds the customization map is trusted before it is reloaded
+CUSTOMIZATION_TTL_S = 60.0
+
+
+@dataclass(frozen=True)
+class VoiceFacets:
+    """Counts of non-deprecated voices per attribute value."""
+
+    providers: dict[str, int] = field(default_factory=dict)
+    languages: dict[str, int] = field(default_factory=dict)
+    genders: dict[str, int] = field(default_factory=dict)
+    age_groups: dict[str, int] = field(default_factory=dict)
+    styles: dict[str, int] = field(default_factory=dict)
+
+
+def _language_prefixes(language: str) -> list[str]:
+    """Hyphen-delimited prefixes of a language tag ("zh-TW" -> ["zh", "zh-tw"])."""
+    parts = language.lower().split("-")
+    return ["-".join(parts[: i + 1]) for i in range(len(parts))]
+
+
+class _CatalogIndex:
+    """Immutable snapshot of voices with attribute -> position indexes."""
+
+    def __init__(self, voices: Iterable[VoiceProfile]) -> None:
+        self.voices: tuple[VoiceProfile, ...] = tuple(
+            sorted(voices, key=lambda v: (v.provider, v.display_name))
+        )
+        self.by_id: dict[str, VoiceProfile] = {}
+        self.by_provider_voice: dict[tuple[str, str], VoiceProfile] = {}
+
+        by_provider: dict[str, set[int]] = defaultdict(set)
+        by_language: dict[str, set[int]] = defaultdict(set)
+        by_gender: dict[str, set[int]] = defaultdict(set)
+        by_age_group: dict[str, set[int]] = defaultdict(set)
+        by_style: dict[str, set[int]] = defaultdict(set)
+        active: set[int] = set()
+
+        for pos, voice in enumerate(self.voices):
+            self.by_id[voice.id] = voice
+            self.by_provider_voice[(voice.provider, voice.voice_id)] = voice
+            by_provider[voice.provider].add(pos)
+            for prefix in _language_prefixes(voice.language):
+                by_language[prefix].add(pos)
+            if voice.gender:
+                by_gender[voice.gender.value].add(pos)
+            if voice.age_group:
+                by_age_group[voice.age_group.value].add(pos)
+            for style in voice.styles:
+                by_style[style.lower()].add(pos)
+            if not voice.is_deprecated:
+                active.add(pos)
+
+        self.by_provider = {k: frozenset(v) for k, v in by_provider.items()}
+        self.by_language = {k: frozenset(v) for k, v in by_language.items()}
+        self.by_gender = {k: frozenset(v) for k, v in by_gender.items()}
+        self.by_age_group = {k: frozenset(v) for k, v in by_age_group.items()}
+        self.by_style = {k: frozenset(v) for k, v in by_style.items()}
+        self.active = frozenset(active)
+        self.facets = self._count_facets()
+
+    def _count_facets(self) -> VoiceFacets:
+        providers: Counter[str] = Counter()
+        languages: Counter[str] = Counter()
+        genders: Counter[str] = Counter()
+        age_groups: Counter[str] = Counter()
+        styles: Counter[str] = Counter()
+
+        for pos in self.active:
+            voice = self.voices[pos]
+            providers[voice.provider] += 1
+            languages[voice.language] += 1
+            if voice.gender:
+                genders[voice.gender.value] += 1
+            if voice.age_group:
+                age_groups[voice.age_group.value] += 1
+            styles.update(style.lower() for style in voice.styles)
+
+        return VoiceFacets(
+            providers=dict(providers),
+            languages=dict(languages),
+            genders=dict(genders),
+            age_groups=dict(age_groups),
+            styles=dict(styles),
+        )
+
+    def language_positions(self, language: str) -> frozenset[int]:
+        """Positions of voices whose language starts with ``language``."""
+        key = language.lower()
+        positions = self.by_language.get(key)
+        if positions is None:
+            # Not on a subtag boundary (e.g. "zh-T"): fall back to a scan
+            positions = frozenset(
+                pos for pos, v in enumerate(self.voices) if v.language.lower().startswith(key)
+            )
+        return positions | self.by_language.get(MULTILINGUAL, frozenset())
+
+
+class VoiceCatalog:
+    """Indexed, read-mostly view of all cached voices."""
+
+    def __init__(
+        self,
+        ttl_s: float = CATALOG_TTL_S,
+        customization_ttl_s: float = CUSTOMIZATION_TTL_S,
+    ) -> None:
+        self._index = _CatalogIndex(())
+        self._loaded_at: datetime | None = None
+        self._expire_at: float | None = None
+        self._ttl_s = ttl_s
+        self._lock = asyncio.Lock()
+
+        self._customizations: dict[str, VoiceCustomization] = {}
+        self._customizations_expire_at: float | None = None
+        self._customization_ttl_s = customization_ttl_s
+        self._customization_lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the catalog has been loaded from voice_cache."""
+        return self._loaded_at is not None
+
+    @property
+    def loaded_at(self) -> datetime | None:
+        """When the current snapshot was loaded."""
+        return self._loaded_at
+
+    def __len__(self) -> int:
+        return len(self._index.voices)
+
+    def load(self, voices: Iterable[VoiceProfile]) -> None:
+        """Replace the catalog with a new snapshot of voices."""
+        self._index = _CatalogIndex(voices)
+        self._loaded_at = datetime.now(UTC)
+        self._expire_at = time.monotonic() + self._ttl_s
+
+    async def refresh(self, repo: IVoiceCacheRepository) -> int:
+        """Reload the catalog from voice_cache (including deprecated voices).
+
+        Args:
+            repo: Voice cache repository to read from
+
+        Returns:
+            Number of voices loaded
+        """
+        async with self._lock:
+            return await self._load_from(repo)
+
+    def _fresh(self) -> bool:
+        return self._expire_at is not None and self._expire_at > time.monotonic()
+
+    async def ensure_loaded(self, repo: IVoiceCacheRepository) -> None:
+        """Load the catalog on first use and reload it once the TTL has passed.
+
+        While an expired snapshot is being reloaded, other callers keep
+        reading the old one instead of waiting.
+        """
+        if self._fresh() or (self.is_loaded and self._lock.locked()):
+            return
+        async with self._lock:
+            if not self._fresh():
+                await self._load_from(repo)
+
+    async def _load_from(self, repo: IVoiceCacheRepository) -> int:
+        voices: list[VoiceProfile] = []
+        offset = 0
+        while True:
+            page = await repo.list_all(include_deprecated=True, limit=LOAD_PAGE_SIZE, offset=offset)
+            voices.extend(page)
+            if len(page) < LOAD_PAGE_SIZE:
+                break
+            offset += LOAD_PAGE_SIZE
+
+        self.load(voices)
+        logger.info("Voice catalog loaded with %d voices", len(voices))
+        return len(voices)
+
+    def invalidate(self) -> None:
+        """Drop the snapshot (and cached customizations) so both reload on next use."""
+        self._index = _CatalogIndex(())
+        self._loaded_at = None
+        self._expire_at = None
+        self.invalidate_customizations()
+
+    def get(self, voice_cache_id: str) -> VoiceProfile | None:
+        """Look up a voice by cache ID (format: provider:voice_id)."""
+        return self._index.by_id.get(voice_cache_id)
+
+    def get_voice(self, provider: str, voice_id: str) -> VoiceProfile | None:
+        """Look up a voice by provider and provider-specific voice ID."""
+        return self._index.by_provider_voice.get((provider, voice_id))
+
+    def has_provider(self, provider: str) -> bool:
+        """Whether any voices are cached for a provider."""
+        return provider in self._index.by_provider
+
+    def update_voice(self, voice: VoiceProfile) -> None:
+        """Insert or replace a single voice (e.g. after a preview URL is stored)."""
+        index = self._index
+        voices = [v for v in index.voices if v.id != voice.id]
+        voices.append(voice)
+        self._index = _CatalogIndex(voices)
+
+    def set_sample_audio_url(self, voice_cache_id: str, sample_audio_url: str) -> None:
+        """Update the preview URL of a cached voice, if present."""
+        voice = self.get(voice_cache_id)
+        if voice is not None:
+            self.update_voice(dataclasses.replace(voice, sample_audio_url=sample_audio_url))
+
+    def query(
+        self,
+        *,
+        provider: str | None = None,
+        language: str | None = None,
+        gender: str | None = None,
+        age_group: AgeGroup | str | None = None,
+        style: str | None = None,
+        search: str | None = None,
+        include_deprecated: bool = False,
+    ) -> list[VoiceProfile]:
+        """Return voices matching all filters, ordered by provider and name.
+
+        Language matches by prefix ("zh" matches "zh-TW") and always
+        includes multilingual voices, mirroring the voice_cache queries.
+        """
+        index = self._index
+        if isinstance(age_group, AgeGroup):
+            age_group = age_group.value
+
+        candidate_sets: list[frozenset[int]] = []
+        if not include_deprecated:
+            candidate_sets.append(index.active)
+        if provider is not None:
+            candidate_sets.append(index.by_provider.get(provider, frozenset()))
+        if language is not None:
+            candidate_sets.append(index.language_positions(language))
+        if gender is not None:
+            candidate_sets.append(index.by_gender.get(gender, frozenset()))
+        if age_group is not None:
+            candidate_sets.append(index.by_age_group.get(age_group, frozenset()))
+        if style is not None:
+            candidate_sets.append(index.by_style.get(style.lower(), frozenset()))
+
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            positions = candidate_sets[0].intersection(*candidate_sets[1:])
+            voices = [index.voices[pos] for pos in sorted(positions)]
+        else:
+            voices = list(index.voices)
+
+        if search:
+            needle = search.lower()
+            voices = [
+                v
+                for v in voices
+                if needle in v.display_name.lower()
+                or needle in v.id.lower()
+                or needle in v.description.lower()
+            ]
+
+        return voices
+
+    def facets(self) -> VoiceFacets:
+        """Precomputed facet counts over non-deprecated voices."""
+        return self._index.facets
+
+    def _customizations_fresh(self) -> bool:
+        expire_at = self._customizations_expire_at
+        return expire_at is not None and expire_at > time.monotonic()
+
+    async def customizations(
+        self, repo: IVoiceCustomizationRepository
+    ) -> dict[str, VoiceCustomization]:
+        """All voice customizations keyed by voice cache ID.
+
+        Served from memory; reloaded in one query once the TTL has passed.
+        The returned mapping must not be mutated.
+        """
+        if self._customizations_fresh():
+            record_cache("voice_customizations", "hit")
+            return self._customizations
+        async with self._customization_lock:
+            if not self._customizations_fresh():
+                record_cache("voice_customizations", "miss")
+                customizations = await repo.list_all()
+                self._customizations = {c.voice_cache_id: c for c in customizations}
+                self._customizations_expire_at = time.monotonic() + self._customization_ttl_s
+        return self._customizations
+
+    def set_customization(self, customization: VoiceCustomization) -> None:
+        """Apply a committed customization to the cached map."""
+        self._customizations = {
+            **self._customizations,
+            customization.voice_cache_id: customization,
+        }
+
+    def remove_customization(self, voice_cache_id: str) -> None:
+        """Drop a deleted customization from the cached map."""
+        if voice_cache_id in self._customizations:
+            self._customizations = {
+                k: v for k, v in self._customizations.items() if k != voice_cache_id
+            }
+
+    def invalidate_customizations(self) -> None:
+        """Reload customizations on next use (e.g. after a bulk update)."""
+        self._customizations_expire_at = None
+
+
+_voice_catalog = VoiceCatalog()
+
+
+def get_voice_catalog() -> VoiceCatalog:
+    """Get the process-wide voice catalog."""
+    return _voice_catalog
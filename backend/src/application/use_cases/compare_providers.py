@@ -1,11 +1,13 @@
 """Compare Providers Use Case."""
 
 import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
 from src.application.interfaces.stt_provider import ISTTProvider
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.provider_loading import load_provider
 from src.domain.entities.audio import AudioData
 from src.domain.entities.stt import STTRequest, STTResult
 from src.domain.entities.tts import TTSRequest, TTSResult
@@ -83,8 +85,8 @@ class CompareProvidersUseCase:
 
     def __init__(
         self,
-        tts_providers: dict[str, ITTSProvider],
-        stt_providers: dict[str, ISTTProvider],
+        tts_providers: Mapping[str, ITTSProvider],
+        stt_providers: Mapping[str, ISTTProvider],
     ):
         """Initialize use case with dependencies.
 
@@ -106,7 +108,7 @@ class CompareProvidersUseCase:
         """
         tasks = []
         for provider_name, voice_id in input_data.voice_ids.items():
-            provider = self._tts_providers.get(provider_name)
+            provider = await load_provider(self._tts_providers, provider_name)
             if provider:
                 request = TTSRequest(
                     text=input_data.text,
@@ -177,7 +179,7 @@ class CompareProvidersUseCase:
         """
         tasks = []
         for provider_name in input_data.providers:
-            provider = self._stt_providers.get(provider_name)
+            provider = await load_provider(self._stt_providers, provider_name)
             if provider:
                 request = STTRequest(
                     provider=provider_name,
@@ -5,11 +5,17 @@ US5: 播放聲音預覽 (Voice Preview Playback)
 """
 
 import logging
+from collections.abc import Callable, Mapping
+from contextlib import AbstractAsyncContextManager
 
 from src.application.interfaces.storage_service import IStorageService
 from src.application.interfaces.tts_provider import ITTSProvider
 from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
+from src.application.services.provider_loading import load_provider
+from src.application.services.single_flight import SingleFlight
+from src.application.services.voice_catalog import get_voice_catalog
 from src.domain.entities.tts import TTSRequest
+from src.domain.entities.voice import VoiceProfile
 from src.domain.errors import AppError, ProviderError, SynthesisError, VoiceNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -17,6 +23,12 @@ logger = logging.getLogger(__name__)
 # Fixed preview text for on-demand synthesis
 PREVIEW_TEXT = "大家好，歡迎收聽，我是你的語音助理。"
 
+# Concurrent requests for the same voice share one synthesis and upload
+_preview_flights: SingleFlight[str] = SingleFlight()
+
+# Opens a repository with its own unit of work, committed when the block exits
+VoiceCacheRepositoryFactory = Callable[[], AbstractAsyncContextManager[IVoiceCacheRepository]]
+
 
 class GenerateVoicePreview:
     """Generate or retrieve a voice preview audio URL.
@@ -26,17 +38,32 @@ class GenerateVoicePreview:
     2. If sample_audio_url already exists → return it (cache hit)
     3. If ElevenLabs and metadata has preview_url → persist & return
     4. Otherwise → synthesize with fixed text → upload to storage → persist URL
+
+    Steps 3-4 run once per voice no matter how many requests arrive while
+    the preview is being generated. That shared work outlives the request
+    that started it, so it writes through a repository from
+    ``repository_factory`` rather than the caller's ``voice_cache_repo``.
     """
 
     def __init__(
         self,
-        providers: dict[str, ITTSProvider],
+        providers: Mapping[str, ITTSProvider],
         storage: IStorageService,
         voice_cache_repo: IVoiceCacheRepository,
+        repository_factory: VoiceCacheRepositoryFactory,
     ) -> None:
+        """Initialize the use case.
+
+        Args:
+            providers: TTS providers by name
+            storage: Storage for synthesized previews
+            voice_cache_repo: Request-scoped repository for the voice lookup
+            repository_factory: Opens the repository the shared generation writes with
+        """
         self._providers = providers
         self._storage = storage
         self._voice_cache_repo = voice_cache_repo
+        self._repository_factory = repository_factory
 
     async def execute(self, voice_cache_id: str) -> str:
         """Generate or retrieve a preview URL for the given voice.
@@ -52,8 +79,16 @@ class GenerateVoicePreview:
             ProviderError: If the TTS provider is unavailable
             SynthesisError: If synthesis fails
         """
-        # 1. Look up voice in cache
-        voice = await self._voice_cache_repo.get_by_id(voice_cache_id)
+        # 1. Look up voice in the catalog, then the cache table
+        catalog = get_voice_catalog()
+        await catalog.ensure_loaded(self._voice_cache_repo)
+        voice = catalog.get(voice_cache_id)
+        if voice is None or not voice.sample_audio_url:
+            # The snapshot may predate a preview stored by another worker
+            stored = await self._voice_cache_repo.get_by_id(voice_cache_id)
+            if stored is not None and stored.sample_audio_url:
+                catalog.set_sample_audio_url(voice_cache_id, stored.sample_audio_url)
+            voice = stored or voice
         if not voice:
             raise VoiceNotFoundError(voice_cache_id)
 
@@ -61,16 +96,25 @@ class GenerateVoicePreview:
         if voice.sample_audio_url:
             return voice.sample_audio_url
 
+        return await _preview_flights.do(
+            voice_cache_id, lambda: self._generate(voice_cache_id, voice)
+        )
+
+    async def _generate(self, voice_cache_id: str, voice: VoiceProfile) -> str:
+        """Resolve or synthesize the preview and persist its URL."""
+        catalog = get_voice_catalog()
+
         # 3. ElevenLabs CDN preview
         if voice.provider == "elevenlabs" and voice.metadata:
             cdn_url = voice.metadata.get("preview_url")
             if cdn_url:
                 logger.info("Using ElevenLabs CDN preview for %s", voice_cache_id)
-                await self._voice_cache_repo.update_sample_audio_url(voice_cache_id, cdn_url)
+                await self._save_sample_audio_url(voice_cache_id, cdn_url)
+                catalog.set_sample_audio_url(voice_cache_id, cdn_url)
                 return cdn_url
 
         # 4. On-demand synthesis
-        provider = self._providers.get(voice.provider)
+        provider = await load_provider(self._providers, voice.provider)
         if not provider:
             raise ProviderError(
                 voice.provider,
@@ -105,7 +149,12 @@ class GenerateVoicePreview:
         )
 
         # Persist the URL
-        await self._voice_cache_repo.update_sample_audio_url(voice_cache_id, stored.url)
+        await self._save_sample_audio_url(voice_cache_id, stored.url)
+        catalog.set_sample_audio_url(voice_cache_id, stored.url)
 
         logger.info("Preview generated for %s → %s", voice_cache_id, stored.url)
         return stored.url
+
+    async def _save_sample_audio_url(self, voice_cache_id: str, url: str) -> None:
+        async with self._repository_factory() as repo:
+            await repo.update_sample_audio_url(voice_cache_id, url)
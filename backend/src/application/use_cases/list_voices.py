@@ -4,10 +4,22 @@ T054: Implement ListVoicesUseCase
 Retrieves available voices from TTS providers with optional filtering.
 """
 
-import contextlib
+import asyncio
+import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Any
 
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.provider_loading import load_provider
+from src.application.services.single_flight import SingleFlight
+from src.application.services.voice_catalog import VoiceCatalog, get_voice_catalog
+from src.domain.entities.voice import VoiceProfile as DomainVoiceProfile
+
+logger = logging.getLogger(__name__)
+
+# Concurrent live listings of the same provider and language share one call
+_live_voice_flights: SingleFlight[list[Any]] = SingleFlight()
 
 
 @dataclass
@@ -38,15 +50,21 @@ class VoiceFilter:
 
 
 class ListVoicesUseCase:
-    """Use case for listing available voices from TTS providers."""
+    """Use case for listing available voices from TTS providers.
+
+    Providers with voices in the voice catalog are served from memory;
+    only providers missing from the catalog are queried live.
+    """
 
-    def __init__(self, providers: dict[str, ITTSProvider]):
+    def __init__(self, providers: Mapping[str, ITTSProvider], catalog: VoiceCatalog | None = None):
         """Initialize with available TTS providers.
 
         Args:
             providers: Dictionary mapping provider names to provider instances
+            catalog: Voice catalog to serve from (defaults to the process-wide one)
         """
         self._providers = providers
+        self._catalog = catalog or get_voice_catalog()
 
     async def execute(
         self,
@@ -64,87 +82,63 @@ class ListVoicesUseCase:
         Returns:
             List of voice profiles matching the filters
         """
-        all_voices: list[VoiceProfile] = []
+        filter = filter or VoiceFilter()
 
         # Determine which providers to query
-        if filter and filter.provider:
-            providers_to_query = {filter.provider: self._providers.get(filter.provider)}
-            providers_to_query = {k: v for k, v in providers_to_query.items() if v}
+        if filter.provider:
+            provider_names = [filter.provider] if filter.provider in self._providers else []
         else:
-            providers_to_query = self._providers
-
-        # Fetch voices from each provider
-        for provider_name, provider in providers_to_query.items():
-            try:
-                voices = await provider.list_voices(language=filter.language if filter else None)
-                for voice in voices:
-                    # Convert various VoiceProfile types to use case VoiceProfile
-                    # Handle domain VoiceProfile objects (from tts/voice entities)
-                    if hasattr(voice, "id"):
-                        # It's a dataclass, extract attributes
-                        gender_val = getattr(voice, "gender", None)
-                        # Convert Gender enum to string if needed
-                        if gender_val is not None and hasattr(gender_val, "value"):
-                            gender_str = gender_val.value
-                        else:
-                            gender_str = str(gender_val) if gender_val else None
-
-                        # Convert AgeGroup enum to string if needed
-                        age_group_val = getattr(voice, "age_group", None)
-                        if age_group_val is not None and hasattr(age_group_val, "value"):
-                            age_group_str = age_group_val.value
-                        else:
-                            age_group_str = str(age_group_val) if age_group_val else None
-
-                        profile = VoiceProfile(
-                            id=getattr(voice, "id", ""),
-                            name=getattr(voice, "name", getattr(voice, "display_name", "")),
-                            provider=provider_name,
-                            language=getattr(voice, "language", ""),
-                            gender=gender_str,
-                            age_group=age_group_str,
-                            description=getattr(voice, "description", None),
-                            sample_url=getattr(
-                                voice, "sample_url", getattr(voice, "sample_audio_url", None)
-                            ),
-                            supported_styles=getattr(
-                                voice, "supported_styles", getattr(voice, "styles", None)
-                            ),
-                        )
-                        all_voices.append(profile)
-                    else:
-                        # Dict format, convert to VoiceProfile
-                        profile = VoiceProfile(
-                            id=voice.get("id", voice.get("voice_id", "")),
-                            name=voice.get("name", voice.get("display_name", "")),
-                            provider=provider_name,
-                            language=voice.get("language", ""),
-                            gender=voice.get("gender"),
-                            age_group=voice.get("age_group"),
-                            description=voice.get("description"),
-                            sample_url=voice.get("sample_url", voice.get("sample_audio_url")),
-                            supported_styles=voice.get("supported_styles", voice.get("styles")),
-                        )
-                        all_voices.append(profile)
-            except Exception as e:
+            provider_names = list(self._providers)
+
+        cached = [p for p in provider_names if self._catalog.has_provider(p)]
+        live = [p for p in provider_names if p not in cached]
+
+        all_voices: list[VoiceProfile] = []
+        for provider_name in cached:
+            all_voices.extend(
+                _catalog_to_profile(v)
+                for v in self._catalog.query(
+                    provider=provider_name,
+                    language=filter.language,
+                    gender=filter.gender,
+                    age_group=filter.age_group,
+                    style=filter.style,
+                )
+            )
+
+        # Query uncached providers concurrently
+        results = await asyncio.gather(
+            *(self._list_live(p, filter.language) for p in live),
+            return_exceptions=True,
+        )
+        live_voices: list[VoiceProfile] = []
+        for provider_name, result in zip(live, results, strict=True):
+            if isinstance(result, BaseException):
                 # Log error but continue with other providers
-                print(f"Error fetching voices from {provider_name}: {e}")
+                logger.warning(f"Error fetching voices from {provider_name}: {result}")
                 continue
+            live_voices.extend(_to_profile(v, provider_name) for v in result)
+        all_voices.extend(self._apply_filters(live_voices, filter))
 
-        # Apply filters
-        if filter:
-            all_voices = self._apply_filters(all_voices, filter)
+        if filter.search:
+            all_voices = self._apply_search(all_voices, filter.search)
 
         # Apply pagination
-        if offset:
-            all_voices = all_voices[offset:]
-        if limit:
-            all_voices = all_voices[:limit]
-
-        return all_voices
+        end = offset + limit if limit else None
+        return all_voices[offset:end]
+
+    async def _list_live(self, provider_name: str, language: str | None = None) -> list[Any]:
+        """List a provider's voices, sharing the call with identical in-flight listings."""
+        provider = await load_provider(self._providers, provider_name)
+        if provider is None:
+            raise KeyError(provider_name)
+        return await _live_voice_flights.do(
+            (provider_name, language),
+            lambda: provider.list_voices(language=language),
+        )
 
     def _apply_filters(self, voices: list[VoiceProfile], filter: VoiceFilter) -> list[VoiceProfile]:
-        """Apply filters to voice list.
+        """Apply attribute filters to live provider voices.
 
         Args:
             voices: List of voices to filter
@@ -170,24 +164,25 @@ class ListVoicesUseCase:
                 if v.supported_styles and any(style_lower in s.lower() for s in v.supported_styles)
             ]
 
-        if filter.search:
-            search_lower = filter.search.lower()
-            filtered = [
-                v
-                for v in filtered
-                if search_lower in v.name.lower()
-                or search_lower in v.id.lower()
-                or (v.description and search_lower in v.description.lower())
-            ]
-
         return filtered
 
+    def _apply_search(self, voices: list[VoiceProfile], search: str) -> list[VoiceProfile]:
+        """Filter voices by a case-insensitive search on name, ID and description."""
+        search_lower = search.lower()
+        return [
+            v
+            for v in voices
+            if search_lower in v.name.lower()
+            or search_lower in v.id.lower()
+            or (v.description and search_lower in v.description.lower())
+        ]
+
     async def get_voice_by_id(self, provider: str, voice_id: str) -> VoiceProfile | None:
         """Get a specific voice by provider and voice ID.
 
         Args:
             provider: Provider name
-            voice_id: Voice ID
+            voice_id: Voice ID as listed (format: provider:voice_id)
 
         Returns:
             Voice profile if found, None otherwise
@@ -195,65 +190,75 @@ class ListVoicesUseCase:
         if provider not in self._providers:
             return None
 
-        provider_instance = self._providers[provider]
+        cached = self._catalog.get(voice_id)
+        if cached is not None and cached.provider == provider:
+            return _catalog_to_profile(cached)
+        if self._catalog.has_provider(provider):
+            # The catalog is authoritative for synced providers
+            return None
 
         try:
-            voices = await provider_instance.list_voices()
-            for voice in voices:
-                # Handle both VoiceProfile objects and dicts
-                if hasattr(voice, "id"):
-                    # It's a dataclass
-                    vid = getattr(voice, "id", getattr(voice, "voice_id", ""))
-                    if vid == voice_id:
-                        gender_val = getattr(voice, "gender", None)
-                        if gender_val is not None and hasattr(gender_val, "value"):
-                            gender_str = gender_val.value
-                        else:
-                            gender_str = str(gender_val) if gender_val else None
-
-                        # Convert AgeGroup enum to string if needed
-                        age_group_val = getattr(voice, "age_group", None)
-                        if age_group_val is not None and hasattr(age_group_val, "value"):
-                            age_group_str = age_group_val.value
-                        else:
-                            age_group_str = str(age_group_val) if age_group_val else None
-
-                        return VoiceProfile(
-                            id=vid,
-                            name=getattr(voice, "name", getattr(voice, "display_name", "")),
-                            provider=provider,
-                            language=getattr(voice, "language", ""),
-                            gender=gender_str,
-                            age_group=age_group_str,
-                            description=getattr(voice, "description", None),
-                            sample_url=getattr(
-                                voice, "sample_url", getattr(voice, "sample_audio_url", None)
-                            ),
-                            supported_styles=getattr(
-                                voice, "supported_styles", getattr(voice, "styles", None)
-                            ),
-                        )
-                else:
-                    # It's a dict
-                    vid = voice.get("id", voice.get("voice_id", ""))
-                    if vid == voice_id:
-                        return VoiceProfile(
-                            id=vid,
-                            name=voice.get("name", voice.get("display_name", "")),
-                            provider=provider,
-                            language=voice.get("language", ""),
-                            gender=voice.get("gender"),
-                            age_group=voice.get("age_group"),
-                            description=voice.get("description"),
-                            sample_url=voice.get("sample_url", voice.get("sample_audio_url")),
-                            supported_styles=voice.get("supported_styles", voice.get("styles")),
-                        )
+            voices = await self._list_live(provider)
         except Exception:
-            pass
+            return None
 
+        for voice in voices:
+            profile = _to_profile(voice, provider)
+            if profile.id == voice_id:
+                return profile
         return None
 
 
+def _enum_value(value: Any) -> str | None:
+    """Convert an enum (or plain value) to its string value."""
+    if value is None:
+        return None
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def _catalog_to_profile(voice: DomainVoiceProfile) -> VoiceProfile:
+    """Convert a cached domain voice into the use case VoiceProfile."""
+    return VoiceProfile(
+        id=voice.id,
+        name=voice.display_name,
+        provider=voice.provider,
+        language=voice.language,
+        gender=_enum_value(voice.gender),
+        age_group=_enum_value(voice.age_group),
+        description=voice.description or None,
+        sample_url=voice.sample_audio_url,
+        supported_styles=list(voice.styles) or None,
+    )
+
+
+def _to_profile(voice: Any, provider_name: str) -> VoiceProfile:
+    """Convert a provider voice (dataclass or dict) into the use case VoiceProfile."""
+    if hasattr(voice, "id"):
+        return VoiceProfile(
+            id=voice.id,
+            name=getattr(voice, "name", getattr(voice, "display_name", "")),
+            provider=provider_name,
+            language=getattr(voice, "language", ""),
+            gender=_enum_value(getattr(voice, "gender", None)),
+            age_group=_enum_value(getattr(voice, "age_group", None)),
+            description=getattr(voice, "description", None),
+            sample_url=getattr(voice, "sample_url", getattr(voice, "sample_audio_url", None)),
+            supported_styles=getattr(voice, "supported_styles", getattr(voice, "styles", None)),
+        )
+
+    return VoiceProfile(
+        id=voice.get("id", voice.get("voice_id", "")),
+        name=voice.get("name", voice.get("display_name", "")),
+        provider=provider_name,
+        language=voice.get("language", ""),
+        gender=voice.get("gender"),
+        age_group=voice.get("age_group"),
+        description=voice.get("description"),
+        sample_url=voice.get("sample_url", voice.get("sample_audio_url")),
+        supported_styles=voice.get("supported_styles", voice.get("styles")),
+    )
+
+
 # Factory function to create use case with default providers
 def create_list_voices_use_case() -> ListVoicesUseCase:
     """Create ListVoicesUseCase with configured providers.
@@ -261,25 +266,20 @@ def create_list_voices_use_case() -> ListVoicesUseCase:
     Returns:
         Configured ListVoicesUseCase instance
     """
-    from src.infrastructure.providers.tts.azure import AzureTTSProvider
-    from src.infrastructure.providers.tts.elevenlabs import ElevenLabsTTSProvider
-    from src.infrastructure.providers.tts.gemini_tts import GeminiTTSProvider
-    from src.infrastructure.providers.tts.voai import VoAITTSProvider
-
-    providers: dict[str, ITTSProvider] = {}
-
-    # Initialize providers (they handle their own configuration)
-    with contextlib.suppress(Exception):
-        providers["azure"] = AzureTTSProvider()
-
-    with contextlib.suppress(Exception):
-        providers["gemini"] = GeminiTTSProvider(api_key="")
-
-    with contextlib.suppress(Exception):
-        providers["elevenlabs"] = ElevenLabsTTSProvider()
-
-    with contextlib.suppress(Exception):
-        providers["voai"] = VoAITTSProvider()
+    from src.infrastructure.providers.lazy import LazyProvider, LazyProviderMap
+
+    # Initialize providers (they handle their own configuration) on first use,
+    # so importing this module does not load the provider SDKs
+    tts = "src.infrastructure.providers.tts"
+    providers: LazyProviderMap[ITTSProvider] = LazyProviderMap(
+        "TTS",
+        {
+            "azure": LazyProvider(f"{tts}.azure:AzureTTSProvider"),
+            "gemini": LazyProvider(f"{tts}.gemini_tts:GeminiTTSProvider", {"api_key": ""}),
+            "elevenlabs": LazyProvider(f"{tts}.elevenlabs:ElevenLabsTTSProvider"),
+            "voai": LazyProvider(f"{tts}.voai:VoAITTSProvider"),
+        },
+    )
 
     return ListVoicesUseCase(providers)
 
@@ -10,7 +10,9 @@ customization data for display_name, is_favorite, is_hidden.
 from dataclasses import dataclass
 
 from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
+from src.application.services.voice_catalog import VoiceCatalog, get_voice_catalog
 from src.domain.entities.voice import AgeGroup
+from src.domain.entities.voice_customization import VoiceCustomization
 from src.domain.repositories.voice_customization_repository import (
     IVoiceCustomizationRepository,
 )
@@ -34,6 +36,7 @@ class VoiceWithCustomization:
     is_deprecated: bool
     is_favorite: bool
     is_hidden: bool
+    customization: VoiceCustomization | None = None
 
 
 @dataclass
@@ -68,19 +71,25 @@ class ListVoicesWithCustomizationUseCase:
         self,
         voice_cache_repo: IVoiceCacheRepository,
         customization_repo: IVoiceCustomizationRepository,
+        catalog: VoiceCatalog | None = None,
     ) -> None:
         """Initialize with repositories.
 
         Args:
-            voice_cache_repo: Repository for voice cache data
+            voice_cache_repo: Repository for voice cache data (loads the catalog)
             customization_repo: Repository for voice customizations
+            catalog: Voice catalog to query (defaults to the process-wide one)
         """
         self._voice_cache_repo = voice_cache_repo
         self._customization_repo = customization_repo
+        self._catalog = catalog or get_voice_catalog()
 
     async def execute(self, filters: VoiceListFilters | None = None) -> VoiceListResult:
         """List voices with customization data.
 
+        Voices and customizations both come from the in-memory catalog;
+        the customization map is only read from the database when stale.
+
         Args:
             filters: Optional filters to apply
 
@@ -89,32 +98,20 @@ class ListVoicesWithCustomizationUseCase:
         """
         filters = filters or VoiceListFilters()
 
-        # Convert string age_group to enum if provided
+        # Validate age_group before querying
         age_group_enum = AgeGroup(filters.age_group) if filters.age_group else None
 
-        # Get voices from cache - get more than limit to apply post-filtering
-        # We need to handle exclude_hidden and favorites_only after merging customizations
-        # So fetch a larger set first
-        fetch_limit = (
-            (filters.offset + filters.limit) * 2
-            if filters.exclude_hidden or filters.favorites_only
-            else filters.limit
-        )
-        fetch_offset = 0 if filters.exclude_hidden or filters.favorites_only else filters.offset
-
-        voices = await self._voice_cache_repo.list_all(
+        await self._catalog.ensure_loaded(self._voice_cache_repo)
+        voices = self._catalog.query(
             provider=filters.provider,
             language=filters.language,
             gender=filters.gender,
             age_group=age_group_enum,
-            include_deprecated=False,
-            limit=fetch_limit,
-            offset=fetch_offset,
         )
 
-        # Get customizations for these voices
-        voice_ids = [v.id for v in voices]
-        customization_map = await self._customization_repo.get_customization_map(voice_ids)
+        customization_map = (
+            await self._catalog.customizations(self._customization_repo) if voices else {}
+        )
 
         # Build results with merged data
         results: list[VoiceWithCustomization] = []
@@ -163,21 +160,15 @@ class ListVoicesWithCustomizationUseCase:
                     is_deprecated=voice.is_deprecated,
                     is_favorite=is_favorite,
                     is_hidden=is_hidden,
+                    customization=customization,
                 )
             )
 
-        # Sort: favorites first, then by provider and name
-        results.sort(key=lambda v: (not v.is_favorite, v.provider, v.name))
+        # Sort: favorites first, then by provider and name (stable on catalog order)
+        results.sort(key=lambda v: not v.is_favorite)
 
-        # Get total count
         total = len(results)
-
-        # Apply pagination if we did post-filtering
-        if filters.exclude_hidden or filters.favorites_only or filters.search:
-            results = results[filters.offset : filters.offset + filters.limit]
-        else:
-            # Pagination was already applied in the query
-            pass
+        results = results[filters.offset : filters.offset + filters.limit]
 
         return VoiceListResult(
             items=results,
@@ -8,6 +8,8 @@ Synchronizes voice data from TTS providers to the local database.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,7 +18,7 @@ from typing import TYPE_CHECKING, Protocol
 from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
 from src.application.interfaces.voice_sync_job_repository import IVoiceSyncJobRepository
 from src.domain.entities.voice import Gender, VoiceProfile
-from src.domain.entities.voice_sync_job import VoiceSyncJob
+from src.domain.entities.voice_sync_job import VoiceSyncJob, VoiceSyncJobType
 from src.domain.services.voice_metadata_inferrer import VoiceMetadataInferrer
 from src.infrastructure.providers.tts.voice_fetchers.azure_voice_fetcher import (
     AzureVoiceFetcher,
@@ -34,6 +36,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def voice_content_hash(voice: VoiceProfile) -> str:
+    """Hash the voice_cache columns a sync writes, to detect unchanged rows.
+
+    sample_audio_url is compared separately: providers rarely report one and
+    the upsert keeps a stored preview when the incoming URL is NULL.
+    """
+    content = [
+        voice.display_name,
+        voice.language,
+        voice.gender.value if voice.gender else None,
+        voice.age_group.value if voice.age_group else None,
+        list(voice.styles),
+        list(voice.use_cases),
+        voice.is_deprecated,
+        voice.metadata,
+    ]
+    encoded = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
 class VoiceFetcherProtocol(Protocol):
     """Protocol for voice fetchers."""
 
@@ -117,7 +139,7 @@ class SyncVoicesUseCase:
         start_time = datetime.utcnow()
 
         # Check for running jobs
-        if await self.sync_job_repo.has_running_job():
+        if await self.sync_job_repo.has_running_job(VoiceSyncJobType.SYNC):
             raise ValueError("A voice sync job is already running")
 
         # Determine which providers to sync
@@ -140,10 +162,21 @@ class SyncVoicesUseCase:
         errors: list[str] = []
 
         try:
-            for provider in providers:
+            # Fetch from all providers concurrently; a failing provider
+            # doesn't affect the others
+            fetched = await asyncio.gather(
+                *(self._fetch_profiles(p, input_data.language) for p in providers),
+                return_exceptions=True,
+            )
+
+            # Writes share one database session, so apply them in turn
+            for provider, result in zip(providers, fetched, strict=True):
                 try:
-                    synced, deprecated = await self._sync_provider(
+                    if isinstance(result, BaseException):
+                        raise result
+                    synced, deprecated = await self._apply_profiles(
                         provider=provider,
+                        profiles=result,
                         language=input_data.language,
                     )
                     total_synced += synced
@@ -195,151 +228,109 @@ class SyncVoicesUseCase:
         Returns:
             Tuple of (voices_synced, voices_deprecated).
         """
-        if provider == "azure":
-            return await self._sync_azure(language)
-        elif provider == "elevenlabs":
-            return await self._sync_elevenlabs()
-        elif provider == "voai":
-            return await self._sync_voai(language)
-        elif provider == "gemini":
-            return await self._sync_gemini()
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        profiles = await self._fetch_profiles(provider, language)
+        return await self._apply_profiles(provider, profiles, language)
 
-    async def _sync_azure(self, language: str | None = None) -> tuple[int, int]:
-        """Sync Azure voices.
+    async def _fetch_profiles(
+        self,
+        provider: str,
+        language: str | None = None,
+    ) -> list[VoiceProfile]:
+        """Fetch a provider's current voices as VoiceProfile entities.
 
         Args:
+            provider: Provider name.
             language: Optional language filter.
 
         Returns:
-            Tuple of (voices_synced, voices_deprecated).
-        """
-        # Fetch voices with retry
-        raw_voices = await self._fetch_with_retry(
-            lambda: self.azure_fetcher.fetch_neural_voices(language)
-        )
-
-        # Convert to VoiceProfile entities
-        profiles = []
-        for v in raw_voices:
-            profile = self._azure_to_voice_profile(v)
-            profiles.append(profile)
-
-        # Upsert to database
-        await self.voice_cache_repo.upsert_batch(profiles)
-
-        # Mark deprecated voices (voices in DB but not in API response)
-        deprecated_count = await self._mark_deprecated_voices(
-            provider="azure",
-            current_voice_ids={p.voice_id for p in profiles},
-        )
-
-        logger.info(f"Synced {len(profiles)} Azure voices, deprecated {deprecated_count}")
-        return len(profiles), deprecated_count
+            Voice profiles currently offered by the provider.
 
-    async def _sync_elevenlabs(self) -> tuple[int, int]:
-        """Sync ElevenLabs voices.
-
-        Returns:
-            Tuple of (voices_synced, voices_deprecated).
+        Raises:
+            ValueError: If the provider is unknown or not configured.
         """
-        # Fetch voices with retry
-        raw_voices = await self._fetch_with_retry(lambda: self.elevenlabs_fetcher.fetch_voices())
-
-        # Convert to VoiceProfile entities
-        profiles = []
-        for v in raw_voices:
-            profile = self._elevenlabs_to_voice_profile(v)
-            profiles.append(profile)
-
-        # Upsert to database
-        await self.voice_cache_repo.upsert_batch(profiles)
-
-        # Mark deprecated voices
-        deprecated_count = await self._mark_deprecated_voices(
-            provider="elevenlabs",
-            current_voice_ids={p.voice_id for p in profiles},
-        )
-
-        logger.info(f"Synced {len(profiles)} ElevenLabs voices, deprecated {deprecated_count}")
-        return len(profiles), deprecated_count
+        if provider == "azure":
+            raw_voices = await self._fetch_with_retry(
+                lambda: self.azure_fetcher.fetch_neural_voices(language)
+            )
+            return [self._azure_to_voice_profile(v) for v in raw_voices]
+        elif provider == "elevenlabs":
+            raw_voices = await self._fetch_with_retry(
+                lambda: self.elevenlabs_fetcher.fetch_voices()
+            )
+            return [self._elevenlabs_to_voice_profile(v) for v in raw_voices]
+        elif provider == "voai":
+            # VoAI voices are hardcoded in the provider, no API fetch needed
+            if not self.voai_provider:
+                raise ValueError("VoAI API key not configured")
+            return self._copy_profiles(await self.voai_provider.list_voices(language))
+        elif provider == "gemini":
+            # Gemini voices are hardcoded in the provider, no API fetch needed
+            if not self.gemini_provider:
+                raise ValueError("Gemini API key not configured")
+            return self._copy_profiles(await self.gemini_provider.list_voices())
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
 
-    async def _sync_voai(self, language: str | None = None) -> tuple[int, int]:
-        """Sync VoAI voices.
+    async def _apply_profiles(
+        self,
+        provider: str,
+        profiles: list[VoiceProfile],
+        language: str | None = None,
+    ) -> tuple[int, int]:
+        """Write a provider's fetched voices to the cache.
 
-        VoAI voices are hardcoded in the provider, no API fetch needed.
+        Only rows whose content changed are upserted, and voices that
+        disappeared are deprecated with a single bulk update.
 
         Args:
-            language: Optional language filter.
+            provider: Provider name.
+            profiles: Voices currently offered by the provider.
+            language: Language filter the fetch was scoped to.
 
         Returns:
             Tuple of (voices_synced, voices_deprecated).
-
-        Raises:
-            ValueError: If VoAI provider is not configured.
         """
-        if not self.voai_provider:
-            raise ValueError("VoAI API key not configured")
-
-        # Get voices directly from provider (no API call needed)
-        raw_profiles = await self.voai_provider.list_voices(language)
-
-        # Update synced_at timestamp for all profiles
-        now = datetime.utcnow()
-        profiles = [
-            VoiceProfile(
-                id=p.id,
-                provider=p.provider,
-                voice_id=p.voice_id,
-                display_name=p.display_name,
-                language=p.language,
-                gender=p.gender,
-                age_group=getattr(p, "age_group", None),
-                styles=getattr(p, "styles", None) or (),
-                use_cases=getattr(p, "use_cases", None) or (),
-                description=getattr(p, "description", None) or "",
-                sample_audio_url=getattr(p, "sample_audio_url", None),
-                is_deprecated=False,
-                tags=getattr(p, "tags", None) or (),
-                metadata=getattr(p, "metadata", None) or {},
-                synced_at=now,
+        existing = await self.voice_cache_repo.get_by_provider(provider, include_deprecated=True)
+        existing_by_id = {v.voice_id: v for v in existing}
+        existing_hashes = {v.voice_id: voice_content_hash(v) for v in existing}
+
+        changed = [
+            p
+            for p in profiles
+            if existing_hashes.get(p.voice_id) != voice_content_hash(p)
+            or (
+                p.sample_audio_url is not None
+                and p.sample_audio_url != existing_by_id[p.voice_id].sample_audio_url
             )
-            for p in raw_profiles
         ]
-
-        # Upsert to database
-        await self.voice_cache_repo.upsert_batch(profiles)
-
-        # Mark deprecated voices
-        deprecated_count = await self._mark_deprecated_voices(
-            provider="voai",
-            current_voice_ids={p.voice_id for p in profiles},
+        if changed:
+            await self.voice_cache_repo.upsert_batch(changed)
+
+        # Voices still active in the DB (within the fetched language scope)
+        # but missing from the provider's response
+        active = {
+            v.voice_id: v.id
+            for v in existing
+            if not v.is_deprecated and (language is None or v.language.startswith(language))
+        }
+        stale = active.keys() - {p.voice_id for p in profiles}
+        deprecated_count = (
+            await self.voice_cache_repo.mark_deprecated([active[vid] for vid in stale])
+            if stale
+            else 0
         )
 
-        logger.info(f"Synced {len(profiles)} VoAI voices, deprecated {deprecated_count}")
+        logger.info(
+            f"Synced {len(profiles)} {provider} voices "
+            f"({len(changed)} changed), deprecated {deprecated_count}"
+        )
         return len(profiles), deprecated_count
 
-    async def _sync_gemini(self) -> tuple[int, int]:
-        """Sync Gemini voices.
-
-        Gemini voices are hardcoded in the provider, no API fetch needed.
-
-        Returns:
-            Tuple of (voices_synced, voices_deprecated).
-
-        Raises:
-            ValueError: If Gemini provider is not configured.
-        """
-        if not self.gemini_provider:
-            raise ValueError("Gemini API key not configured")
-
-        # Get voices directly from provider (no API call needed)
-        raw_profiles = await self.gemini_provider.list_voices()
-
-        # Update synced_at timestamp for all profiles
+    @staticmethod
+    def _copy_profiles(raw_profiles: list) -> list[VoiceProfile]:
+        """Normalize hardcoded provider voices into active VoiceProfile entities."""
         now = datetime.utcnow()
-        profiles = [
+        return [
             VoiceProfile(
                 id=p.id,
                 provider=p.provider,
@@ -360,18 +351,6 @@ class SyncVoicesUseCase:
             for p in raw_profiles
         ]
 
-        # Upsert to database
-        await self.voice_cache_repo.upsert_batch(profiles)
-
-        # Mark deprecated voices
-        deprecated_count = await self._mark_deprecated_voices(
-            provider="gemini",
-            current_voice_ids={p.voice_id for p in profiles},
-        )
-
-        logger.info(f"Synced {len(profiles)} Gemini voices, deprecated {deprecated_count}")
-        return len(profiles), deprecated_count
-
     async def _fetch_with_retry(self, fetch_fn) -> list:
         """Fetch with exponential backoff retry.
 
@@ -486,28 +465,3 @@ class SyncVoicesUseCase:
             is_deprecated=False,
             synced_at=datetime.utcnow(),
         )
-
-    async def _mark_deprecated_voices(
-        self,
-        provider: str,
-        current_voice_ids: set[str],
-    ) -> int:
-        """Mark voices that are no longer available as deprecated.
-
-        Args:
-            provider: Provider name.
-            current_voice_ids: Set of voice IDs currently available.
-
-        Returns:
-            Number of voices marked as deprecated.
-        """
-        # Get all voices for this provider from DB
-        db_voices = await self.voice_cache_repo.get_by_provider(provider)
-
-        deprecated_count = 0
-        for voice in db_voices:
-            if voice.voice_id not in current_voice_ids and not voice.is_deprecated:
-                await self.voice_cache_repo.mark_deprecated(voice.id)
-                deprecated_count += 1
-
-        return deprecated_count
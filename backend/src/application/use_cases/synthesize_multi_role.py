@@ -12,8 +12,6 @@ import logging
 import time
 from dataclasses import dataclass
 
-import azure.cognitiveservices.speech as speechsdk
-
 from src.application.use_cases.base import UseCase
 from src.domain.entities.audio import AudioFormat
 from src.domain.entities.multi_role_tts import (
@@ -23,6 +21,7 @@ from src.domain.entities.multi_role_tts import (
     VoiceAssignment,
 )
 from src.domain.errors import QuotaExceededError, RateLimitError
+from src.domain.services.audio_probe import probe_audio
 from src.infrastructure.providers.tts.factory import (
     ProviderNotSupportedError,
     TTSProviderFactory,
@@ -181,6 +180,23 @@ class SynthesizeMultiRoleUseCase(UseCase[SynthesizeMultiRoleInput, MultiRoleTTSR
                 return total_chars <= capability.character_limit
             return False
 
+    @staticmethod
+    def _measure_duration_ms(audio_data: bytes, turns: list[DialogueTurn]) -> int:
+        """Read duration from the audio headers, estimating only if they can't be read.
+
+        Args:
+            audio_data: Encoded audio returned by the provider.
+            turns: Dialogue turns, used for the fallback estimate.
+
+        Returns:
+            Audio duration in milliseconds.
+        """
+        probe = probe_audio(audio_data)
+        if probe is not None:
+            return probe.duration_ms
+        # Fallback: ~200ms per character
+        return sum(len(t.text) for t in turns) * 200
+
     async def _synthesize_native(
         self,
         input_data: SynthesizeMultiRoleInput,
@@ -228,6 +244,8 @@ class SynthesizeMultiRoleUseCase(UseCase[SynthesizeMultiRoleInput, MultiRoleTTSR
         """
         import os
 
+        import azure.cognitiveservices.speech as speechsdk
+
         start_time = time.time()
 
         # Build SSML
@@ -275,9 +293,7 @@ class SynthesizeMultiRoleUseCase(UseCase[SynthesizeMultiRoleInput, MultiRoleTTSR
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
             latency_ms = int((time.time() - start_time) * 1000)
 
-            # Estimate duration (rough: 150 words/minute for Chinese)
-            total_chars = sum(len(t.text) for t in input_data.turns)
-            estimated_duration_ms = int(total_chars * 200)  # ~200ms per character
+            duration_ms = self._measure_duration_ms(result.audio_data, input_data.turns)
 
             content_type_map = {
                 "mp3": "audio/mpeg",
@@ -288,7 +304,7 @@ class SynthesizeMultiRoleUseCase(UseCase[SynthesizeMultiRoleInput, MultiRoleTTSR
             return MultiRoleTTSResult(
                 audio_content=result.audio_data,
                 content_type=content_type_map.get(input_data.output_format.lower(), "audio/mpeg"),
-                duration_ms=estimated_duration_ms,
+                duration_ms=duration_ms,
                 latency_ms=latency_ms,
                 provider="azure",
                 synthesis_mode=MultiRoleSupportType.NATIVE,
@@ -355,14 +371,12 @@ class SynthesizeMultiRoleUseCase(UseCase[SynthesizeMultiRoleInput, MultiRoleTTSR
 
         latency_ms = int((time.time() - start_time) * 1000)
 
-        # Estimate duration
-        total_chars = sum(len(t.text) for t in input_data.turns)
-        estimated_duration_ms = int(total_chars * 200)
+        duration_ms = self._measure_duration_ms(audio_data, input_data.turns)
 
         return MultiRoleTTSResult(
             audio_content=audio_data,
             content_type="audio/mpeg",
-            duration_ms=estimated_duration_ms,
+            duration_ms=duration_ms,
             latency_ms=latency_ms,
             provider="elevenlabs",
             synthesis_mode=MultiRoleSupportType.NATIVE,
@@ -3,13 +3,15 @@
 T028: Update SynthesizeSpeechUseCase to support batch and streaming modes
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Mapping
 from typing import Protocol
 
 import httpx
 
 from src.application.interfaces.storage_service import IStorageService
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.metrics import track_provider_stream
+from src.application.services.provider_loading import load_provider
 from src.domain.entities.tts import TTSRequest, TTSResult
 from src.domain.errors import ProviderError, QuotaExceededError, SynthesisError
 
@@ -132,7 +134,8 @@ class SynthesizeSpeech:
         """
         try:
             # Stream audio from provider
-            async for chunk in self.provider.synthesize_stream(request):
+            stream = self.provider.synthesize_stream(request)
+            async for chunk in track_provider_stream("tts", self.provider.name, stream, "ttfb"):
                 yield chunk
 
             # Log successful streaming synthesis
@@ -178,7 +181,7 @@ class SynthesizeSpeechFactory:
 
     def __init__(
         self,
-        providers: dict[str, ITTSProvider],
+        providers: Mapping[str, ITTSProvider],
         storage: IStorageService | None = None,
         logger: ISynthesisLogger | None = None,
     ) -> None:
@@ -186,7 +189,7 @@ class SynthesizeSpeechFactory:
         self.storage = storage
         self.logger = logger
 
-    def create(self, provider_name: str) -> SynthesizeSpeech:
+    async def create(self, provider_name: str) -> SynthesizeSpeech:
         """Create a SynthesizeSpeech use case for the specified provider.
 
         Args:
@@ -198,7 +201,7 @@ class SynthesizeSpeechFactory:
         Raises:
             ValueError: If provider is not found
         """
-        provider = self.providers.get(provider_name)
+        provider = await load_provider(self.providers, provider_name)
         if not provider:
             valid_providers = list(self.providers.keys())
             raise ValueError(f"Provider '{provider_name}' not found. Available: {valid_providers}")
@@ -1,8 +1,10 @@
 """Transcribe Audio Use Case."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from src.application.interfaces.stt_provider import ISTTProvider
+from src.application.services.provider_loading import load_provider
 from src.domain.entities.audio import AudioData
 from src.domain.entities.stt import STTRequest, STTResult
 from src.domain.entities.test_record import TestRecord
@@ -45,7 +47,7 @@ class TranscribeAudioUseCase:
 
     def __init__(
         self,
-        stt_providers: dict[str, ISTTProvider],
+        stt_providers: Mapping[str, ISTTProvider],
         test_record_repo: ITestRecordRepository | None = None,
     ):
         """Initialize use case with dependencies.
@@ -71,7 +73,7 @@ class TranscribeAudioUseCase:
             STTProviderError: If transcription fails
         """
         # Get provider
-        provider = self._stt_providers.get(input_data.provider_name)
+        provider = await load_provider(self._stt_providers, input_data.provider_name)
         if not provider:
             available = list(self._stt_providers.keys())
             raise ValueError(
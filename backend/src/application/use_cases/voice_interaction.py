@@ -1,11 +1,14 @@
 """Voice Interaction Use Case."""
 
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from src.application.interfaces.llm_provider import ILLMProvider, LLMMessage
 from src.application.interfaces.stt_provider import ISTTProvider
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.metrics import track_provider_call
+from src.application.services.provider_loading import load_provider
 from src.domain.entities.audio import AudioData
 from src.domain.entities.stt import STTRequest
 from src.domain.entities.tts import TTSRequest
@@ -56,9 +59,9 @@ class VoiceInteractionUseCase:
 
     def __init__(
         self,
-        stt_providers: dict[str, ISTTProvider],
-        llm_providers: dict[str, ILLMProvider],
-        tts_providers: dict[str, ITTSProvider],
+        stt_providers: Mapping[str, ISTTProvider],
+        llm_providers: Mapping[str, ILLMProvider],
+        tts_providers: Mapping[str, ITTSProvider],
     ):
         """Initialize use case with dependencies.
 
@@ -87,7 +90,7 @@ class VoiceInteractionUseCase:
         total_start = time.perf_counter()
 
         # 1. STT - Transcribe user audio
-        stt_provider = self._stt_providers.get(input_data.stt_provider)
+        stt_provider = await load_provider(self._stt_providers, input_data.stt_provider)
         if not stt_provider:
             raise ValueError(f"STT provider '{input_data.stt_provider}' not found")
 
@@ -103,7 +106,7 @@ class VoiceInteractionUseCase:
         user_transcript = stt_result.transcript
 
         # 2. LLM - Generate response
-        llm_provider = self._llm_providers.get(input_data.llm_provider)
+        llm_provider = await load_provider(self._llm_providers, input_data.llm_provider)
         if not llm_provider:
             raise ValueError(f"LLM provider '{input_data.llm_provider}' not found")
 
@@ -118,16 +121,17 @@ class VoiceInteractionUseCase:
         messages.append(LLMMessage(role="user", content=user_transcript))
 
         llm_start = time.perf_counter()
-        llm_response = await llm_provider.generate(
-            messages=messages,
-            max_tokens=input_data.max_response_tokens,
-        )
+        with track_provider_call("llm", llm_provider.name):
+            llm_response = await llm_provider.generate(
+                messages=messages,
+                max_tokens=input_data.max_response_tokens,
+            )
         llm_latency = int((time.perf_counter() - llm_start) * 1000)
 
         ai_text = llm_response.content
 
         # 3. TTS - Synthesize response
-        tts_provider = self._tts_providers.get(input_data.tts_provider)
+        tts_provider = await load_provider(self._tts_providers, input_data.tts_provider)
         if not tts_provider:
             raise ValueError(f"TTS provider '{input_data.tts_provider}' not found")
 
@@ -15,11 +15,20 @@ class VoiceSyncStatus(Enum):
     FAILED = "failed"
 
 
+class VoiceSyncJobType(Enum):
+    """What a voice sync job does."""
+
+    SYNC = "sync"  # Fetch voice metadata from providers
+    PREVIEWS = "previews"  # Pre-generate missing voice previews
+
+
 @dataclass
 class VoiceSyncJob:
     """Voice synchronization job entity.
 
-    Tracks background sync operations that fetch voice metadata from providers.
+    Tracks background sync operations that fetch voice metadata from providers,
+    and preview pre-generation runs over the voice catalog. For preview jobs,
+    voices_synced counts previews resolved so far out of voices_total.
 
     State Transitions:
         [PENDING] --start--> [RUNNING] --success--> [COMPLETED]
@@ -39,18 +48,25 @@ class VoiceSyncJob:
     started_at: datetime | None = None
     completed_at: datetime | None = None
     created_at: datetime = field(default_factory=datetime.utcnow)
+    job_type: VoiceSyncJobType = VoiceSyncJobType.SYNC
+    voices_total: int | None = None
 
     # Constants
     MAX_RETRIES: int = field(default=3, init=False, repr=False)
     RETRY_DELAYS: tuple[float, ...] = field(default=(1.0, 2.0, 4.0), init=False, repr=False)
 
     @classmethod
-    def create(cls, providers: list[str] | None = None) -> "VoiceSyncJob":
+    def create(
+        cls,
+        providers: list[str] | None = None,
+        job_type: VoiceSyncJobType = VoiceSyncJobType.SYNC,
+    ) -> "VoiceSyncJob":
         """Create a new sync job."""
         return cls(
             id=str(uuid4()),
             providers=providers or [],
             status=VoiceSyncStatus.PENDING,
+            job_type=job_type,
         )
 
     def start(self) -> "VoiceSyncJob":
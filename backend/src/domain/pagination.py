@@ -0,0 +1,39 @@
+"""Keyset (cursor) pagination.
+
+History-style lists are ordered newest first by (timestamp, id). A cursor
+records the last row of a page; the next page starts strictly after it,
+so every page is an index range scan instead of an OFFSET skip.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position of the last row on a page, in (timestamp, id) order."""
+
+    timestamp: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """Encode as an opaque, URL-safe token."""
+        raw = json.dumps([self.timestamp.isoformat(), str(self.id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode a token produced by ``encode``.
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            timestamp, row_id = json.loads(raw)
+            return cls(timestamp=datetime.fromisoformat(timestamp), id=UUID(row_id))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid pagination cursor") from e
@@ -6,6 +6,7 @@ T012: Abstract repository for interaction session persistence.
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from datetime import datetime
+from typing import Any, Literal
 from uuid import UUID
 
 from src.domain.entities import (
@@ -15,6 +16,9 @@ from src.domain.entities import (
     LatencyMetrics,
     SessionStatus,
 )
+from src.domain.pagination import PageCursor
+
+LatencyGroupBy = Literal["session", "mode", "provider", "hour", "day"]
 
 
 class InteractionRepository(ABC):
@@ -55,6 +59,35 @@ class InteractionRepository(ABC):
         """List sessions with filters and pagination. Returns (sessions, total_count)."""
         ...
 
+    @abstractmethod
+    async def list_sessions_after(
+        self,
+        user_id: UUID,
+        mode: InteractionMode | None = None,
+        status: SessionStatus | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 20,
+    ) -> tuple[Sequence[InteractionSession], PageCursor | None]:
+        """List sessions newest first after a (started_at, id) cursor.
+
+        Returns (sessions, next_cursor); next_cursor is None on the last page.
+        """
+        ...
+
+    @abstractmethod
+    async def count_sessions(
+        self,
+        user_id: UUID,
+        mode: InteractionMode | None = None,
+        status: SessionStatus | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
+        """Count sessions matching the filters."""
+        ...
+
     # Turn operations
     @abstractmethod
     async def create_turn(self, turn: ConversationTurn) -> ConversationTurn:
@@ -71,6 +104,11 @@ class InteractionRepository(ABC):
         """Update an existing turn."""
         ...
 
+    @abstractmethod
+    async def save_turns(self, turns: Sequence[ConversationTurn]) -> None:
+        """Insert or update a batch of turns (keyed by turn ID)."""
+        ...
+
     @abstractmethod
     async def list_turns(self, session_id: UUID) -> Sequence[ConversationTurn]:
         """List all turns in a session ordered by turn_number."""
@@ -87,6 +125,11 @@ class InteractionRepository(ABC):
         """Create latency metrics for a turn."""
         ...
 
+    @abstractmethod
+    async def create_latency_metrics_batch(self, metrics: Sequence[LatencyMetrics]) -> None:
+        """Create latency metrics for several turns at once."""
+        ...
+
     @abstractmethod
     async def get_latency_metrics(self, turn_id: UUID) -> LatencyMetrics | None:
         """Get latency metrics for a turn."""
@@ -101,9 +144,33 @@ class InteractionRepository(ABC):
         - avg_total_ms: float
         - min_total_ms: int
         - max_total_ms: int
-        - p95_total_ms: int
+        - p95_total_ms: float (interpolated)
         - avg_stt_ms: float | None (cascade only)
         - avg_llm_ttft_ms: float | None (cascade only)
         - avg_tts_ttfb_ms: float | None (cascade only)
         """
         ...
+
+    @abstractmethod
+    async def get_latency_analytics(
+        self,
+        group_by: LatencyGroupBy,
+        user_id: UUID | None = None,
+        mode: InteractionMode | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Aggregate turn latency across sessions.
+
+        Groups by session, mode, provider (mode plus realtime provider or
+        cascade STT/LLM/TTS triple) or hour/day bucket of the metric time.
+
+        Returns one dict per group with keys:
+        - key: dict[str, str | None] of group column values
+        - turns: int
+        - avg_total_ms, min_total_ms, max_total_ms: float
+        - p50_total_ms, p95_total_ms, p99_total_ms: float
+        - avg_stt_ms, avg_llm_ttft_ms, avg_tts_ttfb_ms, avg_realtime_ms: float | None
+        """
+        ...
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from datetime import timedelta
 
 from src.domain.entities.job import Job, JobStatus
+from src.domain.pagination import PageCursor
 
 
 class IJobRepository(ABC):
@@ -62,6 +63,28 @@ class IJobRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_user_id_after(
+        self,
+        user_id: uuid.UUID,
+        status: JobStatus | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Job], PageCursor | None]:
+        """List jobs for a user with keyset pagination.
+
+        Args:
+            user_id: User ID
+            status: Optional status filter
+            cursor: Position after which the page starts (None for the first page)
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Tuple of (jobs ordered by created_at descending, cursor for the
+            next page or None if this is the last page)
+        """
+        pass
+
     @abstractmethod
     async def update(self, job: Job) -> Job:
         """Update an existing job.
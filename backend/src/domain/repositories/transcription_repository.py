@@ -11,6 +11,7 @@ from src.domain.entities.audio_file import AudioFile
 from src.domain.entities.ground_truth import GroundTruth
 from src.domain.entities.stt import STTResult
 from src.domain.entities.wer_analysis import WERAnalysis
+from src.domain.pagination import PageCursor
 
 
 class ITranscriptionRepository(ABC):
@@ -114,6 +115,49 @@ class ITranscriptionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_transcriptions_after(
+        self,
+        user_id: UUID,
+        provider: str | None = None,
+        language: str | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 20,
+    ) -> tuple[list[dict], PageCursor | None]:
+        """List transcriptions for a user with keyset pagination.
+
+        Args:
+            user_id: User UUID
+            provider: Filter by provider
+            language: Filter by language
+            cursor: Position after which the page starts (None for the first page)
+            limit: Maximum items per page
+
+        Returns:
+            Tuple of (list of transcription summaries, cursor for the next page
+            or None if this is the last page)
+        """
+        pass
+
+    @abstractmethod
+    async def count_transcriptions(
+        self,
+        user_id: UUID,
+        provider: str | None = None,
+        language: str | None = None,
+    ) -> int:
+        """Count transcriptions for a user.
+
+        Args:
+            user_id: User UUID
+            provider: Filter by provider
+            language: Filter by language
+
+        Returns:
+            Number of matching transcriptions
+        """
+        pass
+
     @abstractmethod
     async def delete_transcription(self, transcription_id: UUID) -> bool:
         """Delete a transcription record.
@@ -0,0 +1,329 @@
+"""Header-only audio probe.
+
+Reads duration, sample rate and channel count straight from container
+headers (RIFF/WAVE chunks, MPEG frame headers, Ogg page granules, FLAC
+STREAMINFO) without decoding any audio. Used wherever we previously
+estimated duration from text length or hardcoded a sample rate.
+"""
+
+import struct
+from dataclasses import dataclass
+
+from src.domain.entities.audio import AudioData, AudioFormat
+
+
+@dataclass(frozen=True)
+class AudioProbeResult:
+    """Audio properties read from container headers."""
+
+    format: AudioFormat
+    duration_ms: int
+    sample_rate: int
+    channels: int
+
+
+# MPEG audio frame header tables, indexed by [version][layer]
+# version: 1 = MPEG-1, 2 = MPEG-2, 25 = MPEG-2.5; layer: 1, 2, 3
+_MPEG_BITRATES_KBPS: dict[tuple[int, int], tuple[int, ...]] = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MPEG_SAMPLE_RATES: dict[int, tuple[int, int, int]] = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    25: (11025, 12000, 8000),
+}
+_MPEG_VERSIONS = {0b00: 25, 0b10: 2, 0b11: 1}
+_MPEG_LAYERS = {0b01: 3, 0b10: 2, 0b11: 1}
+
+_OPUS_GRANULE_RATE = 48000
+
+# Back-to-back frames needed before a sync word is trusted as MP3
+_MIN_MPEG_FRAMES = 3
+
+
+@dataclass(frozen=True)
+class _MpegFrame:
+    """Parsed MPEG audio frame header."""
+
+    version: int
+    layer: int
+    sample_rate: int
+    channels: int
+    length: int
+    samples: int
+
+
+def probe_audio(data: bytes, format_hint: AudioFormat | None = None) -> AudioProbeResult | None:
+    """Read audio properties from container headers.
+
+    The container is detected from magic bytes. MP3 has no reliable
+    signature without an ID3 tag, so untagged data is only read as MP3
+    when ``format_hint`` says so or a frame header sits at offset 0;
+    anything else (WebM, AAC, ...) returns None for the caller to decode.
+
+    Args:
+        data: Encoded audio bytes
+        format_hint: Format the caller believes the data to be in
+
+    Returns:
+        Probe result, or None if the container is unsupported or malformed
+    """
+    if len(data) < 12:
+        return None
+
+    try:
+        if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+            return _probe_wav(data)
+        if data[:4] == b"OggS":
+            return _probe_ogg(data)
+
+        offset = _skip_id3v2(data)
+        if data[offset : offset + 4] == b"fLaC":
+            return _probe_flac(data, offset)
+        if offset > 0 or format_hint == AudioFormat.MP3 or _parse_mpeg_header(data, 0):
+            return _probe_mp3(data, offset)
+    except (struct.error, IndexError, ZeroDivisionError):
+        return None
+
+    return None
+
+
+def probe_duration_ms(audio: AudioData) -> int | None:
+    """Get the playback duration of an AudioData container.
+
+    Raw PCM has no header, so its duration is derived from the sample
+    rate and channel count carried on the AudioData (16-bit samples).
+
+    Args:
+        audio: Audio data to measure
+
+    Returns:
+        Duration in milliseconds, or None if it cannot be determined
+    """
+    if audio.format == AudioFormat.PCM:
+        bytes_per_second = audio.sample_rate * audio.channels * 2
+        if bytes_per_second <= 0:
+            return None
+        return int(len(audio.data) * 1000 / bytes_per_second)
+
+    result = probe_audio(audio.data, audio.format)
+    return result.duration_ms if result else None
+
+
+def _skip_id3v2(data: bytes) -> int:
+    """Return the offset of the first byte after any leading ID3v2 tag."""
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    # Tag size is a 28-bit syncsafe integer (7 bits per byte)
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _probe_wav(data: bytes) -> AudioProbeResult | None:
+    """Walk RIFF chunks for the fmt and data chunks."""
+    offset = 12
+    channels = sample_rate = byte_rate = 0
+
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            _, channels, sample_rate, byte_rate = struct.unpack_from("<HHII", data, body)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # Streaming writers leave the size as 0 or 0xFFFFFFFF; use what we have
+            available = len(data) - body
+            if chunk_size == 0 or chunk_size > available:
+                chunk_size = available
+            return AudioProbeResult(
+                format=AudioFormat.WAV,
+                duration_ms=int(chunk_size * 1000 / byte_rate),
+                sample_rate=sample_rate,
+                channels=channels,
+            )
+
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def _parse_mpeg_header(data: bytes, offset: int) -> _MpegFrame | None:
+    """Parse a 4-byte MPEG audio frame header at offset."""
+    if offset + 4 > len(data):
+        return None
+    (header,) = struct.unpack_from(">I", data, offset)
+    if header >> 21 != 0x7FF:
+        return None
+
+    version = _MPEG_VERSIONS.get((header >> 19) & 0b11)
+    layer = _MPEG_LAYERS.get((header >> 17) & 0b11)
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0b11
+    if version is None or layer is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    padding = (header >> 9) & 1
+    channels = 1 if (header >> 6) & 0b11 == 0b11 else 2
+    bitrate = _MPEG_BITRATES_KBPS[(min(version, 2), layer)][bitrate_index] * 1000
+    sample_rate = _MPEG_SAMPLE_RATES[version][sample_rate_index]
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 576 if layer == 3 and version != 1 else 1152
+        length = samples // 8 * bitrate // sample_rate + padding
+
+    return _MpegFrame(version, layer, sample_rate, channels, length, samples)
+
+
+def _find_first_mpeg_frame(data: bytes, offset: int) -> tuple[int, _MpegFrame] | None:
+    """Find the first frame header that starts a run of consecutive frames."""
+    pos = data.find(b"\xff", offset)
+    while pos != -1:
+        frame = _parse_mpeg_header(data, pos)
+        if frame is not None and _is_frame_run(data, pos, frame):
+            return pos, frame
+        pos = data.find(b"\xff", pos + 1)
+    return None
+
+
+def _is_frame_run(data: bytes, pos: int, frame: _MpegFrame) -> bool:
+    """Check that ``_MIN_MPEG_FRAMES`` whole frames follow each other from pos.
+
+    A shorter run is accepted only if it ends exactly at the end of the data.
+    """
+    for _ in range(_MIN_MPEG_FRAMES - 1):
+        pos += frame.length
+        if pos == len(data):
+            return True
+        next_frame = _parse_mpeg_header(data, pos)
+        if next_frame is None:
+            return False
+        frame = next_frame
+    return pos + frame.length <= len(data)
+
+
+def _read_vbr_frame_count(data: bytes, offset: int, frame: _MpegFrame) -> int | None:
+    """Read the total frame count from a Xing/Info or VBRI header, if present."""
+    if frame.version == 1:
+        side_info = 17 if frame.channels == 1 else 32
+    else:
+        side_info = 9 if frame.channels == 1 else 17
+
+    xing = offset + 4 + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", data, xing + 4)
+        if flags & 0x1:
+            (frames,) = struct.unpack_from(">I", data, xing + 8)
+            return frames
+        return None
+
+    vbri = offset + 36
+    if data[vbri : vbri + 4] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", data, vbri + 14)
+        return frames
+
+    return None
+
+
+def _probe_mp3(data: bytes, offset: int) -> AudioProbeResult | None:
+    """Use the VBR header frame count when present, otherwise hop frame headers."""
+    found = _find_first_mpeg_frame(data, offset)
+    if found is None:
+        return None
+    pos, first = found
+
+    frame_count = _read_vbr_frame_count(data, pos, first)
+    if frame_count is None:
+        frame_count = 0
+        frame: _MpegFrame | None = first
+        while frame is not None:
+            frame_count += 1
+            pos += frame.length
+            frame = _parse_mpeg_header(data, pos)
+
+    return AudioProbeResult(
+        format=AudioFormat.MP3,
+        duration_ms=int(frame_count * first.samples * 1000 / first.sample_rate),
+        sample_rate=first.sample_rate,
+        channels=first.channels,
+    )
+
+
+def _last_ogg_granule(data: bytes) -> int | None:
+    """Read the granule position of the last complete Ogg page."""
+    pos = data.rfind(b"OggS")
+    while pos != -1:
+        if pos + 14 <= len(data):
+            (granule,) = struct.unpack_from("<q", data, pos + 6)
+            if granule >= 0:
+                return granule
+        pos = data.rfind(b"OggS", 0, pos)
+    return None
+
+
+def _probe_ogg(data: bytes) -> AudioProbeResult | None:
+    """Read the codec id header from the first page and the granule of the last."""
+    segment_count = data[26]
+    payload = 27 + segment_count
+
+    if data[payload : payload + 8] == b"OpusHead":
+        channels = data[payload + 9]
+        (pre_skip,) = struct.unpack_from("<H", data, payload + 10)
+        (input_rate,) = struct.unpack_from("<I", data, payload + 12)
+        granule_rate = _OPUS_GRANULE_RATE
+        sample_rate = input_rate or _OPUS_GRANULE_RATE
+        audio_format = AudioFormat.OPUS
+    elif data[payload : payload + 7] == b"\x01vorbis":
+        channels = data[payload + 11]
+        (sample_rate,) = struct.unpack_from("<I", data, payload + 12)
+        granule_rate = sample_rate
+        pre_skip = 0
+        audio_format = AudioFormat.OGG
+    else:
+        return None
+
+    granule = _last_ogg_granule(data)
+    if granule is None or not granule_rate:
+        return None
+
+    return AudioProbeResult(
+        format=audio_format,
+        duration_ms=int(max(granule - pre_skip, 0) * 1000 / granule_rate),
+        sample_rate=sample_rate,
+        channels=channels,
+    )
+
+
+def _probe_flac(data: bytes, offset: int) -> AudioProbeResult | None:
+    """Read the STREAMINFO metadata block that always follows the fLaC marker."""
+    block = offset + 4
+    if data[block] & 0x7F != 0:
+        return None
+
+    info = block + 4
+    # 20 bits sample rate | 3 bits channels-1 | 5 bits bps-1 | 36 bits total samples
+    (packed,) = struct.unpack_from(">Q", data, info + 10)
+    sample_rate = packed >> 44
+    channels = ((packed >> 41) & 0b111) + 1
+    total_samples = packed & 0xFFFFFFFFF
+    if not sample_rate:
+        return None
+
+    return AudioProbeResult(
+        format=AudioFormat.FLAC,
+        duration_ms=int(total_samples * 1000 / sample_rate),
+        sample_rate=sample_rate,
+        channels=channels,
+    )
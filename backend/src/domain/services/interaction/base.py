@@ -14,7 +14,7 @@ from uuid import UUID
 class AudioChunk:
     """Audio data chunk for streaming."""
 
-    data: bytes
+    data: bytes | memoryview
     format: str  # "pcm16" or "mp3"
     sample_rate: int  # 16000 or 24000
     is_final: bool = False
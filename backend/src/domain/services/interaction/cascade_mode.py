@@ -7,7 +7,6 @@ T048: Integrate existing TTS providers.
 """
 
 import asyncio
-import base64
 import logging
 from collections.abc import AsyncIterator
 from io import BytesIO
@@ -17,6 +16,7 @@ from uuid import UUID
 from src.application.interfaces.llm_provider import ILLMProvider, LLMMessage
 from src.application.interfaces.stt_provider import ISTTProvider
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.metrics import track_provider_stream
 from src.domain.entities.audio import AudioData, AudioFormat
 from src.domain.entities.stt import STTRequest
 from src.domain.entities.tts import TTSRequest
@@ -254,8 +254,9 @@ class CascadeModeService(InteractionModeService):
 
         # Transcribe
         result = await self._stt.transcribe(request)
+        # Not every provider reports a confidence (e.g. Whisper)
         self._logger.debug(
-            f"STT result: '{result.transcript}' (confidence: {result.confidence:.2f})"
+            "STT result: '%s' (confidence: %s)", result.transcript, result.confidence
         )
 
         return result.transcript
@@ -272,11 +273,12 @@ class CascadeModeService(InteractionModeService):
         full_response = ""
         is_first = True
 
-        async for delta in self._llm.generate_stream(
+        stream = self._llm.generate_stream(
             messages=self._messages,
             max_tokens=500,
             temperature=0.7,
-        ):
+        )
+        async for delta in track_provider_stream("llm", self._llm.name, stream, "ttft"):
             if self._interrupted:
                 return ""
 
@@ -311,17 +313,15 @@ class CascadeModeService(InteractionModeService):
 
         # Stream audio chunks
         is_first = True
-        async for chunk in self._tts.synthesize_stream(request):
+        stream = self._tts.synthesize_stream(request)
+        async for chunk in track_provider_stream("tts", self._tts.name, stream, "ttfb"):
             if self._interrupted:
                 return
 
-            # Encode audio as base64 for WebSocket transport
-            audio_b64 = base64.b64encode(chunk).decode("utf-8")
-
             await self._emit_event(
                 "audio",
                 {
-                    "audio": audio_b64,
+                    "audio": chunk,
                     "format": "pcm16",
                     "is_first": is_first,
                     "is_final": False,
@@ -331,5 +331,5 @@ class CascadeModeService(InteractionModeService):
 
         # Signal audio complete
         await self._emit_event(
-            "audio", {"audio": "", "format": "pcm16", "is_first": False, "is_final": True}
+            "audio", {"audio": b"", "format": "pcm16", "is_first": False, "is_final": True}
         )
@@ -43,6 +43,18 @@ AVAILABLE_MODELS = [
 DEFAULT_MODEL = "gemini-2.0-flash-live-001"
 DEFAULT_VOICE = "Kore"  # Female voice, good for Chinese
 
+# Gemini Live responds with 24 kHz PCM16 unless the MIME type says otherwise
+OUTPUT_SAMPLE_RATE = 24000
+
+
+def _parse_pcm_rate(mime_type: str) -> int:
+    """Extract the sample rate from a MIME type like "audio/pcm;rate=24000"."""
+    for param in mime_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key == "rate" and value.isdigit():
+            return int(value)
+    return OUTPUT_SAMPLE_RATE
+
 
 class GeminiRealtimeService(InteractionModeService):
     """Google Gemini Live API implementation.
@@ -455,12 +467,14 @@ class GeminiRealtimeService(InteractionModeService):
                     if "inlineData" in part:
                         inline_data = part["inlineData"]
                         mime_type = inline_data.get("mimeType", "")
-                        data_b64 = inline_data.get("data", "")
                         if mime_type.startswith("audio/"):
+                            # Decode once at ingress; audio travels as bytes from here on
+                            audio_bytes = base64.b64decode(inline_data.get("data", ""))
+
                             # Track recv stats
                             now = time.monotonic()
                             self._recv_chunk_count += 1
-                            self._recv_bytes += len(data_b64)
+                            self._recv_bytes += len(audio_bytes)
                             if self._recv_chunk_count == 1:
                                 self._recv_start_time = now
                                 self._recv_first_chunk_time = now
@@ -470,8 +484,9 @@ class GeminiRealtimeService(InteractionModeService):
                                 ResponseEvent(
                                     type="audio",
                                     data={
-                                        "audio": data_b64,
+                                        "audio": audio_bytes,
                                         "format": "pcm16",
+                                        "sample_rate": _parse_pcm_rate(mime_type),
                                     },
                                 )
                             )
@@ -8,9 +8,14 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.domain.entities import LatencyMetrics
+from src.domain.utils.bounded_store import BoundedStore
 
+# Turns that are never cleared (e.g. a dropped connection) expire after this
+TURN_TTL_S = 3600
+MAX_TRACKED_TURNS = 64
 
-@dataclass
+
+@dataclass(slots=True)
 class LatencyMeasurement:
     """Tracks timing points for a single turn."""
 
@@ -33,7 +38,9 @@ class LatencyTracker:
     """
 
     def __init__(self) -> None:
-        self._measurements: dict[UUID, LatencyMeasurement] = {}
+        self._measurements: BoundedStore[UUID, LatencyMeasurement] = BoundedStore(
+            "latency_turns", ttl_s=TURN_TTL_S, max_size=MAX_TRACKED_TURNS
+        )
 
     def start_turn(self, turn_id: UUID) -> None:
         """Start tracking a new turn."""
@@ -41,43 +48,51 @@ class LatencyTracker:
 
     def mark_speech_started(self, turn_id: UUID) -> None:
         """Mark when user speech was detected."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].speech_started_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.speech_started_at = time.perf_counter()
 
     def mark_speech_ended(self, turn_id: UUID) -> None:
         """Mark when user speech ended."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].speech_ended_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.speech_ended_at = time.perf_counter()
 
     def mark_stt_completed(self, turn_id: UUID) -> None:
         """Mark when STT transcription completed (cascade mode)."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].stt_completed_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.stt_completed_at = time.perf_counter()
 
     def mark_llm_first_token(self, turn_id: UUID) -> None:
         """Mark when first LLM token received (cascade mode)."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].llm_first_token_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.llm_first_token_at = time.perf_counter()
 
     def mark_tts_first_byte(self, turn_id: UUID) -> None:
         """Mark when first TTS audio byte received (cascade mode)."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].tts_first_byte_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.tts_first_byte_at = time.perf_counter()
 
     def mark_response_started(self, turn_id: UUID) -> None:
         """Mark when AI response playback started."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].response_started_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.response_started_at = time.perf_counter()
 
     def mark_response_ended(self, turn_id: UUID) -> None:
         """Mark when AI response completed."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].response_ended_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.response_ended_at = time.perf_counter()
 
     def mark_interrupted(self, turn_id: UUID) -> None:
         """Mark when response was interrupted."""
-        if turn_id in self._measurements:
-            self._measurements[turn_id].interrupted_at = time.perf_counter()
+        m = self._measurements.get(turn_id)
+        if m is not None:
+            m.interrupted_at = time.perf_counter()
 
     def get_metrics_realtime(self, turn_id: UUID) -> LatencyMetrics | None:
         """Calculate metrics for Realtime API mode.
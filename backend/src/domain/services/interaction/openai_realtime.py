@@ -323,13 +323,13 @@ class OpenAIRealtimeService(InteractionModeService):
             )
 
         elif event_type == "response.audio.delta":
-            # Decode base64 audio
-            audio_b64 = event.get("delta", "")
+            # Decode base64 audio once at ingress
+            audio_bytes = base64.b64decode(event.get("delta", ""))
             await self._event_queue.put(
                 ResponseEvent(
                     type="audio",
                     data={
-                        "audio": audio_b64,
+                        "audio": audio_bytes,
                         "format": "pcm16",
                         "response_id": event.get("response_id"),
                         "item_id": event.get("item_id"),
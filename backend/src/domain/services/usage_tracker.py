@@ -8,15 +8,20 @@ expose quota query APIs (e.g., Gemini).
 import contextlib
 import logging
 import time
-from collections import defaultdict
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from threading import Lock
 
+from src.domain.utils.bounded_store import BoundedStore
+
 logger = logging.getLogger(__name__)
 
+# The longest usage window is a day, so older data is never reported
+USAGE_TTL_S = 86400
+MAX_TRACKED_USERS = 10_000
 
-@dataclass
+
+@dataclass(slots=True)
 class RateLimitHeaders:
     """Rate limit info captured from provider HTTP response headers."""
 
@@ -90,7 +95,7 @@ def parse_rate_limit_headers(
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageWindow:
     """Usage counters for a time window."""
 
@@ -137,11 +142,16 @@ class ProviderUsageTracker:
     def __init__(self) -> None:
         self._lock = Lock()
         # {user_id: {provider: {window_key: UsageWindow}}}
-        self._usage: dict[str, dict[str, dict[str, UsageWindow]]] = defaultdict(
-            lambda: defaultdict(dict)
+        self._usage: BoundedStore[str, dict[str, dict[str, UsageWindow]]] = BoundedStore(
+            "provider_usage", ttl_s=USAGE_TTL_S, max_size=MAX_TRACKED_USERS
         )
         # {user_id: {provider: RateLimitHeaders}}
-        self._rate_limits: dict[str, dict[str, RateLimitHeaders]] = defaultdict(dict)
+        self._rate_limits: BoundedStore[str, dict[str, RateLimitHeaders]] = BoundedStore(
+            "provider_rate_limits", ttl_s=USAGE_TTL_S, max_size=MAX_TRACKED_USERS
+        )
+
+    def _windows(self, user_id: str, provider: str) -> dict[str, UsageWindow]:
+        return self._usage.get_or_create(user_id, dict).setdefault(provider, {})
 
     def _get_or_reset_window(
         self,
@@ -159,7 +169,7 @@ class ProviderUsageTracker:
     def record_request(self, user_id: str, provider: str) -> None:
         """Record a successful API request."""
         with self._lock:
-            windows = self._usage[user_id][provider]
+            windows = self._windows(user_id, provider)
             now = time.time()
 
             for key, duration in [("minute", 60), ("hour", 3600), ("day", 86400)]:
@@ -175,7 +185,7 @@ class ProviderUsageTracker:
     ) -> None:
         """Store the latest rate limit headers from a provider response."""
         with self._lock:
-            self._rate_limits[user_id][provider] = headers
+            self._rate_limits.get_or_create(user_id, dict)[provider] = headers
 
     def get_rate_limit_headers(
         self,
@@ -184,7 +194,7 @@ class ProviderUsageTracker:
     ) -> RateLimitHeaders | None:
         """Get the most recent rate limit headers for a provider."""
         with self._lock:
-            return self._rate_limits.get(user_id, {}).get(provider)
+            return (self._rate_limits.get(user_id) or {}).get(provider)
 
     def record_error(
         self,
@@ -196,7 +206,7 @@ class ProviderUsageTracker:
     ) -> None:
         """Record an API error."""
         with self._lock:
-            windows = self._usage[user_id][provider]
+            windows = self._windows(user_id, provider)
             now = time.time()
 
             for key, duration in [("minute", 60), ("hour", 3600), ("day", 86400)]:
@@ -210,7 +220,7 @@ class ProviderUsageTracker:
     def get_usage(self, user_id: str, provider: str) -> ProviderUsageSnapshot:
         """Get current usage snapshot for a provider."""
         with self._lock:
-            windows = self._usage.get(user_id, {}).get(provider, {})
+            windows = (self._usage.get(user_id) or {}).get(provider, {})
             now = time.time()
 
             def _get_valid(key: str, duration: float) -> UsageWindow:
@@ -230,7 +240,7 @@ class ProviderUsageTracker:
             warning = _generate_warning(provider, minute, hour, day, estimated_rpm)
 
             # Merge rate limit header data if available
-            rl = self._rate_limits.get(user_id, {}).get(provider)
+            rl = (self._rate_limits.get(user_id) or {}).get(provider)
             rl_limit: int | None = None
             rl_remaining: int | None = None
             rl_reset_at: float | None = None
@@ -264,7 +274,7 @@ class ProviderUsageTracker:
     def get_all_usage(self, user_id: str) -> dict[str, ProviderUsageSnapshot]:
         """Get usage snapshots for all providers a user has used."""
         with self._lock:
-            providers = list(self._usage.get(user_id, {}).keys())
+            providers = list((self._usage.get(user_id) or {}).keys())
 
         return {p: self.get_usage(user_id, p) for p in providers}
 
@@ -0,0 +1,228 @@
+"""Bounded in-memory key-value store.
+
+Long-lived per-user and per-session state (usage counters, rate limit
+windows, session metrics) is kept in memory. A plain ``dict`` keeps every
+key it has ever seen, so these stores expire entries that have not been
+touched for ``ttl_s`` and, past ``max_size`` entries, evict the least
+recently touched one.
+
+Entries are kept in touch order, so expired entries are always at the
+front and are dropped as new ones are written. Every store registers
+itself by name for :func:`store_stats`, which reports entry counts and
+estimated memory use for ``/metrics``. Memory is estimated from the size
+of a few recently touched entries, re-sampled at most every
+``SIZE_SAMPLE_INTERVAL_S``, so a scrape never walks a whole store.
+"""
+
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass, fields, is_dataclass
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Containers nested deeper than this are not followed when estimating size
+_SIZE_DEPTH = 4
+
+# Entries measured per sample, and how long a per-entry size estimate is reused
+SIZE_SAMPLE_ENTRIES = 32
+SIZE_SAMPLE_INTERVAL_S = 60.0
+
+
+class _Slot(Generic[V]):
+    __slots__ = ("value", "touched_at")
+
+    def __init__(self, value: V, touched_at: float) -> None:
+        self.value = value
+        self.touched_at = touched_at
+
+
+class BoundedStore(Generic[K, V]):
+    """Mapping with idle expiry and a size cap, evicting least recently used.
+
+    Not thread-safe; owners that are shared across threads hold their own lock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_s: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            name: Store name for metrics; stores with the same name are summed
+            ttl_s: Seconds an untouched entry is kept
+            max_size: Maximum number of entries
+            clock: Monotonic time source (seconds)
+        """
+        self.name = name
+        self.ttl_s = ttl_s
+        self.max_size = max_size
+        self._clock = clock
+        self._data: OrderedDict[K, _Slot[V]] = OrderedDict()
+        self._entry_bytes = 0
+        self._entry_bytes_at: float | None = None
+        _stores.add(self)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Value for ``key`` (marking it used), or ``default``."""
+        slot = self._live_slot(key)
+        if slot is None:
+            return default
+        self._touch(key, slot)
+        return slot.value
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """Value for ``key``, storing ``factory()`` first if it is missing."""
+        slot = self._live_slot(key)
+        if slot is None:
+            value = factory()
+            self[key] = value
+            return value
+        self._touch(key, slot)
+        return slot.value
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        slot = self._data.pop(key, None)
+        return default if slot is None else slot.value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def prune(self) -> int:
+        """Drop expired entries; returns how many were dropped."""
+        deadline = self._clock() - self.ttl_s
+        dropped = 0
+        while self._data:
+            key, slot = next(iter(self._data.items()))
+            if slot.touched_at > deadline:
+                break
+            del self._data[key]
+            dropped += 1
+        _count_eviction(self.name, "expired", dropped)
+        return dropped
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """Live entries, least recently used first."""
+        self.prune()
+        return ((key, slot.value) for key, slot in list(self._data.items()))
+
+    def values(self) -> Iterator[V]:
+        return (value for _, value in self.items())
+
+    def __getitem__(self, key: K) -> V:
+        slot = self._live_slot(key)
+        if slot is None:
+            raise KeyError(key)
+        self._touch(key, slot)
+        return slot.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = _Slot(value, self._clock())
+        self._data.move_to_end(key)
+        self.prune()
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            _count_eviction(self.name, "capacity")
+
+    def __contains__(self, key: object) -> bool:
+        return self._live_slot(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        self.prune()
+        return len(self._data)
+
+    def _live_slot(self, key: K) -> _Slot[V] | None:
+        slot = self._data.get(key)
+        if slot is not None and self._clock() - slot.touched_at >= self.ttl_s:
+            del self._data[key]
+            _count_eviction(self.name, "expired")
+            return None
+        return slot
+
+    def _touch(self, key: K, slot: _Slot[V]) -> None:
+        slot.touched_at = self._clock()
+        self._data.move_to_end(key)
+
+    def memory_bytes(self) -> int:
+        """Estimated memory held by the store and its entries.
+
+        Extrapolated from a sample of the most recently touched entries; the
+        per-entry size is re-measured at most every ``SIZE_SAMPLE_INTERVAL_S``.
+        """
+        now = self._clock()
+        if self._entry_bytes_at is None or now - self._entry_bytes_at >= SIZE_SAMPLE_INTERVAL_S:
+            try:
+                sample = list(islice(reversed(self._data.items()), SIZE_SAMPLE_ENTRIES))
+            except RuntimeError:
+                # Written to from another thread mid-sample; keep the last estimate
+                sample = []
+            if sample:
+                self._entry_bytes = sum(
+                    sys.getsizeof(slot) + _sizeof(key) + _sizeof(slot.value) for key, slot in sample
+                ) // len(sample)
+                self._entry_bytes_at = now
+        return sys.getsizeof(self._data) + len(self._data) * self._entry_bytes
+
+
+def _sizeof(obj: Any, depth: int = 0) -> int:
+    size = sys.getsizeof(obj)
+    if depth >= _SIZE_DEPTH or isinstance(obj, str | bytes | int | float | bool):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(
+            _sizeof(k, depth + 1) + _sizeof(v, depth + 1) for k, v in list(obj.items())
+        )
+    if isinstance(obj, list | tuple | set | frozenset):
+        return size + sum(_sizeof(item, depth + 1) for item in list(obj))
+    if is_dataclass(obj):
+        return size + sum(_sizeof(getattr(obj, f.name), depth + 1) for f in fields(obj))
+    return size
+
+
+_stores: "weakref.WeakSet[BoundedStore[Any, Any]]" = weakref.WeakSet()
+
+# Evictions by (store name, reason), kept across the stores' lifetimes
+_evictions: dict[tuple[str, str], int] = {}
+
+
+def _count_eviction(name: str, reason: str, count: int = 1) -> None:
+    if count:
+        _evictions[name, reason] = _evictions.get((name, reason), 0) + count
+
+
+@dataclass(frozen=True, slots=True)
+class StoreStats:
+    """Totals for the live stores sharing a name."""
+
+    name: str
+    stores: int
+    entries: int
+    memory_bytes: int
+
+
+def store_stats() -> list[StoreStats]:
+    """Entry counts and estimated memory use of every live store, by name.
+
+    Entries that expired but were not yet dropped are still counted.
+    """
+    totals: dict[str, list[int]] = {}
+    for store in list(_stores):
+        total = totals.setdefault(store.name, [0, 0, 0])
+        total[0] += 1
+        total[1] += len(store._data)
+        total[2] += store.memory_bytes()
+    return [StoreStats(name, *total) for name, total in sorted(totals.items())]
+
+
+def store_evictions() -> dict[tuple[str, str], int]:
+    """Entries dropped so far by (store name, reason: expired or capacity)."""
+    return dict(_evictions)
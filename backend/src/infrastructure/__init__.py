@@ -10,14 +10,23 @@ Note: Provider classes are imported lazily in the DI container
 to avoid import errors when dependencies are not installed.
 """
 
+from typing import Any
+
 from src.infrastructure.persistence import (
     InMemoryTestRecordRepository,
     InMemoryVoiceRepository,
 )
-from src.infrastructure.storage import (
-    LocalStorageService,
-    S3StorageService,
-)
+from src.infrastructure.storage import LocalStorageService
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on access so that aioboto3 is only imported when S3 is used
+    if name == "S3StorageService":
+        from src.infrastructure import storage
+
+        return storage.S3StorageService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Repositories
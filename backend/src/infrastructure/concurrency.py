@@ -9,6 +9,8 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
+from src.application.services.metrics import MetricFamily
+
 T = TypeVar("T")
 
 
@@ -178,6 +180,26 @@ class ConcurrencyManager:
             "provider_available": {p: s._value for p, s in self._provider_semaphores.items()},
         }
 
+    def collect_metrics(self) -> list[MetricFamily]:
+        """Queue depth, slots in use and request outcomes, for /metrics."""
+        queue = MetricFamily(
+            "voicelab_synthesis_queue_depth", "gauge", "Synthesis requests queued or running"
+        )
+        queue.add(self._queue_size)
+        in_use = MetricFamily(
+            "voicelab_synthesis_slots_in_use", "gauge", "Concurrency slots in use per provider"
+        )
+        for provider, semaphore in self._provider_semaphores.items():
+            in_use.add(
+                self.config.get_provider_limit(provider) - semaphore._value, provider=provider
+            )
+        requests = MetricFamily(
+            "voicelab_synthesis_requests", "counter", "Synthesis requests by outcome"
+        )
+        for outcome in ("completed", "rejected", "timeout"):
+            requests.add(self._stats[f"{outcome}_requests"], outcome=outcome)
+        return [queue, in_use, requests]
+
     def get_availability(self, provider: str) -> dict[str, int]:
         """Get availability info for a provider."""
         provider_sem = self._get_provider_semaphore(provider)
@@ -304,6 +326,21 @@ class ProviderCircuitBreaker:
 
         return status
 
+    def collect_metrics(self) -> list[MetricFamily]:
+        """Circuit state (one series per state, 1 = current) and failures, for /metrics."""
+        state = MetricFamily(
+            "voicelab_circuit_breaker_state", "gauge", "Circuit breaker state per provider"
+        )
+        failures = MetricFamily(
+            "voicelab_circuit_breaker_failures", "gauge", "Failures counted toward opening"
+        )
+        for provider in sorted(self._state.keys() | self._failures.keys()):
+            current = self._state.get(provider, "closed")
+            for name in ("closed", "open", "half_open"):
+                state.add(int(name == current), provider=provider, state=name)
+            failures.add(self._failures.get(provider, 0), provider=provider)
+        return [state, failures]
+
 
 # Default circuit breaker instance
 default_circuit_breaker = ProviderCircuitBreaker()
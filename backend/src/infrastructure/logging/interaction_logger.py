@@ -14,6 +14,12 @@ from uuid import UUID
 
 import structlog
 
+from src.domain.utils.bounded_store import BoundedStore
+
+# Sessions untouched this long are dropped from the metrics
+SESSION_TTL_S = 6 * 3600
+MAX_TRACKED_SESSIONS = 10_000
+
 # Configure structlog for JSON output
 structlog.configure(
     processors=[
@@ -31,7 +37,18 @@ structlog.configure(
 )
 
 
-@dataclass
+@dataclass(slots=True)
+class SessionStats:
+    """Counters for a single session."""
+
+    mode: str
+    start_time: float = field(default_factory=time.time)
+    end_time: float | None = None
+    turns: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
 class ProviderMetrics:
     """Metrics for a single provider."""
 
@@ -76,7 +93,9 @@ class InteractionMetrics:
     def _initialize(self) -> None:
         """Initialize metrics storage."""
         self._providers: dict[str, ProviderMetrics] = defaultdict(ProviderMetrics)
-        self._sessions: dict[UUID, dict[str, Any]] = {}
+        self._sessions: BoundedStore[UUID, SessionStats] = BoundedStore(
+            "interaction_sessions", ttl_s=SESSION_TTL_S, max_size=MAX_TRACKED_SESSIONS
+        )
         self._lock = Lock()
 
     def record_call(
@@ -110,30 +129,28 @@ class InteractionMetrics:
     def start_session(self, session_id: UUID, mode: str) -> None:
         """Record session start."""
         with self._lock:
-            self._sessions[session_id] = {
-                "start_time": time.time(),
-                "mode": mode,
-                "turns": 0,
-                "errors": 0,
-            }
+            self._sessions[session_id] = SessionStats(mode=mode)
 
     def end_session(self, session_id: UUID) -> None:
         """Record session end."""
         with self._lock:
-            if session_id in self._sessions:
-                self._sessions[session_id]["end_time"] = time.time()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.end_time = time.time()
 
     def record_turn(self, session_id: UUID) -> None:
         """Record a conversation turn."""
         with self._lock:
-            if session_id in self._sessions:
-                self._sessions[session_id]["turns"] += 1
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.turns += 1
 
     def record_session_error(self, session_id: UUID) -> None:
         """Record an error in a session."""
         with self._lock:
-            if session_id in self._sessions:
-                self._sessions[session_id]["errors"] += 1
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.errors += 1
 
     def get_provider_metrics(self, provider: str) -> dict[str, Any]:
         """Get metrics for a provider."""
@@ -165,7 +182,7 @@ class InteractionMetrics:
                     }
                     for name, m in self._providers.items()
                 },
-                "active_sessions": len([s for s in self._sessions.values() if "end_time" not in s]),
+                "active_sessions": sum(1 for s in self._sessions.values() if s.end_time is None),
                 "total_sessions": len(self._sessions),
             }
 
@@ -0,0 +1,236 @@
+"""On-demand memory diagnostics for long-running workers.
+
+``tracemalloc`` is switched on and off at runtime: tracing slows every
+allocation down, so it only runs while someone is looking for a leak.
+While it runs, snapshots can be taken and two of them diffed, grouped by
+file or by line, to show where the memory between them was allocated.
+
+Independently of tracing, :meth:`MemoryDiagnostics.live_objects` walks the
+garbage collector's objects to count live audio buffers (``bytes``,
+``bytearray``, pydub ``AudioSegment``) and the per-session buffers of
+active interaction sessions (audio buffer, queued events). The walk holds
+the GIL for its whole duration, so callers run it in a worker thread.
+"""
+
+import gc
+import io
+import itertools
+import logging
+import os
+import sys
+import threading
+import tracemalloc
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from src.domain.services.interaction.base import InteractionModeService
+
+logger = logging.getLogger(__name__)
+
+# Snapshots kept in memory; each one holds a copy of every traced allocation
+MAX_SNAPSHOTS = 4
+
+# bytes objects smaller than this are interned names and small constants
+MIN_BUFFER_BYTES = 1024
+
+GroupBy = Literal["filename", "lineno"]
+
+# Allocations made by the diagnostics themselves and by the import system
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    """A stored tracemalloc snapshot."""
+
+    id: int
+    label: str
+    taken_at: datetime
+    traced_bytes: int
+    traced_blocks: int
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError, AttributeError):
+        return None
+
+
+def _buffer_size(buffer: Any) -> int:
+    if isinstance(buffer, io.BytesIO):
+        # Includes the BytesIO's internal buffer, without copying it
+        return sys.getsizeof(buffer)
+    if isinstance(buffer, bytes | bytearray):
+        return len(buffer)
+    return 0
+
+
+class MemoryDiagnostics:
+    """Runtime-toggled tracemalloc snapshots and live buffer counts."""
+
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS) -> None:
+        """Initialize the diagnostics.
+
+        Args:
+            max_snapshots: Snapshots kept; the oldest is dropped past this
+        """
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[int, tuple[SnapshotInfo, tracemalloc.Snapshot]] = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """Start tracing allocations, keeping ``frames`` frames per allocation."""
+        if tracemalloc.is_tracing():
+            return
+        tracemalloc.start(frames)
+        logger.info("Memory tracing started (%d frame(s))", frames)
+
+    def stop(self) -> None:
+        """Stop tracing. Stored snapshots remain available for diffs."""
+        if not tracemalloc.is_tracing():
+            return
+        tracemalloc.stop()
+        logger.info("Memory tracing stopped")
+
+    def take_snapshot(self, label: str = "") -> SnapshotInfo:
+        """Snapshot the traced allocations.
+
+        Raises:
+            RuntimeError: If tracing is not running
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is not running")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        stats = snapshot.statistics("filename")
+        with self._lock:
+            info = SnapshotInfo(
+                id=next(self._ids),
+                label=label,
+                taken_at=datetime.now(UTC),
+                traced_bytes=sum(s.size for s in stats),
+                traced_blocks=sum(s.count for s in stats),
+            )
+            self._snapshots[info.id] = (info, snapshot)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return info
+
+    def snapshots(self) -> list[SnapshotInfo]:
+        with self._lock:
+            return [info for info, _ in self._snapshots.values()]
+
+    def diff(
+        self,
+        base_id: int,
+        target_id: int,
+        group_by: GroupBy = "lineno",
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Allocation changes from one snapshot to another, largest growth first.
+
+        Raises:
+            KeyError: If either snapshot is unknown (or was dropped)
+        """
+        with self._lock:
+            _, base = self._snapshots[base_id]
+            _, target = self._snapshots[target_id]
+        changes = target.compare_to(base, group_by)
+        return [
+            {
+                "file": stat.traceback[0].filename,
+                "line": stat.traceback[0].lineno if group_by == "lineno" else None,
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in changes[:limit]
+        ]
+
+    def live_objects(self) -> dict[str, Any]:
+        """Live audio buffers and per-session buffers, found through the GC."""
+        gc.collect()
+        containers = gc.get_objects()
+        # bytes are not tracked by the GC, so they are found through their owners
+        buffers: dict[int, int] = {}
+        segments = segment_bytes = 0
+        sessions: list[dict[str, Any]] = []
+        for obj in containers:
+            if type(obj).__name__ == "AudioSegment" and type(obj).__module__.startswith("pydub"):
+                segments += 1
+                segment_bytes += len(getattr(obj, "_data", b""))
+            elif isinstance(obj, InteractionModeService):
+                sessions.append(self._session_buffers(obj))
+            for referent in gc.get_referents(obj):
+                if isinstance(referent, bytes | bytearray) and len(referent) >= MIN_BUFFER_BYTES:
+                    buffers[id(referent)] = len(referent)
+        del containers
+        return {
+            "bytes_buffers": {
+                "count": len(buffers),
+                "total_bytes": sum(buffers.values()),
+                "min_size_bytes": MIN_BUFFER_BYTES,
+            },
+            "audio_segments": {"count": segments, "total_bytes": segment_bytes},
+            "sessions": sessions,
+        }
+
+    @staticmethod
+    def _session_buffers(service: InteractionModeService) -> dict[str, Any]:
+        session_id = getattr(service, "_session_id", None)
+        queue = getattr(service, "_event_queue", None)
+        return {
+            "mode": service.mode_name,
+            "session_id": str(session_id) if session_id is not None else None,
+            "connected": service.is_connected(),
+            "audio_buffer_bytes": _buffer_size(getattr(service, "_audio_buffer", None)),
+            "queued_events": queue.qsize() if queue is not None else 0,
+        }
+
+    def status(self) -> dict[str, Any]:
+        """Tracing state, process memory and stored snapshots."""
+        traced, peak = tracemalloc.get_traced_memory() if self.tracing else (0, 0)
+        return {
+            "tracing": self.tracing,
+            "frames": tracemalloc.get_traceback_limit() if self.tracing else None,
+            "traced_bytes": traced,
+            "traced_peak_bytes": peak,
+            "rss_bytes": current_rss_bytes(),
+            "snapshots": [
+                {
+                    "id": info.id,
+                    "label": info.label,
+                    "taken_at": info.taken_at.isoformat(),
+                    "traced_bytes": info.traced_bytes,
+                    "traced_blocks": info.traced_blocks,
+                }
+                for info in self.snapshots()
+            ],
+        }
+
+
+_diagnostics: MemoryDiagnostics | None = None
+
+
+def get_memory_diagnostics() -> MemoryDiagnostics:
+    """Process-wide memory diagnostics."""
+    global _diagnostics
+    if _diagnostics is None:
+        _diagnostics = MemoryDiagnostics()
+    return _diagnostics
@@ -0,0 +1,134 @@
+"""OTLP/HTTP (JSON) export of request traces.
+
+Sends finished traces to an OpenTelemetry collector's ``/v1/traces``
+endpoint in batches from a background task, so requests never wait on the
+collector. When the collector is down or slow, spans beyond the buffer are
+dropped rather than queued without bound.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Any
+
+import httpx
+
+from src.application.services.tracing import Span, Trace
+
+logger = logging.getLogger(__name__)
+
+# Spans buffered between flushes; older ones are dropped when full
+MAX_QUEUED_SPANS = 10_000
+
+_STATUS_ERROR = 2
+_KIND_INTERNAL = 1
+_KIND_SERVER = 2
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def span_to_otlp(span: Span, remote_parent_id: str | None = None) -> dict[str, Any]:
+    """Encode a span in the OTLP JSON mapping (hex IDs, nanosecond strings)."""
+    duration_ns = int((span.duration_ms or 0.0) * 1e6)
+    encoded: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        # The request's root span is the one without a local parent
+        "kind": _KIND_SERVER if span.parent_id in (None, remote_parent_id) else _KIND_INTERNAL,
+        "startTimeUnixNano": str(span.start_unix_ns),
+        "endTimeUnixNano": str(span.start_unix_ns + duration_ns),
+        "attributes": [_attribute(k, v) for k, v in span.attributes.items() if v is not None],
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    if span.error:
+        encoded["status"] = {"code": _STATUS_ERROR, "message": span.error}
+    return encoded
+
+
+class OTLPSpanExporter:
+    """Batches traces and posts them to an OTLP/HTTP collector."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        flush_interval_s: float = 5.0,
+        max_batch_size: int = 512,
+        timeout_s: float = 5.0,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            endpoint: Collector base URL (e.g. http://localhost:4318)
+            service_name: Value of the ``service.name`` resource attribute
+            flush_interval_s: Interval of the background flush
+            max_batch_size: Spans per export request
+            timeout_s: Timeout of one export request
+        """
+        self._url = endpoint.rstrip("/") + "/v1/traces"
+        self._service_name = service_name
+        self._flush_interval_s = flush_interval_s
+        self._max_batch_size = max_batch_size
+        self._timeout_s = timeout_s
+        self._queue: deque[dict[str, Any]] = deque(maxlen=MAX_QUEUED_SPANS)
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def export(self, trace: Trace) -> None:
+        """Queue a finished trace's spans; called on the request path."""
+        self._queue.extend(span_to_otlp(s, trace.remote_parent_id) for s in trace.spans)
+
+    async def start(self) -> None:
+        self._client = httpx.AsyncClient(timeout=self._timeout_s)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background flush and send what is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def flush(self) -> None:
+        """Post queued spans in batches; a failed batch is dropped and logged."""
+        while self._queue and self._client is not None:
+            batch = [
+                self._queue.popleft() for _ in range(min(self._max_batch_size, len(self._queue)))
+            ]
+            try:
+                response = await self._client.post(self._url, json=self._payload(batch))
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning("Dropped %d spans, OTLP export failed: %s", len(batch), e)
+                return
+
+    def _payload(self, spans: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_attribute("service.name", self._service_name)]},
+                    "scopeSpans": [{"scope": {"name": "voicelab"}, "spans": spans}],
+                }
+            ]
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            await self.flush()
@@ -1,9 +1,18 @@
 import os
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
+from src.config import get_settings
+from src.infrastructure.persistence.pool_metrics import InstrumentedQueuePool, instrument_engine
+
 load_dotenv()
 
 
@@ -29,9 +38,44 @@ def get_database_url() -> str:
     return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{name}"
 
 
+def create_engine_from_settings(url: str, name: str) -> AsyncEngine:
+    """Create an instrumented async engine with the configured pool.
+
+    Args:
+        url: Database URL
+        name: Label for the engine in pool metrics
+
+    Returns:
+        The async engine
+    """
+    settings = get_settings()
+    db_url = make_url(url)
+    options: dict = {"echo": False}
+
+    if db_url.get_backend_name() == "postgresql":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+    if db_url.get_driver_name() == "asyncpg":
+        # asyncpg's own statement cache, plus SQLAlchemy's prepared statement cache
+        options["connect_args"] = {"statement_cache_size": settings.db_statement_cache_size}
+        db_url = db_url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_prepared_statement_cache_size)}
+        )
+
+    async_engine = create_async_engine(db_url, **options)
+    instrument_engine(async_engine.sync_engine, name, settings.db_slow_query_ms)
+    return async_engine
+
+
 DATABASE_URL = get_database_url()
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = create_engine_from_settings(DATABASE_URL, "primary")
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -39,6 +83,17 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica for history/analytics queries
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL") or get_settings().database_read_url
+
+read_engine = create_engine_from_settings(DATABASE_READ_URL, "read") if DATABASE_READ_URL else None
+
+AsyncReadSessionLocal = (
+    async_sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -51,3 +106,10 @@ async def get_db():
 
 # Alias for the dependency
 get_db_session = get_db
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections (application shutdown)."""
+    await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
@@ -5,9 +5,13 @@ T015: Concrete repository implementation for interaction sessions.
 
 from collections.abc import Sequence
 from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import (
@@ -17,12 +21,17 @@ from src.domain.entities import (
     LatencyMetrics,
     SessionStatus,
 )
-from src.domain.repositories.interaction_repository import InteractionRepository
+from src.domain.pagination import PageCursor
+from src.domain.repositories.interaction_repository import (
+    InteractionRepository,
+    LatencyGroupBy,
+)
 from src.infrastructure.persistence.models import (
     ConversationTurnModel,
     InteractionSessionModel,
     LatencyMetricsModel,
 )
+from src.infrastructure.persistence.pagination import paginate_after, split_page
 
 
 class SQLAlchemyInteractionRepository(InteractionRepository):
@@ -98,24 +107,15 @@ class SQLAlchemyInteractionRepository(InteractionRepository):
         page: int = 1,
         page_size: int = 20,
     ) -> tuple[Sequence[InteractionSession], int]:
-        query = select(InteractionSessionModel).where(InteractionSessionModel.user_id == user_id)
-
-        if mode:
-            query = query.where(InteractionSessionModel.mode == mode)
-        if status:
-            query = query.where(InteractionSessionModel.status == status)
-        if start_date:
-            query = query.where(InteractionSessionModel.started_at >= start_date)
-        if end_date:
-            query = query.where(InteractionSessionModel.started_at <= end_date)
+        query = self._sessions_query(user_id, mode, status, start_date, end_date)
 
         # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar() or 0
+        total = await self.count_sessions(user_id, mode, status, start_date, end_date)
 
         # Paginate
-        query = query.order_by(InteractionSessionModel.started_at.desc())
+        query = query.order_by(
+            InteractionSessionModel.started_at.desc(), InteractionSessionModel.id.desc()
+        )
         query = query.offset((page - 1) * page_size).limit(page_size)
 
         result = await self._session.execute(query)
@@ -124,6 +124,62 @@ class SQLAlchemyInteractionRepository(InteractionRepository):
         sessions = [self._session_model_to_entity(m) for m in models]
         return sessions, total
 
+    async def list_sessions_after(
+        self,
+        user_id: UUID,
+        mode: InteractionMode | None = None,
+        status: SessionStatus | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 20,
+    ) -> tuple[Sequence[InteractionSession], PageCursor | None]:
+        query = paginate_after(
+            self._sessions_query(user_id, mode, status, start_date, end_date),
+            InteractionSessionModel.started_at,
+            InteractionSessionModel.id,
+            cursor,
+            limit,
+        )
+        result = await self._session.execute(query)
+        models, next_cursor = split_page(
+            result.scalars().all(), limit, lambda m: (m.started_at, m.id)
+        )
+        return [self._session_model_to_entity(m) for m in models], next_cursor
+
+    async def count_sessions(
+        self,
+        user_id: UUID,
+        mode: InteractionMode | None = None,
+        status: SessionStatus | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
+        query = self._sessions_query(user_id, mode, status, start_date, end_date)
+        count_query = select(func.count()).select_from(query.subquery())
+        count_result = await self._session.execute(count_query)
+        return count_result.scalar() or 0
+
+    @staticmethod
+    def _sessions_query(
+        user_id: UUID,
+        mode: InteractionMode | None,
+        status: SessionStatus | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> Select:
+        query = select(InteractionSessionModel).where(InteractionSessionModel.user_id == user_id)
+
+        if mode:
+            query = query.where(InteractionSessionModel.mode == mode)
+        if status:
+            query = query.where(InteractionSessionModel.status == status)
+        if start_date:
+            query = query.where(InteractionSessionModel.started_at >= start_date)
+        if end_date:
+            query = query.where(InteractionSessionModel.started_at <= end_date)
+        return query
+
     # Turn operations
     async def create_turn(self, turn: ConversationTurn) -> ConversationTurn:
         model = ConversationTurnModel(
@@ -165,6 +221,40 @@ class SQLAlchemyInteractionRepository(InteractionRepository):
             await self._session.flush()
         return turn
 
+    async def save_turns(self, turns: Sequence[ConversationTurn]) -> None:
+        if not turns:
+            return
+        stmt = insert(ConversationTurnModel).values(
+            [
+                {
+                    "id": turn.id,
+                    "session_id": turn.session_id,
+                    "turn_number": turn.turn_number,
+                    "user_audio_path": turn.user_audio_path,
+                    "user_transcript": turn.user_transcript,
+                    "ai_response_text": turn.ai_response_text,
+                    "ai_audio_path": turn.ai_audio_path,
+                    "interrupted": turn.interrupted,
+                    "started_at": turn.started_at,
+                    "ended_at": turn.ended_at,
+                    "created_at": turn.created_at,
+                }
+                for turn in turns
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ConversationTurnModel.id],
+            set_={
+                "user_audio_path": stmt.excluded.user_audio_path,
+                "user_transcript": stmt.excluded.user_transcript,
+                "ai_response_text": stmt.excluded.ai_response_text,
+                "ai_audio_path": stmt.excluded.ai_audio_path,
+                "interrupted": stmt.excluded.interrupted,
+                "ended_at": stmt.excluded.ended_at,
+            },
+        )
+        await self._session.execute(stmt)
+
     async def list_turns(self, session_id: UUID) -> Sequence[ConversationTurn]:
         result = await self._session.execute(
             select(ConversationTurnModel)
@@ -212,6 +302,27 @@ class SQLAlchemyInteractionRepository(InteractionRepository):
         await self._session.flush()
         return metrics
 
+    async def create_latency_metrics_batch(self, metrics: Sequence[LatencyMetrics]) -> None:
+        if not metrics:
+            return
+        await self._session.execute(
+            insert(LatencyMetricsModel).values(
+                [
+                    {
+                        "id": m.id,
+                        "turn_id": m.turn_id,
+                        "total_latency_ms": m.total_latency_ms,
+                        "stt_latency_ms": m.stt_latency_ms,
+                        "llm_ttft_ms": m.llm_ttft_ms,
+                        "tts_ttfb_ms": m.tts_ttfb_ms,
+                        "realtime_latency_ms": m.realtime_latency_ms,
+                        "created_at": m.created_at,
+                    }
+                    for m in metrics
+                ]
+            )
+        )
+
     async def get_latency_metrics(self, turn_id: UUID) -> LatencyMetrics | None:
         result = await self._session.execute(
             select(LatencyMetricsModel).where(LatencyMetricsModel.turn_id == turn_id)
@@ -220,46 +331,107 @@ class SQLAlchemyInteractionRepository(InteractionRepository):
         return self._latency_model_to_entity(model) if model else None
 
     async def get_session_latency_stats(self, session_id: UUID) -> dict[str, float | int | None]:
-        # Get all latency metrics for session turns
+        # Aggregate in Postgres; only one row comes back regardless of turn count
+        total = LatencyMetricsModel.total_latency_ms
         result = await self._session.execute(
-            select(LatencyMetricsModel)
+            select(
+                func.count().label("total_turns"),
+                func.avg(total).label("avg_total_ms"),
+                func.min(total).label("min_total_ms"),
+                func.max(total).label("max_total_ms"),
+                func.percentile_cont(0.95).within_group(total).label("p95_total_ms"),
+                func.avg(LatencyMetricsModel.stt_latency_ms).label("avg_stt_ms"),
+                func.avg(LatencyMetricsModel.llm_ttft_ms).label("avg_llm_ttft_ms"),
+                func.avg(LatencyMetricsModel.tts_ttfb_ms).label("avg_tts_ttfb_ms"),
+            )
             .join(ConversationTurnModel)
             .where(ConversationTurnModel.session_id == session_id)
         )
-        models = result.scalars().all()
+        return {key: _to_number(value) for key, value in result.one()._mapping.items()}
 
-        if not models:
+    async def get_latency_analytics(
+        self,
+        group_by: LatencyGroupBy,
+        user_id: UUID | None = None,
+        mode: InteractionMode | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        keys = self._latency_group_keys(group_by)
+        total = LatencyMetricsModel.total_latency_ms
+
+        query = (
+            select(
+                *(column.label(name) for name, column in keys.items()),
+                func.count().label("turns"),
+                func.avg(total).label("avg_total_ms"),
+                func.min(total).label("min_total_ms"),
+                func.max(total).label("max_total_ms"),
+                func.percentile_cont(0.5).within_group(total).label("p50_total_ms"),
+                func.percentile_cont(0.95).within_group(total).label("p95_total_ms"),
+                func.percentile_cont(0.99).within_group(total).label("p99_total_ms"),
+                func.avg(LatencyMetricsModel.stt_latency_ms).label("avg_stt_ms"),
+                func.avg(LatencyMetricsModel.llm_ttft_ms).label("avg_llm_ttft_ms"),
+                func.avg(LatencyMetricsModel.tts_ttfb_ms).label("avg_tts_ttfb_ms"),
+                func.avg(LatencyMetricsModel.realtime_latency_ms).label("avg_realtime_ms"),
+            )
+            .select_from(LatencyMetricsModel)
+            .join(ConversationTurnModel)
+            .join(InteractionSessionModel)
+            .group_by(*keys.values())
+            .limit(limit)
+        )
+
+        if user_id:
+            query = query.where(InteractionSessionModel.user_id == user_id)
+        if mode:
+            query = query.where(InteractionSessionModel.mode == mode)
+        if start_date:
+            query = query.where(LatencyMetricsModel.created_at >= start_date)
+        if end_date:
+            query = query.where(LatencyMetricsModel.created_at <= end_date)
+
+        if group_by in ("hour", "day"):
+            query = query.order_by(keys["bucket"].desc())
+        else:
+            query = query.order_by(func.count().desc())
+
+        result = await self._session.execute(query)
+        rows = []
+        for row in result.all():
+            values = row._mapping
+            rows.append(
+                {
+                    "key": {name: _to_key(values[name]) for name in keys},
+                    **{
+                        name: _to_number(value)
+                        for name, value in values.items()
+                        if name not in keys
+                    },
+                }
+            )
+        return rows
+
+    @staticmethod
+    def _latency_group_keys(group_by: LatencyGroupBy) -> dict[str, Any]:
+        config = InteractionSessionModel.provider_config
+        if group_by == "session":
+            return {"session_id": InteractionSessionModel.id}
+        if group_by == "mode":
+            return {"mode": InteractionSessionModel.mode}
+        if group_by == "provider":
+            # Cascade sessions record an STT/LLM/TTS triple; realtime a single provider
             return {
-                "total_turns": 0,
-                "avg_total_ms": None,
-                "min_total_ms": None,
-                "max_total_ms": None,
-                "p95_total_ms": None,
-                "avg_stt_ms": None,
-                "avg_llm_ttft_ms": None,
-                "avg_tts_ttfb_ms": None,
+                "mode": InteractionSessionModel.mode,
+                "provider": config["provider"].astext,
+                "stt_provider": config["stt_provider"].astext,
+                "llm_provider": config["llm_provider"].astext,
+                "tts_provider": config["tts_provider"].astext,
             }
-
-        total_latencies = [m.total_latency_ms for m in models]
-        stt_latencies = [m.stt_latency_ms for m in models if m.stt_latency_ms is not None]
-        llm_latencies = [m.llm_ttft_ms for m in models if m.llm_ttft_ms is not None]
-        tts_latencies = [m.tts_ttfb_ms for m in models if m.tts_ttfb_ms is not None]
-
-        # Calculate P95
-        sorted_total = sorted(total_latencies)
-        p95_idx = int(len(sorted_total) * 0.95)
-        p95_total = sorted_total[min(p95_idx, len(sorted_total) - 1)]
-
-        return {
-            "total_turns": len(models),
-            "avg_total_ms": sum(total_latencies) / len(total_latencies),
-            "min_total_ms": min(total_latencies),
-            "max_total_ms": max(total_latencies),
-            "p95_total_ms": p95_total,
-            "avg_stt_ms": sum(stt_latencies) / len(stt_latencies) if stt_latencies else None,
-            "avg_llm_ttft_ms": sum(llm_latencies) / len(llm_latencies) if llm_latencies else None,
-            "avg_tts_ttfb_ms": sum(tts_latencies) / len(tts_latencies) if tts_latencies else None,
-        }
+        if group_by in ("hour", "day"):
+            return {"bucket": func.date_trunc(group_by, LatencyMetricsModel.created_at)}
+        raise ValueError(f"Unsupported latency grouping: {group_by}")
 
     # Helper methods
     def _session_model_to_entity(self, model: InteractionSessionModel) -> InteractionSession:
@@ -305,3 +477,21 @@ class SQLAlchemyInteractionRepository(InteractionRepository):
             realtime_latency_ms=model.realtime_latency_ms,
             created_at=model.created_at,
         )
+
+
+def _to_number(value: Any) -> float | int | None:
+    """Convert SQL aggregate results (Decimal averages) to JSON-friendly numbers."""
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _to_key(value: Any) -> str | None:
+    """Render a group key (UUID, enum or bucket timestamp) as a string."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
@@ -0,0 +1,184 @@
+"""Write-behind persistence for live interaction sessions.
+
+A live session's turns and latency metrics are kept in memory and written
+to PostgreSQL in batches by a background task, so no database round trip
+sits on the WebSocket event path. Turn numbers are allocated locally, and
+repeated updates to a turn between flushes collapse into a single upsert.
+Everything still pending is written when the session closes.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import ConversationTurn, InteractionSession, LatencyMetrics
+from src.infrastructure.persistence.interaction_repository_impl import (
+    SQLAlchemyInteractionRepository,
+)
+
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+DEFAULT_FLUSH_THRESHOLD = 32
+
+logger = logging.getLogger(__name__)
+
+
+class InteractionWriteBehind:
+    """Buffers one interaction session's writes and flushes them in batches.
+
+    Each flush runs in its own database session and transaction, so it never
+    shares an AsyncSession with the request that owns the WebSocket.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            session_factory: Creates database sessions (e.g. AsyncSessionLocal)
+            flush_interval_s: Interval of the periodic background flush
+            flush_threshold: Pending writes that trigger an immediate background flush
+        """
+        self._session_factory = session_factory
+        self._flush_interval_s = flush_interval_s
+        self._flush_threshold = flush_threshold
+
+        self._session: InteractionSession | None = None
+        self._session_dirty = False
+        self._turns: dict[UUID, ConversationTurn] = {}
+        self._metrics: list[LatencyMetrics] = []
+        self._last_turn_number = 0
+
+        self._lock = asyncio.Lock()
+        self._pending: set[asyncio.Task[None]] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of turns, metrics and session updates not yet written."""
+        return len(self._turns) + len(self._metrics) + int(self._session_dirty)
+
+    async def start_session(self, session: InteractionSession) -> InteractionSession:
+        """Write a new session immediately; later writes reference its row.
+
+        Starting another session on the same store (a client re-sending its
+        config) first writes what the previous session left pending and
+        replaces its periodic flush.
+        """
+        await self._stop_periodic_flush()
+        if self._session is not None:
+            await self._flush_logged()
+
+        async with self._session_factory() as db:
+            session = await SQLAlchemyInteractionRepository(db).create_session(session)
+            await db.commit()
+        self._session = session
+        self._last_turn_number = 0
+        self._flush_task = asyncio.create_task(self._periodic_flush())
+        return session
+
+    def next_turn_number(self) -> int:
+        """Allocate the next turn number without querying the database."""
+        self._last_turn_number += 1
+        return self._last_turn_number
+
+    def save_turn(self, turn: ConversationTurn) -> None:
+        """Queue a new or updated turn; updates before the next flush coalesce."""
+        self._turns[turn.id] = turn
+        self._maybe_flush()
+
+    def add_latency_metrics(self, metrics: LatencyMetrics) -> None:
+        """Queue latency metrics for a turn."""
+        self._metrics.append(metrics)
+        self._maybe_flush()
+
+    def update_session(self, session: InteractionSession) -> None:
+        """Queue the session's current state (status, end time)."""
+        self._session = session
+        self._session_dirty = True
+
+    def _maybe_flush(self) -> None:
+        if self.pending_writes >= self._flush_threshold and not self._lock.locked():
+            task = asyncio.create_task(self._flush_logged())
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """Write everything pending in one transaction.
+
+        On failure the batch is queued again for the next flush.
+        """
+        async with self._lock:
+            if not self.pending_writes:
+                return
+
+            turns = list(self._turns.values())
+            metrics = self._metrics
+            session = self._session if self._session_dirty else None
+            self._turns = {}
+            self._metrics = []
+            self._session_dirty = False
+
+            try:
+                async with self._session_factory() as db:
+                    repository = SQLAlchemyInteractionRepository(db)
+                    # Turns first: metrics reference them
+                    await repository.save_turns(turns)
+                    await repository.create_latency_metrics_batch(metrics)
+                    if session is not None:
+                        await repository.update_session(session)
+                    await db.commit()
+            except Exception:
+                # Keep newer queued state; the turn objects are shared, so
+                # re-queuing never overwrites a later update
+                for turn in turns:
+                    self._turns.setdefault(turn.id, turn)
+                self._metrics = metrics + self._metrics
+                self._session_dirty = self._session_dirty or session is not None
+                raise
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush interaction writes, will retry: {e}")
+
+    async def _periodic_flush(self) -> None:
+        """Flush pending writes on a fixed interval."""
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            await self._flush_logged()
+
+    async def _stop_periodic_flush(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+    async def close(self) -> None:
+        """Stop background flushing and write everything still pending."""
+        if self._closed:
+            return
+        self._closed = True
+
+        await self._stop_periodic_flush()
+
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(
+                f"Dropped {self.pending_writes} interaction writes for session "
+                f"{self._session.id if self._session else None}: {e}"
+            )
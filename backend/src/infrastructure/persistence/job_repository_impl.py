@@ -11,8 +11,10 @@ from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.job import Job, JobStatus, JobType
+from src.domain.pagination import PageCursor
 from src.domain.repositories.job_repository import IJobRepository
 from src.infrastructure.persistence.models import JobModel
+from src.infrastructure.persistence.pagination import paginate_after, split_page
 
 
 class JobRepositoryImpl(IJobRepository):
@@ -61,13 +63,33 @@ class JobRepositoryImpl(IJobRepository):
         if status is not None:
             query = query.where(JobModel.status == status.value)
 
-        query = query.order_by(JobModel.created_at.desc())
+        query = query.order_by(JobModel.created_at.desc(), JobModel.id.desc())
         query = query.offset(offset).limit(limit)
 
         result = await self._session.execute(query)
         models = result.scalars().all()
         return [self._model_to_entity(m) for m in models]
 
+    async def get_by_user_id_after(
+        self,
+        user_id: uuid.UUID,
+        status: JobStatus | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 50,
+    ) -> tuple[list[Job], PageCursor | None]:
+        """List jobs for a user after a (created_at, id) cursor."""
+        query = select(JobModel).where(JobModel.user_id == user_id)
+
+        if status is not None:
+            query = query.where(JobModel.status == status.value)
+
+        query = paginate_after(query, JobModel.created_at, JobModel.id, cursor, limit)
+        result = await self._session.execute(query)
+        models, next_cursor = split_page(
+            result.scalars().all(), limit, lambda m: (m.created_at, m.id)
+        )
+        return [self._model_to_entity(m) for m in models], next_cursor
+
     async def update(self, job: Job) -> Job:
         """Update an existing job."""
         await self._session.execute(
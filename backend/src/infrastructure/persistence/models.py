@@ -276,6 +276,7 @@ class TranscriptionRequestModel(Base):
     __table_args__ = (
         Index("idx_transcription_request_audio", "audio_file_id"),
         Index("idx_transcription_request_status", "status"),
+        Index("idx_transcription_request_created_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -401,6 +402,7 @@ class InteractionSessionModel(Base):
     __table_args__ = (
         Index("idx_session_user_id", "user_id"),
         Index("idx_session_status", "status"),
+        Index("idx_session_user_started_id", "user_id", "started_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -485,7 +487,10 @@ class LatencyMetricsModel(Base):
     """SQLAlchemy model for latency metrics."""
 
     __tablename__ = "latency_metrics"
-    __table_args__ = (Index("idx_latency_turn_id", "turn_id"),)
+    __table_args__ = (
+        Index("idx_latency_turn_id", "turn_id"),
+        Index("idx_latency_created_at", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     turn_id: Mapped[uuid.UUID] = mapped_column(
@@ -537,6 +542,7 @@ class JobModel(Base):
     __table_args__ = (
         Index("idx_jobs_user_status", "user_id", "status"),
         Index("idx_jobs_created_at", "created_at"),
+        Index("idx_jobs_user_created_id", "user_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -631,6 +637,12 @@ class VoiceSyncJobModel(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    job_type: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="sync", server_default="sync"
+    )
+    voices_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Refreshed by the process running the job; NULL = not owned
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 # =============================================================================
@@ -0,0 +1,44 @@
+"""Keyset pagination helpers for SQLAlchemy queries."""
+
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.domain.pagination import PageCursor
+
+T = TypeVar("T")
+
+
+def paginate_after(
+    query: Select,
+    timestamp_col: InstrumentedAttribute[datetime],
+    id_col: InstrumentedAttribute[UUID],
+    cursor: PageCursor | None,
+    limit: int,
+) -> Select:
+    """Order newest first and select the page after ``cursor``.
+
+    The row-value comparison matches a (timestamp, id) composite index, so
+    PostgreSQL seeks straight to the cursor. One extra row is fetched to
+    tell whether another page exists (see ``split_page``).
+    """
+    if cursor is not None:
+        query = query.where(tuple_(timestamp_col, id_col) < (cursor.timestamp, cursor.id))
+    return query.order_by(timestamp_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[T],
+    limit: int,
+    position: Callable[[T], tuple[datetime, Any]],
+) -> tuple[Sequence[T], PageCursor | None]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    timestamp, row_id = position(page[-1])
+    return page, PageCursor(timestamp=timestamp, id=row_id)
@@ -0,0 +1,267 @@
+"""Connection pool and query instrumentation for the database engines.
+
+Tracks how long requests wait to check out a pooled connection, how long
+opening new connections takes, how saturated each pool is, and keeps a
+bounded log of slow statements.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from src.application.services.metrics import DB_QUERY_LATENCY, MetricFamily
+from src.application.services.tracing import record_span
+
+logger = logging.getLogger(__name__)
+
+# Slow statements kept per engine
+SLOW_QUERY_LOG_SIZE = 50
+
+# Statement text kept per slow query entry
+MAX_STATEMENT_CHARS = 500
+
+# Checkout waits at or above this count as "waited" (pool exhausted)
+CHECKOUT_WAIT_THRESHOLD_S = 0.001
+
+# Connection record info key carrying the connect time from creation to checkout
+_CONNECT_TIME_KEY = "voicelab_connect_s"
+
+
+@dataclass
+class SlowQuery:
+    """A statement that exceeded the slow query threshold."""
+
+    statement: str
+    duration_ms: float
+    at: datetime
+
+
+@dataclass
+class EngineMetrics:
+    """Counters for one engine's pool and statements."""
+
+    name: str
+    slow_query_ms: float
+    checkouts: int = 0
+    checkout_waits: int = 0
+    checkout_wait_total_s: float = 0.0
+    checkout_wait_max_s: float = 0.0
+    checkout_timeouts: int = 0
+    connects: int = 0
+    connect_errors: int = 0
+    connect_total_s: float = 0.0
+    connect_max_s: float = 0.0
+    queries: int = 0
+    query_total_s: float = 0.0
+    slow_queries: deque[SlowQuery] = field(
+        default_factory=lambda: deque(maxlen=SLOW_QUERY_LOG_SIZE)
+    )
+    pool: Pool | None = None
+
+    def record_checkout(self, wait_s: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.checkout_timeouts += 1
+        else:
+            self.checkouts += 1
+        if wait_s >= CHECKOUT_WAIT_THRESHOLD_S:
+            self.checkout_waits += 1
+            self.checkout_wait_total_s += wait_s
+            self.checkout_wait_max_s = max(self.checkout_wait_max_s, wait_s)
+
+    def record_connect(self, duration_s: float) -> None:
+        self.connects += 1
+        self.connect_total_s += duration_s
+        self.connect_max_s = max(self.connect_max_s, duration_s)
+
+    def record_connect_error(self) -> None:
+        self.connect_errors += 1
+
+    def record_query(self, statement: str, duration_s: float) -> None:
+        self.queries += 1
+        self.query_total_s += duration_s
+        DB_QUERY_LATENCY.labels(self.name).observe(duration_s)
+        record_span(
+            "db.query",
+            duration_s,
+            engine=self.name,
+            operation=statement.lstrip().split(" ", 1)[0].upper(),
+        )
+        duration_ms = duration_s * 1000
+        if duration_ms >= self.slow_query_ms:
+            text = " ".join(statement.split())[:MAX_STATEMENT_CHARS]
+            self.slow_queries.append(
+                SlowQuery(statement=text, duration_ms=duration_ms, at=datetime.now(UTC))
+            )
+            logger.warning("Slow query on %s (%.1f ms): %s", self.name, duration_ms, text)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current counters and pool state as a JSON-friendly dict."""
+        pool: dict[str, Any] = {}
+        if isinstance(self.pool, AsyncAdaptedQueuePool):
+            size = self.pool.size()
+            checked_out = self.pool.checkedout()
+            capacity = size + max(self.pool._max_overflow, 0)
+            pool = {
+                "size": size,
+                "max_overflow": self.pool._max_overflow,
+                "checked_out": checked_out,
+                "checked_in": self.pool.checkedin(),
+                "overflow": self.pool.overflow(),
+                "saturation": checked_out / capacity if capacity else None,
+            }
+
+        return {
+            "pool": pool,
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_waits": self.checkout_waits,
+            "checkout_wait_avg_ms": (
+                self.checkout_wait_total_s / self.checkout_waits * 1000
+                if self.checkout_waits
+                else 0.0
+            ),
+            "checkout_wait_max_ms": self.checkout_wait_max_s * 1000,
+            "connects": self.connects,
+            "connect_errors": self.connect_errors,
+            "connect_avg_ms": (
+                self.connect_total_s / self.connects * 1000 if self.connects else 0.0
+            ),
+            "connect_max_ms": self.connect_max_s * 1000,
+            "queries": self.queries,
+            "query_avg_ms": self.query_total_s / self.queries * 1000 if self.queries else 0.0,
+            "slow_query_ms": self.slow_query_ms,
+            "slow_queries": [
+                {
+                    "statement": q.statement,
+                    "duration_ms": round(q.duration_ms, 1),
+                    "at": q.at.isoformat(),
+                }
+                for q in reversed(self.slow_queries)
+            ],
+        }
+
+
+_engine_metrics: dict[str, EngineMetrics] = {}
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long each checkout waited.
+
+    Time spent opening a new connection is reported as connect time, not
+    as checkout wait. Only the pool's own timeout counts as a timed-out
+    checkout; failures to connect are counted as connect errors.
+    """
+
+    metrics: EngineMetrics | None = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.record_connect_error()
+            raise
+        if self.metrics is not None:
+            connect_s = record.info.pop(_CONNECT_TIME_KEY, 0.0)
+            self.metrics.record_checkout(time.perf_counter() - start - connect_s)
+        return record
+
+    def _create_connection(self) -> Any:
+        start = time.perf_counter()
+        record = super()._create_connection()
+        connect_s = time.perf_counter() - start
+        # Read back by _do_get; concurrent checkouts each carry their own record
+        record.info[_CONNECT_TIME_KEY] = connect_s
+        if self.metrics is not None:
+            self.metrics.record_connect(connect_s)
+        return record
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep reporting to the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+def instrument_engine(engine: Engine, name: str, slow_query_ms: float) -> EngineMetrics:
+    """Attach pool and statement instrumentation to a (sync) engine.
+
+    Args:
+        engine: The engine to instrument (``AsyncEngine.sync_engine`` for async)
+        name: Label for the engine in metrics output
+        slow_query_ms: Threshold for the slow query log
+
+    Returns:
+        The metrics collector for the engine
+    """
+    metrics = EngineMetrics(name=name, slow_query_ms=slow_query_ms, pool=engine.pool)
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics = metrics
+
+    @event.listens_for(engine, "before_cursor_execute", named=True)
+    def _before_cursor_execute(conn, **_kw):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute", named=True)
+    def _after_cursor_execute(conn, statement, **_kw):
+        starts = conn.info.get("query_start")
+        if starts:
+            metrics.record_query(statement, time.perf_counter() - starts.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+    _engine_metrics[name] = metrics
+    return metrics
+
+
+def get_database_metrics() -> dict[str, dict[str, Any]]:
+    """Snapshot of every instrumented engine, keyed by engine name."""
+    return {name: metrics.snapshot() for name, metrics in _engine_metrics.items()}
+
+
+def collect_database_metrics() -> list[MetricFamily]:
+    """Pool state and checkout counters of every engine, for /metrics."""
+    checked_out = MetricFamily(
+        "voicelab_db_pool_checked_out", "gauge", "Connections currently checked out"
+    )
+    capacity = MetricFamily("voicelab_db_pool_capacity", "gauge", "Pool size plus allowed overflow")
+    checkouts = MetricFamily("voicelab_db_pool_checkouts", "counter", "Connection checkouts")
+    waits = MetricFamily(
+        "voicelab_db_pool_checkout_waits", "counter", "Checkouts that waited for a connection"
+    )
+    timeouts = MetricFamily(
+        "voicelab_db_pool_checkout_timeouts", "counter", "Checkouts that timed out"
+    )
+    connects = MetricFamily("voicelab_db_pool_connects", "counter", "New connections opened")
+    connect_errors = MetricFamily(
+        "voicelab_db_pool_connect_errors", "counter", "Failed attempts to open a connection"
+    )
+    for name, metrics in _engine_metrics.items():
+        pool = metrics.pool
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            checked_out.add(pool.checkedout(), engine=name)
+            capacity.add(pool.size() + max(pool._max_overflow, 0), engine=name)
+        checkouts.add(metrics.checkouts, engine=name)
+        waits.add(metrics.checkout_waits, engine=name)
+        timeouts.add(metrics.checkout_timeouts, engine=name)
+        connects.add(metrics.connects, engine=name)
+        connect_errors.add(metrics.connect_errors, engine=name)
+    return [checked_out, capacity, checkouts, waits, timeouts, connects, connect_errors]
@@ -6,7 +6,7 @@ SQLAlchemy implementation for STT transcription persistence.
 
 from uuid import UUID
 
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import Select, delete, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,6 +14,7 @@ from src.domain.entities.audio_file import AudioFile
 from src.domain.entities.ground_truth import GroundTruth
 from src.domain.entities.stt import STTRequest, STTResult, WordTiming
 from src.domain.entities.wer_analysis import WERAnalysis
+from src.domain.pagination import PageCursor
 from src.domain.repositories.transcription_repository import ITranscriptionRepository
 from src.infrastructure.persistence.models import (
     AudioFileModel,
@@ -23,6 +24,7 @@ from src.infrastructure.persistence.models import (
     WERAnalysisModel,
     WordTimingModel,
 )
+from src.infrastructure.persistence.pagination import paginate_after, split_page
 
 
 class TranscriptionRepositoryImpl(ITranscriptionRepository):
@@ -178,64 +180,97 @@ class TranscriptionRepositoryImpl(ITranscriptionRepository):
         page: int = 1,
         page_size: int = 20,
     ) -> tuple[list[dict], int]:
-        # Query Requests joined with AudioFile (filtered by user_id)
-        query = (
-            select(TranscriptionRequestModel)
-            .join(AudioFileModel)
-            .where(AudioFileModel.user_id == user_id)
-            .order_by(desc(TranscriptionRequestModel.created_at))
+        total = await self.count_transcriptions(user_id, provider=provider, language=language)
+
+        # Pagination
+        stmt = (
+            self._history_query(user_id, provider, language)
+            .order_by(
+                desc(TranscriptionRequestModel.created_at), desc(TranscriptionRequestModel.id)
+            )
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+
+        result = await self._session.execute(stmt)
+        return [self._to_summary(req) for req in result.scalars().all() if req.result], total
+
+    async def list_transcriptions_after(
+        self,
+        user_id: UUID,
+        provider: str | None = None,
+        language: str | None = None,
+        cursor: PageCursor | None = None,
+        limit: int = 20,
+    ) -> tuple[list[dict], PageCursor | None]:
+        stmt = paginate_after(
+            self._history_query(user_id, provider, language),
+            TranscriptionRequestModel.created_at,
+            TranscriptionRequestModel.id,
+            cursor,
+            limit,
+        )
+        result = await self._session.execute(stmt)
+        requests, next_cursor = split_page(
+            result.scalars().all(), limit, lambda req: (req.created_at, req.id)
         )
+        return [self._to_summary(req) for req in requests if req.result], next_cursor
 
+    async def count_transcriptions(
+        self,
+        user_id: UUID,
+        provider: str | None = None,
+        language: str | None = None,
+    ) -> int:
+        query = select(func.count()).select_from(TranscriptionRequestModel).join(AudioFileModel)
+        query = query.where(AudioFileModel.user_id == user_id)
         if provider:
             query = query.where(TranscriptionRequestModel.provider == provider)
         if language:
             query = query.where(TranscriptionRequestModel.language == language)
+        return (await self._session.execute(query)).scalar_one()
 
-        # Count
-        count_stmt = select(func.count()).select_from(query.subquery())
-        total = (await self._session.execute(count_stmt)).scalar_one()
-
-        # Pagination
-        stmt = (
-            query.options(
+    def _history_query(self, user_id: UUID, provider: str | None, language: str | None) -> Select:
+        # Query Requests joined with AudioFile (filtered by user_id)
+        query = (
+            select(TranscriptionRequestModel)
+            .join(AudioFileModel)
+            .where(AudioFileModel.user_id == user_id)
+            .options(
                 selectinload(TranscriptionRequestModel.result).selectinload(
                     TranscriptionResultModel.wer_analysis
                 )
             )
-            .offset((page - 1) * page_size)
-            .limit(page_size)
         )
 
-        result = await self._session.execute(stmt)
-        requests = result.scalars().all()
-
-        items = []
-        for req in requests:
-            if not req.result:
-                continue
-
-            # Construct summary
-            item = {
-                "id": str(req.id),
-                "provider": req.provider,
-                "language": req.language,
-                "transcript_preview": req.result.transcript[:100] + "..."
-                if len(req.result.transcript) > 100
-                else req.result.transcript,
-                "duration_ms": None,
-                "confidence": req.result.confidence,
-                "has_ground_truth": False,
-                "error_rate": None,
-                "created_at": req.created_at.isoformat(),
-            }
+        if provider:
+            query = query.where(TranscriptionRequestModel.provider == provider)
+        if language:
+            query = query.where(TranscriptionRequestModel.language == language)
+        return query
 
-            if req.result.wer_analysis:
-                item["error_rate"] = req.result.wer_analysis.error_rate
-                item["has_ground_truth"] = True
+    @staticmethod
+    def _to_summary(req: TranscriptionRequestModel) -> dict:
+        # Construct summary
+        item = {
+            "id": str(req.id),
+            "provider": req.provider,
+            "language": req.language,
+            "transcript_preview": req.result.transcript[:100] + "..."
+            if len(req.result.transcript) > 100
+            else req.result.transcript,
+            "duration_ms": None,
+            "confidence": req.result.confidence,
+            "has_ground_truth": False,
+            "error_rate": None,
+            "created_at": req.created_at.isoformat(),
+        }
 
-            items.append(item)
+        if req.result.wer_analysis:
+            item["error_rate"] = req.result.wer_analysis.error_rate
+            item["has_ground_truth"] = True
 
-        return items, total
+        return item
 
     async def delete_transcription(self, transcription_id: UUID) -> bool:
         # Delete request (cascades to result, words, wer)
@@ -7,14 +7,18 @@ T008: Implement VoiceCacheRepositoryImpl (DB-backed)
 from collections.abc import Sequence
 from datetime import datetime
 
-from sqlalchemy import func, or_, select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import String, any_, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
 from src.domain.entities.voice import AgeGroup, Gender, VoiceProfile
 from src.infrastructure.persistence.models import VoiceCache
 
+# Rows per INSERT in upsert_batch; keeps each statement well under
+# PostgreSQL's 32767 bind-parameter limit (13 columns per row)
+UPSERT_CHUNK_SIZE = 1000
+
 
 class VoiceCacheRepositoryImpl(IVoiceCacheRepository):
     """SQLAlchemy-based implementation of IVoiceCacheRepository."""
@@ -151,7 +155,11 @@ class VoiceCacheRepositoryImpl(IVoiceCacheRepository):
         )
 
     async def upsert_batch(self, voices: Sequence[VoiceProfile]) -> int:
-        """Batch upsert voice profiles."""
+        """Batch upsert voice profiles.
+
+        A NULL incoming sample_audio_url keeps the stored one, so generated
+        previews survive provider syncs.
+        """
         if not voices:
             return 0
 
@@ -175,35 +183,45 @@ class VoiceCacheRepositoryImpl(IVoiceCacheRepository):
             for v in voices
         ]
 
-        stmt = insert(VoiceCache).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["id"],
-            set_={
-                "name": stmt.excluded.name,
-                "language": stmt.excluded.language,
-                "gender": stmt.excluded.gender,
-                "age_group": stmt.excluded.age_group,
-                "styles": stmt.excluded.styles,
-                "use_cases": stmt.excluded.use_cases,
-                "sample_audio_url": stmt.excluded.sample_audio_url,
-                "is_deprecated": stmt.excluded.is_deprecated,
-                "metadata": stmt.excluded.metadata,
-                "synced_at": now,
-                "updated_at": now,
-            },
-        )
-        result = await self._session.execute(stmt)
+        rowcount = 0
+        for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+            stmt = insert(VoiceCache).values(values[start : start + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "language": stmt.excluded.language,
+                    "gender": stmt.excluded.gender,
+                    "age_group": stmt.excluded.age_group,
+                    "styles": stmt.excluded.styles,
+                    "use_cases": stmt.excluded.use_cases,
+                    "sample_audio_url": func.coalesce(
+                        stmt.excluded.sample_audio_url, VoiceCache.sample_audio_url
+                    ),
+                    "is_deprecated": stmt.excluded.is_deprecated,
+                    "metadata": stmt.excluded.metadata,
+                    "synced_at": now,
+                    "updated_at": now,
+                },
+            )
+            result = await self._session.execute(stmt)
+            rowcount += result.rowcount
         await self._session.flush()
-        return result.rowcount
+        return rowcount
 
     async def mark_deprecated(self, voice_ids: Sequence[str]) -> int:
-        """Mark voices as deprecated."""
+        """Mark voices as deprecated in a single UPDATE.
+
+        The IDs are bound as one array parameter (``id = ANY(:ids)``), so the
+        statement is the same regardless of how many voices are deprecated.
+        """
         if not voice_ids:
             return 0
 
+        ids = literal(list(voice_ids), type_=ARRAY(String))
         result = await self._session.execute(
             update(VoiceCache)
-            .where(VoiceCache.id.in_(voice_ids))
+            .where(VoiceCache.id == any_(ids), VoiceCache.is_deprecated.is_(False))
             .values(is_deprecated=True, updated_at=datetime.utcnow())
         )
         await self._session.flush()
@@ -6,15 +6,15 @@ T007: Implement VoiceCustomizationRepositoryImpl (DB-backed)
 
 from datetime import UTC, datetime
 
-from sqlalchemy import delete, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Boolean, String, delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.voice_customization import VoiceCustomization
 from src.domain.repositories.voice_customization_repository import (
     IVoiceCustomizationRepository,
 )
-from src.infrastructure.persistence.models import VoiceCustomizationModel
+from src.infrastructure.persistence.models import VoiceCache, VoiceCustomizationModel
 
 
 class VoiceCustomizationRepositoryImpl(IVoiceCustomizationRepository):
@@ -109,24 +109,58 @@ class VoiceCustomizationRepositoryImpl(IVoiceCustomizationRepository):
     async def bulk_update(
         self, customizations: list[VoiceCustomization]
     ) -> tuple[int, list[tuple[str, str]]]:
-        """Bulk update multiple voice customizations."""
-        success_count = 0
-        failures: list[tuple[str, str]] = []
+        """Bulk update multiple voice customizations.
 
+        Valid items are written with a single INSERT ... SELECT FROM unnest()
+        ... ON CONFLICT DO UPDATE. Rows for unknown voices are filtered out
+        and reported as failures instead of aborting the batch.
+        """
+        failures: list[tuple[str, str]] = []
+        # Later items for the same voice win; ON CONFLICT can't touch a row twice
+        valid: dict[str, VoiceCustomization] = {}
         for customization in customizations:
-            try:
-                # Validate
-                errors = customization.validate()
-                if errors:
-                    failures.append((customization.voice_cache_id, ", ".join(errors)))
-                    continue
-
-                await self.save(customization)
-                success_count += 1
-            except Exception as e:
-                failures.append((customization.voice_cache_id, str(e)))
-
-        return success_count, failures
+            errors = customization.validate()
+            if errors:
+                failures.append((customization.voice_cache_id, ", ".join(errors)))
+            else:
+                valid[customization.voice_cache_id] = customization
+
+        if not valid:
+            return 0, failures
+
+        items = list(valid.values())
+        rows = func.unnest(
+            literal([c.voice_cache_id for c in items], type_=ARRAY(String)),
+            literal([c.custom_name for c in items], type_=ARRAY(String)),
+            literal([c.is_favorite for c in items], type_=ARRAY(Boolean)),
+            literal([c.is_hidden for c in items], type_=ARRAY(Boolean)),
+        ).table_valued("voice_cache_id", "custom_name", "is_favorite", "is_hidden")
+
+        stmt = insert(VoiceCustomizationModel).from_select(
+            ["voice_cache_id", "custom_name", "is_favorite", "is_hidden"],
+            select(
+                rows.c.voice_cache_id,
+                rows.c.custom_name,
+                rows.c.is_favorite,
+                rows.c.is_hidden,
+            ).where(exists().where(VoiceCache.id == rows.c.voice_cache_id)),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["voice_cache_id"],
+            set_={
+                "custom_name": stmt.excluded.custom_name,
+                "is_favorite": stmt.excluded.is_favorite,
+                "is_hidden": stmt.excluded.is_hidden,
+                "updated_at": datetime.now(UTC),
+            },
+        ).returning(VoiceCustomizationModel.voice_cache_id)
+
+        result = await self._session.execute(stmt)
+        written = set(result.scalars().all())
+        await self._session.flush()
+
+        failures.extend((vid, "Voice not found") for vid in valid if vid not in written)
+        return len(written), failures
 
     async def get_customization_map(
         self, voice_cache_ids: list[str]
@@ -11,7 +11,11 @@ from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.voice_sync_job_repository import IVoiceSyncJobRepository
-from src.domain.entities.voice_sync_job import VoiceSyncJob, VoiceSyncStatus
+from src.domain.entities.voice_sync_job import (
+    VoiceSyncJob,
+    VoiceSyncJobType,
+    VoiceSyncStatus,
+)
 from src.infrastructure.persistence.models import VoiceSyncJobModel
 
 
@@ -34,6 +38,8 @@ class VoiceSyncJobRepositoryImpl(IVoiceSyncJobRepository):
             started_at=job.started_at,
             completed_at=job.completed_at,
             created_at=job.created_at,
+            job_type=job.job_type.value,
+            voices_total=job.voices_total,
         )
         self._session.add(model)
         await self._session.flush()
@@ -61,6 +67,7 @@ class VoiceSyncJobRepositoryImpl(IVoiceSyncJobRepository):
                 retry_count=job.retry_count,
                 started_at=job.started_at,
                 completed_at=job.completed_at,
+                voices_total=job.voices_total,
             )
         )
         await self._session.flush()
@@ -118,6 +125,8 @@ class VoiceSyncJobRepositoryImpl(IVoiceSyncJobRepository):
         self,
         status: VoiceSyncStatus,
         limit: int = 10,
+        *,
+        job_type: VoiceSyncJobType | None = None,
     ) -> Sequence[VoiceSyncJob]:
         """List jobs by status."""
         query = (
@@ -126,6 +135,8 @@ class VoiceSyncJobRepositoryImpl(IVoiceSyncJobRepository):
             .order_by(VoiceSyncJobModel.created_at.desc())
             .limit(limit)
         )
+        if job_type is not None:
+            query = query.where(VoiceSyncJobModel.job_type == job_type.value)
 
         result = await self._session.execute(query)
         models = result.scalars().all()
@@ -143,17 +154,62 @@ class VoiceSyncJobRepositoryImpl(IVoiceSyncJobRepository):
         )
         return result.scalar() or 0
 
-    async def has_running_job(self) -> bool:
+    async def has_running_job(self, job_type: VoiceSyncJobType | None = None) -> bool:
         """Check if there's a running sync job."""
         query = (
             select(func.count())
             .select_from(VoiceSyncJobModel)
             .where(VoiceSyncJobModel.status == VoiceSyncStatus.RUNNING.value)
         )
+        if job_type is not None:
+            query = query.where(VoiceSyncJobModel.job_type == job_type.value)
 
         result = await self._session.execute(query)
         return (result.scalar() or 0) > 0
 
+    async def claim_stale_jobs(
+        self,
+        job_type: VoiceSyncJobType,
+        stale_after: timedelta,
+    ) -> Sequence[VoiceSyncJob]:
+        """Claim orphaned RUNNING jobs using FOR UPDATE SKIP LOCKED."""
+        now = datetime.utcnow()
+        query = (
+            select(VoiceSyncJobModel)
+            .where(VoiceSyncJobModel.status == VoiceSyncStatus.RUNNING.value)
+            .where(VoiceSyncJobModel.job_type == job_type.value)
+            .where(
+                (VoiceSyncJobModel.heartbeat_at.is_(None))
+                | (VoiceSyncJobModel.heartbeat_at < now - stale_after)
+            )
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(query)
+        models = result.scalars().all()
+
+        for model in models:
+            model.heartbeat_at = now
+        await self._session.flush()
+        return [self._model_to_entity(m) for m in models]
+
+    async def heartbeat(self, job_id: str) -> None:
+        """Refresh a job's heartbeat."""
+        await self._session.execute(
+            update(VoiceSyncJobModel)
+            .where(VoiceSyncJobModel.id == job_id)
+            .values(heartbeat_at=datetime.utcnow())
+        )
+        await self._session.flush()
+
+    async def release(self, job_id: str) -> None:
+        """Clear a job's heartbeat."""
+        await self._session.execute(
+            update(VoiceSyncJobModel)
+            .where(VoiceSyncJobModel.id == job_id)
+            .values(heartbeat_at=None)
+        )
+        await self._session.flush()
+
     async def cleanup_old_jobs(
         self,
         days: int = 30,
@@ -180,4 +236,6 @@ class VoiceSyncJobRepositoryImpl(IVoiceSyncJobRepository):
             started_at=model.started_at,
             completed_at=model.completed_at,
             created_at=model.created_at,
+            job_type=VoiceSyncJobType(model.job_type),
+            voices_total=model.voices_total,
         )
@@ -0,0 +1,323 @@
+"""On-demand sampling profiler for live traffic.
+
+A background thread periodically samples the event loop thread's Python
+stack and counts identical stacks, so the profiled code itself runs
+untouched. Profiles are written to ``LocalStorage`` in the collapsed-stack
+format (``frame;frame;frame count`` per line) read by flamegraph.pl,
+speedscope and most flame graph viewers.
+
+Nothing runs until a profile is requested, either for one request, job or
+WebSocket session, or for a time window of the whole worker. Only one
+profile runs per process at a time: the sampler sees everything on the
+event loop, so overlapping profiles would only duplicate each other.
+Coroutines waiting on I/O are not on the stack, and code offloaded to
+thread pools is not sampled; idle loop time shows up as the selector call.
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import CodeType, FrameType
+from typing import Any
+
+from src.application.interfaces.storage_service import IStorageService
+from src.application.services.tracing import create_detached_task
+from src.config import get_settings
+from src.infrastructure.storage.local_storage import LocalStorage
+
+logger = logging.getLogger(__name__)
+
+# Storage prefix of saved profiles
+PROFILE_PREFIX = "profiles"
+
+# Finished profiles listed by the status endpoint
+RECENT_PROFILES = 20
+
+# Scopes that can be armed to profile their next run
+PROFILE_TARGETS = ("http", "websocket", "job")
+
+
+def _frame_label(code: CodeType, cache: dict[CodeType, str]) -> str:
+    label = cache.get(code)
+    if label is None:
+        filename = code.co_filename
+        marker = filename.rfind("/src/")
+        short = filename[marker + 1 :] if marker >= 0 else filename.rsplit("/", 1)[-1]
+        # ';' separates frames in the collapsed format
+        label = f"{short}:{code.co_qualname}".replace(";", ":").replace(" ", "_")
+        cache[code] = label
+    return label
+
+
+def collapse_stack(frame: FrameType | None, cache: dict[CodeType, str]) -> str:
+    """A stack as one collapsed-format key, outermost frame first."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame.f_code, cache))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class StackSampler:
+    """Samples one thread's stack from a background thread."""
+
+    def __init__(self, thread_id: int, interval_s: float, max_duration_s: float) -> None:
+        """Initialize the sampler.
+
+        Args:
+            thread_id: Thread to sample (``threading.get_ident()`` of the loop)
+            interval_s: Time between samples
+            max_duration_s: Sampling stops on its own after this long
+        """
+        self._thread_id = thread_id
+        self._interval_s = interval_s
+        self._max_duration_s = max_duration_s
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._labels: dict[CodeType, str] = {}
+        self.samples: Counter[str] = Counter()
+        self.duration_s = 0.0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed-stack format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        while not self._stop.wait(self._interval_s):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                break
+            self.samples[collapse_stack(frame, self._labels)] += 1
+            del frame
+            if time.perf_counter() - start >= self._max_duration_s:
+                break
+        self.duration_s = time.perf_counter() - start
+
+
+@dataclass
+class ProfileInfo:
+    """A finished, stored profile."""
+
+    key: str
+    url: str
+    label: str
+    samples: int
+    duration_s: float
+    finished_at: datetime
+
+
+def _safe_label(label: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.]+", "-", label).strip("-")[:80] or "profile"
+
+
+class Profiler:
+    """Starts profiles and stores their output."""
+
+    def __init__(
+        self,
+        storage: IStorageService | None = None,
+        interval_s: float = 0.005,
+        max_duration_s: float = 60.0,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            storage: Where profiles are written (defaults to LocalStorage)
+            interval_s: Time between stack samples
+            max_duration_s: Upper bound on any single profile
+        """
+        self._storage = storage
+        self.interval_s = interval_s
+        self.max_duration_s = max_duration_s
+        self._active: str | None = None
+        self._armed: dict[str, int] = {}
+        self._window_task: asyncio.Task[ProfileInfo | None] | None = None
+        self.recent: deque[ProfileInfo] = deque(maxlen=RECENT_PROFILES)
+
+    @property
+    def active(self) -> str | None:
+        """Key of the profile currently running, if any."""
+        return self._active
+
+    def arm(self, target: str, count: int = 1) -> None:
+        """Profile the next ``count`` runs of a target (http, websocket, job)."""
+        if target not in PROFILE_TARGETS:
+            raise ValueError(f"Unknown profile target: {target}")
+        if count > 0:
+            self._armed[target] = count
+        else:
+            self._armed.pop(target, None)
+
+    def armed(self) -> dict[str, int]:
+        return dict(self._armed)
+
+    def take_armed(self, target: str) -> bool:
+        """Consume one armed run of the target, if any and no profile is running."""
+        # Checked on every request, so the disarmed path is a single lookup
+        if not self._armed or self._active is not None:
+            return False
+        remaining = self._armed.get(target, 0)
+        if remaining <= 0:
+            return False
+        if remaining == 1:
+            del self._armed[target]
+        else:
+            self._armed[target] = remaining - 1
+        return True
+
+    def new_key(self, label: str) -> str:
+        now = datetime.now(UTC)
+        return (
+            f"{PROFILE_PREFIX}/{now:%Y-%m-%d}/"
+            f"{_safe_label(label)}-{now:%H%M%S}-{uuid.uuid4().hex[:8]}.folded"
+        )
+
+    @asynccontextmanager
+    async def profile(self, label: str) -> AsyncIterator[str | None]:
+        """Sample the event loop while the enclosed block runs.
+
+        Must be entered on the event loop thread.
+
+        Args:
+            label: Name of the profiled work, used in the storage key
+
+        Yields:
+            The storage key of the profile, or None when another is running
+        """
+        started = self._begin(label)
+        if started is None:
+            logger.info("Profile of %s skipped, %s is running", label, self._active)
+            yield None
+            return
+
+        key, sampler = started
+        try:
+            yield key
+        finally:
+            await self._finish(key, label, sampler)
+
+    @asynccontextmanager
+    async def profile_if_armed(self, target: str, label: str) -> AsyncIterator[str | None]:
+        """Profile the enclosed block if the target was armed, else do nothing."""
+        if not self.take_armed(target):
+            yield None
+            return
+        async with self.profile(label) as key:
+            yield key
+
+    def start_window(self, duration_s: float, label: str = "window") -> str | None:
+        """Profile the whole worker for a time window in the background.
+
+        Must be called on the event loop thread.
+
+        Returns:
+            The storage key the profile will be written to, or None when
+            another profile is running
+        """
+        started = self._begin(label)
+        if started is None:
+            return None
+        key, sampler = started
+        duration_s = min(duration_s, self.max_duration_s)
+        self._window_task = create_detached_task(self._window(duration_s, label, key, sampler))
+        return key
+
+    def _begin(self, label: str) -> tuple[str, StackSampler] | None:
+        if self._active is not None:
+            return None
+        key = self.new_key(label)
+        sampler = StackSampler(threading.get_ident(), self.interval_s, self.max_duration_s)
+        self._active = key
+        sampler.start()
+        return key, sampler
+
+    async def _finish(self, key: str, label: str, sampler: StackSampler) -> None:
+        # The sampler wakes on the stop event, so this blocks for one sample at most
+        sampler.stop()
+        self._active = None
+        # Sessions are often torn down by cancellation; the profile is still saved
+        await asyncio.shield(self._save(key, label, sampler))
+
+    async def _window(
+        self, duration_s: float, label: str, key: str, sampler: StackSampler
+    ) -> ProfileInfo | None:
+        try:
+            await asyncio.sleep(duration_s)
+        finally:
+            await self._finish(key, label, sampler)
+        return next((p for p in self.recent if p.key == key), None)
+
+    async def _save(self, key: str, label: str, sampler: StackSampler) -> None:
+        storage = self._storage or LocalStorage()
+        try:
+            stored = await storage.upload(key, sampler.collapsed().encode(), "text/plain")
+        except Exception as e:
+            logger.warning("Profile %s not saved: %s", key, e)
+            return
+        samples = sum(sampler.samples.values())
+        self.recent.appendleft(
+            ProfileInfo(
+                key=key,
+                url=stored.url,
+                label=label,
+                samples=samples,
+                duration_s=sampler.duration_s,
+                finished_at=datetime.now(UTC),
+            )
+        )
+        logger.info("Profile %s saved (%d samples, %.1fs)", key, samples, sampler.duration_s)
+
+    def status(self) -> dict[str, Any]:
+        """Running profile, armed targets and recently stored profiles."""
+        return {
+            "active": self._active,
+            "armed": self.armed(),
+            "interval_ms": self.interval_s * 1000,
+            "max_duration_s": self.max_duration_s,
+            "recent": [
+                {
+                    "key": p.key,
+                    "url": p.url,
+                    "label": p.label,
+                    "samples": p.samples,
+                    "duration_s": round(p.duration_s, 3),
+                    "finished_at": p.finished_at.isoformat(),
+                }
+                for p in self.recent
+            ],
+        }
+
+
+_profiler: Profiler | None = None
+
+
+def get_profiler() -> Profiler:
+    """Process-wide profiler, configured from settings on first use."""
+    global _profiler
+    if _profiler is None:
+        settings = get_settings()
+        _profiler = Profiler(
+            interval_s=settings.profiling_interval_ms / 1000,
+            max_duration_s=settings.profiling_max_duration_s,
+        )
+    return _profiler
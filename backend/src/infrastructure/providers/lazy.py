@@ -0,0 +1,185 @@
+"""Lazily imported and constructed providers.
+
+Provider SDKs (Azure Speech, Google Cloud, pipecat, ...) take hundreds of
+milliseconds to import. Providers are therefore registered as
+:class:`LazyProvider` descriptors, naming the class by import path, and
+are imported and built on first use. :class:`LazyProviderMap` is a mapping
+of such descriptors that behaves like the plain ``dict`` of providers it
+replaces. Checking which providers exist never loads one; async code
+loads them with :meth:`LazyProviderMap.load` (through
+``src.application.services.provider_loading.load_provider``), which
+imports in a worker thread so the event loop keeps running. Building everything ahead of traffic is
+still possible with :meth:`LazyProviderMap.warm_up`.
+
+Every import made through this module is timed; :func:`import_report`
+lists the cost per module together with the SDK packages already loaded
+at startup. For a full breakdown use ``python -X importtime``.
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Third-party packages that should only be imported when a provider needs them
+HEAVY_SDK_PACKAGES = (
+    "aioboto3",
+    "azure.cognitiveservices.speech",
+    "google.api_core",
+    "google.cloud.speech",
+    "google.cloud.texttospeech",
+    "pipecat",
+    "speechmatics",
+)
+
+
+@dataclass(frozen=True)
+class ImportCost:
+    """Time spent importing one module and the packages it pulled in."""
+
+    module: str
+    duration_ms: float
+    new_packages: tuple[str, ...]
+
+
+_import_costs: dict[str, ImportCost] = {}
+
+
+def _top_level_packages() -> set[str]:
+    return {name.partition(".")[0] for name in list(sys.modules)}
+
+
+def import_attribute(path: str) -> Any:
+    """Import ``module:attribute`` and time the module import.
+
+    Args:
+        path: Import path, e.g. ``src.infrastructure.providers.tts.azure_tts:AzureTTSProvider``
+    """
+    module_name, _, attribute = path.partition(":")
+    module = sys.modules.get(module_name)
+    if module is None:
+        before = _top_level_packages()
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        duration_ms = (time.perf_counter() - start) * 1000
+        new_packages = tuple(sorted(_top_level_packages() - before))
+        _import_costs[module_name] = ImportCost(module_name, duration_ms, new_packages)
+        logger.info("Imported %s in %.0f ms", module_name, duration_ms)
+    return getattr(module, attribute)
+
+
+def import_report() -> dict[str, Any]:
+    """Import cost of lazily loaded modules and SDKs loaded at any point so far."""
+    return {
+        "sdk_packages_loaded": [p for p in HEAVY_SDK_PACKAGES if p in sys.modules],
+        "lazy_imports": [
+            {
+                "module": cost.module,
+                "duration_ms": round(cost.duration_ms, 1),
+                "new_packages": list(cost.new_packages),
+            }
+            for cost in sorted(_import_costs.values(), key=lambda c: -c.duration_ms)
+        ],
+    }
+
+
+@dataclass(frozen=True)
+class LazyProvider(Generic[T]):
+    """A provider class named by import path, with its constructor arguments."""
+
+    target: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def load(self) -> T:
+        cls = import_attribute(self.target)
+        return cls(**self.kwargs)
+
+
+class LazyProviderMap(Mapping[str, T]):
+    """Providers by name, each imported and constructed on first access.
+
+    Membership, iteration and ``len`` answer from the configuration and never
+    load a provider. A provider that fails to import or construct is logged
+    and left out from then on, as if it had not been configured. Each
+    provider loads under its own lock, so a slow SDK import does not hold
+    up the others.
+    """
+
+    def __init__(self, kind: str, providers: Mapping[str, LazyProvider[T]]) -> None:
+        """Initialize the map.
+
+        Args:
+            kind: Provider type for log messages (TTS, STT, LLM)
+            providers: Descriptors of the configured providers
+        """
+        self.kind = kind
+        self._descriptors = dict(providers)
+        self._instances: dict[str, T] = {}
+        self._failed: set[str] = set()
+        self._locks = {name: threading.Lock() for name in self._descriptors}
+
+    def configured(self) -> list[str]:
+        """Names of the configured providers, without loading them."""
+        return list(self._descriptors)
+
+    def loaded(self) -> list[str]:
+        return list(self._instances)
+
+    def __getitem__(self, name: str) -> T:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        if name not in self._descriptors or name in self._failed:
+            raise KeyError(name)
+        with self._locks[name]:
+            if name in self._instances:
+                return self._instances[name]
+            if name in self._failed:
+                raise KeyError(name)
+            try:
+                instance = self._descriptors[name].load()
+            except Exception as e:
+                logger.warning("Failed to initialize %s %s: %s", name, self.kind, e)
+                self._failed.add(name)
+                raise KeyError(name) from e
+            self._instances[name] = instance
+            return instance
+
+    async def load(self, name: str) -> T:
+        """Provider by name, imported and constructed in a worker thread if needed.
+
+        Raises:
+            KeyError: If the provider is not configured or failed to load
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        return await asyncio.to_thread(self.__getitem__, name)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name in self._descriptors and name not in self._failed
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._available())
+
+    def __len__(self) -> int:
+        return len(self._available())
+
+    def _available(self) -> list[str]:
+        return [name for name in self._descriptors if name not in self._failed]
+
+    def warm_up(self) -> None:
+        """Import and construct every configured provider now."""
+        for name in self._available():
+            with suppress(KeyError):
+                self[name]
@@ -1,10 +1,34 @@
-"""STT Provider Implementations."""
+"""STT Provider Implementations.
+
+Provider classes are imported on first attribute access, so importing the
+package (or the factory) does not load every provider SDK.
+"""
+
+from typing import TYPE_CHECKING, Any
 
-from src.infrastructure.providers.stt.azure_stt import AzureSTTProvider
-from src.infrastructure.providers.stt.elevenlabs_stt import ElevenLabsSTTProvider
 from src.infrastructure.providers.stt.factory import STTProviderFactory
-from src.infrastructure.providers.stt.gcp_stt import GCPSTTProvider
-from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
+
+if TYPE_CHECKING:
+    from src.infrastructure.providers.stt.azure_stt import AzureSTTProvider
+    from src.infrastructure.providers.stt.elevenlabs_stt import ElevenLabsSTTProvider
+    from src.infrastructure.providers.stt.gcp_stt import GCPSTTProvider
+    from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
+
+_PROVIDER_MODULES = {
+    "AzureSTTProvider": "azure_stt",
+    "ElevenLabsSTTProvider": "elevenlabs_stt",
+    "GCPSTTProvider": "gcp_stt",
+    "WhisperSTTProvider": "whisper_stt",
+}
+
+
+def __getattr__(name: str) -> Any:
+    from src.infrastructure.providers.lazy import import_attribute
+
+    if name not in _PROVIDER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_attribute(f"{__name__}.{_PROVIDER_MODULES[name]}:{name}")
+
 
 __all__ = [
     "AzureSTTProvider",
@@ -5,8 +5,10 @@ from abc import abstractmethod
 from collections.abc import AsyncIterator
 
 from src.application.interfaces.stt_provider import ISTTProvider
+from src.application.services.metrics import track_provider_call
 from src.domain.entities.audio import AudioData
 from src.domain.entities.stt import SpeakerSegment, STTRequest, STTResult, WordTiming
+from src.domain.services.audio_probe import probe_duration_ms
 
 
 class BaseSTTProvider(ISTTProvider):
@@ -23,7 +25,8 @@ class BaseSTTProvider(ISTTProvider):
         """Transcribe audio with timing measurement."""
         start_time = time.perf_counter()
 
-        transcript, word_timings, confidence = await self._do_transcribe(request)
+        with track_provider_call("stt", self._name):
+            transcript, word_timings, confidence = await self._do_transcribe(request)
 
         latency_ms = int((time.perf_counter() - start_time) * 1000)
 
@@ -113,13 +116,5 @@ class BaseSTTProvider(ISTTProvider):
         return segments
 
     def _estimate_audio_duration(self, audio: AudioData) -> int | None:
-        """Estimate audio duration in milliseconds."""
-        try:
-            # For raw PCM: duration = bytes / (sample_rate * channels * bytes_per_sample)
-            # Assuming mono 16-bit audio
-            bytes_per_sample = 2
-            channels = 1
-            duration_seconds = len(audio.data) / (audio.sample_rate * channels * bytes_per_sample)
-            return int(duration_seconds * 1000)
-        except Exception:
-            return None
+        """Get audio duration in milliseconds from the container headers."""
+        return probe_duration_ms(audio)
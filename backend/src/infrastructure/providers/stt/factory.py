@@ -5,18 +5,21 @@ Creates STT provider instances based on configuration and credentials.
 """
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.application.interfaces.stt_provider import ISTTProvider
+from src.application.services.tracing import span
 
-# from src.infrastructure.providers.stt.assemblyai_stt import AssemblyAISTTProvider
-from src.infrastructure.providers.stt.azure_stt import AzureSTTProvider
+# Provider modules import their SDKs, so they are only imported when used
+if TYPE_CHECKING:
+    # from src.infrastructure.providers.stt.assemblyai_stt import AssemblyAISTTProvider
+    from src.infrastructure.providers.stt.azure_stt import AzureSTTProvider
 
-# from src.infrastructure.providers.stt.deepgram_stt import DeepgramSTTProvider
-# from src.infrastructure.providers.stt.elevenlabs_stt import ElevenLabsSTTProvider
-from src.infrastructure.providers.stt.gcp_stt import GCPSTTProvider
-from src.infrastructure.providers.stt.speechmatics_stt import SpeechmaticsSTTProvider
-from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
+    # from src.infrastructure.providers.stt.deepgram_stt import DeepgramSTTProvider
+    # from src.infrastructure.providers.stt.elevenlabs_stt import ElevenLabsSTTProvider
+    from src.infrastructure.providers.stt.gcp_stt import GCPSTTProvider
+    from src.infrastructure.providers.stt.speechmatics_stt import SpeechmaticsSTTProvider
+    from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
 
 
 class STTProviderFactory:
@@ -114,23 +117,24 @@ class STTProviderFactory:
         """
         provider_name = provider_name.lower()
 
-        if provider_name == "azure":
-            return cls._create_azure(credentials)
-        elif provider_name == "gcp":
-            return cls._create_gcp(credentials)
-        elif provider_name == "whisper":
-            return cls._create_whisper(credentials)
-        elif provider_name == "speechmatics":
-            return cls._create_speechmatics(credentials)
-        # TODO: Re-enable after fixing SDK compatibility
-        # elif provider_name == "deepgram":
-        #     return cls._create_deepgram(credentials)
-        # elif provider_name == "assemblyai":
-        #     return cls._create_assemblyai(credentials)
-        # elif provider_name == "elevenlabs":
-        #     return cls._create_elevenlabs(credentials)
-        else:
-            raise ValueError(f"Unknown STT provider: {provider_name}")
+        with span("stt.factory", provider=provider_name):
+            if provider_name == "azure":
+                return cls._create_azure(credentials)
+            elif provider_name == "gcp":
+                return cls._create_gcp(credentials)
+            elif provider_name == "whisper":
+                return cls._create_whisper(credentials)
+            elif provider_name == "speechmatics":
+                return cls._create_speechmatics(credentials)
+            # TODO: Re-enable after fixing SDK compatibility
+            # elif provider_name == "deepgram":
+            #     return cls._create_deepgram(credentials)
+            # elif provider_name == "assemblyai":
+            #     return cls._create_assemblyai(credentials)
+            # elif provider_name == "elevenlabs":
+            #     return cls._create_elevenlabs(credentials)
+            else:
+                raise ValueError(f"Unknown STT provider: {provider_name}")
 
     @classmethod
     def create_default(cls, provider_name: str) -> ISTTProvider:
@@ -147,31 +151,44 @@ class STTProviderFactory:
         """
         provider_name = provider_name.lower()
 
-        if provider_name == "azure":
-            api_key = os.getenv("AZURE_SPEECH_KEY", "")
-            region = os.getenv("AZURE_SPEECH_REGION", "eastasia")
-            if not api_key:
-                raise ValueError("Azure STT requires 'AZURE_SPEECH_KEY' environment variable")
-            return AzureSTTProvider(subscription_key=api_key, region=region)
-        elif provider_name == "gcp":
-            return GCPSTTProvider()
-        elif provider_name == "whisper":
-            api_key = os.getenv("OPENAI_API_KEY", "")
-            if not api_key:
-                raise ValueError("Whisper STT requires 'OPENAI_API_KEY' environment variable")
-            return WhisperSTTProvider(api_key=api_key)
-        elif provider_name == "speechmatics":
-            api_key = os.getenv("SPEECHMATICS_API_KEY", "")
-            if not api_key:
-                raise ValueError(
-                    "Speechmatics STT requires 'SPEECHMATICS_API_KEY' environment variable"
+        with span("stt.factory", provider=provider_name):
+            if provider_name == "azure":
+                from src.infrastructure.providers.stt.azure_stt import AzureSTTProvider
+
+                api_key = os.getenv("AZURE_SPEECH_KEY", "")
+                region = os.getenv("AZURE_SPEECH_REGION", "eastasia")
+                if not api_key:
+                    raise ValueError("Azure STT requires 'AZURE_SPEECH_KEY' environment variable")
+                return AzureSTTProvider(subscription_key=api_key, region=region)
+            elif provider_name == "gcp":
+                from src.infrastructure.providers.stt.gcp_stt import GCPSTTProvider
+
+                return GCPSTTProvider()
+            elif provider_name == "whisper":
+                from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
+
+                api_key = os.getenv("OPENAI_API_KEY", "")
+                if not api_key:
+                    raise ValueError("Whisper STT requires 'OPENAI_API_KEY' environment variable")
+                return WhisperSTTProvider(api_key=api_key)
+            elif provider_name == "speechmatics":
+                from src.infrastructure.providers.stt.speechmatics_stt import (
+                    SpeechmaticsSTTProvider,
                 )
-            return SpeechmaticsSTTProvider(api_key=api_key)
-        else:
-            raise ValueError(f"Unknown STT provider: {provider_name}")
+
+                api_key = os.getenv("SPEECHMATICS_API_KEY", "")
+                if not api_key:
+                    raise ValueError(
+                        "Speechmatics STT requires 'SPEECHMATICS_API_KEY' environment variable"
+                    )
+                return SpeechmaticsSTTProvider(api_key=api_key)
+            else:
+                raise ValueError(f"Unknown STT provider: {provider_name}")
 
     @classmethod
-    def _create_azure(cls, credentials: dict[str, Any]) -> AzureSTTProvider:
+    def _create_azure(cls, credentials: dict[str, Any]) -> "AzureSTTProvider":
+        from src.infrastructure.providers.stt.azure_stt import AzureSTTProvider
+
         subscription_key = credentials.get("subscription_key") or credentials.get("api_key")
         region = credentials.get("region", "eastasia")
         if not subscription_key:
@@ -179,25 +196,33 @@ class STTProviderFactory:
         return AzureSTTProvider(subscription_key=subscription_key, region=region)
 
     @classmethod
-    def _create_gcp(cls, credentials: dict[str, Any]) -> GCPSTTProvider:
+    def _create_gcp(cls, credentials: dict[str, Any]) -> "GCPSTTProvider":
+        from src.infrastructure.providers.stt.gcp_stt import GCPSTTProvider
+
         return GCPSTTProvider(
             credentials_path=credentials.get("credentials_path")
             or credentials.get("service_account_json"),
         )
 
     @classmethod
-    def _create_whisper(cls, credentials: dict[str, Any]) -> WhisperSTTProvider:
+    def _create_whisper(cls, credentials: dict[str, Any]) -> "WhisperSTTProvider":
+        from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
+
         api_key = credentials.get("api_key")
         if not api_key:
             raise ValueError("Whisper STT requires 'api_key'")
         return WhisperSTTProvider(api_key=api_key)
 
     @classmethod
-    def _create_speechmatics(cls, credentials: dict[str, Any]) -> SpeechmaticsSTTProvider:
+    def _create_speechmatics(cls, credentials: dict[str, Any]) -> "SpeechmaticsSTTProvider":
         """Create Speechmatics STT provider.
 
         Speechmatics 是兒童語音辨識的業界領導者 (91.8% 準確度)。
         """
+        from src.infrastructure.providers.stt.speechmatics_stt import (
+            SpeechmaticsSTTProvider,
+        )
+
         api_key = credentials.get("api_key")
         if not api_key:
             raise ValueError("Speechmatics STT requires 'api_key'")
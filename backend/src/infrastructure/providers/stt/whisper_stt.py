@@ -101,9 +101,9 @@ class WhisperSTTProvider(BaseSTTProvider):
             word_timings = [
                 WordTiming(
                     word=w.get("word", ""),
-                    start_time=w.get("start", 0.0),
-                    end_time=w.get("end", 0.0),
-                    confidence=None,
+                    # Whisper reports seconds
+                    start_ms=int(w.get("start", 0.0) * 1000),
+                    end_ms=int(w.get("end", 0.0) * 1000),
                 )
                 for w in result["words"]
             ]
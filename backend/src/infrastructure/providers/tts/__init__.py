@@ -1,14 +1,39 @@
-"""TTS Provider Implementations."""
+"""TTS Provider Implementations.
+
+Provider classes are imported on first attribute access, so importing the
+package (or the factory) does not load every provider SDK.
+"""
+
+from typing import TYPE_CHECKING, Any
 
-from src.infrastructure.providers.tts.azure_tts import AzureTTSProvider
-from src.infrastructure.providers.tts.elevenlabs_tts import ElevenLabsTTSProvider
 from src.infrastructure.providers.tts.factory import (
     ProviderNotSupportedError,
     TTSProviderFactory,
 )
-from src.infrastructure.providers.tts.gcp_tts import GCPTTSProvider
-from src.infrastructure.providers.tts.gemini_tts import GeminiTTSProvider
-from src.infrastructure.providers.tts.voai_tts import VoAITTSProvider
+
+if TYPE_CHECKING:
+    from src.infrastructure.providers.tts.azure_tts import AzureTTSProvider
+    from src.infrastructure.providers.tts.elevenlabs_tts import ElevenLabsTTSProvider
+    from src.infrastructure.providers.tts.gcp_tts import GCPTTSProvider
+    from src.infrastructure.providers.tts.gemini_tts import GeminiTTSProvider
+    from src.infrastructure.providers.tts.voai_tts import VoAITTSProvider
+
+_PROVIDER_MODULES = {
+    "AzureTTSProvider": "azure_tts",
+    "ElevenLabsTTSProvider": "elevenlabs_tts",
+    "GCPTTSProvider": "gcp_tts",
+    "GeminiTTSProvider": "gemini_tts",
+    "VoAITTSProvider": "voai_tts",
+}
+
+
+def __getattr__(name: str) -> Any:
+    from src.infrastructure.providers.lazy import import_attribute
+
+    if name not in _PROVIDER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_attribute(f"{__name__}.{_PROVIDER_MODULES[name]}:{name}")
+
 
 __all__ = [
     "GCPTTSProvider",
@@ -8,9 +8,12 @@ from abc import abstractmethod
 from collections.abc import AsyncGenerator
 
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.metrics import track_provider_call
+from src.application.services.voice_catalog import get_voice_catalog
 from src.domain.entities.audio import AudioData, AudioFormat
 from src.domain.entities.tts import TTSRequest, TTSResult
 from src.domain.entities.voice import VoiceProfile
+from src.domain.services.audio_probe import probe_duration_ms
 from src.domain.services.usage_tracker import RateLimitHeaders
 
 
@@ -79,22 +82,40 @@ class BaseTTSProvider(ITTSProvider):
         """
         start_time = time.time()
 
-        audio = await self._do_synthesize(request)
+        with track_provider_call("tts", self._name):
+            audio = await self._do_synthesize(request)
 
         latency_ms = int((time.time() - start_time) * 1000)
 
-        # Estimate duration based on text length and speed
-        # Rough estimate: ~150 words per minute at normal speed
-        words = len(request.text.split())
-        estimated_duration_ms = int((words / 150) * 60 * 1000 / request.speed)
+        duration_ms = probe_duration_ms(audio)
+        if duration_ms is None:
+            duration_ms = self._estimate_duration_ms(request)
 
         return TTSResult(
             request=request,
             audio=audio,
-            duration_ms=estimated_duration_ms,
+            duration_ms=duration_ms,
             latency_ms=latency_ms,
         )
 
+    @staticmethod
+    def _estimate_duration_ms(request: TTSRequest) -> int:
+        """Estimate duration from text when the audio header can't be read.
+
+        Uses ~150 words per minute for whitespace-delimited text and
+        ~4 characters per second for CJK text, which has no word breaks.
+
+        Args:
+            request: TTS synthesis request
+
+        Returns:
+            Estimated duration in milliseconds
+        """
+        words = len(request.text.split())
+        cjk_chars = sum(1 for ch in request.text if "\u3400" <= ch <= "\u9fff")
+        seconds = max(words / 150 * 60, cjk_chars / 4)
+        return int(seconds * 1000 / request.speed)
+
     @abstractmethod
     async def _do_synthesize(self, request: TTSRequest) -> AudioData:
         """Provider-specific synthesis implementation.
@@ -142,8 +163,8 @@ class BaseTTSProvider(ITTSProvider):
     async def get_voice(self, voice_id: str) -> VoiceProfile | None:
         """Get a specific voice profile.
 
-        Default implementation searches through all voices.
-        Override for more efficient lookup if available.
+        Served from the voice catalog when the voice has been synced;
+        otherwise falls back to searching the live voice list.
 
         Args:
             voice_id: Provider-specific voice ID
@@ -151,6 +172,10 @@ class BaseTTSProvider(ITTSProvider):
         Returns:
             Voice profile if found, None otherwise
         """
+        cached = get_voice_catalog().get_voice(self.name, voice_id)
+        if cached is not None:
+            return cached
+
         voices = await self.list_voices()
         for voice in voices:
             if voice.voice_id == voice_id:
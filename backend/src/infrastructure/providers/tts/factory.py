@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.tracing import span
 from src.domain.repositories.provider_credential_repository import (
     IProviderCredentialRepository,
 )
@@ -200,14 +201,17 @@ class TTSProviderFactory:
         used_user_credential = False
         credential_id: uuid.UUID | None = None
 
-        if user_id and credential_repo:
-            user_credential = await credential_repo.get_by_user_and_provider(user_id, provider_name)
-            if user_credential and user_credential.is_valid:
-                api_key = user_credential.api_key
-                used_user_credential = True
-                credential_id = user_credential.id
-
-        provider = cls._create_provider(provider_name, api_key=api_key, **kwargs)
+        with span("tts.factory", provider=provider_name):
+            if user_id and credential_repo:
+                user_credential = await credential_repo.get_by_user_and_provider(
+                    user_id, provider_name
+                )
+                if user_credential and user_credential.is_valid:
+                    api_key = user_credential.api_key
+                    used_user_credential = True
+                    credential_id = user_credential.id
+
+            provider = cls._create_provider(provider_name, api_key=api_key, **kwargs)
 
         return ProviderCreationResult(
             provider=provider,
@@ -11,6 +11,7 @@ import os
 from google.api_core.exceptions import ResourceExhausted
 from google.cloud import texttospeech_v1 as texttospeech
 
+from src.application.services.voice_catalog import get_voice_catalog
 from src.domain.entities.audio import AudioData, AudioFormat
 from src.domain.entities.tts import TTSRequest
 from src.domain.entities.voice import Gender, VoiceProfile
@@ -154,6 +155,10 @@ class GCPTTSProvider(BaseTTSProvider):
         if lookup_id.startswith("gcp:"):
             lookup_id = lookup_id[4:]
 
+        cached = get_voice_catalog().get_voice(self.name, lookup_id)
+        if cached is not None:
+            return cached
+
         # Try to find in all voices (GCP voices are dynamic)
         voices = await self.list_voices()
         for voice in voices:
@@ -17,6 +17,7 @@ from collections.abc import AsyncGenerator
 import httpx
 from pydub import AudioSegment
 
+from src.application.services.tracing import span
 from src.domain.entities.audio import AudioData, AudioFormat
 from src.domain.entities.tts import TTSRequest
 from src.domain.entities.voice import Gender, VoiceProfile
@@ -367,7 +368,8 @@ class GeminiTTSProvider(BaseTTSProvider):
             AudioFormat.FLAC: "flac",
         }
         export_format = format_map.get(target_format, "mp3")
-        audio.export(buffer, format=export_format)
+        with span("audio.encode", format=export_format):
+            audio.export(buffer, format=export_format)
         return buffer.getvalue()
 
     async def synthesize_stream(self, request: TTSRequest) -> AsyncGenerator[bytes, None]:
@@ -15,6 +15,7 @@ from pydub import AudioSegment
 from pydub.effects import normalize
 
 from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.services.tracing import span
 from src.domain.entities.audio import AudioFormat
 from src.domain.entities.multi_role_tts import (
     DialogueTurn,
@@ -144,10 +145,11 @@ class SegmentedMergerService:
             audio_data = result.audio.data
 
             # Convert to AudioSegment
-            segment = AudioSegment.from_file(
-                io.BytesIO(audio_data),
-                format=self._config.output_format.value,
-            )
+            with span("audio.decode", format=self._config.output_format.value):
+                segment = AudioSegment.from_file(
+                    io.BytesIO(audio_data),
+                    format=self._config.output_format.value,
+                )
 
             # Record timing before adding gap
             turn_start = current_position_ms
@@ -172,16 +174,18 @@ class SegmentedMergerService:
             if self._config.request_delay_ms > 0 and i < len(turns) - 1:
                 await asyncio.sleep(self._config.request_delay_ms / 1000)
 
-        # Merge segments
-        merged = self._merge_segments(segments)
+        with span("audio.merge", segments=len(segments)):
+            # Merge segments
+            merged = self._merge_segments(segments)
 
-        # Normalize audio
-        merged = normalize(merged, headroom=abs(self._config.target_dbfs))
+            # Normalize audio
+            merged = normalize(merged, headroom=abs(self._config.target_dbfs))
 
         # Export to bytes
-        output_buffer = io.BytesIO()
-        merged.export(output_buffer, format=self._config.output_format.value)
-        audio_content = output_buffer.getvalue()
+        with span("audio.encode", format=self._config.output_format.value):
+            output_buffer = io.BytesIO()
+            merged.export(output_buffer, format=self._config.output_format.value)
+            audio_content = output_buffer.getvalue()
 
         # Calculate metrics
         latency_ms = int((time.time() - start_time) * 1000)
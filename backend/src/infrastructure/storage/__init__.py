@@ -1,16 +1,25 @@
 """Storage Layer - Storage service implementations."""
 
+from typing import Any
+
 from src.infrastructure.storage.dj_audio_storage import DJAudioStorageService
 from src.infrastructure.storage.local_storage import LocalStorage
 
 # Alias for backward compatibility
 LocalStorageService = LocalStorage
 
-# S3 is optional - only import if aioboto3 is available
-try:
-    from src.infrastructure.storage.s3_storage import S3StorageService
-except ImportError:
-    S3StorageService = None  # type: ignore
+
+def __getattr__(name: str) -> Any:
+    # S3 is optional and aioboto3 is slow to import: load it on first access,
+    # as None when aioboto3 is not installed
+    if name == "S3StorageService":
+        try:
+            from src.infrastructure.storage.s3_storage import S3StorageService
+        except ImportError:
+            return None
+        return S3StorageService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "LocalStorage",
@@ -10,16 +10,21 @@ from uuid import UUID
 import aiofiles
 import aiofiles.os
 
+from src.infrastructure.storage.session_recorder import SessionAudioRecorder
+
 
 class AudioStorageService:
     """Service for managing interaction audio files.
 
     Storage structure:
     storage/interactions/{session_id}/
-        turn_001_user.webm
-        turn_001_ai.mp3
-        turn_002_user.webm
-        turn_002_ai.mp3
+        turn_001_user.wav
+        turn_001_ai.wav
+        turn_002_user.wav
+        turn_002_ai.wav
+
+    Streamed sessions are written as PCM16 WAV by SessionAudioRecorder;
+    batch uploads keep the client's format (e.g. webm/mp3).
     """
 
     def __init__(self, base_path: str = "storage/interactions") -> None:
@@ -68,29 +73,12 @@ class AudioStorageService:
 
         return str(path.relative_to(self._base_path.parent))
 
-    async def append_user_audio(
-        self, session_id: UUID, turn_number: int, audio_chunk: bytes, format: str = "webm"
-    ) -> str:
-        """Append audio chunk to user audio file (for streaming)."""
-        await self.ensure_session_dir(session_id)
-        path = self._user_audio_path(session_id, turn_number, format)
-
-        async with aiofiles.open(path, "ab") as f:
-            await f.write(audio_chunk)
-
-        return str(path.relative_to(self._base_path.parent))
-
-    async def append_ai_audio(
-        self, session_id: UUID, turn_number: int, audio_chunk: bytes, format: str = "mp3"
-    ) -> str:
-        """Append audio chunk to AI audio file (for streaming)."""
-        await self.ensure_session_dir(session_id)
-        path = self._ai_audio_path(session_id, turn_number, format)
-
-        async with aiofiles.open(path, "ab") as f:
-            await f.write(audio_chunk)
-
-        return str(path.relative_to(self._base_path.parent))
+    def create_recorder(self, session_id: UUID) -> SessionAudioRecorder:
+        """Create a buffered recorder for streaming a session's audio to disk."""
+        return SessionAudioRecorder(
+            session_dir=self._session_dir(session_id),
+            relative_to=self._base_path.parent,
+        )
 
     async def get_audio(self, relative_path: str) -> bytes | None:
         """Read audio file by relative path."""
@@ -7,7 +7,9 @@ Manages audio file storage for DJ tracks.
 Supports local filesystem with option for GCS in production.
 """
 
+import asyncio
 import shutil
+from collections.abc import AsyncIterator
 from datetime import timedelta
 from pathlib import Path
 from uuid import UUID
@@ -15,6 +17,13 @@ from uuid import UUID
 import aiofiles
 import aiofiles.os
 
+from src.application.interfaces.storage_service import StoredObject
+from src.infrastructure.storage.file_streaming import (
+    DEFAULT_CHUNK_SIZE,
+    iter_local_file,
+    stat_local_file,
+)
+
 # GCS support - optional
 try:
     from google.cloud import storage
@@ -197,6 +206,93 @@ class DJAudioStorageService:
 
         return blob.download_as_bytes()
 
+    # =========================================================================
+    # Streaming Methods
+    # =========================================================================
+
+    def resolve_local_path(self, relative_path: str) -> Path | None:
+        """Resolve a path under the DJ audio directory, rejecting traversal.
+
+        Args:
+            relative_path: Path relative to the DJ audio base directory
+
+        Returns:
+            Resolved local path, or None if it escapes the base directory
+        """
+        base = self._base_path.resolve()
+        path = (base / relative_path).resolve()
+        if not path.is_relative_to(base):
+            return None
+        return path
+
+    async def stat(self, storage_path: str) -> StoredObject:
+        """Get size, ETag and modification time without reading the audio.
+
+        Args:
+            storage_path: Storage path (gs:// URL or local path)
+
+        Returns:
+            Metadata of the stored audio
+
+        Raises:
+            FileNotFoundError: If the audio doesn't exist
+        """
+        if storage_path.startswith("gs://"):
+            return await asyncio.to_thread(self._stat_gcs, storage_path)
+        return stat_local_file(Path(storage_path), storage_path)
+
+    def _stat_gcs(self, storage_path: str) -> StoredObject:
+        """Get GCS object metadata."""
+        if not self.is_using_gcs:
+            raise FileNotFoundError(f"File not found: {storage_path}")
+
+        gcs_path = storage_path.replace(f"gs://{self._gcs_bucket_name}/", "")
+        blob = self._gcs_bucket.get_blob(gcs_path)
+        if blob is None:
+            raise FileNotFoundError(f"File not found: {storage_path}")
+
+        return StoredObject(
+            key=storage_path,
+            size_bytes=blob.size,
+            content_type=blob.content_type or self.DEFAULT_CONTENT_TYPE,
+            etag=f'"{blob.etag}"',
+            last_modified=blob.updated,
+        )
+
+    async def stream(
+        self,
+        storage_path: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of track audio with constant memory.
+
+        Args:
+            storage_path: Storage path (gs:// URL or local path)
+            start: First byte offset
+            end: Last byte offset, inclusive (None for end of file)
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            Audio content chunks
+        """
+        if not storage_path.startswith("gs://"):
+            async for chunk in iter_local_file(Path(storage_path), start, end, chunk_size):
+                yield chunk
+            return
+
+        info = await self.stat(storage_path)
+        stop = info.size_bytes - 1 if end is None else min(end, info.size_bytes - 1)
+        gcs_path = storage_path.replace(f"gs://{self._gcs_bucket_name}/", "")
+        blob = self._gcs_bucket.blob(gcs_path)
+
+        offset = start
+        while offset <= stop:
+            chunk_end = min(offset + chunk_size - 1, stop)
+            yield await asyncio.to_thread(blob.download_as_bytes, start=offset, end=chunk_end)
+            offset = chunk_end + 1
+
     # =========================================================================
     # URL Generation Methods
     # =========================================================================
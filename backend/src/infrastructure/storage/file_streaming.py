@@ -0,0 +1,83 @@
+"""Constant-memory streaming of local files.
+
+Shared by LocalStorage and DJAudioStorageService. Files are memory-mapped
+and served slice by slice, so only the chunk being sent is resident.
+"""
+
+import asyncio
+import hashlib
+import mimetypes
+import mmap
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.application.interfaces.storage_service import StoredObject
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def stat_local_file(path: Path, key: str, content_type: str | None = None) -> StoredObject:
+    """Build StoredObject metadata from a local file's stat.
+
+    Args:
+        path: Absolute or relative path on disk
+        key: Storage key reported back to callers
+        content_type: MIME type; guessed from the extension when omitted
+
+    Returns:
+        Metadata of the file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not path.is_file():
+        raise FileNotFoundError(f"File not found: {key}")
+
+    st = path.stat()
+    # Same weak validator StaticFiles uses: changes whenever size or mtime does
+    etag = hashlib.md5(f"{st.st_mtime}-{st.st_size}".encode(), usedforsecurity=False).hexdigest()
+
+    return StoredObject(
+        key=key,
+        size_bytes=st.st_size,
+        content_type=content_type
+        or mimetypes.guess_type(path.name)[0]
+        or "application/octet-stream",
+        etag=f'"{etag}"',
+        last_modified=datetime.fromtimestamp(st.st_mtime, tz=UTC),
+    )
+
+
+async def iter_local_file(
+    path: Path,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Stream a byte range of a local file via mmap.
+
+    Each slice is copied out of the mapping in a worker thread so page
+    faults on cold files don't block the event loop.
+
+    Args:
+        path: Path on disk
+        start: First byte offset
+        end: Last byte offset, inclusive (None for end of file)
+        chunk_size: Maximum size of each yielded chunk
+
+    Yields:
+        File content chunks
+    """
+    with open(path, "rb") as f:
+        size = path.stat().st_size
+        if size == 0:
+            return
+
+        stop = size if end is None else min(end + 1, size)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            offset = start
+            while offset < stop:
+                next_offset = min(offset + chunk_size, stop)
+                yield await asyncio.to_thread(mapped.__getitem__, slice(offset, next_offset))
+                offset = next_offset
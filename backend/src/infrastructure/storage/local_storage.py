@@ -5,14 +5,21 @@ T032: Complete local storage implementation (storage/{provider}/{uuid}.mp3)
 
 import os
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 
 import aiofiles
 
-from src.application.interfaces.storage_service import IStorageService, StoredFile
+from src.application.interfaces.storage_service import IStorageService, StoredFile, StoredObject
+from src.application.services.metrics import track_storage
 from src.domain.entities.audio import AudioData
 from src.domain.errors import StorageError
+from src.infrastructure.storage.file_streaming import (
+    DEFAULT_CHUNK_SIZE,
+    iter_local_file,
+    stat_local_file,
+)
 
 
 class LocalStorage(IStorageService):
@@ -75,8 +82,9 @@ class LocalStorage(IStorageService):
             file_path = Path(self.base_path) / key
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(data)
+            with track_storage("local", "upload"):
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(data)
 
             # Generate URL without checking existence (file was just created)
             if key.startswith("storage/"):
@@ -148,8 +156,9 @@ class LocalStorage(IStorageService):
             if not full_path.exists():
                 raise FileNotFoundError(f"File not found: {key}")
 
-            async with aiofiles.open(full_path, "rb") as f:
-                return await f.read()
+            with track_storage("local", "download"):
+                async with aiofiles.open(full_path, "rb") as f:
+                    return await f.read()
 
         except FileNotFoundError:
             raise
@@ -158,6 +167,47 @@ class LocalStorage(IStorageService):
         except Exception as e:
             raise StorageError(f"Unexpected error downloading file: {str(e)}") from e
 
+    def _full_path(self, key: str) -> Path:
+        """Resolve a storage key to its path on disk."""
+        if key.startswith("storage/"):
+            return Path(self.base_path).parent / key
+        return Path(self.base_path) / key
+
+    async def stat(self, key: str) -> StoredObject:
+        """Get file metadata from the filesystem without reading the file.
+
+        Args:
+            key: Storage key/path of the file
+
+        Returns:
+            Metadata of the stored file
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        return stat_local_file(self._full_path(key), key)
+
+    async def stream(
+        self,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a file via mmap.
+
+        Args:
+            key: Storage key/path of the file
+            start: First byte offset
+            end: Last byte offset, inclusive (None for end of file)
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            File content chunks
+        """
+        async for chunk in iter_local_file(self._full_path(key), start, end, chunk_size):
+            yield chunk
+
     async def get(self, path: str) -> bytes:
         """Retrieve audio data from storage.
 
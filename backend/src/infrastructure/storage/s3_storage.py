@@ -1,12 +1,33 @@
 """AWS S3 Storage Service Implementation."""
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Any
+
 import aioboto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from src.application.interfaces.storage_service import IStorageService, StoredFile, StoredObject
+from src.application.services.metrics import track_storage
+
+_NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound"}
 
-from src.application.interfaces.storage_service import IStorageService, StoredFile
+# S3 requires every part except the last to be at least 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
 
 
 class S3StorageService(IStorageService):
-    """AWS S3 storage implementation."""
+    """AWS S3 storage implementation.
+
+    Call ``open()`` once (the app lifespan does this) to create a
+    long-lived client that is shared by all operations; until then each
+    call falls back to a short-lived client.
+    """
 
     def __init__(
         self,
@@ -15,6 +36,9 @@ class S3StorageService(IStorageService):
         access_key_id: str | None = None,
         secret_access_key: str | None = None,
         endpoint_url: str | None = None,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize S3 storage service.
 
@@ -24,19 +48,29 @@ class S3StorageService(IStorageService):
             access_key_id: AWS access key (optional, uses default credentials if not provided)
             secret_access_key: AWS secret key (optional)
             endpoint_url: Custom endpoint URL (for S3-compatible services like MinIO)
+            multipart_threshold: Uploads at or above this size use multipart upload
+            part_size: Size of each multipart part (at least 5 MiB)
+            max_concurrency: Maximum parts uploaded in parallel
         """
         self._bucket_name = bucket_name
         self._region = region
         self._access_key_id = access_key_id
         self._secret_access_key = secret_access_key
         self._endpoint_url = endpoint_url
+        self._multipart_threshold = multipart_threshold
+        self._part_size = max(part_size, MIN_PART_SIZE)
+        self._max_concurrency = max_concurrency
 
         self._session = aioboto3.Session()
+        self._client: Any = None
+        self._exit_stack: contextlib.AsyncExitStack | None = None
 
     def _get_client_config(self) -> dict:
         """Get boto3 client configuration."""
-        config = {
+        config: dict[str, Any] = {
             "region_name": self._region,
+            # Keep enough pooled connections for concurrent multipart parts
+            "config": Config(max_pool_connections=max(10, self._max_concurrency * 2)),
         }
 
         if self._access_key_id and self._secret_access_key:
@@ -48,26 +82,61 @@ class S3StorageService(IStorageService):
 
         return config
 
+    async def open(self) -> None:
+        """Open the shared client. Safe to call more than once."""
+        if self._client is not None:
+            return
+        exit_stack = contextlib.AsyncExitStack()
+        self._client = await exit_stack.enter_async_context(
+            self._session.client("s3", **self._get_client_config())
+        )
+        self._exit_stack = exit_stack
+
+    async def close(self) -> None:
+        """Close the shared client and its connection pool."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._client = None
+        self._exit_stack = None
+
+    async def __aenter__(self) -> "S3StorageService":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.close()
+
+    @contextlib.asynccontextmanager
+    async def _s3(self) -> AsyncIterator[Any]:
+        """Yield the shared client, or a short-lived one if not opened."""
+        if self._client is not None:
+            yield self._client
+            return
+        async with self._session.client("s3", **self._get_client_config()) as s3:
+            yield s3
+
     async def upload(
         self,
         key: str,
         data: bytes,
         content_type: str | None = None,
     ) -> StoredFile:
-        """Upload data to S3."""
-        config = self._get_client_config()
+        """Upload data to S3, using multipart upload for large objects."""
+        extra_args = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
 
-        async with self._session.client("s3", **config) as s3:
-            extra_args = {}
-            if content_type:
-                extra_args["ContentType"] = content_type
-
-            await s3.put_object(
-                Bucket=self._bucket_name,
-                Key=key,
-                Body=data,
-                **extra_args,
-            )
+        with track_storage("s3", "upload"):
+            async with self._s3() as s3:
+                if len(data) >= self._multipart_threshold:
+                    await self._upload_multipart(s3, key, data, extra_args)
+                else:
+                    await s3.put_object(
+                        Bucket=self._bucket_name,
+                        Key=key,
+                        Body=data,
+                        **extra_args,
+                    )
 
         # Generate URL
         url = await self.get_url(key) or ""
@@ -79,26 +148,74 @@ class S3StorageService(IStorageService):
             content_type=content_type or "application/octet-stream",
         )
 
-    async def download(self, key: str) -> bytes | None:
-        """Download data from S3."""
-        config = self._get_client_config()
+    async def _upload_multipart(
+        self,
+        s3: Any,
+        key: str,
+        data: bytes,
+        extra_args: dict[str, str],
+    ) -> None:
+        """Upload parts concurrently; abort the upload if any part fails."""
+        created = await s3.create_multipart_upload(
+            Bucket=self._bucket_name,
+            Key=key,
+            **extra_args,
+        )
+        upload_id = created["UploadId"]
+        view = memoryview(data)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def upload_part(part_number: int, offset: int) -> dict[str, Any]:
+            async with semaphore:
+                response = await s3.upload_part(
+                    Bucket=self._bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=bytes(view[offset : offset + self._part_size]),
+                )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
 
         try:
-            async with self._session.client("s3", **config) as s3:
-                response = await s3.get_object(
+            parts = await asyncio.gather(
+                *(
+                    upload_part(number, offset)
+                    for number, offset in enumerate(range(0, len(data), self._part_size), 1)
+                )
+            )
+            await s3.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except Exception:
+            with contextlib.suppress(Exception):
+                await s3.abort_multipart_upload(
                     Bucket=self._bucket_name,
                     Key=key,
+                    UploadId=upload_id,
                 )
-                return await response["Body"].read()
+            raise
+
+    async def download(self, key: str) -> bytes | None:
+        """Download data from S3."""
+        try:
+            with track_storage("s3", "download"):
+                async with self._s3() as s3:
+                    response = await s3.get_object(
+                        Bucket=self._bucket_name,
+                        Key=key,
+                    )
+                    async with response["Body"] as body:
+                        return await body.read()
         except Exception:
             return None
 
     async def delete(self, key: str) -> bool:
         """Delete data from S3."""
-        config = self._get_client_config()
-
         try:
-            async with self._session.client("s3", **config) as s3:
+            async with self._s3() as s3:
                 await s3.delete_object(
                     Bucket=self._bucket_name,
                     Key=key,
@@ -108,12 +225,14 @@ class S3StorageService(IStorageService):
             return False
 
     async def get_url(self, key: str, expires_in: int = 3600) -> str | None:
-        """Get presigned URL for accessing the file."""
-        config = self._get_client_config()
+        """Get presigned URL for accessing the file.
 
+        Presigning is a local signature computation, so with the shared
+        client open this makes no network call.
+        """
         try:
-            async with self._session.client("s3", **config) as s3:
-                url = await s3.generate_presigned_url(
+            async with self._s3() as s3:
+                return await s3.generate_presigned_url(
                     "get_object",
                     Params={
                         "Bucket": self._bucket_name,
@@ -121,16 +240,13 @@ class S3StorageService(IStorageService):
                     },
                     ExpiresIn=expires_in,
                 )
-                return url
         except Exception:
             return None
 
     async def exists(self, key: str) -> bool:
         """Check if file exists in S3."""
-        config = self._get_client_config()
-
         try:
-            async with self._session.client("s3", **config) as s3:
+            async with self._s3() as s3:
                 await s3.head_object(
                     Bucket=self._bucket_name,
                     Key=key,
@@ -138,3 +254,37 @@ class S3StorageService(IStorageService):
                 return True
         except Exception:
             return False
+
+    async def stat(self, key: str) -> StoredObject:
+        """Get object metadata with a HEAD request."""
+        try:
+            async with self._s3() as s3:
+                head = await s3.head_object(Bucket=self._bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _NOT_FOUND_CODES:
+                raise FileNotFoundError(f"File not found: {key}") from e
+            raise
+
+        return StoredObject(
+            key=key,
+            size_bytes=head["ContentLength"],
+            content_type=head.get("ContentType", "application/octet-stream"),
+            etag=head["ETag"],
+            last_modified=head.get("LastModified"),
+        )
+
+    async def stream(
+        self,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = 256 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of an object using a ranged GET."""
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+
+        async with self._s3() as s3:
+            response = await s3.get_object(Bucket=self._bucket_name, Key=key, Range=byte_range)
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(chunk_size):
+                    yield chunk
@@ -0,0 +1,230 @@
+"""Buffered per-session recorder for interaction audio.
+
+Keeps one open file handle per (turn, speaker) stream and buffers incoming
+PCM16 chunks in memory. Buffers are flushed in a worker thread when they
+grow past a threshold or on a periodic timer, so the WebSocket hot path
+never touches the filesystem. Closing a stream patches in a proper WAV
+header; turns are finalized in the background after they end.
+"""
+
+import asyncio
+import contextlib
+import logging
+import struct
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+Speaker = Literal["user", "ai"]
+
+WAV_HEADER_SIZE = 44
+DEFAULT_FLUSH_BYTES = 64 * 1024
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+def build_wav_header(data_size: int, sample_rate: int, channels: int = 1) -> bytes:
+    """Build a 44-byte PCM16 WAV header.
+
+    Args:
+        data_size: Size of the PCM data chunk in bytes
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+
+    Returns:
+        RIFF/WAVE header bytes
+    """
+    block_align = channels * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+class _AudioStream:
+    """One PCM16 stream written to a single WAV file."""
+
+    def __init__(self, path: Path, sample_rate: int, channels: int = 1) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.buffer = bytearray()
+        self.data_size = 0
+        self.lock = asyncio.Lock()
+        self._handle: BinaryIO | None = None
+
+    def _write(self, chunk: bytes) -> None:
+        """Write buffered audio (runs in a worker thread)."""
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "wb")  # noqa: SIM115 - held open across flushes
+            # Placeholder header, patched with real sizes on close
+            self._handle.write(build_wav_header(0, self.sample_rate, self.channels))
+        self._handle.write(chunk)
+        self._handle.flush()
+        self.data_size += len(chunk)
+
+    def _close(self) -> None:
+        """Patch the WAV header and close the handle (runs in a worker thread)."""
+        if self._handle is None:
+            return
+        self._handle.seek(0)
+        self._handle.write(build_wav_header(self.data_size, self.sample_rate, self.channels))
+        self._handle.close()
+        self._handle = None
+
+    async def flush(self) -> None:
+        """Write any buffered audio to disk."""
+        async with self.lock:
+            if not self.buffer:
+                return
+            chunk = bytes(self.buffer)
+            self.buffer.clear()
+            await asyncio.to_thread(self._write, chunk)
+
+    async def close(self) -> None:
+        """Flush remaining audio and finalize the WAV file."""
+        await self.flush()
+        async with self.lock:
+            await asyncio.to_thread(self._close)
+
+
+class SessionAudioRecorder:
+    """Records user and AI audio for one interaction session.
+
+    Storage layout matches AudioStorageService:
+    {base_path}/{session_id}/turn_{NNN}_{user|ai}.wav
+    """
+
+    def __init__(
+        self,
+        session_dir: Path,
+        relative_to: Path,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            session_dir: Directory for this session's audio files
+            relative_to: Directory that returned paths are relative to
+            flush_bytes: Buffer size that triggers an immediate background flush
+            flush_interval_s: Interval of the periodic background flush
+        """
+        self._session_dir = session_dir
+        self._relative_to = relative_to
+        self._flush_bytes = flush_bytes
+        self._flush_interval_s = flush_interval_s
+
+        self._streams: dict[tuple[int, Speaker], _AudioStream] = {}
+        self._pending: set[asyncio.Task[None]] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    def _path(self, turn_number: int, speaker: Speaker) -> Path:
+        return self._session_dir / f"turn_{turn_number:03d}_{speaker}.wav"
+
+    def _relative(self, path: Path) -> str:
+        return str(path.relative_to(self._relative_to))
+
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def append(
+        self,
+        turn_number: int,
+        speaker: Speaker,
+        chunk: bytes | memoryview,
+        sample_rate: int,
+    ) -> str:
+        """Buffer a PCM16 chunk for a turn's user or AI stream.
+
+        Does no I/O on the calling task; disk writes happen in background
+        flushes.
+
+        Args:
+            turn_number: Turn the audio belongs to
+            speaker: "user" or "ai"
+            chunk: Raw PCM16 audio
+            sample_rate: Sample rate of the audio, fixed by the first chunk
+
+        Returns:
+            Path of the stream's file relative to the storage root
+        """
+        if self._closed:
+            raise RuntimeError("Recorder is closed")
+
+        key = (turn_number, speaker)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = _AudioStream(self._path(turn_number, speaker), sample_rate)
+            self._streams[key] = stream
+
+        stream.buffer += chunk
+        if len(stream.buffer) >= self._flush_bytes and not stream.lock.locked():
+            self._spawn(stream.flush())
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._periodic_flush())
+
+        return self._relative(stream.path)
+
+    def finalize_turn(self, turn_number: int) -> dict[Speaker, str]:
+        """Close a turn's streams in the background.
+
+        Args:
+            turn_number: Turn to finalize
+
+        Returns:
+            Relative paths of the turn's recorded streams, keyed by speaker
+        """
+        paths: dict[Speaker, str] = {}
+        for speaker in ("user", "ai"):
+            stream = self._streams.pop((turn_number, speaker), None)
+            if stream is not None:
+                paths[speaker] = self._relative(stream.path)
+                self._spawn(stream.close())
+        return paths
+
+    async def _periodic_flush(self) -> None:
+        """Flush all open streams on a fixed interval."""
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            for stream in list(self._streams.values()):
+                try:
+                    await stream.flush()
+                except OSError as e:
+                    logger.warning(f"Failed to flush audio to {stream.path}: {e}")
+
+    async def close(self) -> None:
+        """Finalize every open stream and wait for pending writes."""
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        for turn_number, _speaker in list(self._streams):
+            self.finalize_turn(turn_number)
+
+        if self._pending:
+            results = await asyncio.gather(*self._pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to finalize interaction audio: {result}")
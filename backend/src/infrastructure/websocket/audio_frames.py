@@ -0,0 +1,106 @@
+"""Binary WebSocket audio framing.
+
+Audio travels as binary frames in both directions; JSON is reserved for
+control events. Each frame is a fixed 8-byte little-endian header followed
+by raw PCM16 samples:
+
+    offset 0  uint8   frame type (FrameType)
+    offset 1  uint8   flags (FrameFlag)
+    offset 2  uint16  reserved, must be 0
+    offset 4  uint32  sample rate in Hz
+    offset 8  ...     PCM16 payload
+
+Compared to base64 inside JSON this is ~33% smaller on the wire and skips
+the encode/decode step on both ends.
+"""
+
+import struct
+from dataclasses import dataclass
+from enum import IntEnum, IntFlag
+
+_HEADER = struct.Struct("<BBHI")
+HEADER_SIZE = _HEADER.size
+
+
+class FrameType(IntEnum):
+    """Binary frame payload types."""
+
+    AUDIO = 1
+
+
+class FrameFlag(IntFlag):
+    """Per-frame flags."""
+
+    NONE = 0
+    FIRST = 1  # First audio chunk of a response
+    FINAL = 2  # Last audio chunk of a response (payload may be empty)
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    """Decoded binary audio frame. ``payload`` is a view into the frame."""
+
+    sample_rate: int
+    payload: memoryview
+    flags: FrameFlag = FrameFlag.NONE
+
+    @property
+    def is_first(self) -> bool:
+        return FrameFlag.FIRST in self.flags
+
+    @property
+    def is_final(self) -> bool:
+        return FrameFlag.FINAL in self.flags
+
+
+def encode_audio_frame(
+    pcm: bytes | memoryview,
+    sample_rate: int,
+    *,
+    is_first: bool = False,
+    is_final: bool = False,
+) -> bytes:
+    """Encode PCM16 audio into a binary frame.
+
+    Args:
+        pcm: Raw PCM16 audio
+        sample_rate: Sample rate in Hz
+        is_first: Mark the first chunk of a response
+        is_final: Mark the last chunk of a response
+
+    Returns:
+        Header followed by the PCM payload
+    """
+    flags = FrameFlag.NONE
+    if is_first:
+        flags |= FrameFlag.FIRST
+    if is_final:
+        flags |= FrameFlag.FINAL
+    header = _HEADER.pack(FrameType.AUDIO, flags, 0, sample_rate)
+    return b"".join((header, pcm))
+
+
+def decode_audio_frame(data: bytes | memoryview) -> AudioFrame:
+    """Decode a binary audio frame without copying the payload.
+
+    Args:
+        data: Complete binary WebSocket message
+
+    Returns:
+        Decoded frame
+
+    Raises:
+        ValueError: If the frame is truncated or not an audio frame
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"Binary frame too short: {len(data)} bytes")
+
+    frame_type, flags, _reserved, sample_rate = _HEADER.unpack_from(data)
+    if frame_type != FrameType.AUDIO:
+        raise ValueError(f"Unsupported binary frame type: {frame_type}")
+
+    return AudioFrame(
+        sample_rate=sample_rate,
+        payload=memoryview(data)[HEADER_SIZE:],
+        flags=FrameFlag(flags),
+    )
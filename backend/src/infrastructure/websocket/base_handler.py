@@ -16,6 +16,8 @@ from uuid import UUID
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
+from src.infrastructure.websocket.audio_frames import encode_audio_frame
+
 
 class MessageType(StrEnum):
     """WebSocket message types."""
@@ -136,6 +138,19 @@ class BaseWebSocketHandler(ABC):
             self._logger.error(f"Error sending binary data: {e}")
             raise
 
+    async def send_audio(
+        self,
+        pcm: bytes | memoryview,
+        sample_rate: int,
+        *,
+        is_first: bool = False,
+        is_final: bool = False,
+    ) -> None:
+        """Send PCM16 audio to the client as a binary audio frame."""
+        await self.send_binary(
+            encode_audio_frame(pcm, sample_rate, is_first=is_first, is_final=is_final)
+        )
+
     async def send_error(
         self,
         error_code: str,
@@ -19,20 +19,25 @@ from src.domain.entities import (
     LatencyMetrics,
     SessionStatus,
 )
-from src.domain.repositories.interaction_repository import InteractionRepository
 from src.domain.services.interaction.base import (
     AudioChunk,
     InteractionModeService,
     ResponseEvent,
 )
 from src.domain.services.interaction.latency_tracker import LatencyTracker
+from src.infrastructure.persistence.interaction_write_behind import InteractionWriteBehind
 from src.infrastructure.storage.audio_storage import AudioStorageService
+from src.infrastructure.storage.session_recorder import SessionAudioRecorder
+from src.infrastructure.websocket.audio_frames import decode_audio_frame
 from src.infrastructure.websocket.base_handler import (
     BaseWebSocketHandler,
     MessageType,
     WebSocketMessage,
 )
 
+# Realtime and cascade providers all stream PCM16 responses at 24 kHz
+AI_AUDIO_SAMPLE_RATE = 24000
+
 
 class InteractionWebSocketHandler(BaseWebSocketHandler):
     """Handles WebSocket communication for voice interaction sessions.
@@ -43,6 +48,10 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
     Lightweight Mode:
         When lightweight_mode=True, audio storage is deferred to batch upload
         via REST API, reducing latency for realtime V2V interactions.
+
+    Persistence:
+        Turns and latency metrics go through a write-behind store and are
+        flushed in the background, never awaited on the event path.
     """
 
     def __init__(
@@ -50,7 +59,7 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         websocket: WebSocket,
         user_id: UUID,
         mode_service: InteractionModeService,
-        repository: InteractionRepository,
+        store: InteractionWriteBehind,
         audio_storage: AudioStorageService,
         logger: logging.Logger | None = None,
         lightweight_mode: bool = False,
@@ -58,9 +67,10 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         super().__init__(websocket, logger=logger)
         self._user_id = user_id
         self._mode_service = mode_service
-        self._repository = repository
+        self._store = store
         self._audio_storage = audio_storage
         self._lightweight_mode = lightweight_mode
+        self._recorder: SessionAudioRecorder | None = None
 
         self._session: InteractionSession | None = None
         self._current_turn: ConversationTurn | None = None
@@ -127,8 +137,15 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
 
         # Update session status
         if self._session:
-            self._session.end_session(SessionStatus.DISCONNECTED)
-            await self._repository.update_session(self._session)
+            self._session.end(SessionStatus.DISCONNECTED)
+            self._store.update_session(self._session)
+
+        # Finalize any audio still being recorded
+        if self._recorder:
+            await self._recorder.close()
+
+        # Write everything still buffered
+        await self._store.close()
 
         self._latency_tracker.clear_all()
 
@@ -137,7 +154,7 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
 
         Supports both Text (JSON) and Binary messages:
         - Text: Control messages (config, end_turn, interrupt, ping)
-        - Binary: Audio data with header [4 bytes sample_rate (u32 LE)] + [PCM16 data]
+        - Binary: Audio frames (see audio_frames for the header layout)
         """
         await self.start_heartbeat()
 
@@ -187,22 +204,23 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
             return None
 
     async def _handle_binary_audio(self, data: bytes) -> None:
-        """Handle binary audio data.
+        """Handle a binary audio frame.
 
-        Binary format: [4 bytes sample_rate (uint32 LE)] + [PCM16 audio data]
-        This is more efficient than Base64 JSON (~33% smaller, no encode/decode overhead).
+        The PCM payload is passed on as a view into the received frame, so
+        it is never copied or base64-encoded on the way to the mode service.
         """
         if not self._session or not self._mode_service.is_connected():
             await self.send_error("NOT_CONNECTED", "No active session")
             return
 
-        if len(data) < 4:
-            self._logger.warning("Binary audio data too short (missing header)")
+        try:
+            frame = decode_audio_frame(data)
+        except ValueError as e:
+            self._logger.warning(f"Dropping binary message: {e}")
             return
 
-        # Parse header: sample_rate as uint32 little-endian
-        sample_rate = int.from_bytes(data[:4], byteorder="little")
-        audio_bytes = data[4:]
+        sample_rate = frame.sample_rate
+        audio_bytes = frame.payload
 
         if not audio_bytes:
             return
@@ -211,14 +229,9 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         if not self._current_turn:
             await self._start_new_turn()
 
-        # Lightweight mode: skip sync storage, forward immediately
-        if not self._lightweight_mode and self._current_turn:
-            await self._audio_storage.append_user_audio(
-                session_id=self._session.id,
-                turn_number=self._current_turn.turn_number,
-                audio_chunk=audio_bytes,
-                format="webm",
-            )
+        # Lightweight mode: skip recording, forward immediately
+        if not self._lightweight_mode and self._current_turn and self._recorder:
+            self._recorder.append(self._current_turn.turn_number, "user", audio_bytes, sample_rate)
 
         # Send to mode service immediately (minimal latency path)
         audio_chunk = AudioChunk(
@@ -270,10 +283,11 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
                 ai_role=ai_role,
                 scenario_context=scenario_context,
             )
-            self._session = await self._repository.create_session(self._session)
+            self._session = await self._store.start_session(self._session)
 
-            # Ensure storage directory
+            # Ensure storage directory and open the session recorder
             await self._audio_storage.ensure_session_dir(self._session.id)
+            self._recorder = self._audio_storage.create_recorder(self._session.id)
 
             # Connect mode service
             await self._mode_service.connect(
@@ -325,16 +339,11 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         if not self._current_turn:
             await self._start_new_turn()
 
-        # Lightweight mode: skip sync storage, forward immediately to Gemini
+        # Lightweight mode: skip recording, forward immediately to Gemini
         # Audio can be uploaded later via batch REST API
-        if not self._lightweight_mode and self._current_turn:
-            # Standard mode: store audio synchronously
-            await self._audio_storage.append_user_audio(
-                session_id=self._session.id,
-                turn_number=self._current_turn.turn_number,
-                audio_chunk=audio_bytes,
-                format="webm",
-            )
+        if not self._lightweight_mode and self._current_turn and self._recorder:
+            # Standard mode: buffer audio in the recorder (flushed in background)
+            self._recorder.append(self._current_turn.turn_number, "user", audio_bytes, sample_rate)
 
         # Send to mode service immediately (minimal latency path)
         audio_chunk = AudioChunk(
@@ -367,7 +376,7 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         # Record text as user input in the turn
         if self._current_turn:
             self._current_turn.set_user_input(text)
-            await self._repository.update_turn(self._current_turn)
+            self._store.save_turn(self._current_turn)
 
         # Send text to mode service
         await self._mode_service.send_text(text)
@@ -405,13 +414,13 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         # Reset response_started flag for new turn
         self._response_started_sent = False
 
-        turn_number = await self._repository.get_next_turn_number(self._session.id)
+        turn_number = self._store.next_turn_number()
         self._current_turn = ConversationTurn(
             session_id=self._session.id,
             turn_number=turn_number,
             started_at=datetime.utcnow(),
         )
-        self._current_turn = await self._repository.create_turn(self._current_turn)
+        self._store.save_turn(self._current_turn)
         self._latency_tracker.start_turn(self._current_turn.id)
         self._logger.debug(f"Started turn {turn_number} for session {self._session.id}")
 
@@ -425,7 +434,16 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
             return None
 
         self._current_turn.end()
-        await self._repository.update_turn(self._current_turn)
+
+        # Finalize recorded audio in the background; paths are known up front
+        if self._recorder:
+            paths = self._recorder.finalize_turn(self._current_turn.turn_number)
+            if "user" in paths:
+                self._current_turn.user_audio_path = paths["user"]
+            if "ai" in paths:
+                self._current_turn.ai_audio_path = paths["ai"]
+
+        self._store.save_turn(self._current_turn)
 
         # Calculate and save latency metrics
         if self._session.mode == InteractionMode.REALTIME:
@@ -434,7 +452,7 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
             metrics = self._latency_tracker.get_metrics_cascade(self._current_turn.id)
 
         if metrics:
-            await self._repository.create_latency_metrics(metrics)
+            self._store.add_latency_metrics(metrics)
 
         self._latency_tracker.clear_turn(self._current_turn.id)
         self._current_turn = None
@@ -483,7 +501,7 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
             if self._current_turn:
                 self._latency_tracker.mark_stt_completed(self._current_turn.id)
                 self._current_turn.set_user_input(data.get("text", ""))
-                await self._repository.update_turn(self._current_turn)
+                self._store.save_turn(self._current_turn)
             # T073b: Include role name in transcript message
             transcript_data = {**data, "role": self._user_role}
             await self.send_message(
@@ -525,6 +543,7 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
         elif event_type == "audio":
             audio_data = data.get("audio")
             is_first = data.get("is_first", False)
+            sample_rate = data.get("sample_rate", AI_AUDIO_SAMPLE_RATE)
 
             if self._current_turn:
                 if is_first:
@@ -543,25 +562,18 @@ class InteractionWebSocketHandler(BaseWebSocketHandler):
                             )
                         )
 
-                # Store AI audio
-                if audio_data and self._session:
-                    audio_bytes = (
-                        base64.b64decode(audio_data) if isinstance(audio_data, str) else audio_data
-                    )
-                    await self._audio_storage.append_ai_audio(
-                        session_id=self._session.id,
-                        turn_number=self._current_turn.turn_number,
-                        audio_chunk=audio_bytes,
+                # Record AI audio; lightweight mode only defers the user's audio
+                if audio_data and self._recorder:
+                    self._recorder.append(
+                        self._current_turn.turn_number, "ai", audio_data, sample_rate
                     )
 
-            # Forward audio to client
-            await self.send_message(
-                WebSocketMessage(
-                    type=MessageType.AUDIO,
-                    session_id=self.session_id,
-                    turn_id=self._current_turn.id if self._current_turn else None,
-                    data=data,
-                )
+            # Forward audio to client as a binary frame
+            await self.send_audio(
+                audio_data or b"",
+                sample_rate,
+                is_first=is_first,
+                is_final=data.get("is_final", False),
             )
 
         elif event_type == "response_ended":
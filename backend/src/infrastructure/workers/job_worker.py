@@ -24,6 +24,8 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.application.interfaces.storage_service import IStorageService
+from src.application.services.loop_monitor import task_context
 from src.application.use_cases.synthesize_multi_role import (
     SynthesizeMultiRoleInput,
     SynthesizeMultiRoleUseCase,
@@ -34,11 +36,13 @@ from src.domain.entities.job import Job, JobStatus, JobType
 from src.domain.entities.multi_role_tts import DialogueTurn, VoiceAssignment
 from src.domain.entities.tts import TTSRequest
 from src.domain.errors import QuotaExceededError
+from src.domain.services.audio_probe import probe_audio
 from src.infrastructure.persistence.credential_repository import (
     SQLAlchemyProviderCredentialRepository,
 )
 from src.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
 from src.infrastructure.persistence.models import AudioFileModel
+from src.infrastructure.profiling import get_profiler
 from src.infrastructure.providers.tts.factory import TTSProviderFactory
 from src.infrastructure.storage.local_storage import LocalStorage
 
@@ -53,6 +57,7 @@ TIMEOUT_CHECK_INTERVAL_SECONDS = 30
 DATA_RETENTION_DAYS = 30
 CLEANUP_INTERVAL_SECONDS = 3600  # 1 hour
 CLEANUP_BATCH_SIZE = 50
+DEFAULT_SAMPLE_RATE = 24000  # Used only when the audio headers can't be read
 
 
 class JobWorker:
@@ -66,15 +71,17 @@ class JobWorker:
         self,
         session_factory: async_sessionmaker[AsyncSession],
         storage_path: str | None = None,
+        storage: IStorageService | None = None,
     ) -> None:
         """Initialize the job worker.
 
         Args:
             session_factory: SQLAlchemy async session factory
-            storage_path: Base path for audio storage
+            storage_path: Base path for local audio storage (ignored if storage is given)
+            storage: Storage service for job output (defaults to LocalStorage)
         """
         self._session_factory = session_factory
-        self._storage = LocalStorage(
+        self._storage = storage or LocalStorage(
             base_path=storage_path or os.getenv("LOCAL_STORAGE_PATH", "./storage")
         )
         self._running = False
@@ -155,15 +162,19 @@ class JobWorker:
 
             logger.info(f"Acquired job: id={job.id}, type={job.job_type}, provider={job.provider}")
 
-            try:
-                # Process the job
-                await self._execute_job(job, session, job_repo)
-            except QuotaExceededError as e:
-                # Quota exhausted — no point retrying
-                await self._handle_job_failure(job, session, job_repo, str(e), no_retry=True)
-            except Exception as e:
-                # Handle job failure
-                await self._handle_job_failure(job, session, job_repo, str(e))
+            with task_context(job_id=str(job.id), job_type=job.job_type.value):
+                async with get_profiler().profile_if_armed("job", f"job-{job.id}"):
+                    try:
+                        # Process the job
+                        await self._execute_job(job, session, job_repo)
+                    except QuotaExceededError as e:
+                        # Quota exhausted — no point retrying
+                        await self._handle_job_failure(
+                            job, session, job_repo, str(e), no_retry=True
+                        )
+                    except Exception as e:
+                        # Handle job failure
+                        await self._handle_job_failure(job, session, job_repo, str(e))
 
     async def _execute_job(
         self,
@@ -322,7 +333,7 @@ class JobWorker:
             job: The job being processed
             audio_content: Raw audio bytes
             content_type: MIME type
-            duration_ms: Audio duration in milliseconds
+            duration_ms: Audio duration in milliseconds, used if the headers can't be read
             session: Database session
 
         Returns:
@@ -349,6 +360,13 @@ class JobWorker:
             content_type=content_type,
         )
 
+        # Prefer the real duration/sample rate from the audio headers
+        sample_rate = DEFAULT_SAMPLE_RATE
+        probe = probe_audio(audio_content)
+        if probe is not None:
+            duration_ms = probe.duration_ms
+            sample_rate = probe.sample_rate
+
         # Create AudioFileModel
         audio_file = AudioFileModel(
             id=uuid.uuid4(),
@@ -356,7 +374,7 @@ class JobWorker:
             filename=filename,
             format=extension.replace(".", ""),
             duration_ms=duration_ms,
-            sample_rate=44100,  # Default sample rate
+            sample_rate=sample_rate,
             file_size_bytes=stored_file.size_bytes,
             storage_path=stored_file.key,
             source="synthesis",
@@ -0,0 +1,267 @@
+"""Background pre-generation of voice previews for the voice catalog.
+
+Previews are otherwise synthesized on the first click, which costs several
+seconds per voice. This worker walks the catalog and resolves every missing
+preview ahead of time, with a bounded number of syntheses per provider.
+
+Progress is tracked as a VoiceSyncJob of type PREVIEWS. Each preview URL is
+committed as soon as it is stored, so a job interrupted by a restart resumes
+by re-running: voices that already have a preview are skipped. The process
+running a job keeps its heartbeat fresh; on startup, a process only claims
+jobs whose heartbeat has gone stale, so each job runs in one process.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Mapping
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.storage_service import IStorageService
+from src.application.interfaces.tts_provider import ITTSProvider
+from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
+from src.application.services.tracing import create_detached_task
+from src.application.services.voice_catalog import get_voice_catalog
+from src.application.use_cases.generate_voice_preview import GenerateVoicePreview
+from src.domain.entities.voice import VoiceProfile
+from src.domain.entities.voice_sync_job import VoiceSyncJob, VoiceSyncJobType
+from src.infrastructure.persistence.voice_cache_repository_impl import VoiceCacheRepositoryImpl
+from src.infrastructure.persistence.voice_sync_job_repository_impl import (
+    VoiceSyncJobRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+# Concurrent preview syntheses per provider
+DEFAULT_PER_PROVIDER_CONCURRENCY = 2
+
+# Persist job progress after this many resolved voices
+PROGRESS_UPDATE_EVERY = 10
+
+# Failure messages kept in the job's error_message
+MAX_REPORTED_ERRORS = 5
+
+# Seconds between heartbeats of a running job
+HEARTBEAT_INTERVAL_S = 30.0
+
+# Heartbeat age after which a RUNNING job is considered orphaned
+STALE_AFTER = timedelta(minutes=2)
+
+
+def _has_cdn_preview(voice: VoiceProfile) -> bool:
+    return voice.provider == "elevenlabs" and bool((voice.metadata or {}).get("preview_url"))
+
+
+class PreviewPregenerationWorker:
+    """Runs preview pre-generation jobs in the background."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        providers: Mapping[str, ITTSProvider],
+        storage: IStorageService,
+        per_provider_concurrency: int = DEFAULT_PER_PROVIDER_CONCURRENCY,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            session_factory: Creates database sessions (e.g. AsyncSessionLocal)
+            providers: System TTS providers used for synthesis
+            storage: Storage service previews are uploaded to
+            per_provider_concurrency: Concurrent syntheses per provider
+        """
+        self._session_factory = session_factory
+        self._providers = providers
+        self._storage = storage
+        self._per_provider_concurrency = per_provider_concurrency
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def running_jobs(self) -> list[str]:
+        """IDs of jobs running in this process."""
+        return list(self._tasks)
+
+    async def start_job(self, providers: list[str] | None = None) -> VoiceSyncJob:
+        """Create a preview job and run it in the background.
+
+        Args:
+            providers: Providers to cover; None = every provider in the catalog
+
+        Returns:
+            The created job (RUNNING)
+
+        Raises:
+            ValueError: If a preview job is already running
+        """
+        async with self._session_factory() as db:
+            repo = VoiceSyncJobRepositoryImpl(db)
+            if self._tasks or await repo.has_running_job(VoiceSyncJobType.PREVIEWS):
+                raise ValueError("A preview pre-generation job is already running")
+
+            job = VoiceSyncJob.create(providers=providers, job_type=VoiceSyncJobType.PREVIEWS)
+            await repo.create(job)
+            job = job.start()
+            await repo.update(job)
+            await repo.heartbeat(job.id)
+            await db.commit()
+
+        self._spawn(job)
+        return job
+
+    async def resume_interrupted(self) -> int:
+        """Resume preview jobs left RUNNING by a process that has stopped.
+
+        Jobs whose heartbeat is still fresh belong to another live process
+        and are left alone.
+
+        Returns:
+            Number of jobs resumed
+        """
+        async with self._session_factory() as db:
+            jobs = await VoiceSyncJobRepositoryImpl(db).claim_stale_jobs(
+                VoiceSyncJobType.PREVIEWS, STALE_AFTER
+            )
+            await db.commit()
+
+        resumed = 0
+        for job in jobs:
+            if job.id not in self._tasks:
+                logger.info("Resuming preview pre-generation job %s", job.id)
+                self._spawn(job)
+                resumed += 1
+        return resumed
+
+    async def stop(self) -> None:
+        """Cancel running jobs; they stay RUNNING and resume on next start."""
+        running = dict(self._tasks)
+        for task in running.values():
+            task.cancel()
+        for task in running.values():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        # Let the next process claim the jobs without waiting for STALE_AFTER
+        for job_id in running:
+            try:
+                async with self._session_factory() as db:
+                    await VoiceSyncJobRepositoryImpl(db).release(job_id)
+                    await db.commit()
+            except Exception as e:
+                logger.warning("Failed to release preview job %s: %s", job_id, e)
+
+    def _spawn(self, job: VoiceSyncJob) -> None:
+        # Started from an admin request; the job must not join that request's trace
+        task = create_detached_task(self._run(job))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _t: self._tasks.pop(job.id, None))
+
+    async def _run(self, job: VoiceSyncJob) -> None:
+        """Run ``job`` while keeping its heartbeat fresh."""
+        heartbeat = asyncio.create_task(self._keep_alive(job.id))
+        try:
+            await self._generate_all(job)
+        finally:
+            heartbeat.cancel()
+
+    async def _keep_alive(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL_S)
+            try:
+                async with self._session_factory() as db:
+                    await VoiceSyncJobRepositoryImpl(db).heartbeat(job_id)
+                    await db.commit()
+            except Exception as e:
+                logger.warning("Failed to refresh heartbeat of preview job %s: %s", job_id, e)
+
+    async def _generate_all(self, job: VoiceSyncJob) -> None:
+        """Resolve every missing preview covered by ``job``."""
+        try:
+            voices = await self._missing_previews(job.providers)
+        except Exception as e:
+            logger.exception("Preview pre-generation job %s failed", job.id)
+            await self._save(job.fail(str(e)))
+            return
+
+        # voices_synced counts previews resolved across runs of this job
+        done_before = job.voices_synced
+        job.voices_total = done_before + len(voices)
+        await self._save(job)
+        logger.info("Preview job %s: %d previews to generate", job.id, len(voices))
+
+        semaphores: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self._per_provider_concurrency)
+        )
+        errors: list[str] = []
+
+        async def generate(voice: VoiceProfile) -> None:
+            try:
+                if _has_cdn_preview(voice):
+                    # Only records the CDN URL; no synthesis
+                    await self._generate(voice)
+                else:
+                    async with semaphores[voice.provider]:
+                        await self._generate(voice)
+            except Exception as e:
+                logger.warning("Preview for %s failed: %s", voice.id, e)
+                errors.append(f"{voice.id}: {e}")
+                return
+
+            job.voices_synced += 1
+            if (job.voices_synced - done_before) % PROGRESS_UPDATE_EVERY == 0:
+                await self._save(job)
+
+        await asyncio.gather(*(generate(v) for v in voices))
+
+        if errors:
+            summary = "; ".join(errors[:MAX_REPORTED_ERRORS])
+            job.fail(f"{len(errors)} of {len(voices)} previews failed: {summary}")
+        else:
+            job.complete(voices_synced=job.voices_synced)
+        await self._save(job)
+        logger.info(
+            "Preview job %s finished: %d generated, %d failed",
+            job.id,
+            len(voices) - len(errors),
+            len(errors),
+        )
+
+    async def _missing_previews(self, providers: list[str]) -> list[VoiceProfile]:
+        """Voices without a preview that can get one, read fresh from voice_cache."""
+        catalog = get_voice_catalog()
+        async with self._session_factory() as db:
+            await catalog.refresh(VoiceCacheRepositoryImpl(db))
+
+        voices = [
+            v
+            for v in catalog.query()
+            if not v.sample_audio_url and (not providers or v.provider in providers)
+        ]
+        # Voices of unconfigured providers can only use a CDN preview
+        return [v for v in voices if v.provider in self._providers or _has_cdn_preview(v)]
+
+    async def _generate(self, voice: VoiceProfile) -> None:
+        async with self._session_factory() as db:
+            use_case = GenerateVoicePreview(
+                self._providers,
+                self._storage,
+                VoiceCacheRepositoryImpl(db),
+                self._open_voice_cache_repository,
+            )
+            await use_case.execute(voice.id)
+
+    @contextlib.asynccontextmanager
+    async def _open_voice_cache_repository(self) -> AsyncIterator[IVoiceCacheRepository]:
+        async with self._session_factory() as db:
+            yield VoiceCacheRepositoryImpl(db)
+            await db.commit()
+
+    async def _save(self, job: VoiceSyncJob) -> None:
+        try:
+            async with self._session_factory() as db:
+                await VoiceSyncJobRepositoryImpl(db).update(job)
+                await db.commit()
+        except Exception as e:
+            logger.warning("Failed to record progress of preview job %s: %s", job.id, e)
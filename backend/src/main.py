@@ -1,27 +1,41 @@
 """Voice Lab API - Main application entry point."""
 
+import asyncio
+import contextlib
 import logging
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from src.application.services.loop_monitor import get_loop_monitor
+from src.application.services.tracing import set_span_exporter
+from src.application.services.voice_catalog import get_voice_catalog
 from src.config import get_settings
-from src.infrastructure.persistence.database import AsyncSessionLocal
+from src.infrastructure.otlp_exporter import OTLPSpanExporter
+from src.infrastructure.persistence.database import AsyncSessionLocal, dispose_engines
+from src.infrastructure.persistence.voice_cache_repository_impl import VoiceCacheRepositoryImpl
+from src.infrastructure.providers.lazy import LazyProviderMap, import_report
 from src.infrastructure.workers.job_worker import JobWorker
 from src.presentation.api import api_router
 from src.presentation.api.middleware.error_handler import (
     RequestIdMiddleware,
     setup_error_handlers,
 )
+from src.presentation.api.middleware.profiling import ProfilingMiddleware
 from src.presentation.api.middleware.rate_limit import (
     RateLimitMiddleware,
     default_rate_limiter,
 )
 
+if TYPE_CHECKING:
+    from src.application.interfaces.storage_service import IStorageService
+    from src.infrastructure.storage.s3_storage import S3StorageService
+
 # Configure logging to show INFO level from all modules
 # This ensures JobWorker and other module logs are visible
 logging.basicConfig(
@@ -35,6 +49,23 @@ settings = get_settings()
 _job_worker: JobWorker | None = None
 
 
+def _s3_storage(storage_service: "IStorageService") -> "S3StorageService | None":
+    """The storage service if it is S3, without importing aioboto3 otherwise."""
+    if os.getenv("STORAGE_TYPE", "local") != "s3":
+        return None
+    from src.infrastructure.storage.s3_storage import S3StorageService
+
+    return storage_service if isinstance(storage_service, S3StorageService) else None
+
+
+async def _warm_up_providers(delay_s: float, *provider_maps: LazyProviderMap) -> None:
+    """Import and construct the configured providers off the event loop."""
+    await asyncio.sleep(delay_s)
+    for provider_map in provider_maps:
+        await asyncio.to_thread(provider_map.warm_up)
+    print(f"Providers warmed up: {import_report()['lazy_imports']}")
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup and shutdown events."""
@@ -47,29 +78,93 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     storage_path = os.getenv("LOCAL_STORAGE_PATH", "./storage")
     os.makedirs(storage_path, exist_ok=True)
 
-    # Initialize providers on startup (lazy initialization in Container)
+    # Configure providers on startup; they are imported on first use
     from src.presentation.api.dependencies import get_container
 
     container = get_container()
-    print(f"TTS Providers: {list(container.get_tts_providers().keys())}")
-    print(f"STT Providers: {list(container.get_stt_providers().keys())}")
-    print(f"LLM Providers: {list(container.get_llm_providers().keys())}")
+    provider_maps = (
+        container.get_tts_providers(),
+        container.get_stt_providers(),
+        container.get_llm_providers(),
+    )
+    for provider_map in provider_maps:
+        print(f"{provider_map.kind} Providers: {provider_map.configured()}")
+    print(f"Provider SDKs loaded at startup: {import_report()['sdk_packages_loaded']}")
+
+    # Open long-lived storage clients (S3 connection pool) once for the app
+    storage_service = container.get_storage_service()
+    s3_storage = _s3_storage(storage_service)
+    if s3_storage is not None:
+        await s3_storage.open()
+
+    # Warm the in-memory voice catalog; on failure it loads on first use
+    try:
+        async with AsyncSessionLocal() as session:
+            count = await get_voice_catalog().refresh(VoiceCacheRepositoryImpl(session))
+        print(f"Voice catalog loaded: {count} voices")
+    except Exception as e:
+        print(f"Voice catalog not loaded at startup: {e}")
+
+    # Watch for callbacks that block the event loop
+    if settings.loop_monitor_enabled:
+        await get_loop_monitor().start()
+
+    # Ship request traces to an OpenTelemetry collector when configured
+    span_exporter: OTLPSpanExporter | None = None
+    if settings.otlp_traces_endpoint:
+        span_exporter = OTLPSpanExporter(settings.otlp_traces_endpoint, settings.app_name)
+        await span_exporter.start()
+        set_span_exporter(span_exporter)
+        print(f"Exporting traces to {settings.otlp_traces_endpoint}")
 
     # Start job worker for background TTS synthesis (Feature 007)
-    _job_worker = JobWorker(session_factory=AsyncSessionLocal, storage_path=storage_path)
+    _job_worker = JobWorker(session_factory=AsyncSessionLocal, storage=storage_service)
     await _job_worker.start()
     print("JobWorker started for background TTS synthesis")
 
+    # Resume preview pre-generation interrupted by the last shutdown
+    preview_worker = container.get_preview_pregeneration_worker()
+    try:
+        resumed = await preview_worker.resume_interrupted()
+        if resumed:
+            print(f"Resumed {resumed} preview pre-generation job(s)")
+    except Exception as e:
+        print(f"Preview pre-generation jobs not resumed: {e}")
+
+    warmup_task: asyncio.Task[None] | None = None
+    if settings.provider_warmup_enabled:
+        warmup_task = asyncio.create_task(
+            _warm_up_providers(settings.provider_warmup_delay_s, *provider_maps)
+        )
+
     yield
 
     # Shutdown
     print(f"Shutting down {settings.app_name}...")
 
+    if warmup_task is not None:
+        warmup_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warmup_task
+
     # Stop job worker gracefully
     if _job_worker:
         await _job_worker.stop()
         print("JobWorker stopped")
 
+    await preview_worker.stop()
+
+    if s3_storage is not None:
+        await s3_storage.close()
+
+    if span_exporter is not None:
+        set_span_exporter(None)
+        await span_exporter.close()
+
+    await get_loop_monitor().stop()
+
+    await dispose_engines()
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -96,6 +191,9 @@ app.add_middleware(
 )
 app.add_middleware(RateLimitMiddleware, limiter=default_rate_limiter)
 app.add_middleware(RequestIdMiddleware)
+# Outermost, so a profiled request includes every middleware
+if settings.profiling_token:
+    app.add_middleware(ProfilingMiddleware, token=settings.profiling_token)
 
 # Include API routes
 app.include_router(api_router, prefix=settings.api_prefix)
@@ -3,6 +3,8 @@
 from fastapi import APIRouter
 
 from src.presentation.api.routes import (
+    admin_memory,
+    admin_profiling,
     admin_voices,
     auth,
     compare,
@@ -46,6 +48,8 @@ api_router.include_router(credentials.router)  # Credentials routes have their o
 api_router.include_router(jobs.router)  # Jobs routes (async job management)
 api_router.include_router(music.router)  # Music generation routes (Mureka AI)
 api_router.include_router(admin_voices.router)  # Admin voice sync routes
+api_router.include_router(admin_profiling.router)  # On-demand sampling profiles
+api_router.include_router(admin_memory.router)  # Allocation snapshots and live buffers
 api_router.include_router(dj.router)  # DJ routes (Magic DJ Controller)
 api_router.include_router(voice_customizations.router)  # Voice customization routes (Feature 013)
 api_router.include_router(quota.router)  # Quota and rate limit status
@@ -5,6 +5,8 @@ following Clean Architecture principles.
 """
 
 import os
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import Depends
@@ -43,6 +45,7 @@ from src.infrastructure.persistence import (
     VoiceCacheRepositoryImpl,
     VoiceCustomizationRepositoryImpl,
     VoiceSyncJobRepositoryImpl,
+    database,
 )
 from src.infrastructure.persistence.credential_repository import (
     SQLAlchemyProviderCredentialRepository,
@@ -52,7 +55,23 @@ from src.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
 from src.infrastructure.persistence.transcription_repository_impl import (
     TranscriptionRepositoryImpl,
 )
+from src.infrastructure.providers.lazy import LazyProvider, LazyProviderMap
 from src.infrastructure.storage import LocalStorageService
+from src.infrastructure.workers.preview_pregeneration import PreviewPregenerationWorker
+
+_TTS = "src.infrastructure.providers.tts"
+_STT = "src.infrastructure.providers.stt"
+_LLM = "src.infrastructure.providers.llm"
+
+
+def _gcp_enabled(credentials_path: str | None) -> bool:
+    return bool(
+        credentials_path
+        or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        or os.getenv("K_SERVICE")  # Cloud Run sets this
+        or os.getenv("GCP_PROJECT")  # Alternative GCP indicator
+        or os.getenv("ENABLE_GCP_PROVIDERS", "").lower() == "true"
+    )
 
 
 class Container:
@@ -62,12 +81,13 @@ class Container:
     """
 
     _instance: "Container | None" = None
-    _tts_providers: dict[str, ITTSProvider] | None = None
-    _stt_providers: dict[str, ISTTProvider] | None = None
-    _llm_providers: dict[str, ILLMProvider] | None = None
+    _tts_providers: LazyProviderMap[ITTSProvider] | None = None
+    _stt_providers: LazyProviderMap[ISTTProvider] | None = None
+    _llm_providers: LazyProviderMap[ILLMProvider] | None = None
     _storage_service: IStorageService | None = None
     _test_record_repo: ITestRecordRepository | None = None
     _voice_repo: IVoiceRepository | None = None
+    _preview_worker: PreviewPregenerationWorker | None = None
 
     @classmethod
     def get_instance(cls) -> "Container":
@@ -76,20 +96,20 @@ class Container:
             cls._instance = Container()
         return cls._instance
 
-    def get_tts_providers(self) -> dict[str, ITTSProvider]:
-        """Get TTS providers (lazy initialization)."""
+    def get_tts_providers(self) -> LazyProviderMap[ITTSProvider]:
+        """Get TTS providers (imported on first use)."""
         if self._tts_providers is None:
             self._tts_providers = self._create_tts_providers()
         return self._tts_providers
 
-    def get_stt_providers(self) -> dict[str, ISTTProvider]:
-        """Get STT providers (lazy initialization)."""
+    def get_stt_providers(self) -> LazyProviderMap[ISTTProvider]:
+        """Get STT providers (imported on first use)."""
         if self._stt_providers is None:
             self._stt_providers = self._create_stt_providers()
         return self._stt_providers
 
-    def get_llm_providers(self) -> dict[str, ILLMProvider]:
-        """Get LLM providers (lazy initialization)."""
+    def get_llm_providers(self) -> LazyProviderMap[ILLMProvider]:
+        """Get LLM providers (imported on first use)."""
         if self._llm_providers is None:
             self._llm_providers = self._create_llm_providers()
         return self._llm_providers
@@ -100,6 +120,16 @@ class Container:
             self._storage_service = self._create_storage_service()
         return self._storage_service
 
+    def get_preview_pregeneration_worker(self) -> PreviewPregenerationWorker:
+        """Get the background preview pre-generation worker."""
+        if self._preview_worker is None:
+            self._preview_worker = PreviewPregenerationWorker(
+                session_factory=database.AsyncSessionLocal,
+                providers=self.get_tts_providers(),
+                storage=self.get_storage_service(),
+            )
+        return self._preview_worker
+
     def get_test_record_repository(self) -> ITestRecordRepository:
         """Get test record repository."""
         if self._test_record_repo is None:
@@ -112,196 +142,148 @@ class Container:
             self._voice_repo = InMemoryVoiceRepository()
         return self._voice_repo
 
-    def _create_tts_providers(self) -> dict[str, ITTSProvider]:
-        """Create TTS provider instances based on configuration."""
-        providers: dict[str, ITTSProvider] = {}
+    def _create_tts_providers(self) -> LazyProviderMap[ITTSProvider]:
+        """Describe the TTS providers enabled by configuration.
+
+        Providers (and their SDKs) are imported and constructed on first use.
+        """
+        providers: dict[str, LazyProvider[ITTSProvider]] = {}
 
         # Gemini TTS - Enable if GOOGLE_AI_API_KEY or GEMINI_API_KEY is set
         google_ai_api_key = os.getenv("GOOGLE_AI_API_KEY") or os.getenv("GEMINI_API_KEY")
         if google_ai_api_key:
-            try:
-                from src.infrastructure.providers.tts import GeminiTTSProvider
-
-                providers["gemini"] = GeminiTTSProvider(
-                    api_key=google_ai_api_key,
-                    model=os.getenv("GEMINI_TTS_MODEL", "gemini-2.5-pro-preview-tts"),
-                )
-            except Exception as e:
-                print(f"Failed to initialize Gemini TTS: {e}")
+            providers["gemini"] = LazyProvider(
+                f"{_TTS}.gemini_tts:GeminiTTSProvider",
+                {
+                    "api_key": google_ai_api_key,
+                    "model": os.getenv("GEMINI_TTS_MODEL", "gemini-2.5-pro-preview-tts"),
+                },
+            )
 
         # Azure TTS
         azure_key = os.getenv("AZURE_SPEECH_KEY")
         azure_region = os.getenv("AZURE_SPEECH_REGION")
         if azure_key and azure_region:
-            try:
-                from src.infrastructure.providers.tts import AzureTTSProvider
-
-                providers["azure"] = AzureTTSProvider(
-                    subscription_key=azure_key,
-                    region=azure_region,
-                )
-            except Exception as e:
-                print(f"Failed to initialize Azure TTS: {e}")
+            providers["azure"] = LazyProvider(
+                f"{_TTS}.azure_tts:AzureTTSProvider",
+                {"subscription_key": azure_key, "region": azure_region},
+            )
 
         # ElevenLabs TTS
         elevenlabs_key = os.getenv("ELEVENLABS_API_KEY")
         if elevenlabs_key:
-            try:
-                from src.infrastructure.providers.tts import ElevenLabsTTSProvider
-
-                providers["elevenlabs"] = ElevenLabsTTSProvider(api_key=elevenlabs_key)
-            except Exception as e:
-                print(f"Failed to initialize ElevenLabs TTS: {e}")
+            providers["elevenlabs"] = LazyProvider(
+                f"{_TTS}.elevenlabs_tts:ElevenLabsTTSProvider", {"api_key": elevenlabs_key}
+            )
 
         # VoAI TTS
         voai_key = os.getenv("VOAI_API_KEY")
         voai_endpoint = os.getenv("VOAI_API_ENDPOINT")
         if voai_key:
-            try:
-                from src.infrastructure.providers.tts import VoAITTSProvider
-
-                providers["voai"] = VoAITTSProvider(api_key=voai_key, api_endpoint=voai_endpoint)
-            except Exception as e:
-                print(f"Failed to initialize VoAI TTS: {e}")
+            providers["voai"] = LazyProvider(
+                f"{_TTS}.voai_tts:VoAITTSProvider",
+                {"api_key": voai_key, "api_endpoint": voai_endpoint},
+            )
 
         # GCP Cloud TTS - Enable if credentials path set, GOOGLE_APPLICATION_CREDENTIALS set,
         # or running in GCP environment (Cloud Run uses ADC automatically)
         gcp_credentials = os.getenv("GCP_CREDENTIALS_PATH")
-        enable_gcp_tts = (
-            gcp_credentials
-            or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            or os.getenv("K_SERVICE")  # Cloud Run sets this
-            or os.getenv("GCP_PROJECT")  # Alternative GCP indicator
-            or os.getenv("ENABLE_GCP_PROVIDERS", "").lower() == "true"
-        )
-        if enable_gcp_tts:
-            try:
-                from src.infrastructure.providers.tts.gcp_tts import GCPTTSProvider
-
-                providers["gcp"] = GCPTTSProvider(credentials_path=gcp_credentials)
-            except Exception as e:
-                print(f"Failed to initialize GCP TTS: {e}")
-
-        return providers
-
-    def _create_stt_providers(self) -> dict[str, ISTTProvider]:
-        """Create STT provider instances based on configuration."""
-        providers: dict[str, ISTTProvider] = {}
+        if _gcp_enabled(gcp_credentials):
+            providers["gcp"] = LazyProvider(
+                f"{_TTS}.gcp_tts:GCPTTSProvider", {"credentials_path": gcp_credentials}
+            )
+
+        return LazyProviderMap("TTS", providers)
+
+    def _create_stt_providers(self) -> LazyProviderMap[ISTTProvider]:
+        """Describe the STT providers enabled by configuration.
+
+        Providers (and their SDKs) are imported and constructed on first use.
+        """
+        providers: dict[str, LazyProvider[ISTTProvider]] = {}
 
         # GCP STT - Enable if credentials path set, GOOGLE_APPLICATION_CREDENTIALS set,
         # or running in GCP environment (Cloud Run uses ADC automatically)
         gcp_credentials = os.getenv("GCP_CREDENTIALS_PATH")
-        enable_gcp = (
-            gcp_credentials
-            or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            or os.getenv("K_SERVICE")  # Cloud Run sets this
-            or os.getenv("GCP_PROJECT")  # Alternative GCP indicator
-            or os.getenv("ENABLE_GCP_PROVIDERS", "").lower() == "true"
-        )
-        if enable_gcp:
-            try:
-                from src.infrastructure.providers.stt import GCPSTTProvider
-
-                providers["gcp"] = GCPSTTProvider(credentials_path=gcp_credentials)
-            except Exception as e:
-                print(f"Failed to initialize GCP STT: {e}")
+        if _gcp_enabled(gcp_credentials):
+            providers["gcp"] = LazyProvider(
+                f"{_STT}.gcp_stt:GCPSTTProvider", {"credentials_path": gcp_credentials}
+            )
 
         # Azure STT
         azure_key = os.getenv("AZURE_SPEECH_KEY")
         azure_region = os.getenv("AZURE_SPEECH_REGION")
         if azure_key and azure_region:
-            try:
-                from src.infrastructure.providers.stt import AzureSTTProvider
-
-                providers["azure"] = AzureSTTProvider(
-                    subscription_key=azure_key,
-                    region=azure_region,
-                )
-            except Exception as e:
-                print(f"Failed to initialize Azure STT: {e}")
+            providers["azure"] = LazyProvider(
+                f"{_STT}.azure_stt:AzureSTTProvider",
+                {"subscription_key": azure_key, "region": azure_region},
+            )
 
         # Whisper STT
         openai_key = os.getenv("OPENAI_API_KEY")
         if openai_key:
-            try:
-                from src.infrastructure.providers.stt import WhisperSTTProvider
-
-                providers["whisper"] = WhisperSTTProvider(api_key=openai_key)
-            except Exception as e:
-                print(f"Failed to initialize Whisper STT: {e}")
+            providers["whisper"] = LazyProvider(
+                f"{_STT}.whisper_stt:WhisperSTTProvider", {"api_key": openai_key}
+            )
 
         # ElevenLabs STT
         elevenlabs_key = os.getenv("ELEVENLABS_API_KEY")
         if elevenlabs_key:
-            try:
-                from src.infrastructure.providers.stt import ElevenLabsSTTProvider
+            providers["elevenlabs"] = LazyProvider(
+                f"{_STT}.elevenlabs_stt:ElevenLabsSTTProvider", {"api_key": elevenlabs_key}
+            )
 
-                providers["elevenlabs"] = ElevenLabsSTTProvider(api_key=elevenlabs_key)
-            except Exception as e:
-                print(f"Failed to initialize ElevenLabs STT: {e}")
+        return LazyProviderMap("STT", providers)
 
-        return providers
+    def _create_llm_providers(self) -> LazyProviderMap[ILLMProvider]:
+        """Describe the LLM providers enabled by configuration.
 
-    def _create_llm_providers(self) -> dict[str, ILLMProvider]:
-        """Create LLM provider instances based on configuration."""
-        providers: dict[str, ILLMProvider] = {}
+        Providers are imported and constructed on first use.
+        """
+        providers: dict[str, LazyProvider[ILLMProvider]] = {}
 
         # OpenAI
         openai_key = os.getenv("OPENAI_API_KEY")
         if openai_key:
-            try:
-                from src.infrastructure.providers.llm import OpenAILLMProvider
-
-                providers["openai"] = OpenAILLMProvider(
-                    api_key=openai_key,
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                )
-            except Exception as e:
-                print(f"Failed to initialize OpenAI LLM: {e}")
+            providers["openai"] = LazyProvider(
+                f"{_LLM}.openai_llm:OpenAILLMProvider",
+                {"api_key": openai_key, "model": os.getenv("OPENAI_MODEL", "gpt-4o-mini")},
+            )
 
         # Azure OpenAI
         azure_openai_key = os.getenv("AZURE_OPENAI_API_KEY")
         azure_openai_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
         azure_openai_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
         if azure_openai_key and azure_openai_endpoint and azure_openai_deployment:
-            try:
-                from src.infrastructure.providers.llm import AzureOpenAILLMProvider
-
-                providers["azure-openai"] = AzureOpenAILLMProvider(
-                    api_key=azure_openai_key,
-                    endpoint=azure_openai_endpoint,
-                    deployment_name=azure_openai_deployment,
-                )
-            except Exception as e:
-                print(f"Failed to initialize Azure OpenAI LLM: {e}")
+            providers["azure-openai"] = LazyProvider(
+                f"{_LLM}.azure_openai_llm:AzureOpenAILLMProvider",
+                {
+                    "api_key": azure_openai_key,
+                    "endpoint": azure_openai_endpoint,
+                    "deployment_name": azure_openai_deployment,
+                },
+            )
 
         # Anthropic
         anthropic_key = os.getenv("ANTHROPIC_API_KEY")
         if anthropic_key:
-            try:
-                from src.infrastructure.providers.llm import AnthropicLLMProvider
-
-                providers["anthropic"] = AnthropicLLMProvider(
-                    api_key=anthropic_key,
-                    model=os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307"),
-                )
-            except Exception as e:
-                print(f"Failed to initialize Anthropic LLM: {e}")
+            providers["anthropic"] = LazyProvider(
+                f"{_LLM}.anthropic_llm:AnthropicLLMProvider",
+                {
+                    "api_key": anthropic_key,
+                    "model": os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307"),
+                },
+            )
 
         # Google Gemini
         gemini_key = os.getenv("GEMINI_API_KEY")
         if gemini_key:
-            try:
-                from src.infrastructure.providers.llm import GeminiLLMProvider
-
-                providers["gemini"] = GeminiLLMProvider(
-                    api_key=gemini_key,
-                    model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp"),
-                )
-            except Exception as e:
-                print(f"Failed to initialize Gemini LLM: {e}")
+            providers["gemini"] = LazyProvider(
+                f"{_LLM}.gemini_llm:GeminiLLMProvider",
+                {"api_key": gemini_key, "model": os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")},
+            )
 
-        return providers
+        return LazyProviderMap("LLM", providers)
 
     def _create_storage_service(self) -> IStorageService:
         """Create storage service based on configuration."""
@@ -331,17 +313,17 @@ def get_container() -> Container:
     return Container.get_instance()
 
 
-def get_tts_providers() -> dict[str, ITTSProvider]:
+def get_tts_providers() -> Mapping[str, ITTSProvider]:
     """FastAPI dependency for TTS providers."""
     return get_container().get_tts_providers()
 
 
-def get_stt_providers() -> dict[str, ISTTProvider]:
+def get_stt_providers() -> Mapping[str, ISTTProvider]:
     """FastAPI dependency for STT providers."""
     return get_container().get_stt_providers()
 
 
-def get_llm_providers() -> dict[str, ILLMProvider]:
+def get_llm_providers() -> Mapping[str, ILLMProvider]:
     """FastAPI dependency for LLM providers."""
     return get_container().get_llm_providers()
 
@@ -351,6 +333,11 @@ def get_storage_service() -> IStorageService:
     return get_container().get_storage_service()
 
 
+def get_preview_pregeneration_worker() -> PreviewPregenerationWorker:
+    """FastAPI dependency for the preview pre-generation worker."""
+    return get_container().get_preview_pregeneration_worker()
+
+
 def get_test_record_repository() -> ITestRecordRepository:
     """FastAPI dependency for test record repository."""
     return get_container().get_test_record_repository()
@@ -361,6 +348,21 @@ def get_voice_repository() -> IVoiceRepository:
     return get_container().get_voice_repository()
 
 
+async def get_read_db_session(
+    primary: Annotated[AsyncSession, Depends(get_db_session)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for read-only history/analytics queries.
+
+    Uses the read replica when DATABASE_READ_URL is configured, otherwise the
+    primary session (which only checks out a connection once it is used).
+    """
+    if database.AsyncReadSessionLocal is None:
+        yield primary
+        return
+    async with database.AsyncReadSessionLocal() as session:
+        yield session
+
+
 def get_provider_credential_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> IProviderCredentialRepository:
@@ -389,6 +391,17 @@ def get_voice_cache_repository(
     return VoiceCacheRepositoryImpl(session)
 
 
+@asynccontextmanager
+async def open_voice_cache_repository() -> AsyncIterator[IVoiceCacheRepository]:
+    """Voice cache repository with its own session, committed on success.
+
+    For work that outlives the request, such as a shared preview generation.
+    """
+    async with database.AsyncSessionLocal() as session:
+        yield VoiceCacheRepositoryImpl(session)
+        await session.commit()
+
+
 def get_voice_sync_job_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> IVoiceSyncJobRepository:
@@ -10,6 +10,9 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.application.services.loop_monitor import set_task_context
+from src.application.services.tracing import span, start_trace
+from src.config import get_settings
 from src.domain.errors import (
     AppError,
     AuthenticationError,
@@ -226,7 +229,12 @@ def setup_error_handlers(app: FastAPI) -> None:
 
 
 class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Middleware to add request ID to each request."""
+    """Middleware to add request ID to each request.
+
+    Also opens the request's trace (continuing an incoming W3C
+    ``traceparent``), so spans recorded while handling it are collected and
+    summarized in the ``Server-Timing`` header.
+    """
 
     async def dispatch(self, request: Request, call_next: Callable) -> JSONResponse:
         """Add request ID to request state."""
@@ -234,8 +242,21 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
 
         request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
         request.state.request_id = request_id
+        set_task_context(request_id=request_id, method=request.method, path=request.url.path)
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+        with start_trace(request.headers.get("traceparent")) as trace:
+            with span(
+                "http.request",
+                method=request.method,
+                path=request.url.path,
+                request_id=request_id,
+            ) as root:
+                response = await call_next(request)
+                if root is not None:
+                    root.set_attribute("status_code", response.status_code)
+
+            response.headers["X-Request-ID"] = request_id
+            if get_settings().server_timing_enabled:
+                response.headers["Server-Timing"] = trace.server_timing(root)
 
         return response
@@ -0,0 +1,57 @@
+"""Per-request profiling middleware.
+
+A request or WebSocket handshake carrying ``X-Profile: <profiling token>``
+is profiled from start to finish, as is the next request or session of a
+target armed through ``/admin/profiling/arm``. The storage key of the
+profile is returned in the ``X-Profile-Key`` response header (or in the
+WebSocket accept headers).
+
+Plain ASGI rather than ``BaseHTTPMiddleware`` so streamed responses and
+WebSocket sessions are profiled until they actually end.
+"""
+
+import hmac
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.profiling import Profiler, get_profiler
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_KEY_HEADER = b"x-profile-key"
+
+
+class ProfilingMiddleware:
+    """Profiles requests that ask for it with the profiling token."""
+
+    def __init__(self, app: ASGIApp, token: str, profiler: Profiler | None = None) -> None:
+        self.app = app
+        self._token = token.encode()
+        self._profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = self._profiler or get_profiler()
+        label = f"{scope['type']}-{scope['path']}"
+        async with profiler.profile(label) as key:
+            if key is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_key(message: Message) -> None:
+                if message["type"] in ("http.response.start", "websocket.accept"):
+                    headers: list[Any] = list(message.get("headers", []))
+                    headers.append((PROFILE_KEY_HEADER, key.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_key)
+
+    def _wanted(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return hmac.compare_digest(value, self._token)
+        return (self._profiler or get_profiler()).take_armed(scope["type"])
@@ -5,7 +5,6 @@ T067: Implement rate limiting middleware
 
 import asyncio
 import time
-from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
@@ -13,6 +12,11 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.domain.errors import RateLimitError
+from src.domain.utils.bounded_store import BoundedStore
+
+# The longest window is an hour; idle clients are forgotten after it
+CLIENT_STATE_TTL_S = 3600
+MAX_TRACKED_CLIENTS = 100_000
 
 
 @dataclass
@@ -50,7 +54,7 @@ class RateLimitConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitState:
     """State for tracking rate limits.
 
@@ -75,7 +79,9 @@ class RateLimiter:
 
     def __init__(self, config: RateLimitConfig | None = None) -> None:
         self.config = config or RateLimitConfig()
-        self._states: dict[str, RateLimitState] = defaultdict(RateLimitState)
+        self._states: BoundedStore[str, RateLimitState] = BoundedStore(
+            "rate_limit_clients", ttl_s=CLIENT_STATE_TTL_S, max_size=MAX_TRACKED_CLIENTS
+        )
         self._lock = asyncio.Lock()
 
     def _get_client_id(self, request: Request) -> str:
@@ -124,7 +130,7 @@ class RateLimiter:
         is_strict = self._is_strict_path(path)
 
         async with self._lock:
-            state = self._states[client_id]
+            state = self._states.get_or_create(client_id, RateLimitState)
             now = time.time()
 
             # --- Reset general windows ---
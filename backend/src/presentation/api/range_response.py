@@ -0,0 +1,130 @@
+"""Streaming file responses with HTTP Range and conditional GET support.
+
+Serves stored audio without loading it into memory: the body is pulled
+from storage chunk by chunk, clients can seek with ``Range`` requests,
+and unchanged files are answered with 304 via ``ETag``/``Last-Modified``.
+"""
+
+import re
+from collections.abc import AsyncIterator, Callable
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, status
+from fastapi.responses import Response, StreamingResponse
+
+from src.application.interfaces.storage_service import StoredObject
+
+BodyFactory = Callable[[int, int | None], AsyncIterator[bytes]]
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range_header(range_header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range`` header into inclusive byte offsets.
+
+    Args:
+        range_header: Raw ``Range`` header value
+        size: Total size of the resource in bytes
+
+    Returns:
+        (start, end) inclusive offsets, or None if the header is malformed
+        or requests multiple ranges (the full body is served instead)
+
+    Raises:
+        ValueError: If the range is well-formed but not satisfiable
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(f"Range {range_header} not satisfiable for size {size}")
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(f"Range {range_header} not satisfiable for size {size}")
+    return start, min(end, size - 1)
+
+
+def _not_modified(request: Request, obj: StoredObject) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the stored object."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or obj.etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and obj.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return obj.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def ranged_file_response(
+    request: Request,
+    obj: StoredObject,
+    body: BodyFactory,
+    *,
+    media_type: str | None = None,
+    filename: str | None = None,
+) -> Response:
+    """Build a streaming response honouring Range and conditional headers.
+
+    Args:
+        request: Incoming request (for Range / If-* headers)
+        obj: Metadata of the stored file
+        body: Factory returning a chunk iterator for an inclusive byte range
+        media_type: Content type override (defaults to the object's)
+        filename: If set, sent as an attachment with this filename
+
+    Returns:
+        200, 206, 304 or 416 response
+    """
+    headers = {"Accept-Ranges": "bytes", "ETag": obj.etag}
+    if obj.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(obj.last_modified, usegmt=True)
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    if _not_modified(request, obj):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    media_type = media_type or obj.content_type
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == obj.etag):
+        try:
+            byte_range = parse_range_header(range_header, obj.size_bytes)
+        except ValueError:
+            # Literal code: the constant's name differs across Starlette versions
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{obj.size_bytes}"},
+            )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(obj.size_bytes)
+        return StreamingResponse(body(0, None), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{obj.size_bytes}"
+    return StreamingResponse(
+        body(start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -0,0 +1,105 @@
+"""Admin Memory Diagnostics API Routes.
+
+Allocation tracing, snapshot diffs and live buffer counts of this worker
+(see ``src.infrastructure.memory_diagnostics``). Protected like the
+profiling endpoints: the ``X-Profile-Token`` header must match the
+``PROFILING_TOKEN`` setting, and the routes are hidden (404) without one.
+"""
+
+import asyncio
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from src.infrastructure.memory_diagnostics import (
+    GroupBy,
+    MemoryDiagnostics,
+    get_memory_diagnostics,
+)
+from src.presentation.api.routes.admin_profiling import require_profiling_token
+
+router = APIRouter(
+    prefix="/admin/memory",
+    tags=["admin-memory"],
+    dependencies=[Depends(require_profiling_token)],
+)
+
+DiagnosticsDep = Annotated[MemoryDiagnostics, Depends(get_memory_diagnostics)]
+
+
+class TracingRequest(BaseModel):
+    """Request to switch allocation tracing on or off."""
+
+    enabled: bool
+    frames: int = Field(default=1, ge=1, le=50)
+
+
+class SnapshotRequest(BaseModel):
+    """Request to snapshot the traced allocations."""
+
+    label: str = ""
+
+
+class SnapshotResponse(BaseModel):
+    """A stored snapshot."""
+
+    id: int
+    label: str
+    traced_bytes: int
+    traced_blocks: int
+
+
+@router.get("")
+async def memory_status(diagnostics: DiagnosticsDep) -> dict[str, Any]:
+    """Tracing state, process RSS and stored snapshots."""
+    return diagnostics.status()
+
+
+@router.post("/tracing")
+async def set_tracing(request: TracingRequest, diagnostics: DiagnosticsDep) -> dict[str, Any]:
+    """Start or stop allocation tracing; no restart needed.
+
+    Tracing slows down every allocation, so leave it off when not in use.
+    """
+    if request.enabled:
+        diagnostics.start(request.frames)
+    else:
+        diagnostics.stop()
+    return diagnostics.status()
+
+
+@router.post("/snapshots", response_model=SnapshotResponse, status_code=201)
+async def take_snapshot(request: SnapshotRequest, diagnostics: DiagnosticsDep) -> SnapshotResponse:
+    """Snapshot the allocations traced so far."""
+    if not diagnostics.tracing:
+        raise HTTPException(status_code=409, detail="Memory tracing is not running")
+    info = await asyncio.to_thread(diagnostics.take_snapshot, request.label)
+    return SnapshotResponse(
+        id=info.id,
+        label=info.label,
+        traced_bytes=info.traced_bytes,
+        traced_blocks=info.traced_blocks,
+    )
+
+
+@router.get("/diff")
+async def diff_snapshots(
+    diagnostics: DiagnosticsDep,
+    base: int,
+    target: int,
+    group_by: GroupBy = "lineno",
+    limit: Annotated[int, Query(ge=1, le=200)] = 20,
+) -> dict[str, Any]:
+    """Where memory was allocated (or freed) between two snapshots."""
+    try:
+        changes = await asyncio.to_thread(diagnostics.diff, base, target, group_by, limit)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Unknown snapshot {e.args[0]}") from e
+    return {"base": base, "target": target, "group_by": group_by, "changes": changes}
+
+
+@router.get("/objects")
+async def live_objects(diagnostics: DiagnosticsDep) -> dict[str, Any]:
+    """Live bytes buffers, AudioSegments and per-session buffers."""
+    return await asyncio.to_thread(diagnostics.live_objects)
@@ -0,0 +1,91 @@
+"""Admin Profiling API Routes.
+
+On-demand sampling profiles of this worker (see ``src.infrastructure.profiling``).
+Every endpoint requires the ``X-Profile-Token`` header to match the
+``PROFILING_TOKEN`` setting and is hidden (404) when no token is configured.
+"""
+
+import hmac
+from typing import Annotated, Any, Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from pydantic import BaseModel, Field
+
+from src.config import get_settings
+from src.infrastructure.profiling import Profiler, get_profiler
+
+router = APIRouter(prefix="/admin/profiling", tags=["admin-profiling"])
+
+
+def require_profiling_token(
+    x_profile_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Reject callers without the profiling token."""
+    token = get_settings().profiling_token
+    if not token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_profile_token is None or not hmac.compare_digest(x_profile_token, token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+class ProfileWindowRequest(BaseModel):
+    """Request to profile the worker for a time window."""
+
+    duration_s: float = Field(default=10.0, gt=0)
+    label: str = "window"
+
+
+class ProfileWindowResponse(BaseModel):
+    """Where the window profile will be stored once finished."""
+
+    key: str
+    duration_s: float
+
+
+class ArmProfileRequest(BaseModel):
+    """Request to profile the next runs of a target."""
+
+    target: Literal["http", "websocket", "job"]
+    count: int = Field(default=1, ge=0, le=100)
+
+
+@router.get("", dependencies=[Depends(require_profiling_token)])
+async def profiling_status(
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+) -> dict[str, Any]:
+    """Running profile, armed targets and recently stored profiles."""
+    return profiler.status()
+
+
+@router.post(
+    "/window",
+    response_model=ProfileWindowResponse,
+    status_code=202,
+    dependencies=[Depends(require_profiling_token)],
+)
+async def start_window_profile(
+    request: ProfileWindowRequest,
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+) -> ProfileWindowResponse:
+    """Profile everything on this worker's event loop for a while.
+
+    Returns immediately; the profile is written when the window closes.
+    """
+    duration_s = min(request.duration_s, profiler.max_duration_s)
+    key = profiler.start_window(duration_s, request.label)
+    if key is None:
+        raise HTTPException(status_code=409, detail=f"Profile {profiler.active} is running")
+    return ProfileWindowResponse(key=key, duration_s=duration_s)
+
+
+@router.post("/arm", dependencies=[Depends(require_profiling_token)])
+async def arm_profile(
+    request: ArmProfileRequest,
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+) -> dict[str, int]:
+    """Profile the next ``count`` HTTP requests, WebSocket sessions or jobs.
+
+    A count of 0 disarms the target.
+    """
+    profiler.arm(request.target, request.count)
+    return profiler.armed()
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
 from src.application.interfaces.voice_sync_job_repository import IVoiceSyncJobRepository
+from src.application.services.voice_catalog import get_voice_catalog
 from src.application.use_cases.sync_voices import (
     SyncVoicesInput,
     SyncVoicesUseCase,
@@ -27,6 +28,8 @@ from src.infrastructure.persistence.voice_sync_job_repository_impl import (
 )
 from src.infrastructure.providers.tts.gemini_tts import GeminiTTSProvider
 from src.infrastructure.providers.tts.voai_tts import VoAITTSProvider
+from src.infrastructure.workers.preview_pregeneration import PreviewPregenerationWorker
+from src.presentation.api.dependencies import get_preview_pregeneration_worker
 
 router = APIRouter(prefix="/admin/voices", tags=["admin-voices"])
 
@@ -48,6 +51,12 @@ class SyncVoicesResponse(BaseModel):
     providers: list[str]
 
 
+class PregeneratePreviewsRequest(BaseModel):
+    """Request to pre-generate missing voice previews."""
+
+    providers: list[str] | None = None  # None = every provider in the catalog
+
+
 class SyncStatusResponse(BaseModel):
     """Response with sync status."""
 
@@ -62,9 +71,11 @@ class SyncJobResponse(BaseModel):
     """Response with sync job details."""
 
     id: str
+    job_type: str
     providers: list[str]
     status: str
     voices_synced: int
+    voices_total: int | None
     voices_deprecated: int
     error_message: str | None
     started_at: str | None
@@ -131,9 +142,11 @@ def _job_to_response(job: VoiceSyncJob) -> SyncJobResponse:
     """Convert VoiceSyncJob to API response."""
     return SyncJobResponse(
         id=job.id,
+        job_type=job.job_type.value,
         providers=job.providers,
         status=job.status.value,
         voices_synced=job.voices_synced,
+        voices_total=job.voices_total,
         voices_deprecated=job.voices_deprecated,
         error_message=job.error_message,
         started_at=job.started_at.isoformat() if job.started_at else None,
@@ -173,6 +186,9 @@ async def trigger_voice_sync(
         result = await use_case.execute(input_data)
         await session.commit()
 
+        # Rebuild the in-memory catalog from the freshly synced cache
+        await get_voice_catalog().refresh(use_case.voice_cache_repo)
+
         return SyncVoicesResponse(
             job_id=result.job_id,
             message=f"Voice sync started for {len(result.providers_synced)} providers",
@@ -184,6 +200,39 @@ async def trigger_voice_sync(
         raise HTTPException(status_code=500, detail=f"Sync failed: {e}") from e
 
 
+@router.post("/previews/pregenerate", response_model=SyncVoicesResponse, status_code=202)
+async def pregenerate_voice_previews(
+    request: PregeneratePreviewsRequest,
+    worker: PreviewPregenerationWorker = Depends(get_preview_pregeneration_worker),
+) -> SyncVoicesResponse:
+    """Pre-generate missing voice previews in the background.
+
+    Voices that already have a preview (stored or ElevenLabs CDN) are
+    skipped, so re-triggering after a failure only covers what is left.
+    Progress is reported through GET /sync/jobs/{job_id}.
+
+    Args:
+        request: Optional provider filter
+        worker: Preview pre-generation worker
+
+    Returns:
+        SyncVoicesResponse with the job ID
+
+    Raises:
+        HTTPException: If a preview job is already running
+    """
+    try:
+        job = await worker.start_job(request.providers)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    return SyncVoicesResponse(
+        job_id=job.id,
+        message="Preview pre-generation started",
+        providers=job.providers,
+    )
+
+
 @router.get("/sync/status", response_model=SyncStatusResponse)
 async def get_sync_status(
     sync_job_repo: IVoiceSyncJobRepository = Depends(get_voice_sync_job_repo),
@@ -9,8 +9,8 @@ This module provides REST API endpoints for DJ preset and track management.
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from fastapi.responses import RedirectResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.services.dj_service import (
@@ -28,6 +28,7 @@ from src.infrastructure.persistence.database import get_db_session
 from src.infrastructure.persistence.dj_repository_impl import DJRepositoryImpl
 from src.infrastructure.storage.dj_audio_storage import DJAudioStorageService
 from src.presentation.api.middleware.auth import CurrentUserDep
+from src.presentation.api.range_response import ranged_file_response
 from src.presentation.api.schemas.dj import (
     AudioUploadResponse,
     CreatePresetRequest,
@@ -775,6 +776,42 @@ async def get_audio(
         ) from None
 
 
+@router.get(
+    "/audio/file/{file_path:path}",
+    summary="串流本機音檔",
+    description="串流本機儲存的音檔，支援 Range 與條件式請求。",
+)
+async def stream_local_audio(
+    file_path: str,
+    request: Request,
+    current_user: CurrentUserDep,
+) -> Response:
+    """Stream a locally stored track file (target of local signed URLs)."""
+    audio_storage = _get_audio_storage()
+    path = audio_storage.resolve_local_path(file_path)
+
+    # Files live under {user_id}/, so users can only reach their own audio
+    if path is None or file_path.split("/", 1)[0] != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Audio file not found",
+        )
+
+    try:
+        stored = await audio_storage.stat(str(path))
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Audio file not found",
+        ) from None
+
+    return ranged_file_response(
+        request,
+        stored,
+        lambda start, end: audio_storage.stream(stored.key, start, end),
+    )
+
+
 @router.delete(
     "/audio/{track_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1,9 +1,32 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+
+from src.application.services.loop_monitor import get_loop_monitor
+from src.application.services.metrics import (
+    CONTENT_TYPE,
+    collect_store_metrics,
+    get_metrics_registry,
+)
+from src.infrastructure.concurrency import default_circuit_breaker, default_concurrency_manager
+from src.infrastructure.persistence.pool_metrics import (
+    collect_database_metrics,
+    get_database_metrics,
+)
+from src.infrastructure.providers.lazy import import_report
+from src.presentation.api.dependencies import get_container
+from src.presentation.api.routes.admin_profiling import require_profiling_token
 
 router = APIRouter()
 
+# Components that keep their own state are read on each scrape
+_registry = get_metrics_registry()
+_registry.register_collector("database", collect_database_metrics)
+_registry.register_collector("concurrency", default_concurrency_manager.collect_metrics)
+_registry.register_collector("circuit_breaker", default_circuit_breaker.collect_metrics)
+_registry.register_collector("stores", collect_store_metrics)
+
 
 @router.get("/health")
 async def health_check():
@@ -11,6 +34,48 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@router.get("/metrics")
+async def metrics() -> Response:
+    """All metrics in OpenMetrics format, for Prometheus to scrape."""
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
+
+@router.get("/metrics/db", dependencies=[Depends(require_profiling_token)])
+async def database_metrics():
+    """Connection pool saturation, checkout waits and slow queries per engine.
+
+    Slow queries include their SQL text, so this needs the profiling token.
+    """
+    return get_database_metrics()
+
+
+@router.get("/metrics/loop", dependencies=[Depends(require_profiling_token)])
+async def loop_metrics():
+    """Event loop lag and recent blocking calls with their stacks and context.
+
+    Stacks and task context can reveal request details, so this needs the
+    profiling token.
+    """
+    return get_loop_monitor().snapshot()
+
+
+@router.get("/metrics/imports")
+async def import_metrics():
+    """Provider SDK import costs and which providers have been loaded so far."""
+    container = get_container()
+    return {
+        **import_report(),
+        "providers": {
+            m.kind: {"configured": m.configured(), "loaded": m.loaded()}
+            for m in (
+                container.get_tts_providers(),
+                container.get_stt_providers(),
+                container.get_llm_providers(),
+            )
+        },
+    }
+
+
 @router.get("/")
 async def root():
     """Root endpoint."""
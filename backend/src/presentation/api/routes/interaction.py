@@ -9,10 +9,11 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, UploadFile
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.services.total_count_cache import get_total_count_cache
 from src.application.use_cases.voice_interaction import (
     VoiceInteractionInput,
     VoiceInteractionUseCase,
@@ -20,6 +21,8 @@ from src.application.use_cases.voice_interaction import (
 from src.config import get_settings
 from src.domain.entities import InteractionMode, SessionStatus
 from src.domain.entities.audio import AudioData, AudioFormat
+from src.domain.pagination import PageCursor
+from src.domain.repositories.interaction_repository import LatencyGroupBy
 from src.infrastructure.persistence.credential_repository import (
     SQLAlchemyProviderCredentialRepository,
 )
@@ -34,12 +37,16 @@ from src.infrastructure.storage.audio_storage import AudioStorageService
 from src.presentation.api.dependencies import (
     Container,
     get_container,
+    get_read_db_session,
     get_voice_interaction_use_case,
 )
 from src.presentation.api.middleware.auth import CurrentUserDep
+from src.presentation.api.routes.admin_profiling import require_profiling_token
 from src.presentation.schemas.interaction import (
     ConversationMessage,
     InteractionResponse,
+    LatencyAnalyticsResponse,
+    LatencyGroupStats,
     LatencyStatsResponse,
     ScenarioTemplateResponse,
     SessionListResponse,
@@ -174,14 +181,49 @@ async def list_sessions(
     end_date: datetime | None = Query(None, description="Filter sessions started before"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Page size"),
-    db: AsyncSession = Depends(get_db_session),
+    cursor: str | None = Query(None, description="next_cursor from a previous page; replaces page"),
+    include_total: bool = Query(False, description="Also return the total on cursor pages"),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> SessionListResponse:
-    """List interaction sessions for a user with optional filters."""
+    """List interaction sessions for a user with optional filters.
+
+    Following ``next_cursor`` pages by (started_at, id) without OFFSET.
+    """
     repository = SQLAlchemyInteractionRepository(db)
 
     mode_enum = InteractionMode(mode) if mode else None
     status_enum = SessionStatus(status) if status else None
 
+    if cursor is not None:
+        try:
+            after = PageCursor.decode(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+        sessions, next_cursor = await repository.list_sessions_after(
+            user_id=user_id,
+            mode=mode_enum,
+            status=status_enum,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=after,
+            limit=page_size,
+        )
+        total = None
+        if include_total:
+            total = await get_total_count_cache().get_or_count(
+                ("interaction_sessions", user_id, mode_enum, status_enum, start_date, end_date),
+                lambda: repository.count_sessions(
+                    user_id, mode_enum, status_enum, start_date, end_date
+                ),
+            )
+        return SessionListResponse(
+            sessions=[_session_to_response(s) for s in sessions],
+            total=total,
+            page_size=page_size,
+            next_cursor=next_cursor.encode() if next_cursor else None,
+        )
+
     sessions, total = await repository.list_sessions(
         user_id=user_id,
         mode=mode_enum,
@@ -192,11 +234,17 @@ async def list_sessions(
         page_size=page_size,
     )
 
+    next_cursor = None
+    if sessions and page * page_size < total:
+        last = sessions[-1]
+        next_cursor = PageCursor(timestamp=last.started_at, id=last.id).encode()
+
     return SessionListResponse(
         sessions=[_session_to_response(s) for s in sessions],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -323,7 +371,7 @@ async def get_turn_audio(
 @router.get("/sessions/{session_id}/latency", response_model=LatencyStatsResponse)
 async def get_session_latency_stats(
     session_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ) -> LatencyStatsResponse:
     """Get latency statistics for a session."""
     repository = SQLAlchemyInteractionRepository(db)
@@ -346,6 +394,50 @@ async def get_session_latency_stats(
     )
 
 
+@router.get("/analytics/latency", response_model=LatencyAnalyticsResponse)
+async def get_latency_analytics(
+    current_user: CurrentUserDep,
+    group_by: LatencyGroupBy = Query(
+        "mode", description="Group by: session, mode, provider, hour or day"
+    ),
+    user_id: UUID | None = Query(
+        None, description="Only sessions of this user (default: the current user)"
+    ),
+    all_users: bool = Query(False, description="Aggregate across every user"),
+    mode: str | None = Query(None, description="Filter by mode: 'realtime' or 'cascade'"),
+    start_date: datetime | None = Query(None, description="Metrics recorded at or after"),
+    end_date: datetime | None = Query(None, description="Metrics recorded at or before"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of groups"),
+    x_profile_token: Annotated[str | None, Header()] = None,
+    db: AsyncSession = Depends(get_read_db_session),
+) -> LatencyAnalyticsResponse:
+    """Aggregate turn latency (averages and percentiles) across sessions.
+
+    Only the current user's sessions are included unless the caller presents
+    the admin profiling token, which allows other users and ``all_users``.
+    """
+    own_id = UUID(current_user.id)
+    if all_users or (user_id is not None and user_id != own_id):
+        require_profiling_token(x_profile_token)
+    scope = None if all_users else (user_id or own_id)
+
+    repository = SQLAlchemyInteractionRepository(db)
+
+    groups = await repository.get_latency_analytics(
+        group_by=group_by,
+        user_id=scope,
+        mode=InteractionMode(mode) if mode else None,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+    )
+
+    return LatencyAnalyticsResponse(
+        group_by=group_by,
+        groups=[LatencyGroupStats(**group) for group in groups],
+    )
+
+
 # =============================================================================
 # Scenario Templates Endpoints (US4 - Role/Scenario Configuration)
 # =============================================================================
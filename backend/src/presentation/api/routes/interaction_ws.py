@@ -10,14 +10,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.services.loop_monitor import set_task_context
 from src.domain.services.interaction.base import InteractionModeService
 from src.infrastructure.persistence.credential_repository import (
     SQLAlchemyProviderCredentialRepository,
 )
-from src.infrastructure.persistence.database import get_db_session
-from src.infrastructure.persistence.interaction_repository_impl import (
-    SQLAlchemyInteractionRepository,
-)
+from src.infrastructure.persistence.database import AsyncSessionLocal, get_db_session
+from src.infrastructure.persistence.interaction_write_behind import InteractionWriteBehind
 from src.infrastructure.storage.audio_storage import AudioStorageService
 from src.infrastructure.websocket.interaction_handler import InteractionWebSocketHandler
 
@@ -171,9 +170,10 @@ async def interaction_websocket(
         await websocket.close(code=4000, reason="Invalid mode. Use 'realtime' or 'cascade'")
         return
 
-    repository = SQLAlchemyInteractionRepository(db)
+    set_task_context(websocket=f"interaction/{mode}", user_id=str(user_id))
     audio_storage = AudioStorageService()
     mode_service: InteractionModeService | None = None
+    handler: InteractionWebSocketHandler | None = None
 
     try:
         # Accept connection first
@@ -198,7 +198,7 @@ async def interaction_websocket(
             websocket=websocket,
             user_id=user_id,
             mode_service=mode_service,
-            repository=repository,
+            store=InteractionWriteBehind(AsyncSessionLocal),
             audio_storage=audio_storage,
             logger=logger,
             lightweight_mode=lightweight_mode,
@@ -222,6 +222,7 @@ async def interaction_websocket(
             },
         )
         await handler._handle_config(config_message)
+        set_task_context(session_id=str(handler.session_id))
 
         # Run the main handler loop
         await handler.run()
@@ -237,5 +238,8 @@ async def interaction_websocket(
         with contextlib.suppress(Exception):
             await websocket.close(code=4500, reason="Internal server error")
     finally:
-        if mode_service and mode_service.is_connected():
+        if handler is not None:
+            # Ends the session and flushes buffered turns, metrics and audio
+            await handler.on_disconnect()
+        elif mode_service and mode_service.is_connected():
             await mode_service.disconnect()
@@ -4,27 +4,30 @@ Feature: 007-async-job-mgmt
 This module provides REST API endpoints for async TTS synthesis job management.
 """
 
-import os
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.interfaces.storage_service import IStorageService, StoredObject
 from src.application.services.job_service import (
     JobCancelError,
     JobLimitExceededError,
     JobNotFoundError,
     JobService,
 )
-from src.domain.entities.job import JobStatus, JobType
+from src.application.services.total_count_cache import get_total_count_cache
+from src.domain.entities.job import Job, JobStatus, JobType
+from src.domain.pagination import PageCursor
 from src.infrastructure.persistence.database import get_db_session
 from src.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
 from src.infrastructure.persistence.models import AudioFileModel
-from src.infrastructure.storage.local_storage import LocalStorage
+from src.presentation.api.dependencies import get_container
 from src.presentation.api.middleware.auth import CurrentUserDep
+from src.presentation.api.range_response import ranged_file_response
 from src.presentation.api.schemas.job_schemas import (
     CreateJobRequest,
     CreateSingleTTSJobRequest,
@@ -42,6 +45,19 @@ def _get_job_service(session: AsyncSession) -> JobService:
     return JobService(job_repo)
 
 
+def _job_to_response(job: Job) -> JobResponse:
+    """Convert a Job entity to its list item response."""
+    return JobResponse(
+        id=job.id,
+        status=job.status,
+        job_type=job.job_type,
+        provider=job.provider,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+    )
+
+
 @router.post(
     "",
     response_model=JobResponse,
@@ -201,6 +217,14 @@ async def list_jobs(
         int,
         Query(ge=0, description="跳過筆數"),
     ] = 0,
+    cursor: Annotated[
+        str | None,
+        Query(description="上一頁回傳的 next_cursor（取代 offset）"),
+    ] = None,
+    include_total: Annotated[
+        bool,
+        Query(description="使用 cursor 時是否回傳總筆數"),
+    ] = False,
 ) -> JobListResponse:
     """List jobs for the current user.
 
@@ -210,6 +234,8 @@ async def list_jobs(
         status_filter: Optional status filter
         limit: Maximum number of jobs to return
         offset: Number of jobs to skip
+        cursor: Keyset cursor from a previous page (replaces offset)
+        include_total: Whether cursor pages include the total count
 
     Returns:
         Paginated job list response
@@ -217,6 +243,31 @@ async def list_jobs(
     job_service = _get_job_service(session)
     user_id = uuid.UUID(current_user.id)
 
+    if cursor is not None:
+        try:
+            after = PageCursor.decode(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+        jobs, next_cursor = await job_service.list_jobs_after(
+            user_id=user_id,
+            status=status_filter,
+            cursor=after,
+            limit=limit,
+        )
+        total = None
+        if include_total:
+            total = await get_total_count_cache().get_or_count(
+                ("jobs", user_id, status_filter),
+                lambda: job_service.count_jobs(user_id, status_filter),
+            )
+        return JobListResponse(
+            items=[_job_to_response(job) for job in jobs],
+            total=total,
+            limit=limit,
+            next_cursor=next_cursor.encode() if next_cursor else None,
+        )
+
     jobs, total = await job_service.list_jobs(
         user_id=user_id,
         status=status_filter,
@@ -224,22 +275,16 @@ async def list_jobs(
         offset=offset,
     )
 
+    next_page = None
+    if jobs and offset + len(jobs) < total:
+        next_page = PageCursor(timestamp=jobs[-1].created_at, id=jobs[-1].id).encode()
+
     return JobListResponse(
-        items=[
-            JobResponse(
-                id=job.id,
-                status=job.status,
-                job_type=job.job_type,
-                provider=job.provider,
-                created_at=job.created_at,
-                started_at=job.started_at,
-                completed_at=job.completed_at,
-            )
-            for job in jobs
-        ],
+        items=[_job_to_response(job) for job in jobs],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_page,
     )
 
 
@@ -354,18 +399,18 @@ async def cancel_job(
 # =============================================================================
 
 
-async def get_audio_file_content(
+async def get_audio_file_object(
     audio_file_id: uuid.UUID,
     session: AsyncSession,
-) -> tuple[bytes, str, str]:
-    """Get audio file content from storage.
+) -> tuple[IStorageService, StoredObject, str, str]:
+    """Look up an audio file and its storage metadata without reading it.
 
     Args:
         audio_file_id: ID of the audio file
         session: Database session
 
     Returns:
-        Tuple of (content, content_type, filename)
+        Tuple of (storage, stored_object, content_type, filename)
 
     Raises:
         HTTPException: 404 if audio file not found
@@ -380,12 +425,11 @@ async def get_audio_file_content(
             detail="Audio file not found",
         )
 
-    # Get storage and read file
-    storage_path = os.getenv("LOCAL_STORAGE_PATH", "./storage")
-    storage = LocalStorage(base_path=storage_path)
+    # Same storage the job worker writes to (local or S3)
+    storage = get_container().get_storage_service()
 
     try:
-        content = await storage.download(audio_file.storage_path)
+        stored = await storage.stat(audio_file.storage_path)
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -401,7 +445,7 @@ async def get_audio_file_content(
     }
     content_type = content_type_map.get(audio_file.format, "application/octet-stream")
 
-    return content, content_type, audio_file.filename
+    return storage, stored, content_type, audio_file.filename
 
 
 @router.get(
@@ -413,18 +457,24 @@ async def get_audio_file_content(
             "content": {"audio/mpeg": {}, "audio/wav": {}},
             "description": "Audio file stream",
         },
+        206: {"description": "Partial audio content for a Range request"},
+        304: {"description": "Audio unchanged since the supplied ETag"},
         404: {"description": "Job not found or not completed"},
     },
 )
 async def download_job_audio(
     job_id: uuid.UUID,
+    request: Request,
     current_user: CurrentUserDep,
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> Response:
     """Download audio file for a completed job.
 
+    Streams from storage and supports Range requests and conditional GETs.
+
     Args:
         job_id: Job ID
+        request: Incoming request (Range / If-None-Match headers)
         current_user: Current authenticated user
         session: Database session
 
@@ -460,14 +510,14 @@ async def download_job_audio(
             detail=f"Job {job_id} has no audio file",
         )
 
-    # Get audio file content
-    content, content_type, filename = await get_audio_file_content(job.audio_file_id, session)
+    storage, stored, content_type, filename = await get_audio_file_object(
+        job.audio_file_id, session
+    )
 
-    return Response(
-        content=content,
+    return ranged_file_response(
+        request,
+        stored,
+        lambda start, end: storage.stream(stored.key, start, end),
         media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(len(content)),
-        },
+        filename=filename,
     )
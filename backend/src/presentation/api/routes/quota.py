@@ -1,6 +1,7 @@
 """Quota and Rate Limit Status API Routes."""
 
 import asyncio
+import hashlib
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -9,6 +10,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.services.quota_cache import get_quota_cache
 from src.domain.errors import ProviderQuotaInfo
 from src.domain.services.usage_tracker import provider_usage_tracker
 from src.infrastructure.persistence.credential_repository import (
@@ -76,6 +78,14 @@ PROVIDER_RATE_LIMITS: dict[str, ProviderRateLimitInfo] = {
 # Providers that support quota querying via API
 QUOTA_QUERYABLE_PROVIDERS = {"elevenlabs"}
 
+# Seconds the dashboard waits for live quota lookups before returning without them
+QUOTA_FETCH_BUDGET_S = 1.5
+
+
+def _quota_cache_key(provider_id: str, api_key: str) -> tuple[str, str]:
+    """Cache key for a credential; the API key itself is never stored."""
+    return provider_id, hashlib.sha256(api_key.encode()).hexdigest()
+
 
 async def _fetch_provider_quota(
     provider_id: str,
@@ -112,6 +122,10 @@ async def get_quota_dashboard(
     For providers that support API-based quota querying (e.g., ElevenLabs),
     real-time usage data is fetched. For others, static reference data
     about known rate limits is returned.
+
+    Live quota data is cached per credential and refreshed in the background.
+    Lookups still running after QUOTA_FETCH_BUDGET_S are left out and the
+    response is marked partial; they complete into the cache for the next load.
     """
     user_id = uuid.UUID(current_user.id)
     repo = SQLAlchemyProviderCredentialRepository(session)
@@ -123,15 +137,27 @@ async def get_quota_dashboard(
     # Build provider status list
     all_providers = ProviderValidatorRegistry.list_supported_providers()
 
-    # Fetch quota for providers that support it (in parallel)
-    quota_tasks: dict[str, asyncio.Task] = {}  # type: ignore[type-arg]
-    async with asyncio.TaskGroup() as tg:
-        for provider_id in all_providers:
-            cred = cred_by_provider.get(provider_id)
-            if cred and cred.is_valid and provider_id in QUOTA_QUERYABLE_PROVIDERS:
-                quota_tasks[provider_id] = tg.create_task(
-                    _fetch_provider_quota(provider_id, cred.api_key)
+    # Fetch quota for providers that support it (in parallel, cached, time-boxed)
+    quota_cache = get_quota_cache()
+    quota_keys: dict[str, tuple[str, str]] = {}
+    quota_tasks: dict[str, asyncio.Task[dict | None]] = {}
+    for provider_id in all_providers:
+        cred = cred_by_provider.get(provider_id)
+        if cred and cred.is_valid and provider_id in QUOTA_QUERYABLE_PROVIDERS:
+            key = _quota_cache_key(provider_id, cred.api_key)
+            quota_keys[provider_id] = key
+            quota_tasks[provider_id] = asyncio.create_task(
+                quota_cache.get(
+                    key,
+                    lambda p=provider_id, k=cred.api_key: _fetch_provider_quota(p, k),
                 )
+            )
+
+    pending: set[asyncio.Task[dict | None]] = set()
+    if quota_tasks:
+        _done, pending = await asyncio.wait(quota_tasks.values(), timeout=QUOTA_FETCH_BUDGET_S)
+        for task in pending:
+            task.cancel()
 
     # Get tracked usage data for this user
     user_id_str = str(user_id)
@@ -145,8 +171,11 @@ async def get_quota_dashboard(
 
         # Get quota data if available
         quota_data: dict | None = None
-        if provider_id in quota_tasks:
-            quota_data = quota_tasks[provider_id].result()
+        quota_fetched_at: datetime | None = None
+        task = quota_tasks.get(provider_id)
+        if task is not None and task not in pending:
+            quota_data = task.result()
+            quota_fetched_at = quota_cache.fetched_at(quota_keys[provider_id])
 
         # Calculate usage percent
         usage_percent: float | None = None
@@ -191,6 +220,7 @@ async def get_quota_dashboard(
                 remaining_characters=remaining_characters,
                 usage_percent=usage_percent,
                 tier=tier,
+                quota_fetched_at=quota_fetched_at,
                 minute_requests=usage.minute_requests if usage else 0,
                 hour_requests=usage.hour_requests if usage else 0,
                 day_requests=usage.day_requests if usage else 0,
@@ -233,4 +263,5 @@ async def get_quota_dashboard(
         providers=provider_statuses,
         app_rate_limits=app_rate_limits,
         fetched_at=datetime.now(UTC),
+        partial=bool(pending),
     )
@@ -20,9 +20,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.storage_service import IStorageService
 from src.application.services.stt_service import STTService
+from src.application.services.total_count_cache import get_total_count_cache
 from src.domain.entities.audio_file import AudioFile, AudioFileFormat, AudioSource
 from src.domain.errors import QuotaExceededError
+from src.domain.pagination import PageCursor
 from src.domain.repositories.transcription_repository import ITranscriptionRepository
+from src.domain.services.audio_probe import probe_audio
 from src.domain.services.usage_tracker import provider_usage_tracker
 from src.infrastructure.persistence.credential_repository import (
     SQLAlchemyProviderCredentialRepository,
@@ -84,6 +87,11 @@ def _determine_error_type(language: str) -> str:
 
 def _calculate_audio_metadata(audio_bytes: bytes) -> tuple[int, int]:
     """Calculate duration and sample rate from audio bytes."""
+    # Header-only probe first; full decode only for containers it can't read
+    probe = probe_audio(audio_bytes)
+    if probe is not None:
+        return probe.duration_ms, probe.sample_rate
+
     try:
         audio = AudioSegment.from_file(io.BytesIO(audio_bytes))
         duration_ms = len(audio)
@@ -414,15 +422,55 @@ async def list_history(
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page (1-100)"),
     provider: str | None = None,
     language: str | None = None,
+    cursor: str | None = Query(
+        default=None, description="next_cursor from a previous page; replaces page"
+    ),
+    include_total: bool = Query(
+        default=False, description="Also return the total count on cursor pages"
+    ),
     transcription_repo: ITranscriptionRepository = Depends(get_transcription_repository),
 ):
-    """List transcription history."""
+    """List transcription history.
+
+    Offset pages (``page``) are kept for compatibility; following
+    ``next_cursor`` instead pages by (created_at, id) without OFFSET.
+    """
+    try:
+        after = PageCursor.decode(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
     try:
         user_id = uuid.UUID(current_user.id)
         logger.info(
             f"Fetching transcription history: user_id={user_id}, page={page}, "
-            f"page_size={page_size}, provider={provider}, language={language}"
+            f"cursor={cursor is not None}, page_size={page_size}, provider={provider}, "
+            f"language={language}"
         )
+
+        if after is not None:
+            items, next_cursor = await transcription_repo.list_transcriptions_after(
+                user_id=user_id,
+                provider=provider,
+                language=language,
+                cursor=after,
+                limit=page_size,
+            )
+            total = None
+            if include_total:
+                total = await get_total_count_cache().get_or_count(
+                    ("stt_history", user_id, provider, language),
+                    lambda: transcription_repo.count_transcriptions(
+                        user_id=user_id, provider=provider, language=language
+                    ),
+                )
+            return TranscriptionHistoryPage(
+                items=[TranscriptionSummary(**item) for item in items],
+                total=total,
+                page_size=page_size,
+                next_cursor=next_cursor.encode() if next_cursor else None,
+            )
+
         items, total = await transcription_repo.list_transcriptions(
             user_id=user_id, provider=provider, language=language, page=page, page_size=page_size
         )
@@ -433,12 +481,20 @@ async def list_history(
 
         logger.info(f"Retrieved {len(items)} transcriptions (total={total}) for user_id={user_id}")
 
+        next_cursor = None
+        if summary_items and page < total_pages:
+            last = summary_items[-1]
+            next_cursor = PageCursor(
+                timestamp=datetime.fromisoformat(last.created_at), id=uuid.UUID(last.id)
+            ).encode()
+
         return TranscriptionHistoryPage(
             items=summary_items,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
     except Exception as e:
         logger.error(f"Failed to fetch transcription history: {str(e)}", exc_info=True)
@@ -8,13 +8,16 @@ T074: Add audit logging for credential.used events
 import base64
 import logging
 import uuid
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.services.audit_service import AuditService
+from src.application.services.provider_loading import load_provider
+from src.application.services.single_flight import SingleFlight
+from src.application.services.tracing import span
 from src.application.use_cases.synthesize_long_text import SynthesizeLongText
 from src.application.use_cases.synthesize_speech import SynthesizeSpeech
 from src.config import get_settings
@@ -40,7 +43,7 @@ from src.infrastructure.persistence.credential_repository import (
     SQLAlchemyProviderCredentialRepository,
 )
 from src.infrastructure.persistence.database import get_db_session
-from src.infrastructure.providers.tts.factory import TTSProviderFactory
+from src.infrastructure.providers.tts.factory import ProviderCreationResult, TTSProviderFactory
 from src.infrastructure.storage.local_storage import LocalStorage
 from src.presentation.api.dependencies import get_container
 from src.presentation.api.schemas.tts import (
@@ -61,6 +64,16 @@ logger = logging.getLogger(__name__)
 # Development user ID for DISABLE_AUTH mode
 DEV_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
+# Identical concurrent synthesis requests share one provider call and storage write
+_synthesis_flights: SingleFlight[Any] = SingleFlight()
+
+
+def _synthesis_scope(provider_result: ProviderCreationResult) -> str:
+    """Credential a synthesis runs under; results are only shared within it."""
+    if provider_result.used_user_credential and provider_result.credential_id:
+        return str(provider_result.credential_id)
+    return "system"
+
 
 async def get_optional_user_id(request: Request) -> uuid.UUID | None:
     """Get the current user ID from the request if available.
@@ -89,13 +102,13 @@ async def get_optional_user_id(request: Request) -> uuid.UUID | None:
     return None
 
 
-def get_provider(provider_name: str, container=None):
+async def get_provider(provider_name: str, container=None):
     """Get TTS provider instance by name from Container."""
     if container is None:
         container = get_container()
 
     tts_providers = container.get_tts_providers()
-    provider = tts_providers.get(provider_name)
+    provider = await load_provider(tts_providers, provider_name)
 
     if not provider:
         available = list(tts_providers.keys())
@@ -141,17 +154,18 @@ async def synthesize(
 
         # Log credential usage if user credential was used
         if provider_result.used_user_credential and user_id and provider_result.credential_id:
-            audit_repo = SQLAlchemyAuditLogRepository(session)
-            audit_service = AuditService(audit_repo)
-            await audit_service.log_credential_used(
-                user_id=user_id,
-                credential_id=provider_result.credential_id,
-                provider=provider_result.provider_name,
-                operation="tts.synthesize",
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("User-Agent"),
-            )
-            await session.commit()
+            with span("audit.credential_used"):
+                audit_repo = SQLAlchemyAuditLogRepository(session)
+                audit_service = AuditService(audit_repo)
+                await audit_service.log_credential_used(
+                    user_id=user_id,
+                    credential_id=provider_result.credential_id,
+                    provider=provider_result.provider_name,
+                    operation="tts.synthesize",
+                    ip_address=request.client.host if request.client else None,
+                    user_agent=request.headers.get("User-Agent"),
+                )
+                await session.commit()
 
         storage = get_storage()
 
@@ -166,21 +180,36 @@ async def synthesize(
             long_text_use_case = SynthesizeLongText(
                 provider=provider_result.provider, storage=storage
             )
-            long_result = await long_text_use_case.execute(
-                text=request_data.text,
-                voice_id=request_data.voice_id,
-                provider_name=request_data.provider,
-                language=request_data.language,
-                output_format=output_format,
-                gap_ms=request_data.segment_gap_ms,
-                crossfade_ms=request_data.segment_crossfade_ms,
+            long_key = (
+                "long",
+                _synthesis_scope(provider_result),
+                request_data.text,
+                request_data.voice_id,
+                request_data.provider,
+                request_data.language,
+                output_format,
+                request_data.segment_gap_ms,
+                request_data.segment_crossfade_ms,
+            )
+            long_result = await _synthesis_flights.do(
+                long_key,
+                lambda: long_text_use_case.execute(
+                    text=request_data.text,
+                    voice_id=request_data.voice_id,
+                    provider_name=request_data.provider,
+                    language=request_data.language,
+                    output_format=output_format,
+                    gap_ms=request_data.segment_gap_ms,
+                    crossfade_ms=request_data.segment_crossfade_ms,
+                ),
             )
 
             # Track successful request
             _track_success(user_id, request_data.provider)
             _capture_rate_limit_headers(user_id, request_data.provider, provider_result.provider)
 
-            audio_b64 = base64.b64encode(long_result.audio_content).decode("utf-8")
+            with span("response.encode"):
+                audio_b64 = base64.b64encode(long_result.audio_content).decode("utf-8")
 
             # Build segment timing metadata
             timings = []
@@ -220,13 +249,17 @@ async def synthesize(
                 output_mode=OutputMode.BATCH,
             )
 
-            result = await use_case.execute(domain_request)
+            result = await _synthesis_flights.do(
+                (_synthesis_scope(provider_result), domain_request),
+                lambda: use_case.execute(domain_request),
+            )
 
             # Track successful request
             _track_success(user_id, request_data.provider)
             _capture_rate_limit_headers(user_id, request_data.provider, provider_result.provider)
 
-            audio_b64 = base64.b64encode(result.audio.data).decode("utf-8")
+            with span("response.encode"):
+                audio_b64 = base64.b64encode(result.audio.data).decode("utf-8")
 
             return SynthesizeResponse(
                 audio_content=audio_b64,
@@ -431,7 +464,10 @@ async def synthesize_binary(
             output_mode=OutputMode.BATCH,
         )
 
-        result = await use_case.execute(domain_request)
+        result = await _synthesis_flights.do(
+            (_synthesis_scope(provider_result), domain_request),
+            lambda: use_case.execute(domain_request),
+        )
 
         # Track successful request
         _track_success(user_id, request_data.provider)
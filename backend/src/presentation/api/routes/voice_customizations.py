@@ -9,6 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.services.voice_catalog import get_voice_catalog
 from src.application.use_cases.get_voice_customization import (
     GetVoiceCustomizationUseCase,
 )
@@ -136,6 +137,7 @@ async def update_voice_customization(
             )
         )
         await session.commit()
+        get_voice_catalog().set_customization(result.customization)
 
         c = result.customization
         return VoiceCustomizationSchema(
@@ -164,6 +166,7 @@ async def delete_voice_customization(
     """
     deleted = await repo.delete(voice_cache_id)
     await session.commit()
+    get_voice_catalog().remove_customization(voice_cache_id)
 
     if not deleted:
         raise HTTPException(
@@ -206,6 +209,7 @@ async def bulk_update_voice_customizations(
             )
         )
         await session.commit()
+        get_voice_catalog().invalidate_customizations()
 
         return BulkUpdateResultSchema(
             updated_count=result.updated_count,
@@ -5,12 +5,15 @@ T056: Add GET /voices/{provider}/{voice_id} endpoint
 T059: Add POST /{voice_cache_id}/preview endpoint (voice preview)
 """
 
+import dataclasses
+from collections.abc import Mapping
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.storage_service import IStorageService
 from src.application.interfaces.tts_provider import ITTSProvider
 from src.application.interfaces.voice_cache_repository import IVoiceCacheRepository
+from src.application.services.voice_catalog import get_voice_catalog
 from src.application.use_cases.generate_voice_preview import GenerateVoicePreview
 from src.application.use_cases.list_voices import (
     VoiceFilter,
@@ -24,12 +27,12 @@ from src.application.use_cases.list_voices_with_customization import (
 from src.domain.repositories.voice_customization_repository import (
     IVoiceCustomizationRepository,
 )
-from src.infrastructure.persistence.database import get_db_session
 from src.presentation.api.dependencies import (
     get_storage_service,
     get_tts_providers,
     get_voice_cache_repository,
     get_voice_customization_repository,
+    open_voice_cache_repository,
 )
 
 router = APIRouter(prefix="/voices", tags=["voices"])
@@ -121,10 +124,6 @@ async def list_voices(
             "offset": offset,
         }
 
-    # Get customization map to include in response
-    voice_ids = [v.id for v in result.items]
-    customization_map = await customization_repo.get_customization_map(voice_ids)
-
     items = []
     for v in result.items:
         item: dict = {
@@ -144,7 +143,7 @@ async def list_voices(
             "is_hidden": v.is_hidden,
             "customization": None,
         }
-        c = customization_map.get(v.id)
+        c = v.customization
         if c:
             item["customization"] = {
                 "id": c.id,
@@ -162,6 +161,7 @@ async def list_voices(
         "total": result.total,
         "limit": result.limit,
         "offset": result.offset,
+        "facets": dataclasses.asdict(get_voice_catalog().facets()),
     }
 
 
@@ -169,9 +169,8 @@ async def list_voices(
 async def generate_voice_preview(
     voice_cache_id: str,
     voice_cache_repo: IVoiceCacheRepository = Depends(get_voice_cache_repository),
-    providers: dict[str, ITTSProvider] = Depends(get_tts_providers),
+    providers: Mapping[str, ITTSProvider] = Depends(get_tts_providers),
     storage: IStorageService = Depends(get_storage_service),
-    session: AsyncSession = Depends(get_db_session),
 ) -> dict:
     """Generate or retrieve a preview audio URL for a voice.
 
@@ -184,9 +183,10 @@ async def generate_voice_preview(
     Returns:
         Dictionary with preview_url
     """
-    use_case = GenerateVoicePreview(providers, storage, voice_cache_repo)
+    use_case = GenerateVoicePreview(
+        providers, storage, voice_cache_repo, open_voice_cache_repository
+    )
     preview_url = await use_case.execute(voice_cache_id)
-    await session.commit()
     return {"preview_url": preview_url}
 
 
@@ -262,15 +262,19 @@ class JobListResponse(BaseModel):
         ...,
         description="List of jobs",
     )
-    total: int = Field(
-        ...,
-        description="Total count",
+    total: int | None = Field(
+        default=None,
+        description="Total count (omitted on cursor pages unless requested)",
     )
     limit: int = Field(
         ...,
         description="Page size",
     )
-    offset: int = Field(
-        ...,
-        description="Current offset",
+    offset: int | None = Field(
+        default=None,
+        description="Current offset (offset pagination only)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; null on the last page",
     )
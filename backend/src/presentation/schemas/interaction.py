@@ -83,9 +83,14 @@ class SessionListResponse(BaseSchema):
     """Paginated list of sessions."""
 
     sessions: list[SessionResponse] = Field(..., description="List of sessions")
-    total: int = Field(..., description="Total number of sessions")
-    page: int = Field(..., description="Current page number")
+    total: int | None = Field(
+        None, description="Total number of sessions (omitted on cursor pages unless requested)"
+    )
+    page: int | None = Field(None, description="Current page number (offset pagination only)")
     page_size: int = Field(..., description="Page size")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
 
 
 class TurnResponse(BaseSchema):
@@ -116,6 +121,30 @@ class LatencyStatsResponse(BaseSchema):
     avg_tts_ttfb_ms: float | None = Field(None, description="Average TTS TTFB")
 
 
+class LatencyGroupStats(BaseSchema):
+    """Latency aggregates for one analytics group."""
+
+    key: dict[str, str | None] = Field(..., description="Group column values")
+    turns: int = Field(..., description="Number of turns in the group")
+    avg_total_ms: float | None = Field(None, description="Average total latency")
+    min_total_ms: float | None = Field(None, description="Minimum total latency")
+    max_total_ms: float | None = Field(None, description="Maximum total latency")
+    p50_total_ms: float | None = Field(None, description="Median total latency")
+    p95_total_ms: float | None = Field(None, description="95th percentile latency")
+    p99_total_ms: float | None = Field(None, description="99th percentile latency")
+    avg_stt_ms: float | None = Field(None, description="Average STT latency")
+    avg_llm_ttft_ms: float | None = Field(None, description="Average LLM TTFT")
+    avg_tts_ttfb_ms: float | None = Field(None, description="Average TTS TTFB")
+    avg_realtime_ms: float | None = Field(None, description="Average realtime latency")
+
+
+class LatencyAnalyticsResponse(BaseSchema):
+    """Latency aggregates across sessions."""
+
+    group_by: str = Field(..., description="Grouping used for the aggregates")
+    groups: list[LatencyGroupStats] = Field(..., description="One entry per group")
+
+
 class SystemPromptTemplateResponse(BaseSchema):
     """Response containing a system prompt template."""
 
@@ -33,6 +33,10 @@ class ProviderQuotaStatus(BaseModel):
     remaining_characters: int | None = Field(default=None, description="Remaining characters")
     usage_percent: float | None = Field(default=None, description="Usage percentage (0-100)")
     tier: str | None = Field(default=None, description="Subscription tier name")
+    quota_fetched_at: datetime | None = Field(
+        default=None,
+        description="When the quota data was fetched from the provider (may be cached)",
+    )
 
     # Tracked usage (from in-memory usage tracker)
     minute_requests: int = Field(default=0, description="Requests in current minute")
@@ -94,3 +98,7 @@ class QuotaDashboardResponse(BaseModel):
     providers: list[ProviderQuotaStatus] = Field(description="Per-provider quota status")
     app_rate_limits: AppRateLimitStatus = Field(description="Application-level rate limits")
     fetched_at: datetime = Field(description="Timestamp of this data fetch")
+    partial: bool = Field(
+        default=False,
+        description="True if some live quota lookups missed the latency budget and are omitted",
+    )
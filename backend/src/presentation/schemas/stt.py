@@ -143,10 +143,15 @@ class TranscriptionHistoryPage(BaseSchema):
     """Paginated transcription history."""
 
     items: list[TranscriptionSummary]
-    total: int
-    page: int
+    total: int | None = Field(
+        default=None, description="Total count (omitted on cursor pages unless requested)"
+    )
+    page: int | None = Field(default=None, description="Page number (offset pagination only)")
     page_size: int
-    total_pages: int
+    total_pages: int | None = None
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page; null on the last page"
+    )
 
 
 class AudioFileResponse(BaseSchema):
@@ -0,0 +1,4 @@
+"""Hermetic end-to-end benchmarks against local stub provider servers.
+
+Run with ``python -m tests.benchmark.e2e --help`` from the backend directory.
+"""
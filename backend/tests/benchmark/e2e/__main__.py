@@ -0,0 +1,5 @@
+"""Run the end-to-end benchmarks: ``python -m tests.benchmark.e2e``."""
+
+from tests.benchmark.e2e.harness import main
+
+main()
@@ -0,0 +1,779 @@
+"""End-to-end benchmark harness.
+
+Drives the real FastAPI app in-process (ASGI transport, so no client-side
+network hop) while every provider it calls is pointed at a local
+:class:`StubServer`. Provider clients, use cases, storage writes, routing and
+middleware all run for real; only the remote APIs and the database are
+replaced. Each scenario reports throughput, latency percentiles and process
+memory, and the whole run is written as a JSON report.
+
+Scenarios:
+    tts_synthesize[<provider>]  POST /tts/synthesize, one provider call each
+    tts_long_text               POST /tts/synthesize with auto-segmented text
+    stt_transcribe              POST /stt/transcribe (Whisper)
+    stt_compare                 POST /stt/compare (two Whisper transcriptions in parallel)
+    jobs                        Background job throughput (needs PostgreSQL)
+    cascade_session             STT -> LLM -> TTS interaction turns
+    realtime_session[<api>]     OpenAI Realtime / Gemini Live interaction turns
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import tempfile
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+from tests.benchmark.e2e.stub_servers import (
+    GEMINI_LIVE_PATH,
+    StubConfig,
+    StubServer,
+    silent_pcm,
+    silent_wav,
+)
+
+from src.domain.entities.stt import STTResult
+from src.domain.services.interaction import gemini_realtime, openai_realtime
+from src.domain.services.interaction.base import AudioChunk, InteractionModeService
+from src.domain.services.interaction.cascade_mode import CascadeModeService
+from src.infrastructure.persistence.database import get_db_session
+from src.infrastructure.providers.llm.gemini_llm import GeminiLLMProvider
+from src.infrastructure.providers.llm.openai_llm import OpenAILLMProvider
+from src.infrastructure.providers.stt.whisper_stt import WhisperSTTProvider
+from src.infrastructure.providers.tts.elevenlabs_tts import ElevenLabsTTSProvider
+from src.infrastructure.providers.tts.gemini_tts import GeminiTTSProvider
+from src.infrastructure.providers.tts.voai_tts import VoAITTSProvider
+from src.infrastructure.storage.local_storage import LocalStorage
+from src.main import app
+from src.presentation.api.dependencies import (
+    get_provider_credential_repository,
+    get_storage_service,
+    get_transcription_repository,
+)
+from src.presentation.api.middleware.auth import CurrentUser, get_current_user
+from src.presentation.api.middleware.rate_limit import RateLimitConfig, default_rate_limiter
+from src.presentation.api.routes import tts as tts_routes
+
+BENCH_USER_ID = uuid.UUID("00000000-0000-0000-0000-00000000be4c")
+
+SHORT_TEXT = "你好，歡迎使用語音實驗室。"
+# About 1,500 characters; VoAI's 500-character limit splits it into segments
+LONG_TEXT = "今天的天氣很好，我們一起去公園散步吧。" * 80
+
+# Stub API keys; requests never leave the machine
+STUB_ENV = {
+    "ELEVENLABS_API_KEY": "stub-elevenlabs",
+    "GOOGLE_AI_API_KEY": "stub-gemini",
+    "GEMINI_API_KEY": "stub-gemini",
+    "VOAI_API_KEY": "stub-voai",
+    "OPENAI_API_KEY": "stub-openai",
+}
+
+# Voice per TTS provider used by the synthesize scenarios
+TTS_VOICES = {
+    "elevenlabs": "21m00Tcm4TlvDq8ikWAM",
+    "gemini": "Kore",
+    "voai": "佑希",
+}
+
+
+class BenchmarkRequestError(Exception):
+    """A benchmarked request returned an error status."""
+
+
+@dataclass
+class ScenarioResult:
+    """Throughput, latency and memory of one benchmark scenario."""
+
+    name: str
+    requests: int = 0
+    errors: int = 0
+    concurrency: int = 1
+    duration_s: float = 0.0
+    throughput_rps: float = 0.0
+    p50_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    mean_ms: float | None = None
+    max_ms: float | None = None
+    rss_start_mb: float | None = None
+    rss_end_mb: float | None = None
+    peak_rss_mb: float | None = None
+    error_samples: dict[str, int] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+    skipped: str | None = None
+    # Raw latencies, for statistical comparison against a baseline
+    samples_ms: list[float] = field(default_factory=list)
+
+
+@dataclass
+class BenchmarkOptions:
+    """What to run and how hard."""
+
+    requests: int = 100
+    concurrency: int = 10
+    sessions: int = 5
+    turns: int = 3
+    jobs: int = 20
+    job_workers: int = 2
+    database_url: str | None = None
+    scenarios: list[str] | None = None  # None = all
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """The q-th percentile (0-100) of values, linearly interpolated."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _rss_mb() -> float | None:
+    """Current resident set size (Linux only)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _summarize(
+    name: str,
+    latencies_ms: list[float],
+    errors: Counter[str],
+    concurrency: int,
+    duration_s: float,
+    rss_start_mb: float | None,
+) -> ScenarioResult:
+    completed = len(latencies_ms)
+    return ScenarioResult(
+        name=name,
+        requests=completed + sum(errors.values()),
+        errors=sum(errors.values()),
+        concurrency=concurrency,
+        duration_s=round(duration_s, 3),
+        throughput_rps=round(completed / duration_s, 2) if duration_s > 0 else 0.0,
+        p50_ms=_round(percentile(latencies_ms, 50)),
+        p95_ms=_round(percentile(latencies_ms, 95)),
+        p99_ms=_round(percentile(latencies_ms, 99)),
+        mean_ms=_round(statistics.fmean(latencies_ms)) if latencies_ms else None,
+        max_ms=_round(max(latencies_ms)) if latencies_ms else None,
+        rss_start_mb=_round(rss_start_mb),
+        rss_end_mb=_round(_rss_mb()),
+        peak_rss_mb=_round(_peak_rss_mb()),
+        error_samples=dict(errors.most_common(5)),
+        samples_ms=[round(v, 3) for v in latencies_ms],
+    )
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 2) if value is not None else None
+
+
+def _error_key(error: Exception) -> str:
+    return f"{type(error).__name__}: {str(error)[:120]}"
+
+
+async def run_load(
+    name: str,
+    call: Callable[[int], Awaitable[None]],
+    requests: int,
+    concurrency: int,
+) -> ScenarioResult:
+    """Run ``requests`` calls with at most ``concurrency`` in flight.
+
+    Only successful calls count towards latency and throughput; failures are
+    counted and their messages sampled.
+    """
+    latencies_ms: list[float] = []
+    errors: Counter[str] = Counter()
+    indices = iter(range(requests))
+
+    async def worker() -> None:
+        for i in indices:
+            start = time.perf_counter()
+            try:
+                await call(i)
+            except Exception as e:
+                errors[_error_key(e)] += 1
+            else:
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    rss_start = _rss_mb()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, requests)))))
+    return _summarize(
+        name, latencies_ms, errors, concurrency, time.perf_counter() - start, rss_start
+    )
+
+
+# ---------------------------------------------------------------------------
+# Wiring the app to the stubs
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def providers_pointed_at(stub: StubServer) -> Iterator[None]:
+    """Point every stubbed provider at ``stub`` and supply stub API keys."""
+    base = stub.base_url
+
+    def rebased(cls: type, attribute: str, url: str) -> Callable[..., None]:
+        # Providers that build their URL per instance are rebased after __init__
+        original = cls.__init__
+
+        def init(self: Any, *args: Any, **kwargs: Any) -> None:
+            original(self, *args, **kwargs)
+            setattr(self, attribute, url)
+
+        return init
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, STUB_ENV))
+        stack.enter_context(patch.object(ElevenLabsTTSProvider, "BASE_URL", f"{base}/v1"))
+        stack.enter_context(patch.object(GeminiTTSProvider, "API_URL", f"{base}/v1beta/models"))
+        stack.enter_context(patch.object(GeminiLLMProvider, "BASE_URL", f"{base}/v1beta/models"))
+        stack.enter_context(
+            patch.object(WhisperSTTProvider, "BASE_URL", f"{base}/v1/audio/transcriptions")
+        )
+        stack.enter_context(
+            patch.object(OpenAILLMProvider, "BASE_URL", f"{base}/v1/chat/completions")
+        )
+        stack.enter_context(
+            patch.object(
+                VoAITTSProvider, "__init__", rebased(VoAITTSProvider, "_base_url", f"{base}/v1")
+            )
+        )
+        stack.enter_context(
+            patch.object(openai_realtime, "OPENAI_REALTIME_URL", f"{stub.ws_url}/v1/realtime")
+        )
+        stack.enter_context(
+            patch.object(gemini_realtime, "GEMINI_LIVE_URL", f"{stub.ws_url}{GEMINI_LIVE_PATH}")
+        )
+        yield
+
+
+class _NullSession:
+    """Stands in for the database session; the benchmarked routes only commit."""
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class _NoCredentials:
+    """Credential repository without user keys, so system (stub) keys are used."""
+
+    async def get_by_user_and_provider(self, user_id: uuid.UUID, provider: str) -> None:
+        return None
+
+
+class InMemoryTranscriptionRepository:
+    """Keeps audio files and transcriptions of a run in memory."""
+
+    def __init__(self) -> None:
+        self.audio_files: dict[uuid.UUID, Any] = {}
+        self.transcriptions: list[STTResult] = []
+
+    async def save_audio_file(self, audio_file: Any) -> Any:
+        self.audio_files[audio_file.id] = audio_file
+        return audio_file
+
+    async def get_audio_file(self, audio_file_id: uuid.UUID) -> Any:
+        return self.audio_files.get(audio_file_id)
+
+    async def save_ground_truth(self, ground_truth: Any) -> Any:
+        return ground_truth
+
+    async def save_transcription(
+        self, result: STTResult, audio_file_id: uuid.UUID, user_id: uuid.UUID
+    ) -> tuple[uuid.UUID, uuid.UUID]:
+        self.transcriptions.append(result)
+        return uuid.uuid4(), uuid.uuid4()
+
+
+@asynccontextmanager
+async def app_client(storage_dir: str) -> AsyncIterator[httpx.AsyncClient]:
+    """An HTTP client bound to the app with the database swapped for memory."""
+    storage = LocalStorage(base_path=storage_dir)
+    transcriptions = InMemoryTranscriptionRepository()
+    user = CurrentUser(
+        id=str(BENCH_USER_ID),
+        email="bench@example.com",
+        name="Benchmark",
+        picture_url=None,
+        google_id="benchmark",
+    )
+    unlimited = RateLimitConfig(
+        requests_per_minute=10**9,
+        requests_per_hour=10**9,
+        tts_requests_per_minute=10**9,
+        tts_requests_per_hour=10**9,
+        burst_size=10**9,
+    )
+
+    async def override_user() -> CurrentUser:
+        return user
+
+    async def override_session() -> Any:
+        return _NullSession()
+
+    overrides: dict[Callable[..., Any], Callable[..., Any]] = {
+        get_current_user: override_user,
+        get_db_session: override_session,
+        get_transcription_repository: lambda: transcriptions,
+        get_provider_credential_repository: lambda: _NoCredentials(),
+        get_storage_service: lambda: storage,
+    }
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(app.dependency_overrides, overrides))
+        stack.enter_context(patch.object(tts_routes, "get_storage", lambda: storage))
+        stack.enter_context(
+            patch.object(
+                tts_routes, "SQLAlchemyProviderCredentialRepository", lambda _s: _NoCredentials()
+            )
+        )
+        stack.enter_context(patch.object(default_rate_limiter, "config", unlimited))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=120.0
+        ) as client:
+            yield client
+
+
+async def _check(response: httpx.Response) -> None:
+    if response.status_code >= 400:
+        raise BenchmarkRequestError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+async def bench_tts_synthesize(
+    client: httpx.AsyncClient, provider: str, options: BenchmarkOptions
+) -> ScenarioResult:
+    async def call(i: int) -> None:
+        # Distinct texts, so identical-request coalescing does not hide provider calls
+        payload = {
+            "text": f"{SHORT_TEXT}{i}",
+            "provider": provider,
+            "voice_id": TTS_VOICES[provider],
+            "output_format": "wav",
+        }
+        await _check(await client.post("/api/v1/tts/synthesize", json=payload))
+
+    return await run_load(
+        f"tts_synthesize[{provider}]", call, options.requests, options.concurrency
+    )
+
+
+async def bench_tts_long_text(
+    client: httpx.AsyncClient, options: BenchmarkOptions
+) -> ScenarioResult:
+    segments: list[int] = []
+
+    async def call(i: int) -> None:
+        payload = {
+            "text": f"{i}{LONG_TEXT}",
+            "provider": "voai",
+            "voice_id": TTS_VOICES["voai"],
+            "output_format": "wav",
+        }
+        response = await client.post("/api/v1/tts/synthesize", json=payload)
+        await _check(response)
+        segments.append(response.json()["metadata"]["segment_count"])
+
+    # Each request fans out into several provider calls; keep the count modest
+    requests = max(1, options.requests // 4)
+    result = await run_load("tts_long_text", call, requests, options.concurrency)
+    result.extra = {"text_chars": len(LONG_TEXT), "segments": max(segments, default=0)}
+    return result
+
+
+async def bench_stt_transcribe(
+    client: httpx.AsyncClient, audio: bytes, options: BenchmarkOptions
+) -> ScenarioResult:
+    async def call(_i: int) -> None:
+        response = await client.post(
+            "/api/v1/stt/transcribe",
+            files={"audio": ("bench.wav", audio, "audio/wav")},
+            data={"provider": "whisper", "language": "zh-TW"},
+        )
+        await _check(response)
+
+    result = await run_load("stt_transcribe", call, options.requests, options.concurrency)
+    result.extra = {"audio_bytes": len(audio)}
+    return result
+
+
+async def bench_stt_compare(
+    client: httpx.AsyncClient, audio: bytes, options: BenchmarkOptions
+) -> ScenarioResult:
+    # Whisper is the only HTTP-based STT provider the factory enables, so the
+    # comparison fans out to it twice
+    providers = ["whisper", "whisper"]
+
+    async def call(_i: int) -> None:
+        response = await client.post(
+            "/api/v1/stt/compare",
+            files={"audio": ("bench.wav", audio, "audio/wav")},
+            data={"providers": providers, "language": "zh-TW"},
+        )
+        await _check(response)
+        # Providers that fail are left out of the results
+        if len(response.json()["results"]) != len(providers):
+            raise BenchmarkRequestError("A compared provider failed")
+
+    result = await run_load("stt_compare", call, options.requests, options.concurrency)
+    result.extra = {"providers": providers, "audio_bytes": len(audio)}
+    return result
+
+
+async def _run_turns(
+    service: InteractionModeService,
+    audio: bytes,
+    turns: int,
+    latencies_ms: list[float],
+    first_audio_ms: list[float],
+) -> None:
+    """Speak ``turns`` times and time each response."""
+    events = service.events().__aiter__()
+    frame = 640  # 20 ms of 16 kHz PCM16
+    for _ in range(turns):
+        for offset in range(0, len(audio), frame):
+            await service.send_audio(
+                AudioChunk(data=audio[offset : offset + frame], format="pcm16", sample_rate=16000)
+            )
+
+        start = time.perf_counter()
+        end_turn = asyncio.create_task(service.end_turn())
+        first_audio = True
+        while True:
+            event = await asyncio.wait_for(anext(events), timeout=30)
+            if event.type == "audio" and first_audio and event.data.get("audio"):
+                first_audio_ms.append((time.perf_counter() - start) * 1000)
+                first_audio = False
+            elif event.type == "error":
+                raise BenchmarkRequestError(str(event.data))
+            elif event.type == "response_ended":
+                break
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+        await end_turn
+
+
+async def _bench_sessions(
+    name: str,
+    create_service: Callable[[], InteractionModeService],
+    config: dict[str, Any],
+    options: BenchmarkOptions,
+) -> ScenarioResult:
+    """Concurrent interaction sessions; latency is per turn (end of speech to response end)."""
+    audio = silent_pcm(1.0, 16000)
+    latencies_ms: list[float] = []
+    first_audio_ms: list[float] = []
+    errors: Counter[str] = Counter()
+
+    async def session() -> None:
+        service = create_service()
+        try:
+            await service.connect(uuid.uuid4(), config, system_prompt="You are a benchmark.")
+            await _run_turns(service, audio, options.turns, latencies_ms, first_audio_ms)
+        except Exception as e:
+            errors[_error_key(e)] += 1
+        finally:
+            await service.disconnect()
+
+    rss_start = _rss_mb()
+    start = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(options.sessions)))
+    result = _summarize(
+        name, latencies_ms, errors, options.sessions, time.perf_counter() - start, rss_start
+    )
+    result.extra = {
+        "sessions": options.sessions,
+        "turns_per_session": options.turns,
+        "first_audio_p50_ms": _round(percentile(first_audio_ms, 50)),
+        "first_audio_p95_ms": _round(percentile(first_audio_ms, 95)),
+    }
+    return result
+
+
+async def bench_cascade_sessions(options: BenchmarkOptions) -> ScenarioResult:
+    def create() -> InteractionModeService:
+        return CascadeModeService(
+            stt_provider=WhisperSTTProvider(api_key=STUB_ENV["OPENAI_API_KEY"]),
+            llm_provider=GeminiLLMProvider(api_key=STUB_ENV["GEMINI_API_KEY"]),
+            tts_provider=ElevenLabsTTSProvider(api_key=STUB_ENV["ELEVENLABS_API_KEY"]),
+        )
+
+    config = {"tts_voice": TTS_VOICES["elevenlabs"], "language": "zh-TW"}
+    return await _bench_sessions("cascade_session", create, config, options)
+
+
+async def bench_realtime_sessions(api: str, options: BenchmarkOptions) -> ScenarioResult:
+    def create() -> InteractionModeService:
+        if api == "openai":
+            return openai_realtime.OpenAIRealtimeService(api_key=STUB_ENV["OPENAI_API_KEY"])
+        return gemini_realtime.GeminiRealtimeService(api_key=STUB_ENV["GEMINI_API_KEY"])
+
+    return await _bench_sessions(f"realtime_session[{api}]", create, {}, options)
+
+
+async def bench_jobs(storage_dir: str, options: BenchmarkOptions) -> ScenarioResult:
+    """Submit single-TTS jobs and time them through the background worker.
+
+    Requires PostgreSQL (the worker acquires jobs with FOR UPDATE SKIP LOCKED).
+    Jobs and the benchmark user are deleted afterwards.
+    """
+    if not options.database_url:
+        return ScenarioResult(name="jobs", skipped="no --database-url given")
+
+    from sqlalchemy import delete
+    from sqlalchemy.dialects.postgresql import insert
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from src.domain.entities.job import Job, JobType
+    from src.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
+    from src.infrastructure.persistence.models import User
+    from src.infrastructure.workers import job_worker
+
+    engine = create_async_engine(options.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    storage = LocalStorage(base_path=storage_dir)
+    workers = [
+        job_worker.JobWorker(session_factory, storage=storage) for _ in range(options.job_workers)
+    ]
+    jobs = [
+        Job(
+            user_id=BENCH_USER_ID,
+            job_type=JobType.SINGLE_TTS,
+            provider="elevenlabs",
+            input_params={
+                "text": f"{SHORT_TEXT}{i}",
+                "voice_id": TTS_VOICES["elevenlabs"],
+                "provider": "elevenlabs",
+                "output_format": "wav",
+            },
+        )
+        for i in range(options.jobs)
+    ]
+
+    try:
+        async with session_factory() as db:
+            await db.execute(
+                insert(User)
+                .values(id=BENCH_USER_ID, google_id="benchmark", email="bench@example.com")
+                .on_conflict_do_nothing()
+            )
+            repo = JobRepositoryImpl(db)
+            for job in jobs:
+                await repo.save(job)
+            await db.commit()
+
+        rss_start = _rss_mb()
+        start = time.perf_counter()
+        # The worker sleeps between polls; poll continuously to measure processing
+        with patch.object(job_worker, "POLL_INTERVAL_SECONDS", 0.01):
+            for worker in workers:
+                await worker.start()
+            finished = await _wait_for_jobs(session_factory, [j.id for j in jobs], timeout_s=600)
+        duration = time.perf_counter() - start
+
+        latencies_ms = [
+            (j.completed_at - j.created_at).total_seconds() * 1000
+            for j in finished
+            if j.status.value == "completed" and j.completed_at
+        ]
+        errors: Counter[str] = Counter(
+            j.error_message or j.status.value for j in finished if j.status.value != "completed"
+        )
+        result = _summarize("jobs", latencies_ms, errors, options.job_workers, duration, rss_start)
+        result.extra = {"workers": options.job_workers, "latency": "submission to completion"}
+        return result
+    finally:
+        for worker in workers:
+            await worker.stop()
+        async with session_factory() as db:
+            await db.execute(delete(User).where(User.id == BENCH_USER_ID))
+            await db.commit()
+        await engine.dispose()
+
+
+async def _wait_for_jobs(
+    session_factory: Any, job_ids: list[uuid.UUID], timeout_s: float
+) -> list[Any]:
+    from src.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
+
+    deadline = time.monotonic() + timeout_s
+    while True:
+        async with session_factory() as db:
+            repo = JobRepositoryImpl(db)
+            jobs = [await repo.get_by_id(job_id) for job_id in job_ids]
+        done = [j for j in jobs if j is not None and j.is_terminal()]
+        if len(done) == len(job_ids) or time.monotonic() > deadline:
+            return done
+        await asyncio.sleep(0.05)
+
+
+# ---------------------------------------------------------------------------
+# Running a suite
+# ---------------------------------------------------------------------------
+
+SCENARIOS = [
+    "tts_synthesize",
+    "tts_long_text",
+    "stt_transcribe",
+    "stt_compare",
+    "jobs",
+    "cascade_session",
+    "realtime_session",
+]
+
+
+async def run_suite(
+    stub_config: StubConfig | None = None, options: BenchmarkOptions | None = None
+) -> dict[str, Any]:
+    """Run the selected scenarios against a fresh stub server.
+
+    Returns:
+        The JSON-serializable report
+    """
+    stub_config = stub_config or StubConfig()
+    options = options or BenchmarkOptions()
+    selected = options.scenarios or SCENARIOS
+    unknown = set(selected) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results: list[ScenarioResult] = []
+    audio = silent_wav(stub_config.audio_seconds, 16000)
+    started_at = datetime.now(UTC)
+
+    with tempfile.TemporaryDirectory(prefix="voicelab-bench-") as storage_dir:
+        async with StubServer(stub_config) as stub:
+            with providers_pointed_at(stub):
+                async with app_client(storage_dir) as client:
+                    if "tts_synthesize" in selected:
+                        for provider in TTS_VOICES:
+                            results.append(await bench_tts_synthesize(client, provider, options))
+                    if "tts_long_text" in selected:
+                        results.append(await bench_tts_long_text(client, options))
+                    if "stt_transcribe" in selected:
+                        results.append(await bench_stt_transcribe(client, audio, options))
+                    if "stt_compare" in selected:
+                        results.append(await bench_stt_compare(client, audio, options))
+                if "jobs" in selected:
+                    results.append(await bench_jobs(storage_dir, options))
+                if "cascade_session" in selected:
+                    results.append(await bench_cascade_sessions(options))
+                if "realtime_session" in selected:
+                    for api in ("openai", "gemini"):
+                        results.append(await bench_realtime_sessions(api, options))
+
+            stub_requests = dict(stub.app.state.requests)
+            stub_rate_limited = dict(stub.app.state.rate_limited)
+
+    return {
+        "started_at": started_at.isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "stub_config": asdict(stub_config),
+        "options": asdict(options),
+        "stub_requests": stub_requests,
+        "stub_rate_limited": stub_rate_limited,
+        "scenarios": [asdict(r) for r in results],
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark.e2e",
+        description="Hermetic end-to-end benchmarks against local stub providers.",
+    )
+    parser.add_argument("--output", type=Path, default=Path("benchmark-report.json"))
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, dest="scenarios")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--job-workers", type=int, default=2)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="PostgreSQL URL (postgresql+asyncpg://...) for the jobs scenario",
+    )
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--rate-limit-rps", type=float, default=None)
+    parser.add_argument("--audio-seconds", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    stub_config = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_rps=args.rate_limit_rps,
+        audio_seconds=args.audio_seconds,
+        seed=args.seed,
+    )
+    options = BenchmarkOptions(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        sessions=args.sessions,
+        turns=args.turns,
+        jobs=args.jobs,
+        job_workers=args.job_workers,
+        database_url=args.database_url,
+        scenarios=args.scenarios,
+    )
+    report = asyncio.run(run_suite(stub_config, options))
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    for scenario in report["scenarios"]:
+        if scenario["skipped"]:
+            print(f"{scenario['name']:<28} skipped: {scenario['skipped']}")
+            continue
+        print(
+            f"{scenario['name']:<28} {scenario['throughput_rps']:>8.1f} req/s  "
+            f"p50 {scenario['p50_ms']} ms  p95 {scenario['p95_ms']} ms  "
+            f"p99 {scenario['p99_ms']} ms  errors {scenario['errors']}"
+        )
+    print(f"Report written to {args.output}")
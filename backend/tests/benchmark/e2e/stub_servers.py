@@ -0,0 +1,367 @@
+"""Local stub servers emulating the provider APIs the backend calls.
+
+One FastAPI app serves every emulated API under the same paths as the real
+services, so pointing a provider at the stub only means swapping its base URL:
+
+- ElevenLabs TTS:   POST /v1/text-to-speech/{voice_id}
+- Gemini TTS / LLM: POST /v1beta/models/{model}:generateContent
+                    POST /v1beta/models/{model}:streamGenerateContent (SSE)
+- VoAI TTS:         POST /TTS/Speech
+- Whisper STT:      POST /v1/audio/transcriptions
+- OpenAI LLM:       POST /v1/chat/completions
+- OpenAI Realtime:  WS   /v1/realtime
+- Gemini Live:      WS   /ws/google.ai.generativelanguage.v1alpha.GenerativeService.BidiGenerateContent
+
+Every response is delayed by a configurable latency with jitter, requests
+beyond the configured rate get a 429, and audio payloads are sized by the
+configured duration.
+"""
+
+import asyncio
+import base64
+import io
+import json
+import random
+import socket
+import time
+import wave
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+GEMINI_LIVE_PATH = "/ws/google.ai.generativelanguage.v1alpha.GenerativeService.BidiGenerateContent"
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub providers.
+
+    Attributes:
+        latency_ms: Base delay before a response (or its first chunk)
+        jitter_ms: Uniform +/- jitter added to every delay
+        rate_limit_rps: Requests per second served before answering 429; None = unlimited
+        audio_seconds: Duration of synthesized audio, which sets payload sizes
+        sample_rate: Sample rate of synthesized audio (16-bit mono PCM)
+        stream_chunks: Chunks in streamed responses (LLM tokens, realtime audio)
+        chunk_interval_ms: Delay between streamed chunks
+        transcript: Text returned by speech-to-text and realtime transcription
+        seed: Seed for the jitter generator, so runs are repeatable
+    """
+
+    latency_ms: float = 50.0
+    jitter_ms: float = 10.0
+    rate_limit_rps: float | None = None
+    audio_seconds: float = 1.0
+    sample_rate: int = 24000
+    stream_chunks: int = 5
+    chunk_interval_ms: float = 10.0
+    transcript: str = "今天天氣很好"
+    seed: int = 0
+
+
+class _TokenBucket:
+    """Admits ``rate`` requests per second with a one-second burst."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def silent_pcm(seconds: float, sample_rate: int) -> bytes:
+    """Silent 16-bit mono PCM."""
+    return bytes(2 * int(sample_rate * seconds))
+
+
+def silent_wav(seconds: float, sample_rate: int) -> bytes:
+    """Silent 16-bit mono WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        out.writeframes(silent_pcm(seconds, sample_rate))
+    return buffer.getvalue()
+
+
+def create_stub_app(config: StubConfig) -> FastAPI:
+    """Build the stub provider app.
+
+    ``app.state.requests`` counts served requests per emulated API and
+    ``app.state.rate_limited`` counts those answered with 429.
+    """
+    app = FastAPI()
+    app.state.requests = Counter()
+    app.state.rate_limited = Counter()
+
+    rng = random.Random(config.seed)
+    bucket = _TokenBucket(config.rate_limit_rps) if config.rate_limit_rps else None
+    wav = silent_wav(config.audio_seconds, config.sample_rate)
+    pcm = silent_pcm(config.audio_seconds, config.sample_rate)
+    words = list(config.transcript)
+
+    async def delay(base_ms: float) -> None:
+        jitter = rng.uniform(-config.jitter_ms, config.jitter_ms)
+        await asyncio.sleep(max(0.0, base_ms + jitter) / 1000)
+
+    async def admit(api: str) -> Response | None:
+        """Count the request, apply latency and rate limiting."""
+        app.state.requests[api] += 1
+        if bucket is not None and not bucket.try_acquire():
+            app.state.rate_limited[api] += 1
+            return JSONResponse(
+                {"error": {"message": "Rate limit exceeded (stub)"}},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+        await delay(config.latency_ms)
+        return None
+
+    def chunks(data: bytes) -> list[bytes]:
+        size = max(1, -(-len(data) // config.stream_chunks))
+        return [data[i : i + size] for i in range(0, len(data), size)]
+
+    @app.post("/v1/text-to-speech/{voice_id}")
+    async def elevenlabs_tts(voice_id: str) -> Response:
+        if (limited := await admit("elevenlabs_tts")) is not None:
+            return limited
+        return Response(wav, media_type="audio/wav")
+
+    @app.post("/TTS/Speech")
+    async def voai_tts() -> Response:
+        if (limited := await admit("voai_tts")) is not None:
+            return limited
+        return Response(wav, media_type="audio/wav")
+
+    @app.post("/v1/audio/transcriptions")
+    async def whisper_stt() -> Response:
+        if (limited := await admit("whisper_stt")) is not None:
+            return limited
+        step = config.audio_seconds / max(1, len(words))
+        return JSONResponse(
+            {
+                "text": config.transcript,
+                "words": [
+                    {"word": w, "start": i * step, "end": (i + 1) * step}
+                    for i, w in enumerate(words)
+                ],
+            }
+        )
+
+    @app.post("/v1/chat/completions")
+    async def openai_chat() -> Response:
+        if (limited := await admit("openai_llm")) is not None:
+            return limited
+        return JSONResponse(
+            {
+                "choices": [{"message": {"role": "assistant", "content": config.transcript}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": len(words)},
+            }
+        )
+
+    @app.post("/v1beta/models/{model_action}")
+    async def gemini_generate(model_action: str, request: Request) -> Response:
+        body = await request.json()
+        modalities = body.get("generationConfig", {}).get("responseModalities", [])
+
+        if "AUDIO" in modalities:
+            if (limited := await admit("gemini_tts")) is not None:
+                return limited
+            part = {"inlineData": {"mimeType": "audio/L16;rate=24000", "data": _b64(pcm)}}
+            return JSONResponse(
+                {"candidates": [{"content": {"parts": [part]}, "finishReason": "STOP"}]}
+            )
+
+        if (limited := await admit("gemini_llm")) is not None:
+            return limited
+
+        if model_action.endswith(":streamGenerateContent"):
+
+            async def sse() -> Any:
+                for i, token in enumerate(_split(config.transcript, config.stream_chunks)):
+                    if i:
+                        await delay(config.chunk_interval_ms)
+                    data = {"candidates": [{"content": {"parts": [{"text": token}]}}]}
+                    yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+            return StreamingResponse(sse(), media_type="text/event-stream")
+
+        return JSONResponse(
+            {
+                "candidates": [{"content": {"parts": [{"text": config.transcript}]}}],
+                "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": len(words)},
+            }
+        )
+
+    @app.websocket("/v1/realtime")
+    async def openai_realtime(ws: WebSocket) -> None:
+        app.state.requests["openai_realtime"] += 1
+        await ws.accept()
+        await ws.send_json({"type": "session.created", "session": {"id": "stub-session"}})
+        responses = 0
+        speaking = False
+        current: asyncio.Task[None] | None = None
+
+        async def respond(response_id: str) -> None:
+            await delay(config.latency_ms)
+            await ws.send_json({"type": "response.created", "response": {"id": response_id}})
+            for i, chunk in enumerate(chunks(pcm)):
+                if i:
+                    await delay(config.chunk_interval_ms)
+                await ws.send_json(
+                    {
+                        "type": "response.audio.delta",
+                        "response_id": response_id,
+                        "delta": _b64(chunk),
+                    }
+                )
+            await ws.send_json(
+                {
+                    "type": "response.audio_transcript.delta",
+                    "response_id": response_id,
+                    "delta": config.transcript,
+                }
+            )
+            await ws.send_json(
+                {"type": "response.done", "response": {"id": response_id, "status": "completed"}}
+            )
+
+        try:
+            while True:
+                event = json.loads(await ws.receive_text())
+                if event.get("type") == "input_audio_buffer.append" and not speaking:
+                    speaking = True
+                    await ws.send_json({"type": "input_audio_buffer.speech_started"})
+                elif event.get("type") == "input_audio_buffer.commit" and speaking:
+                    speaking = False
+                    await ws.send_json({"type": "input_audio_buffer.speech_stopped"})
+                elif event.get("type") == "response.create":
+                    responses += 1
+                    current = asyncio.create_task(respond(f"resp-{responses}"))
+                elif event.get("type") == "response.cancel" and current and not current.done():
+                    current.cancel()
+                    await ws.send_json(
+                        {
+                            "type": "response.done",
+                            "response": {"id": f"resp-{responses}", "status": "cancelled"},
+                        }
+                    )
+        except WebSocketDisconnect:
+            pass
+        finally:
+            if current is not None:
+                current.cancel()
+
+    @app.websocket(GEMINI_LIVE_PATH)
+    async def gemini_live(ws: WebSocket) -> None:
+        app.state.requests["gemini_realtime"] += 1
+        await ws.accept()
+        current: asyncio.Task[None] | None = None
+
+        async def respond() -> None:
+            await delay(config.latency_ms)
+            await ws.send_json(
+                {"serverContent": {"inputTranscription": {"text": config.transcript}}}
+            )
+            for i, chunk in enumerate(chunks(pcm)):
+                if i:
+                    await delay(config.chunk_interval_ms)
+                part = {"inlineData": {"mimeType": "audio/pcm;rate=24000", "data": _b64(chunk)}}
+                await ws.send_json({"serverContent": {"modelTurn": {"parts": [part]}}})
+            await ws.send_json(
+                {"serverContent": {"outputTranscription": {"text": config.transcript}}}
+            )
+            await ws.send_json({"serverContent": {"turnComplete": True}})
+
+        try:
+            while True:
+                event = json.loads(await ws.receive_text())
+                if "setup" in event:
+                    await ws.send_json({"setupComplete": {}})
+                elif event.get("realtime_input", {}).get("audio_stream_end"):
+                    current = asyncio.create_task(respond())
+                elif "client_content" in event and current and not current.done():
+                    # Client content during a response interrupts it
+                    current.cancel()
+                    await ws.send_json({"serverContent": {"interrupted": True}})
+        except WebSocketDisconnect:
+            pass
+        finally:
+            if current is not None:
+                current.cancel()
+
+    return app
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _split(text: str, parts: int) -> list[str]:
+    size = max(1, -(-len(text) // max(1, parts)))
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class StubServer:
+    """Serves the stub app on a free local port for the duration of a context.
+
+    Example:
+        async with StubServer(StubConfig(latency_ms=20)) as stub:
+            ElevenLabsTTSProvider.BASE_URL = f"{stub.base_url}/v1"
+    """
+
+    def __init__(self, config: StubConfig | None = None) -> None:
+        self.config = config or StubConfig()
+        self.app = create_stub_app(self.config)
+        self._socket: socket.socket | None = None
+        self._server: uvicorn.Server | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def port(self) -> int:
+        if self._socket is None:
+            raise RuntimeError("Stub server is not running")
+        return int(self._socket.getsockname()[1])
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    async def __aenter__(self) -> "StubServer":
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+
+        config = uvicorn.Config(self.app, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._task = asyncio.create_task(self._server.serve(sockets=[self._socket]))
+        while not self._server.started:
+            if self._task.done():
+                self._task.result()
+            await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._task is not None:
+            await self._task
+        if self._socket is not None:
+            self._socket.close()
@@ -0,0 +1,588 @@
+"""WebSocket interaction load generator.
+
+Opens N concurrent ``/interaction/ws/{mode}`` sessions against the real app
+and its ``InteractionWebSocketHandler``, with every STT/LLM/TTS or realtime
+provider pointed at a local :class:`StubServer`. Each session streams PCM at
+real-time pace in binary frames, ends its turns with ``end_turn`` and, if
+asked, barges in with ``interrupt`` once the reply starts playing.
+
+The app is served by uvicorn on its own thread and event loop, so loop lag
+and CPU time of the server loop are measured apart from the load generator.
+Both still share one process (and the GIL), so treat the absolute numbers
+as a lower bound of what a dedicated instance sustains.
+
+Recorded per load level:
+    turn latency           end_turn sent -> response_ended received
+    first audio            end_turn sent -> first reply audio frame
+    interrupt latency      interrupt sent -> interrupted received
+    server latency         LatencyMetrics reported in response_ended
+    late frames            upstream frames sent more than one frame late
+    playback underruns     reply audio arriving after a simulated jitter
+                           buffer ran dry (what a listener hears as choppy)
+    loop lag               oversleep of a timer on the server loop
+    CPU / memory           server loop thread CPU, process CPU and RSS
+
+Run with ``python -m tests.benchmark.e2e.ws_load --sessions 10 --sessions 50``
+to step through load levels and find where audio starts breaking up.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import socket
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import uvicorn
+from tests.benchmark.e2e.harness import (
+    BENCH_USER_ID,
+    TTS_VOICES,
+    _error_key,
+    _round,
+    _rss_mb,
+    percentile,
+    providers_pointed_at,
+)
+from tests.benchmark.e2e.stub_servers import StubConfig, StubServer, silent_pcm
+from websockets.asyncio.client import ClientConnection, connect
+
+from src.domain.entities import InteractionSession
+from src.infrastructure.persistence.database import get_db_session
+from src.infrastructure.persistence.interaction_write_behind import InteractionWriteBehind
+from src.infrastructure.storage.audio_storage import AudioStorageService
+from src.infrastructure.websocket.audio_frames import decode_audio_frame, encode_audio_frame
+from src.main import app
+from src.presentation.api.routes import interaction_ws
+
+INPUT_SAMPLE_RATE = 16000
+
+# Reply audio that arrives this long after the previous chunk finished
+# playing is counted as a dropout (typical client jitter buffer)
+DEFAULT_PLAYOUT_BUFFER_MS = 60.0
+
+RESPONSE_TIMEOUT_S = 30.0
+
+# How long to wait for "interrupted" once the reply has already ended
+INTERRUPT_GRACE_S = 1.0
+
+
+class SessionError(Exception):
+    """A load-generator session received an error or stalled."""
+
+
+@dataclass
+class LoadOptions:
+    """Load shape; ``sessions`` lists the concurrency levels to step through."""
+
+    sessions: list[int] = field(default_factory=lambda: [10])
+    turns: int = 3
+    mode: str = "cascade"
+    realtime_provider: str = "openai"
+    frame_ms: int = 20
+    interrupt_every: int = 0
+    ramp_up_s: float = 1.0
+    playout_buffer_ms: float = DEFAULT_PLAYOUT_BUFFER_MS
+    lightweight: bool = False
+    lag_interval_ms: float = 20.0
+    audio_path: Path | None = None
+
+
+@dataclass
+class _LevelStats:
+    """Measurements of one load level, filled in by all of its sessions."""
+
+    turn_ms: list[float] = field(default_factory=list)
+    first_audio_ms: list[float] = field(default_factory=list)
+    interrupt_ms: list[float] = field(default_factory=list)
+    interrupts_missed: int = 0
+    connect_ms: list[float] = field(default_factory=list)
+    server_latency_ms: dict[str, list[float]] = field(default_factory=dict)
+    frames_sent: int = 0
+    late_frames: int = 0
+    audio_frames_received: int = 0
+    underruns: int = 0
+    turns_completed: int = 0
+    sessions_completed: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+
+
+class _InMemoryInteractionStore(InteractionWriteBehind):
+    """Write-behind store that buffers exactly like the real one but never hits a database."""
+
+    def __init__(self, _session_factory: Any = None) -> None:
+        super().__init__(session_factory=None)  # type: ignore[arg-type]
+
+    async def start_session(self, session: InteractionSession) -> InteractionSession:
+        self._session = session
+        self._last_turn_number = 0
+        return session
+
+    async def flush(self) -> None:
+        self._turns = {}
+        self._metrics = []
+        self._session_dirty = False
+
+
+class _NullSession:
+    async def close(self) -> None:
+        pass
+
+
+class _NoCredentials:
+    def __init__(self, _db: Any = None) -> None:
+        pass
+
+    async def list_by_user(self, user_id: uuid.UUID) -> list[Any]:
+        return []
+
+
+class _Playout:
+    """Simulates a client jitter buffer playing reply audio in real time."""
+
+    def __init__(self, buffer_ms: float) -> None:
+        self._buffer_s = buffer_ms / 1000
+        self._playing_until: float | None = None
+
+    def push(self, arrived_at: float, seconds: float) -> bool:
+        """Queue a chunk; returns True when playback had already run dry."""
+        if self._playing_until is None:
+            self._playing_until = arrived_at + self._buffer_s + seconds
+            return False
+        if arrived_at > self._playing_until:
+            self._playing_until = arrived_at + self._buffer_s + seconds
+            return True
+        self._playing_until += seconds
+        return False
+
+
+class AppServer:
+    """Serves the app on a free port from a dedicated thread and event loop."""
+
+    def __init__(self, lag_interval_ms: float) -> None:
+        self._lag_interval_s = lag_interval_ms / 1000
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+        self._thread = threading.Thread(target=self._run, name="ws-load-server", daemon=True)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.lag_ms: list[float] = []
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://127.0.0.1:{self._socket.getsockname()[1]}"
+
+    def _run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        monitor = asyncio.create_task(self._monitor_lag())
+        try:
+            await self._server.serve(sockets=[self._socket])
+        finally:
+            monitor.cancel()
+
+    async def _monitor_lag(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._lag_interval_s)
+            overshoot = time.perf_counter() - start - self._lag_interval_s
+            self.lag_ms.append(max(0.0, overshoot * 1000))
+
+    async def thread_cpu_s(self) -> float:
+        """CPU time consumed so far by the server loop's thread."""
+        if self._loop is None:
+            return 0.0
+
+        async def read() -> float:
+            return time.thread_time()
+
+        future = asyncio.run_coroutine_threadsafe(read(), self._loop)
+        return await asyncio.wrap_future(future)
+
+    async def __aenter__(self) -> "AppServer":
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("App server failed to start")
+            await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._server.should_exit = True
+        await asyncio.to_thread(self._thread.join)
+        self._socket.close()
+
+
+@contextmanager
+def interaction_app(storage_dir: str) -> Iterator[None]:
+    """Swap the database and credential store for memory; audio goes to ``storage_dir``."""
+
+    async def override_session() -> Any:
+        return _NullSession()
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.dict(app.dependency_overrides, {get_db_session: override_session})
+        )
+        stack.enter_context(
+            patch.object(interaction_ws, "SQLAlchemyProviderCredentialRepository", _NoCredentials)
+        )
+        stack.enter_context(
+            patch.object(interaction_ws, "InteractionWriteBehind", _InMemoryInteractionStore)
+        )
+        stack.enter_context(
+            patch.object(
+                interaction_ws,
+                "AudioStorageService",
+                lambda: AudioStorageService(base_path=storage_dir),
+            )
+        )
+        yield
+
+
+def load_pcm(path: Path | None, seconds: float = 1.5) -> bytes:
+    """The utterance every session speaks: a 16 kHz mono PCM16 WAV, or silence."""
+    if path is None:
+        return silent_pcm(seconds, INPUT_SAMPLE_RATE)
+
+    with wave.open(str(path), "rb") as wav:
+        if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (
+            INPUT_SAMPLE_RATE,
+            1,
+            2,
+        ):
+            raise ValueError(f"{path} must be {INPUT_SAMPLE_RATE} Hz mono 16-bit PCM")
+        return wav.readframes(wav.getnframes())
+
+
+def _session_config(options: LoadOptions) -> dict[str, Any]:
+    if options.mode == "realtime":
+        return {"provider": options.realtime_provider}
+    return {
+        "stt_provider": "whisper",
+        "llm_provider": "gemini",
+        "tts_provider": "elevenlabs",
+        "tts_voice": TTS_VOICES["elevenlabs"],
+        "language": "zh-TW",
+    }
+
+
+async def _read_events(ws: ClientConnection, events: asyncio.Queue[tuple[str, Any, float]]) -> None:
+    """Queue (type, data, arrival time) for every server message."""
+    try:
+        async for message in ws:
+            arrived_at = time.perf_counter()
+            if isinstance(message, bytes):
+                events.put_nowait(("audio", decode_audio_frame(message), arrived_at))
+            else:
+                payload = json.loads(message)
+                events.put_nowait((payload["type"], payload.get("data", {}), arrived_at))
+    finally:
+        events.put_nowait(("closed", {}, time.perf_counter()))
+
+
+async def _next_event(
+    events: asyncio.Queue[tuple[str, Any, float]], timeout: float = RESPONSE_TIMEOUT_S
+) -> tuple[str, Any, float]:
+    try:
+        kind, data, arrived_at = await asyncio.wait_for(events.get(), timeout)
+    except TimeoutError as e:
+        raise SessionError(f"No server message within {timeout:g}s") from e
+    if kind == "error":
+        raise SessionError(f"{data.get('error_code')}: {data.get('message')}")
+    if kind == "closed":
+        raise SessionError("Server closed the connection")
+    return kind, data, arrived_at
+
+
+async def _stream_utterance(
+    ws: ClientConnection, audio: bytes, frame_ms: int, stats: _LevelStats
+) -> None:
+    """Send ``audio`` in binary frames at real-time pace."""
+    frame_bytes = INPUT_SAMPLE_RATE * 2 * frame_ms // 1000
+    frame_s = frame_ms / 1000
+    start = time.perf_counter()
+    for i, offset in enumerate(range(0, len(audio), frame_bytes)):
+        wait = start + i * frame_s - time.perf_counter()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        elif -wait > frame_s:
+            stats.late_frames += 1
+        await ws.send(encode_audio_frame(audio[offset : offset + frame_bytes], INPUT_SAMPLE_RATE))
+        stats.frames_sent += 1
+
+
+async def _run_turn(
+    ws: ClientConnection,
+    events: asyncio.Queue[tuple[str, Any, float]],
+    interrupt: bool,
+    options: LoadOptions,
+    stats: _LevelStats,
+) -> None:
+    """End the user's turn and follow the reply until it ends or is interrupted."""
+    # Anything still queued belongs to the previous (interrupted) reply
+    while not events.empty():
+        events.get_nowait()
+
+    playout = _Playout(options.playout_buffer_ms)
+    start = time.perf_counter()
+    await ws.send(json.dumps({"type": "end_turn", "data": {}}))
+    first_audio = True
+    interrupt_sent: float | None = None
+    ended = False
+
+    while True:
+        if ended:
+            # The reply finished before the interrupt reached the provider
+            try:
+                kind, data, arrived_at = await _next_event(events, INTERRUPT_GRACE_S)
+            except SessionError:
+                stats.interrupts_missed += 1
+                break
+        else:
+            kind, data, arrived_at = await _next_event(events)
+        if kind == "audio":
+            if not data.payload:
+                continue
+            stats.audio_frames_received += 1
+            if playout.push(arrived_at, len(data.payload) / 2 / data.sample_rate):
+                stats.underruns += 1
+            if first_audio:
+                first_audio = False
+                stats.first_audio_ms.append((arrived_at - start) * 1000)
+                if interrupt:
+                    await ws.send(json.dumps({"type": "interrupt", "data": {}}))
+                    interrupt_sent = time.perf_counter()
+        elif kind == "response_ended":
+            for key, value in (data.get("latency") or {}).items():
+                if value is not None:
+                    stats.server_latency_ms.setdefault(key, []).append(value)
+            if interrupt_sent is None:
+                stats.turn_ms.append((arrived_at - start) * 1000)
+                break
+            ended = True
+        elif kind == "interrupted" and interrupt_sent is not None:
+            stats.interrupt_ms.append((arrived_at - interrupt_sent) * 1000)
+            break
+    stats.turns_completed += 1
+
+
+async def _run_session(
+    url: str, audio: bytes, delay_s: float, options: LoadOptions, stats: _LevelStats
+) -> None:
+    await asyncio.sleep(delay_s)
+    events: asyncio.Queue[tuple[str, Any, float]] = asyncio.Queue()
+    try:
+        start = time.perf_counter()
+        async with connect(url, max_size=None) as ws:
+            reader = asyncio.create_task(_read_events(ws, events))
+            try:
+                await ws.send(
+                    json.dumps(
+                        {
+                            "type": "config",
+                            "data": {
+                                "config": _session_config(options),
+                                "system_prompt": "You are a load test.",
+                                "lightweight_mode": options.lightweight,
+                            },
+                        }
+                    )
+                )
+                while True:
+                    kind, data, _ = await _next_event(events)
+                    if kind == "connected" and data.get("status") == "session_started":
+                        break
+                stats.connect_ms.append((time.perf_counter() - start) * 1000)
+
+                for turn in range(1, options.turns + 1):
+                    await _stream_utterance(ws, audio, options.frame_ms, stats)
+                    interrupt = (
+                        bool(options.interrupt_every) and turn % options.interrupt_every == 0
+                    )
+                    await _run_turn(ws, events, interrupt, options, stats)
+            finally:
+                reader.cancel()
+        stats.sessions_completed += 1
+    except Exception as e:
+        stats.errors[_error_key(e)] += 1
+
+
+def _distribution(values: list[float]) -> dict[str, float | int | None]:
+    return {
+        "count": len(values),
+        "p50": _round(percentile(values, 50)),
+        "p95": _round(percentile(values, 95)),
+        "p99": _round(percentile(values, 99)),
+        "max": _round(max(values)) if values else None,
+    }
+
+
+async def run_level(
+    server: AppServer, sessions: int, audio: bytes, options: LoadOptions
+) -> dict[str, Any]:
+    """Run ``sessions`` concurrent sessions and summarize the level."""
+    stats = _LevelStats()
+    url = f"{server.ws_url}/api/v1/interaction/ws/{options.mode}?user_id={BENCH_USER_ID}"
+    lag_offset = len(server.lag_ms)
+    rss_samples = [_rss_mb() or 0.0]
+    server_cpu_start = await server.thread_cpu_s()
+    process_cpu_start = resource.getrusage(resource.RUSAGE_SELF)
+    wall_start = time.perf_counter()
+
+    async def sample_rss() -> None:
+        while True:
+            await asyncio.sleep(0.25)
+            rss_samples.append(_rss_mb() or 0.0)
+
+    sampler = asyncio.create_task(sample_rss())
+    try:
+        await asyncio.gather(
+            *(
+                _run_session(url, audio, options.ramp_up_s * i / sessions, options, stats)
+                for i in range(sessions)
+            )
+        )
+    finally:
+        sampler.cancel()
+
+    wall = time.perf_counter() - wall_start
+    process_cpu_end = resource.getrusage(resource.RUSAGE_SELF)
+    process_cpu = (process_cpu_end.ru_utime - process_cpu_start.ru_utime) + (
+        process_cpu_end.ru_stime - process_cpu_start.ru_stime
+    )
+    server_cpu = await server.thread_cpu_s() - server_cpu_start
+    lag = server.lag_ms[lag_offset:]
+
+    return {
+        "sessions": sessions,
+        "sessions_completed": stats.sessions_completed,
+        "turns_completed": stats.turns_completed,
+        "duration_s": round(wall, 3),
+        "errors": dict(stats.errors),
+        "connect_ms": _distribution(stats.connect_ms),
+        "turn_ms": _distribution(stats.turn_ms),
+        "first_audio_ms": _distribution(stats.first_audio_ms),
+        "interrupt_ms": _distribution(stats.interrupt_ms),
+        "interrupts_missed": stats.interrupts_missed,
+        "server_latency_ms": {
+            key: _distribution(values) for key, values in sorted(stats.server_latency_ms.items())
+        },
+        "frames": {
+            "sent": stats.frames_sent,
+            "late": stats.late_frames,
+            "audio_received": stats.audio_frames_received,
+            "underruns": stats.underruns,
+        },
+        "loop_lag_ms": _distribution(lag),
+        "server_loop_cpu_pct": round(100 * server_cpu / wall, 1) if wall else None,
+        "process_cpu_pct": round(100 * process_cpu / wall, 1) if wall else None,
+        "rss_mb": {
+            "start": round(rss_samples[0], 1),
+            "end": round(rss_samples[-1], 1),
+            "max": round(max(rss_samples), 1),
+        },
+    }
+
+
+async def run_load(stub_config: StubConfig, options: LoadOptions) -> dict[str, Any]:
+    """Start stubs and the app, then run every load level in turn."""
+    audio = load_pcm(options.audio_path)
+    with tempfile.TemporaryDirectory(prefix="voicelab-ws-load-") as storage_dir:
+        async with StubServer(stub_config) as stub:
+            with providers_pointed_at(stub), interaction_app(storage_dir):
+                async with AppServer(options.lag_interval_ms) as server:
+                    levels = [await run_level(server, n, audio, options) for n in options.sessions]
+            stub_requests = dict(stub.app.state.requests)
+
+    return {
+        "started_at": datetime.now(UTC).isoformat(),
+        "stub_config": asdict(stub_config),
+        "options": {**asdict(options), "audio_path": str(options.audio_path or "")},
+        "utterance_seconds": round(len(audio) / 2 / INPUT_SAMPLE_RATE, 3),
+        "stub_requests": stub_requests,
+        "levels": levels,
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark.e2e.ws_load",
+        description="Concurrent /interaction/ws sessions against stub providers.",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        action="append",
+        help="Concurrent sessions; repeat to step through load levels (default 10)",
+    )
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--mode", choices=["cascade", "realtime"], default="cascade")
+    parser.add_argument("--realtime-provider", choices=["openai", "gemini"], default="openai")
+    parser.add_argument("--frame-ms", type=int, default=20)
+    parser.add_argument(
+        "--interrupt-every", type=int, default=0, help="Barge in on every N-th turn (0 = never)"
+    )
+    parser.add_argument("--ramp-up-s", type=float, default=1.0)
+    parser.add_argument("--playout-buffer-ms", type=float, default=DEFAULT_PLAYOUT_BUFFER_MS)
+    parser.add_argument("--lightweight", action="store_true", help="Skip server audio recording")
+    parser.add_argument("--audio", type=Path, default=None, help="16 kHz mono PCM16 WAV to speak")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--audio-seconds", type=float, default=1.0, help="Length of each reply")
+    parser.add_argument("--output", type=Path, default=Path("ws-load-report.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    # Per-message INFO logs would cost more than the handler itself
+    logging.disable(logging.INFO)
+    options = LoadOptions(
+        sessions=args.sessions or [10],
+        turns=args.turns,
+        mode=args.mode,
+        realtime_provider=args.realtime_provider,
+        frame_ms=args.frame_ms,
+        interrupt_every=args.interrupt_every,
+        ramp_up_s=args.ramp_up_s,
+        playout_buffer_ms=args.playout_buffer_ms,
+        lightweight=args.lightweight,
+        audio_path=args.audio,
+    )
+    stub_config = StubConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, audio_seconds=args.audio_seconds
+    )
+    report = asyncio.run(run_load(stub_config, options))
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    for level in report["levels"]:
+        frames = level["frames"]
+        print(
+            f"{level['sessions']:>4} sessions  turn p95 {level['turn_ms']['p95']} ms  "
+            f"first audio p95 {level['first_audio_ms']['p95']} ms  "
+            f"lag p99 {level['loop_lag_ms']['p99']} ms  "
+            f"late {frames['late']}/{frames['sent']}  underruns {frames['underruns']}  "
+            f"cpu {level['server_loop_cpu_pct']}%  errors {sum(level['errors'].values())}"
+        )
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Benchmark regression gate.
+
+Runs the micro-benchmarks and/or the end-to-end suite, records every run in a
+local SQLite history and compares it against the stored baseline. Run with
+``python -m tests.benchmark.regression --help`` from the backend directory.
+"""
@@ -0,0 +1,7 @@
+"""Run the benchmark regression gate: ``python -m tests.benchmark.regression``."""
+
+import sys
+
+from tests.benchmark.regression.cli import main
+
+sys.exit(main())
@@ -0,0 +1,137 @@
+"""Command-line entry point of the regression gate."""
+
+import argparse
+import asyncio
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from tests.benchmark.e2e.harness import BenchmarkOptions, run_suite
+from tests.benchmark.e2e.stub_servers import StubConfig
+from tests.benchmark.regression.gate import compare_runs, format_report
+from tests.benchmark.regression.history import BenchmarkHistory, BenchmarkSample
+from tests.benchmark.regression.micro import MICRO_BENCHMARKS, run_micro_benchmarks
+
+DEFAULT_HISTORY = Path(".benchmarks/history.sqlite")
+
+
+def _git_rev() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def e2e_samples(report: dict[str, Any]) -> dict[str, BenchmarkSample]:
+    """Extract the comparable scenarios of an e2e report (skipped ones are dropped)."""
+    return {
+        scenario["name"]: BenchmarkSample(scenario["samples_ms"], scenario["throughput_rps"])
+        for scenario in report["scenarios"]
+        if not scenario["skipped"] and scenario.get("samples_ms")
+    }
+
+
+async def _collect(suite: str, args: argparse.Namespace) -> dict[str, BenchmarkSample]:
+    if suite == "micro":
+        results = await run_micro_benchmarks(
+            iterations=args.iterations,
+            warmup=args.warmup,
+            selected=args.benchmarks,
+        )
+        return {r.name: BenchmarkSample(r.samples_ms, r.throughput_rps) for r in results}
+
+    if args.e2e_report is not None:
+        report = json.loads(args.e2e_report.read_text())
+    else:
+        report = await run_suite(
+            StubConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms),
+            BenchmarkOptions(requests=args.requests, concurrency=args.concurrency),
+        )
+    return e2e_samples(report)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark.regression",
+        description="Run benchmarks and fail when they regress against the stored baseline.",
+    )
+    parser.add_argument("--suite", choices=["micro", "e2e", "all"], default="micro")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Record this run as the new baseline instead of gating on the old one",
+    )
+    parser.add_argument("--p95-threshold", type=float, default=0.10)
+    parser.add_argument("--throughput-threshold", type=float, default=0.10)
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--benchmark", action="append", choices=MICRO_BENCHMARKS, dest="benchmarks")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument(
+        "--e2e-report",
+        type=Path,
+        default=None,
+        help="Gate an existing e2e report JSON instead of running the e2e suite",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the gate.
+
+    Returns:
+        Exit code: 1 when any benchmark regressed, 0 otherwise
+    """
+    args = _parse_args(argv)
+    # Per-call INFO logs would dominate the measurements and bury the report
+    logging.disable(logging.INFO)
+    suites = ["micro", "e2e"] if args.suite == "all" else [args.suite]
+    history = BenchmarkHistory(args.history)
+    git_rev = _git_rev()
+    failed = False
+
+    try:
+        for suite in suites:
+            current = asyncio.run(_collect(suite, args))
+            baseline = history.baseline(suite)
+            run_id = history.record(
+                suite,
+                current,
+                baseline=args.save_baseline or baseline is None,
+                git_rev=git_rev,
+                metadata={"argv": sys.argv[1:]},
+            )
+
+            print(f"== {suite} (run {run_id}) ==")
+            if args.save_baseline or baseline is None:
+                print("Recorded as baseline; nothing to compare against.")
+                continue
+
+            comparisons = compare_runs(
+                baseline.results,
+                current,
+                p95_threshold=args.p95_threshold,
+                throughput_threshold=args.throughput_threshold,
+                alpha=args.alpha,
+            )
+            print(f"Baseline: run {baseline.id} ({baseline.git_rev or 'unknown rev'})")
+            print(format_report(comparisons))
+            failed = failed or any(c.regressed for c in comparisons)
+    finally:
+        history.close()
+
+    return 1 if failed else 0
@@ -0,0 +1,174 @@
+"""Compare a benchmark run against its baseline.
+
+A p95 regression must be both larger than the threshold and statistically
+significant (one-sided Mann-Whitney U test on the raw latency samples), so a
+single noisy tail sample does not fail the gate. Throughput has one value per
+run and is skewed by the same outliers, so a throughput drop only counts when
+the latency test agrees that the whole distribution moved.
+"""
+
+import math
+from dataclasses import dataclass
+
+from tests.benchmark.e2e.harness import percentile
+from tests.benchmark.regression.history import BenchmarkSample
+
+
+@dataclass
+class Comparison:
+    """Outcome for one benchmark present in the current run."""
+
+    name: str
+    status: str  # "ok", "regressed", "improved" or "new"
+    baseline_p95_ms: float | None = None
+    current_p95_ms: float | None = None
+    p95_change: float | None = None
+    baseline_throughput: float | None = None
+    current_throughput: float | None = None
+    throughput_change: float | None = None
+    p_value: float | None = None
+    reasons: tuple[str, ...] = ()
+
+    @property
+    def regressed(self) -> bool:
+        return self.status == "regressed"
+
+
+def mann_whitney_greater(current: list[float], baseline: list[float]) -> float:
+    """One-sided Mann-Whitney U test that ``current`` tends to be larger.
+
+    Uses the normal approximation with tie and continuity correction, which
+    is accurate for the sample sizes benchmarks produce (n >= 20).
+
+    Returns:
+        The p-value; 1.0 when either sample is empty or all values are tied
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        rank_sum += average_rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        tied = j - i + 1
+        tie_term += tied**3 - tied
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _change(baseline: float | None, current: float | None) -> float | None:
+    if baseline is None or current is None or baseline == 0:
+        return None
+    return (current - baseline) / baseline
+
+
+def compare_runs(
+    baseline: dict[str, BenchmarkSample],
+    current: dict[str, BenchmarkSample],
+    *,
+    p95_threshold: float = 0.10,
+    throughput_threshold: float = 0.10,
+    alpha: float = 0.01,
+) -> list[Comparison]:
+    """Compare every benchmark of ``current`` with the same one in ``baseline``.
+
+    Args:
+        p95_threshold: Relative p95 increase that counts as a regression
+        throughput_threshold: Relative throughput drop that counts as a regression
+        alpha: Significance level of the latency shift test
+    """
+    comparisons = []
+    for name, sample in current.items():
+        current_p95 = percentile(sample.samples_ms, 95)
+        reference = baseline.get(name)
+        if reference is None:
+            comparisons.append(
+                Comparison(
+                    name,
+                    "new",
+                    current_p95_ms=current_p95,
+                    current_throughput=sample.throughput_rps,
+                )
+            )
+            continue
+
+        baseline_p95 = percentile(reference.samples_ms, 95)
+        p95_change = _change(baseline_p95, current_p95)
+        throughput_change = _change(reference.throughput_rps, sample.throughput_rps)
+        p_value = mann_whitney_greater(sample.samples_ms, reference.samples_ms)
+
+        reasons = []
+        if p95_change is not None and p95_change > p95_threshold and p_value < alpha:
+            reasons.append(f"p95 +{p95_change:.1%} (p={p_value:.2g})")
+        if (
+            throughput_change is not None
+            and throughput_change < -throughput_threshold
+            and p_value < alpha
+        ):
+            reasons.append(f"throughput {throughput_change:.1%} (p={p_value:.2g})")
+
+        if reasons:
+            status = "regressed"
+        elif (p95_change is not None and p95_change < -p95_threshold) or (
+            throughput_change is not None and throughput_change > throughput_threshold
+        ):
+            status = "improved"
+        else:
+            status = "ok"
+
+        comparisons.append(
+            Comparison(
+                name,
+                status,
+                baseline_p95_ms=baseline_p95,
+                current_p95_ms=current_p95,
+                p95_change=p95_change,
+                baseline_throughput=reference.throughput_rps,
+                current_throughput=sample.throughput_rps,
+                throughput_change=throughput_change,
+                p_value=p_value,
+                reasons=tuple(reasons),
+            )
+        )
+    return comparisons
+
+
+def _fmt(value: float | None, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    """Render comparisons as a fixed-width table followed by the regressions."""
+    header = (
+        f"{'benchmark':<28} {'p95 base':>10} {'p95 now':>10} {'Δp95':>8} "
+        f"{'rps base':>10} {'rps now':>10} {'Δrps':>8} {'p':>8}  status"
+    )
+    lines = [header, "-" * len(header)]
+    for c in comparisons:
+        lines.append(
+            f"{c.name:<28} {_fmt(c.baseline_p95_ms, '.3f'):>10} {_fmt(c.current_p95_ms, '.3f'):>10} "
+            f"{_fmt(c.p95_change, '+.1%'):>8} {_fmt(c.baseline_throughput, '.1f'):>10} "
+            f"{_fmt(c.current_throughput, '.1f'):>10} {_fmt(c.throughput_change, '+.1%'):>8} "
+            f"{_fmt(c.p_value, '.2g'):>8}  {c.status}"
+        )
+
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        lines.append("")
+        lines.append(f"{len(regressions)} regression(s):")
+        lines.extend(f"  {c.name}: {'; '.join(c.reasons)}" for c in regressions)
+    return "\n".join(lines)
@@ -0,0 +1,146 @@
+"""SQLite history of benchmark runs and their baselines."""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    git_rev TEXT,
+    is_baseline INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    throughput_rps REAL,
+    samples_ms TEXT NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_suite_baseline ON runs (suite, is_baseline, id);
+"""
+
+
+@dataclass
+class BenchmarkSample:
+    """Latency samples and throughput of one benchmark in one run."""
+
+    samples_ms: list[float]
+    throughput_rps: float | None = None
+
+
+@dataclass
+class RecordedRun:
+    """A run read back from the history."""
+
+    id: int
+    suite: str
+    created_at: str
+    git_rev: str | None
+    is_baseline: bool
+    metadata: dict[str, Any]
+    results: dict[str, BenchmarkSample]
+
+
+class BenchmarkHistory:
+    """Stores runs per suite; the latest run marked as baseline is compared against."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        if str(path) != ":memory:":
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def record(
+        self,
+        suite: str,
+        results: dict[str, BenchmarkSample],
+        *,
+        baseline: bool = False,
+        git_rev: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> int:
+        """Store a run.
+
+        Returns:
+            The run ID
+        """
+        with self._db:
+            cursor = self._db.execute(
+                "INSERT INTO runs (suite, created_at, git_rev, is_baseline, metadata) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    suite,
+                    datetime.now(UTC).isoformat(),
+                    git_rev,
+                    int(baseline),
+                    json.dumps(metadata or {}),
+                ),
+            )
+            run_id = int(cursor.lastrowid or 0)
+            self._db.executemany(
+                "INSERT INTO results (run_id, name, throughput_rps, samples_ms) VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, name, sample.throughput_rps, json.dumps(sample.samples_ms))
+                    for name, sample in results.items()
+                ],
+            )
+        return run_id
+
+    def mark_baseline(self, run_id: int) -> None:
+        """Make an existing run the baseline of its suite."""
+        with self._db:
+            updated = self._db.execute("UPDATE runs SET is_baseline = 1 WHERE id = ?", (run_id,))
+        if updated.rowcount == 0:
+            raise ValueError(f"Run {run_id} does not exist")
+
+    def baseline(self, suite: str) -> RecordedRun | None:
+        """The most recent baseline run of ``suite``."""
+        row = self._db.execute(
+            "SELECT id FROM runs WHERE suite = ? AND is_baseline = 1 ORDER BY id DESC LIMIT 1",
+            (suite,),
+        ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def get(self, run_id: int) -> RecordedRun | None:
+        row = self._db.execute(
+            "SELECT id, suite, created_at, git_rev, is_baseline, metadata FROM runs WHERE id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        results = {
+            name: BenchmarkSample(json.loads(samples), throughput)
+            for name, throughput, samples in self._db.execute(
+                "SELECT name, throughput_rps, samples_ms FROM results WHERE run_id = ?",
+                (run_id,),
+            )
+        }
+        return RecordedRun(
+            id=row[0],
+            suite=row[1],
+            created_at=row[2],
+            git_rev=row[3],
+            is_baseline=bool(row[4]),
+            metadata=json.loads(row[5]),
+            results=results,
+        )
+
+    def runs(self, suite: str, limit: int = 20) -> list[RecordedRun]:
+        """Recent runs of ``suite``, newest first."""
+        ids = self._db.execute(
+            "SELECT id FROM runs WHERE suite = ? ORDER BY id DESC LIMIT ?", (suite, limit)
+        ).fetchall()
+        return [run for (run_id,) in ids if (run := self.get(run_id)) is not None]
@@ -0,0 +1,256 @@
+"""In-process micro-benchmarks of hot code paths.
+
+Each benchmark is an async callable timed over many iterations; nothing
+touches the network or a database.
+"""
+
+import asyncio
+import tempfile
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from starlette.requests import Request
+from tests.benchmark.e2e.stub_servers import silent_wav
+
+from src.domain.config.provider_limits import get_split_config
+from src.domain.entities.audio import AudioData, AudioFormat
+from src.domain.entities.job import Job, JobStatus, JobType
+from src.domain.entities.multi_role_tts import DialogueTurn
+from src.domain.entities.tts import TTSRequest
+from src.domain.entities.voice import VoiceProfile
+from src.domain.services.text_splitter import TextSplitter
+from src.domain.services.wer_calculator import calculate_cer, calculate_wer
+from src.infrastructure.providers.tts.base import BaseTTSProvider
+from src.infrastructure.providers.tts.multi_role.segmented_merger import (
+    MergeConfig,
+    SegmentedMergerService,
+)
+from src.infrastructure.storage.local_storage import LocalStorage
+from src.infrastructure.workers import job_worker
+from src.presentation.api.middleware.rate_limit import RateLimiter
+
+Benchmark = Callable[[], Awaitable[None]]
+
+CJK_REFERENCE = "今天的天氣很好，我們一起去公園散步吧。" * 25
+CJK_HYPOTHESIS = "今天天氣很好，我們一起去公園散步。" * 25
+EN_REFERENCE = " ".join(["the quick brown fox jumps over the lazy dog"] * 30)
+EN_HYPOTHESIS = " ".join(["the quick brown fox jumped over a lazy dog"] * 30)
+SPLIT_TEXT = "今天的天氣很好，我們一起去公園散步吧。我們可以在湖邊坐一下！" * 150
+
+# Rate limiter checks per timed iteration; a single check is below timer resolution
+RATE_LIMIT_BATCH = 100
+
+
+@dataclass
+class MicroResult:
+    """Latency samples of one micro-benchmark."""
+
+    name: str
+    samples_ms: list[float]
+    throughput_rps: float
+
+
+class _InstantTTSProvider(BaseTTSProvider):
+    """Returns a fixed WAV clip immediately."""
+
+    def __init__(self, audio: bytes) -> None:
+        super().__init__("instant")
+        self._audio = audio
+
+    async def _do_synthesize(self, request: TTSRequest) -> AudioData:
+        return AudioData(data=self._audio, format=AudioFormat.WAV, sample_rate=24000)
+
+    async def list_voices(self, language: str | None = None) -> list[VoiceProfile]:
+        return []
+
+
+class _NullSession:
+    def add(self, instance: object) -> None:
+        pass
+
+    async def flush(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+
+class _NullJobRepository:
+    async def update(self, job: Job) -> Job:
+        return job
+
+
+def _wer() -> Benchmark:
+    async def run() -> None:
+        calculate_wer(EN_REFERENCE, EN_HYPOTHESIS)
+
+    return run
+
+
+def _cer() -> Benchmark:
+    async def run() -> None:
+        calculate_cer(CJK_REFERENCE, CJK_HYPOTHESIS)
+
+    return run
+
+
+def _splitter(provider: str) -> Benchmark:
+    splitter = TextSplitter(get_split_config(provider))
+
+    async def run() -> None:
+        splitter.split(SPLIT_TEXT)
+
+    return run
+
+
+def _segment_merger() -> Benchmark:
+    merger = SegmentedMergerService(
+        _InstantTTSProvider(silent_wav(1.0, 24000)),
+        MergeConfig(output_format=AudioFormat.WAV),
+    )
+    turns = [DialogueTurn(speaker="AB"[i % 2], text=f"第{i}句話。", index=i) for i in range(6)]
+    voice_map = {"A": "voice-a", "B": "voice-b"}
+
+    async def run() -> None:
+        await merger.synthesize_and_merge(turns, voice_map)
+
+    return run
+
+
+def _rate_limiter() -> Benchmark:
+    limiter = RateLimiter()
+    requests = [
+        Request(
+            {
+                "type": "http",
+                "method": "POST",
+                "path": "/api/v1/tts/synthesize",
+                "headers": [],
+                "query_string": b"",
+                "client": (f"10.0.{i // 256}.{i % 256}", 50000),
+            }
+        )
+        for i in range(1000)
+    ]
+    position = 0
+
+    async def run() -> None:
+        nonlocal position
+        for _ in range(RATE_LIMIT_BATCH):
+            await limiter.check_rate_limit(requests[position])
+            position = (position + 1) % len(requests)
+
+    return run
+
+
+@contextmanager
+def _job_worker_benchmark() -> Iterator[Benchmark]:
+    """One single-TTS job through the worker: synthesis, storage write, probe."""
+    provider = _InstantTTSProvider(silent_wav(2.0, 24000))
+
+    class _Factory:
+        @staticmethod
+        async def create(**_kwargs: object) -> BaseTTSProvider:
+            return provider
+
+    with ExitStack() as stack:
+        storage_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="voicelab-micro-"))
+        stack.enter_context(patch.object(job_worker, "TTSProviderFactory", _Factory))
+        worker = job_worker.JobWorker(
+            session_factory=None,  # type: ignore[arg-type]
+            storage=LocalStorage(base_path=storage_dir),
+        )
+
+        async def run() -> None:
+            job = Job(
+                user_id=uuid.uuid4(),
+                job_type=JobType.SINGLE_TTS,
+                provider="instant",
+                status=JobStatus.PROCESSING,
+                input_params={
+                    "text": "你好，歡迎使用語音實驗室。",
+                    "voice_id": "voice-a",
+                    "provider": "instant",
+                    "output_format": "wav",
+                },
+            )
+            await worker._execute_single_tts_job(
+                job,
+                _NullSession(),  # type: ignore[arg-type]
+                _NullJobRepository(),  # type: ignore[arg-type]
+            )
+
+        yield run
+
+
+MICRO_BENCHMARKS = [
+    "wer_engine[wer]",
+    "wer_engine[cer]",
+    "text_splitter[bytes]",
+    "text_splitter[chars]",
+    "segment_merger",
+    "rate_limiter",
+    "job_worker",
+]
+
+
+@contextmanager
+def _benchmark(name: str) -> Iterator[Benchmark]:
+    if name == "job_worker":
+        with _job_worker_benchmark() as run:
+            yield run
+        return
+
+    factories: dict[str, Callable[[], Benchmark]] = {
+        "wer_engine[wer]": _wer,
+        "wer_engine[cer]": _cer,
+        "text_splitter[bytes]": lambda: _splitter("gemini"),
+        "text_splitter[chars]": lambda: _splitter("voai"),
+        "segment_merger": _segment_merger,
+        "rate_limiter": _rate_limiter,
+    }
+    yield factories[name]()
+
+
+async def measure(run: Benchmark, iterations: int, warmup: int) -> tuple[list[float], float]:
+    """Time ``iterations`` sequential calls after ``warmup`` untimed ones.
+
+    Returns:
+        Per-call latencies in ms and calls per second
+    """
+    for _ in range(warmup):
+        await run()
+
+    samples: list[float] = []
+    total_start = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - start) * 1000)
+    total = time.perf_counter() - total_start
+    return samples, iterations / total if total > 0 else 0.0
+
+
+async def run_micro_benchmarks(
+    iterations: int = 200,
+    warmup: int = 10,
+    selected: list[str] | None = None,
+) -> list[MicroResult]:
+    """Run the selected micro-benchmarks (all by default)."""
+    names = selected or MICRO_BENCHMARKS
+    unknown = set(names) - set(MICRO_BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown micro-benchmarks: {', '.join(sorted(unknown))}")
+
+    results = []
+    for name in names:
+        with _benchmark(name) as run:
+            samples, throughput = await measure(run, iterations, warmup)
+        results.append(MicroResult(name, [round(v, 4) for v in samples], round(throughput, 2)))
+        # Let file handles and callbacks from the previous benchmark settle
+        await asyncio.sleep(0)
+    return results
@@ -0,0 +1,63 @@
+"""Smoke test for the end-to-end benchmark harness.
+
+Runs every scenario (and a couple of WebSocket sessions) once against
+zero-latency stubs, so a broken pipeline or harness shows up in the regular
+test run. Real measurements come from ``python -m tests.benchmark.e2e`` and
+``python -m tests.benchmark.e2e.ws_load``.
+"""
+
+import json
+
+import pytest
+from tests.benchmark.e2e.harness import BenchmarkOptions, percentile, run_suite
+from tests.benchmark.e2e.stub_servers import StubConfig
+from tests.benchmark.e2e.ws_load import LoadOptions
+from tests.benchmark.e2e.ws_load import run_load as run_ws_load
+
+
+def test_percentile_interpolates() -> None:
+    assert percentile([], 50) is None
+    assert percentile([10.0], 99) == 10.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([float(i) for i in range(1, 101)], 95) == pytest.approx(95.05)
+
+
+@pytest.mark.asyncio
+async def test_suite_runs_every_scenario_against_stubs() -> None:
+    stub_config = StubConfig(latency_ms=0, jitter_ms=0, chunk_interval_ms=0, audio_seconds=0.2)
+    options = BenchmarkOptions(requests=4, concurrency=2, sessions=1, turns=2)
+
+    report = await run_suite(stub_config, options)
+
+    scenarios = {s["name"]: s for s in report["scenarios"]}
+    assert scenarios["jobs"]["skipped"]
+    for name, scenario in scenarios.items():
+        if scenario["skipped"]:
+            continue
+        assert scenario["errors"] == 0, (name, scenario["error_samples"])
+        assert scenario["p95_ms"] is not None
+        assert scenario["throughput_rps"] > 0
+
+    assert scenarios["tts_long_text"]["extra"]["segments"] > 1
+    assert scenarios["cascade_session"]["requests"] == 2
+    assert report["stub_requests"]["voai_tts"] > 0
+    json.dumps(report)
+
+
+@pytest.mark.asyncio
+async def test_ws_load_generator_runs_sessions_against_stubs() -> None:
+    stub_config = StubConfig(latency_ms=0, jitter_ms=0, chunk_interval_ms=0, audio_seconds=0.2)
+    options = LoadOptions(sessions=[2], turns=2, interrupt_every=2, ramp_up_s=0)
+
+    report = await run_ws_load(stub_config, options)
+
+    [level] = report["levels"]
+    assert level["errors"] == {}
+    assert level["sessions_completed"] == 2
+    assert level["turns_completed"] == 4
+    assert level["turn_ms"]["count"] == 2
+    assert level["frames"]["sent"] > 0
+    assert level["frames"]["audio_received"] > 0
+    assert level["server_latency_ms"]["total_ms"]["count"] > 0
+    assert level["loop_lag_ms"]["count"] > 0
+    json.dumps(report)
@@ -0,0 +1,124 @@
+"""Tests for the benchmark regression gate."""
+
+import random
+
+import pytest
+from tests.benchmark.regression.cli import e2e_samples
+from tests.benchmark.regression.gate import compare_runs, format_report, mann_whitney_greater
+from tests.benchmark.regression.history import BenchmarkHistory, BenchmarkSample
+from tests.benchmark.regression.micro import run_micro_benchmarks
+
+
+def _samples(center: float, n: int = 200, seed: int = 0) -> list[float]:
+    rng = random.Random(seed)
+    return [rng.gauss(center, center * 0.05) for _ in range(n)]
+
+
+class TestMannWhitney:
+    def test_detects_shift(self) -> None:
+        assert mann_whitney_greater(_samples(12.0, seed=1), _samples(10.0, seed=2)) < 1e-6
+
+    def test_same_distribution_is_not_significant(self) -> None:
+        assert mann_whitney_greater(_samples(10.0, seed=1), _samples(10.0, seed=2)) > 0.01
+
+    def test_one_sided(self) -> None:
+        assert mann_whitney_greater(_samples(8.0, seed=1), _samples(10.0, seed=2)) > 0.99
+
+    def test_degenerate_inputs(self) -> None:
+        assert mann_whitney_greater([], [1.0]) == 1.0
+        assert mann_whitney_greater([1.0, 1.0], [1.0, 1.0]) == 1.0
+
+
+class TestCompareRuns:
+    def test_flags_p95_regression(self) -> None:
+        baseline = {"tts": BenchmarkSample(_samples(10.0, seed=1), 100.0)}
+        current = {"tts": BenchmarkSample(_samples(13.0, seed=2), 98.0)}
+
+        [comparison] = compare_runs(baseline, current)
+
+        assert comparison.regressed
+        assert comparison.reasons[0].startswith("p95 +")
+        assert "1 regression(s):" in format_report([comparison])
+
+    def test_flags_throughput_regression(self) -> None:
+        baseline = {"tts": BenchmarkSample(_samples(10.0, seed=1), 100.0)}
+        current = {"tts": BenchmarkSample(_samples(10.5, seed=2), 80.0)}
+
+        [comparison] = compare_runs(baseline, current)
+
+        assert comparison.regressed
+        assert comparison.reasons == (f"throughput -20.0% (p={comparison.p_value:.2g})",)
+
+    def test_noise_is_not_a_regression(self) -> None:
+        baseline = {"tts": BenchmarkSample(_samples(10.0, seed=1), 100.0)}
+        # A few slow outliers move p95 and throughput but not the distribution
+        noisy = _samples(10.0, seed=2)
+        noisy[:12] = [30.0] * 12
+        current = {"tts": BenchmarkSample(noisy, 85.0)}
+
+        [comparison] = compare_runs(baseline, current)
+
+        assert comparison.status == "ok"
+
+    def test_improvement_and_new_benchmark(self) -> None:
+        baseline = {"tts": BenchmarkSample(_samples(10.0, seed=1), 100.0)}
+        current = {
+            "tts": BenchmarkSample(_samples(7.0, seed=2), 140.0),
+            "stt": BenchmarkSample(_samples(5.0, seed=3), 50.0),
+        }
+
+        statuses = {c.name: c.status for c in compare_runs(baseline, current)}
+
+        assert statuses == {"tts": "improved", "stt": "new"}
+
+
+class TestBenchmarkHistory:
+    def test_round_trip_and_baseline(self, tmp_path) -> None:
+        history = BenchmarkHistory(tmp_path / "history.sqlite")
+        results = {"rate_limiter": BenchmarkSample([1.0, 2.0], 500.0)}
+
+        assert history.baseline("micro") is None
+        first = history.record("micro", results, baseline=True, git_rev="abc123")
+        second = history.record("micro", {"rate_limiter": BenchmarkSample([3.0], 300.0)})
+        history.record("e2e", results, baseline=True)
+
+        baseline = history.baseline("micro")
+        assert baseline is not None
+        assert baseline.id == first
+        assert baseline.git_rev == "abc123"
+        assert baseline.results == results
+
+        history.mark_baseline(second)
+        assert history.baseline("micro").id == second  # type: ignore[union-attr]
+        assert [run.id for run in history.runs("micro")] == [second, first]
+
+        with pytest.raises(ValueError):
+            history.mark_baseline(999)
+        history.close()
+
+
+def test_e2e_samples_skip_skipped_scenarios() -> None:
+    report = {
+        "scenarios": [
+            {"name": "tts", "skipped": None, "samples_ms": [1.0], "throughput_rps": 2.0},
+            {"name": "jobs", "skipped": "no database", "samples_ms": [], "throughput_rps": 0},
+        ]
+    }
+
+    assert e2e_samples(report) == {"tts": BenchmarkSample([1.0], 2.0)}
+
+
+@pytest.mark.asyncio
+async def test_micro_benchmarks_run() -> None:
+    results = await run_micro_benchmarks(iterations=2, warmup=0)
+
+    assert [r.name for r in results] == [
+        "wer_engine[wer]",
+        "wer_engine[cer]",
+        "text_splitter[bytes]",
+        "text_splitter[chars]",
+        "segment_merger",
+        "rate_limiter",
+        "job_worker",
+    ]
+    assert all(len(r.samples_ms) == 2 and r.throughput_rps > 0 for r in results)
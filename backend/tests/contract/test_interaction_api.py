@@ -7,11 +7,15 @@ Tests the REST API request/response contracts.
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
 
+from src.config import get_settings
 from src.domain.entities import (
     ConversationTurn,
     InteractionMode,
@@ -20,6 +24,15 @@ from src.domain.entities import (
 )
 from src.infrastructure.persistence.database import get_db_session
 from src.main import app
+from src.presentation.api.middleware.auth import CurrentUser, get_current_user
+
+ANALYST = CurrentUser(
+    id=str(uuid4()),
+    email="analyst@example.com",
+    name="Analyst",
+    picture_url=None,
+    google_id="analyst-google-id",
+)
 
 
 @pytest.fixture
@@ -237,6 +250,123 @@ class TestLatencyStatsEndpoint:
                 assert value is None or isinstance(value, (int, float))
 
 
+class TestLatencyAnalyticsEndpoint:
+    """Contract tests for GET /api/v1/interaction/analytics/latency endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def setup_dependencies(self) -> MagicMock:
+        """Run the real repository against a DB session that records the query."""
+        row = MagicMock()
+        row._mapping = {
+            "mode": InteractionMode.CASCADE,
+            "provider": None,
+            "stt_provider": "azure",
+            "llm_provider": "openai",
+            "tts_provider": "azure",
+            "turns": 12,
+            "avg_total_ms": Decimal("812.5"),
+            "min_total_ms": 400,
+            "max_total_ms": 1900,
+            "p50_total_ms": 760.0,
+            "p95_total_ms": 1650.0,
+            "p99_total_ms": 1850.0,
+            "avg_stt_ms": Decimal("210.0"),
+            "avg_llm_ttft_ms": Decimal("350.0"),
+            "avg_tts_ttfb_ms": Decimal("180.0"),
+            "avg_realtime_ms": None,
+        }
+        mock_db = AsyncMock()
+        mock_db.execute.return_value.all = MagicMock(return_value=[row])
+        app.dependency_overrides[get_db_session] = lambda: mock_db
+        app.dependency_overrides[get_current_user] = lambda: ANALYST
+        yield mock_db
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_groups_by_provider_triple(self, setup_dependencies: AsyncMock) -> None:
+        """Aggregates are computed in SQL and returned per provider group."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/v1/interaction/analytics/latency", params={"group_by": "provider"}
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["group_by"] == "provider"
+        group = data["groups"][0]
+        assert group["key"] == {
+            "mode": "cascade",
+            "provider": None,
+            "stt_provider": "azure",
+            "llm_provider": "openai",
+            "tts_provider": "azure",
+        }
+        assert group["turns"] == 12
+        assert group["avg_total_ms"] == 812.5
+        assert group["p95_total_ms"] == 1650.0
+
+        stmt = setup_dependencies.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "percentile_cont" in sql
+        assert "WITHIN GROUP (ORDER BY latency_metrics.total_latency_ms)" in sql
+        assert "GROUP BY interaction_sessions.mode" in sql
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_current_user(
+        self, setup_dependencies: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without the admin token only the caller's own sessions are aggregated."""
+        monkeypatch.setattr(get_settings(), "profiling_token", "secret")
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/interaction/analytics/latency")
+            other_user = await client.get(
+                "/api/v1/interaction/analytics/latency", params={"user_id": str(uuid4())}
+            )
+            everyone = await client.get(
+                "/api/v1/interaction/analytics/latency", params={"all_users": "true"}
+            )
+
+        assert response.status_code == 200
+        stmt = setup_dependencies.execute.await_args.args[0]
+        assert ANALYST.id in str(
+            stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        )
+        assert other_user.status_code == 403
+        assert everyone.status_code == 403
+        assert setup_dependencies.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_admin_token_allows_all_users(
+        self, setup_dependencies: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The profiling token unlocks the unscoped view."""
+        monkeypatch.setattr(get_settings(), "profiling_token", "secret")
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/v1/interaction/analytics/latency",
+                params={"all_users": "true"},
+                headers={"X-Profile-Token": "secret"},
+            )
+
+        assert response.status_code == 200
+        stmt = setup_dependencies.execute.await_args.args[0]
+        assert "interaction_sessions.user_id" not in str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_grouping(self) -> None:
+        """Only the supported groupings are accepted."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/v1/interaction/analytics/latency", params={"group_by": "weekday"}
+            )
+
+        assert response.status_code == 422
+
+
 class TestDeleteSessionEndpoint:
     """Contract tests for DELETE /api/v1/interaction/sessions/{id} endpoint."""
 
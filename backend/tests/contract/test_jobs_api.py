@@ -12,6 +12,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from src.domain.entities.job import Job, JobStatus, JobType
+from src.infrastructure.storage.local_storage import LocalStorage
 from src.main import app
 from src.presentation.api.middleware.auth import CurrentUser, get_current_user
 
@@ -38,6 +39,13 @@ def mock_current_user(mock_user_id: uuid.UUID) -> CurrentUser:
     )
 
 
+async def _patched_object(tmp_path, content: bytes, filename: str = "test.mp3"):
+    """Store content under tmp_path and build the get_audio_file_object return value."""
+    storage = LocalStorage(base_path=str(tmp_path))
+    (tmp_path / filename).write_bytes(content)
+    return storage, await storage.stat(filename), "audio/mpeg", filename
+
+
 @pytest.fixture
 def sample_create_job_request() -> dict:
     """Sample request payload for creating a job."""
@@ -600,6 +608,7 @@ class TestDownloadJobAudioEndpoint:
         self,
         mock_user_id: uuid.UUID,
         mock_current_user: CurrentUser,
+        tmp_path,
     ):
         """T047: Test downloading completed job audio returns 200 with audio stream."""
         # Create a completed job with audio file
@@ -641,9 +650,9 @@ class TestDownloadJobAudioEndpoint:
                     return_value=mock_job_repo,
                 ),
                 patch(
-                    "src.presentation.api.routes.jobs.get_audio_file_content",
+                    "src.presentation.api.routes.jobs.get_audio_file_object",
                     new_callable=AsyncMock,
-                    return_value=(mock_audio_content, "audio/mpeg", "test.mp3"),
+                    return_value=await _patched_object(tmp_path, mock_audio_content),
                 ),
             ):
                 transport = ASGITransport(app=app)
@@ -665,6 +674,7 @@ class TestDownloadJobAudioEndpoint:
         self,
         mock_user_id: uuid.UUID,
         mock_current_user: CurrentUser,
+        tmp_path,
     ):
         """T047: Test download response includes proper Content-Disposition header."""
         audio_file_id = uuid.uuid4()
@@ -704,9 +714,11 @@ class TestDownloadJobAudioEndpoint:
                     return_value=mock_job_repo,
                 ),
                 patch(
-                    "src.presentation.api.routes.jobs.get_audio_file_content",
+                    "src.presentation.api.routes.jobs.get_audio_file_object",
                     new_callable=AsyncMock,
-                    return_value=(mock_audio_content, "audio/mpeg", "synthesis_result.mp3"),
+                    return_value=await _patched_object(
+                        tmp_path, mock_audio_content, "synthesis_result.mp3"
+                    ),
                 ),
             ):
                 transport = ASGITransport(app=app)
@@ -720,6 +732,74 @@ class TestDownloadJobAudioEndpoint:
                 content_disposition = response.headers.get("content-disposition", "")
                 assert "attachment" in content_disposition
                 assert "filename=" in content_disposition
+                assert response.headers["accept-ranges"] == "bytes"
+                assert "etag" in response.headers
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_download_range_and_conditional_requests(
+        self,
+        mock_user_id: uuid.UUID,
+        mock_current_user: CurrentUser,
+        tmp_path,
+    ):
+        """Range requests return 206 slices; matching If-None-Match returns 304."""
+        completed_job = Job(
+            id=uuid.uuid4(),
+            user_id=mock_user_id,
+            job_type=JobType.MULTI_ROLE_TTS,
+            status=JobStatus.COMPLETED,
+            provider="azure",
+            input_params={},
+            created_at=datetime.utcnow(),
+            audio_file_id=uuid.uuid4(),
+        )
+
+        mock_job_repo = AsyncMock()
+        mock_job_repo.get_by_id.return_value = completed_job
+        mock_audio_content = bytes(range(256)) * 4
+
+        async def override_get_current_user():
+            return mock_current_user
+
+        async def override_get_db_session():
+            return MagicMock()
+
+        from src.presentation.api.routes import jobs as jobs_module
+
+        app.dependency_overrides[get_current_user] = override_get_current_user
+        app.dependency_overrides[jobs_module.get_db_session] = override_get_db_session
+
+        try:
+            with (
+                patch(
+                    "src.presentation.api.routes.jobs.JobRepositoryImpl",
+                    return_value=mock_job_repo,
+                ),
+                patch(
+                    "src.presentation.api.routes.jobs.get_audio_file_object",
+                    new_callable=AsyncMock,
+                    return_value=await _patched_object(tmp_path, mock_audio_content),
+                ),
+            ):
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                    url = f"/api/v1/jobs/{completed_job.id}/download"
+                    partial = await ac.get(url, headers={"Range": "bytes=100-199"})
+                    suffix = await ac.get(url, headers={"Range": "bytes=-24"})
+                    unsatisfiable = await ac.get(url, headers={"Range": "bytes=5000-"})
+                    cached = await ac.get(url, headers={"If-None-Match": partial.headers["etag"]})
+
+                assert partial.status_code == 206
+                assert partial.content == mock_audio_content[100:200]
+                assert partial.headers["content-range"] == "bytes 100-199/1024"
+                assert suffix.status_code == 206
+                assert suffix.content == mock_audio_content[-24:]
+                assert unsatisfiable.status_code == 416
+                assert unsatisfiable.headers["content-range"] == "bytes */1024"
+                assert cached.status_code == 304
+                assert cached.content == b""
         finally:
             app.dependency_overrides.clear()
 
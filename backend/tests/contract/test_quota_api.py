@@ -4,6 +4,7 @@ Tests the GET /api/v1/quota endpoint, verifying response schema,
 tracked usage integration, and provider credential detection.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from src.application.services.quota_cache import get_quota_cache
 from src.domain.services.usage_tracker import ProviderUsageTracker
 from src.infrastructure.persistence.database import get_db_session
 from src.main import app
@@ -60,7 +62,9 @@ class TestQuotaDashboardEndpoint:
 
         app.dependency_overrides[get_current_user] = get_mock_user
         app.dependency_overrides[get_db_session] = get_mock_session
+        get_quota_cache().clear()
         yield mock_session
+        get_quota_cache().clear()
         app.dependency_overrides.clear()
 
     @pytest.mark.asyncio()
@@ -285,6 +289,36 @@ class TestQuotaDashboardEndpoint:
         assert elevenlabs["remaining_characters"] == 5000
         assert elevenlabs["tier"] == "starter"
 
+    @pytest.mark.asyncio()
+    async def test_slow_quota_lookup_returns_partial(self) -> None:
+        """A lookup that misses the latency budget is omitted, not waited for."""
+        elevenlabs_cred = _make_credential("elevenlabs", is_valid=True)
+
+        async def slow_fetch(*_args):
+            await asyncio.sleep(1)
+            return {"character_count": 1, "character_limit": 2}
+
+        with (
+            patch(
+                "src.presentation.api.routes.quota.SQLAlchemyProviderCredentialRepository"
+            ) as mock_repo_cls,
+            patch("src.presentation.api.routes.quota._fetch_provider_quota", slow_fetch),
+            patch("src.presentation.api.routes.quota.QUOTA_FETCH_BUDGET_S", 0.05),
+        ):
+            mock_repo = AsyncMock()
+            mock_repo.list_by_user.return_value = [elevenlabs_cred]
+            mock_repo_cls.return_value = mock_repo
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                response = await ac.get("/api/v1/quota")
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["partial"] is True
+        elevenlabs = next(p for p in data["providers"] if p["provider"] == "elevenlabs")
+        assert elevenlabs["character_count"] is None
+
     @pytest.mark.asyncio()
     async def test_help_url_and_suggestions_present(self) -> None:
         """Providers should include help URLs and suggestions."""
@@ -7,17 +7,34 @@ Tests endpoints for viewing and managing transcription history.
 """
 
 import uuid
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from src.application.services.total_count_cache import get_total_count_cache
+from src.domain.pagination import PageCursor
 from src.infrastructure.persistence.database import get_db_session
 from src.main import app
 from src.presentation.api.dependencies import get_transcription_repository
 from src.presentation.api.middleware.auth import CurrentUser, get_current_user
 
 
+def _summary() -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "provider": "azure",
+        "language": "en-US",
+        "transcript_preview": "test",
+        "duration_ms": None,
+        "confidence": 0.95,
+        "has_ground_truth": False,
+        "error_rate": None,
+        "created_at": "2024-01-01T00:00:00+00:00",
+    }
+
+
 @pytest.fixture
 def mock_current_user() -> CurrentUser:
     """Create a mock current user."""
@@ -285,6 +302,95 @@ class TestHistoryListEndpoint:
         finally:
             app.dependency_overrides.pop(get_transcription_repository, None)
 
+    async def test_history_offset_page_returns_next_cursor(self) -> None:
+        """An offset page links to the rest of the list with a cursor."""
+        last_id = uuid.uuid4()
+        mock_repo = AsyncMock()
+        mock_repo.list_transcriptions.return_value = (
+            [{**_summary(), "id": str(last_id), "created_at": "2024-01-02T03:04:05+00:00"}],
+            3,
+        )
+        app.dependency_overrides[get_transcription_repository] = lambda: mock_repo
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/v1/stt/history", params={"page_size": 1})
+
+            cursor = PageCursor.decode(response.json()["next_cursor"])
+            assert cursor.id == last_id
+            assert cursor.timestamp == datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        finally:
+            app.dependency_overrides.pop(get_transcription_repository, None)
+
+    async def test_history_cursor_page(self) -> None:
+        """A cursor page uses keyset pagination and skips the count by default."""
+        cursor = PageCursor(timestamp=datetime(2024, 1, 2, tzinfo=UTC), id=uuid.uuid4())
+        following = PageCursor(timestamp=datetime(2024, 1, 1, tzinfo=UTC), id=uuid.uuid4())
+        mock_repo = AsyncMock()
+        mock_repo.list_transcriptions_after.return_value = ([_summary()], following)
+        app.dependency_overrides[get_transcription_repository] = lambda: mock_repo
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    "/api/v1/stt/history",
+                    params={"cursor": cursor.encode(), "page_size": 1, "provider": "azure"},
+                )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            assert data["next_cursor"] == following.encode()
+
+            call_kwargs = mock_repo.list_transcriptions_after.call_args[1]
+            assert call_kwargs["cursor"] == cursor
+            assert call_kwargs["limit"] == 1
+            assert call_kwargs["provider"] == "azure"
+            mock_repo.list_transcriptions.assert_not_called()
+            mock_repo.count_transcriptions.assert_not_called()
+        finally:
+            app.dependency_overrides.pop(get_transcription_repository, None)
+
+    async def test_history_cursor_page_with_cached_total(self) -> None:
+        """include_total counts once and serves later pages from the cache."""
+        get_total_count_cache().clear()
+        cursor = PageCursor(timestamp=datetime(2024, 1, 2, tzinfo=UTC), id=uuid.uuid4())
+        mock_repo = AsyncMock()
+        mock_repo.list_transcriptions_after.return_value = ([], None)
+        mock_repo.count_transcriptions.return_value = 42
+        app.dependency_overrides[get_transcription_repository] = lambda: mock_repo
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                params = {"cursor": cursor.encode(), "include_total": True}
+                first = await client.get("/api/v1/stt/history", params=params)
+                second = await client.get("/api/v1/stt/history", params=params)
+
+            assert first.json()["total"] == 42
+            assert second.json()["total"] == 42
+            assert mock_repo.count_transcriptions.await_count == 1
+        finally:
+            get_total_count_cache().clear()
+            app.dependency_overrides.pop(get_transcription_repository, None)
+
+    async def test_history_invalid_cursor(self) -> None:
+        """A malformed cursor is rejected with 400."""
+        app.dependency_overrides[get_transcription_repository] = lambda: AsyncMock()
+
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    "/api/v1/stt/history", params={"cursor": "not-a-cursor"}
+                )
+
+            assert response.status_code == 400
+        finally:
+            app.dependency_overrides.pop(get_transcription_repository, None)
+
 
 @pytest.mark.asyncio
 class TestHistoryDetailEndpoint:
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from src.application.services.voice_catalog import get_voice_catalog
 from src.application.use_cases.list_voices import VoiceProfile
 from src.main import app
 from src.presentation.api.dependencies import (
@@ -89,14 +90,18 @@ def mock_repos():
     mock_cache_repo = AsyncMock()
     mock_customization_repo = AsyncMock()
 
-    # Default: return empty customization map
+    # Default: no customizations
     mock_customization_repo.get_customization_map = AsyncMock(return_value={})
+    mock_customization_repo.list_all = AsyncMock(return_value=[])
 
     app.dependency_overrides[get_voice_cache_repository] = lambda: mock_cache_repo
     app.dependency_overrides[get_voice_customization_repository] = lambda: mock_customization_repo
+    # The catalog is process-wide; reload it from each test's mock repo
+    get_voice_catalog().invalidate()
 
     yield mock_cache_repo, mock_customization_repo
 
+    get_voice_catalog().invalidate()
     app.dependency_overrides.pop(get_voice_cache_repository, None)
     app.dependency_overrides.pop(get_voice_customization_repository, None)
 
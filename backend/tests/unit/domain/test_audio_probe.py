@@ -0,0 +1,183 @@
+"""Unit tests for the header-only audio probe."""
+
+import io
+import random
+import struct
+import wave
+
+import pytest
+
+from src.domain.entities.audio import AudioData, AudioFormat
+from src.domain.services.audio_probe import probe_audio, probe_duration_ms
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, joint stereo, no padding -> 417-byte frames
+_MP3_HEADER = b"\xff\xfb\x90\x44"
+_MP3_FRAME_LENGTH = 417
+
+
+def _make_wav(duration_ms: int, sample_rate: int = 24000, channels: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * channels * (sample_rate * duration_ms // 1000))
+    return buffer.getvalue()
+
+
+def _make_mp3_frame(payload: bytes = b"") -> bytes:
+    body = payload.ljust(_MP3_FRAME_LENGTH - 4, b"\x00")
+    return _MP3_HEADER + body
+
+
+def _make_ogg_page(granule: int, payload: bytes, header_type: int = 0) -> bytes:
+    return (
+        b"OggS"
+        + bytes([0, header_type])
+        + struct.pack("<qIIIB", granule, 1, 0, 0, 1)
+        + bytes([len(payload)])
+        + payload
+    )
+
+
+class TestProbeWav:
+    """WAV duration comes from the data chunk size and byte rate."""
+
+    def test_mono_duration_and_rate(self) -> None:
+        result = probe_audio(_make_wav(1500, sample_rate=16000))
+
+        assert result is not None
+        assert result.format == AudioFormat.WAV
+        assert result.duration_ms == 1500
+        assert result.sample_rate == 16000
+        assert result.channels == 1
+
+    def test_stereo(self) -> None:
+        result = probe_audio(_make_wav(250, sample_rate=44100, channels=2))
+
+        assert result is not None
+        assert result.duration_ms == 250
+        assert result.channels == 2
+
+    def test_streaming_header_uses_available_bytes(self) -> None:
+        data = bytearray(_make_wav(1000))
+        # Streaming writers leave the data chunk size unset
+        data[40:44] = b"\xff\xff\xff\xff"
+
+        result = probe_audio(bytes(data))
+
+        assert result is not None
+        assert result.duration_ms == 1000
+
+
+class TestProbeMp3:
+    """MP3 duration comes from VBR headers or frame header hopping."""
+
+    def test_cbr_frame_scan(self) -> None:
+        data = _make_mp3_frame() * 100
+
+        result = probe_audio(data)
+
+        assert result is not None
+        assert result.format == AudioFormat.MP3
+        assert result.sample_rate == 44100
+        assert result.channels == 2
+        assert result.duration_ms == int(100 * 1152 * 1000 / 44100)
+
+    def test_skips_id3v2_tag(self) -> None:
+        tag = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10
+        data = tag + _make_mp3_frame() * 10
+
+        result = probe_audio(data)
+
+        assert result is not None
+        assert result.duration_ms == int(10 * 1152 * 1000 / 44100)
+
+    def test_xing_frame_count(self) -> None:
+        # Xing header sits after 32 bytes of side info for MPEG-1 stereo
+        xing = b"\x00" * 32 + b"Xing" + struct.pack(">II", 0x1, 5000)
+        data = _make_mp3_frame(xing) + _make_mp3_frame() * 3
+
+        result = probe_audio(data)
+
+        assert result is not None
+        assert result.duration_ms == int(5000 * 1152 * 1000 / 44100)
+
+    def test_unknown_container_with_stray_sync_word(self) -> None:
+        # WebM (EBML) data that happens to contain an MPEG sync word near its end
+        data = b"\x1a\x45\xdf\xa3" + bytes(range(256)) * 4 + _MP3_HEADER + b"\x00" * 100
+
+        assert probe_audio(data) is None
+
+    def test_hint_needs_consecutive_frames(self) -> None:
+        isolated = b"\x00" * 64 + _make_mp3_frame() + b"\x00" * 512
+
+        assert probe_audio(isolated, AudioFormat.MP3) is None
+        assert probe_audio(b"\x00" * 64 + _make_mp3_frame() * 3, AudioFormat.MP3) is not None
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_data_is_not_mp3(self, seed: int) -> None:
+        data = random.Random(seed).randbytes(16 * 1024)
+
+        assert probe_audio(data) is None
+
+
+class TestProbeOgg:
+    """Ogg duration comes from the last page granule position."""
+
+    def test_vorbis(self) -> None:
+        ident = b"\x01vorbis" + struct.pack("<IBI", 0, 2, 22050) + b"\x00" * 13
+        data = _make_ogg_page(0, ident, header_type=2) + _make_ogg_page(44100, b"\x00" * 8)
+
+        result = probe_audio(data)
+
+        assert result is not None
+        assert result.format == AudioFormat.OGG
+        assert result.sample_rate == 22050
+        assert result.channels == 2
+        assert result.duration_ms == 2000
+
+    def test_opus_subtracts_pre_skip(self) -> None:
+        head = b"OpusHead" + struct.pack("<BBHIhB", 1, 1, 312, 16000, 0, 0)
+        data = _make_ogg_page(0, head, header_type=2) + _make_ogg_page(48312, b"\x00" * 8)
+
+        result = probe_audio(data)
+
+        assert result is not None
+        assert result.format == AudioFormat.OPUS
+        assert result.duration_ms == 1000
+        assert result.sample_rate == 16000
+
+
+class TestProbeFlac:
+    """FLAC duration comes from STREAMINFO total samples."""
+
+    def test_streaminfo(self) -> None:
+        packed = (48000 << 44) | ((2 - 1) << 41) | ((16 - 1) << 36) | 96000
+        streaminfo = b"\x00" * 10 + struct.pack(">Q", packed) + b"\x00" * 16
+        data = b"fLaC" + b"\x80" + len(streaminfo).to_bytes(3, "big") + streaminfo
+
+        result = probe_audio(data)
+
+        assert result is not None
+        assert result.format == AudioFormat.FLAC
+        assert result.duration_ms == 2000
+        assert result.channels == 2
+
+
+class TestProbeDurationMs:
+    """probe_duration_ms handles raw PCM and unreadable data."""
+
+    def test_pcm_uses_audio_data_rate(self) -> None:
+        audio = AudioData(data=b"\x00" * 48000, format=AudioFormat.PCM, sample_rate=24000)
+
+        assert probe_duration_ms(audio) == 1000
+
+    def test_encoded_format(self) -> None:
+        audio = AudioData(data=_make_wav(750), format=AudioFormat.WAV)
+
+        assert probe_duration_ms(audio) == 750
+
+    @pytest.mark.parametrize("data", [b"", b"fake audio data", b"RIFF\x00\x00\x00\x00WAVEjunk"])
+    def test_unreadable_returns_none(self, data: bytes) -> None:
+        assert probe_duration_ms(AudioData(data=data, format=AudioFormat.MP3)) is None
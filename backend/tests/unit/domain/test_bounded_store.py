@@ -0,0 +1,110 @@
+"""Unit tests for the bounded in-memory store."""
+
+from uuid import uuid4
+
+from src.application.services.metrics import collect_store_metrics, get_metrics_registry
+from src.domain.services.interaction.latency_tracker import LatencyTracker
+from src.domain.utils.bounded_store import (
+    SIZE_SAMPLE_INTERVAL_S,
+    BoundedStore,
+    store_evictions,
+    store_stats,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _store(name: str = "test", ttl_s: float = 10, max_size: int = 3):
+    clock = FakeClock()
+    return BoundedStore[str, int](name, ttl_s=ttl_s, max_size=max_size, clock=clock), clock
+
+
+class TestBoundedStore:
+    def test_untouched_entries_expire(self) -> None:
+        store, clock = _store("test_expiry")
+        store["a"] = 1
+        store["b"] = 2
+
+        clock.now += 6
+        assert store.get("a") == 1  # touching keeps it alive
+        clock.now += 6
+
+        assert "b" not in store
+        assert store["a"] == 1
+        assert len(store) == 1
+        assert store_evictions()["test_expiry", "expired"] == 1
+
+    def test_least_recently_used_entry_is_evicted_past_max_size(self) -> None:
+        store, _ = _store("test_capacity")
+        for i, key in enumerate("abc"):
+            store[key] = i
+        store.get("a")
+
+        store["d"] = 3
+
+        assert [key for key, _ in store.items()] == ["c", "a", "d"]
+        assert store_evictions()["test_capacity", "capacity"] == 1
+
+    def test_get_or_create(self) -> None:
+        store, _ = _store()
+
+        assert store.get_or_create("a", lambda: 1) == 1
+        assert store.get_or_create("a", lambda: 2) == 1
+        assert store.pop("a") == 1
+        assert store.get("a", 5) == 5
+
+    def test_stats_are_summed_by_name(self) -> None:
+        first, _ = _store("test_stats")
+        second, _ = _store("test_stats")
+        first["a"] = 1
+        second["b"] = 2
+        second["c"] = 3
+
+        [stats] = [s for s in store_stats() if s.name == "test_stats"]
+
+        assert (stats.stores, stats.entries) == (2, 3)
+        assert stats.memory_bytes > 0
+
+    def test_memory_estimate_is_sampled_and_reused(self) -> None:
+        store, clock = _store("test_memory", ttl_s=3600, max_size=1000)
+        for i in range(500):
+            store[str(i)] = "x"
+        estimate = store.memory_bytes()
+
+        store["big"] = "x" * 100_000
+        cached = store.memory_bytes()
+        clock.now += SIZE_SAMPLE_INTERVAL_S
+
+        assert estimate < cached < estimate + 1000
+        assert store.memory_bytes() > estimate + 100_000
+
+
+def test_latency_tracker_drops_uncleared_turns() -> None:
+    tracker = LatencyTracker()
+    turns = [uuid4() for _ in range(100)]
+
+    for turn_id in turns:
+        tracker.start_turn(turn_id)
+        tracker.mark_speech_ended(turn_id)
+
+    assert len(tracker._measurements) == tracker._measurements.max_size
+    assert tracker.get_metrics_cascade(turns[0]) is None
+    assert tracker.get_metrics_cascade(turns[-1]) is not None
+
+
+def test_store_gauges_are_exported() -> None:
+    store, _ = _store("test_gauges")
+    store["a"] = 1
+    registry = get_metrics_registry()
+    registry.register_collector("stores", collect_store_metrics)
+
+    rendered = registry.render()
+
+    assert 'voicelab_store_entries{store="test_gauges"} 1' in rendered
+    assert 'voicelab_store_memory_bytes{store="test_gauges"}' in rendered
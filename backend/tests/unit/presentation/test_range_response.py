@@ -0,0 +1,70 @@
+"""Unit tests for Range header parsing and local file streaming."""
+
+import pytest
+
+from src.infrastructure.storage.file_streaming import iter_local_file, stat_local_file
+from src.presentation.api.range_response import parse_range_header
+
+
+class TestParseRangeHeader:
+    """parse_range_header returns inclusive offsets or signals 416."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=900-5000", (900, 999)),
+        ],
+    )
+    def test_satisfiable(self, header: str, expected: tuple[int, int]) -> None:
+        assert parse_range_header(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=0-1,5-9", "items=0-9", "bytes=-", "garbage"])
+    def test_unsupported_serves_full_body(self, header: str) -> None:
+        assert parse_range_header(header, 1000) is None
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=50-10", "bytes=-0"])
+    def test_unsatisfiable(self, header: str) -> None:
+        with pytest.raises(ValueError):
+            parse_range_header(header, 1000)
+
+
+class TestLocalFileStreaming:
+    """Local files are streamed in bounded chunks."""
+
+    @pytest.mark.asyncio
+    async def test_streams_requested_range_in_chunks(self, tmp_path) -> None:
+        path = tmp_path / "track.mp3"
+        content = bytes(range(256)) * 10
+        path.write_bytes(content)
+
+        chunks = [chunk async for chunk in iter_local_file(path, 10, 1009, chunk_size=300)]
+
+        assert b"".join(chunks) == content[10:1010]
+        assert max(len(chunk) for chunk in chunks) <= 300
+
+    @pytest.mark.asyncio
+    async def test_empty_file_yields_nothing(self, tmp_path) -> None:
+        path = tmp_path / "empty.wav"
+        path.write_bytes(b"")
+
+        assert [chunk async for chunk in iter_local_file(path)] == []
+
+    def test_stat_reports_size_type_and_stable_etag(self, tmp_path) -> None:
+        path = tmp_path / "track.wav"
+        path.write_bytes(b"\x00" * 64)
+
+        first = stat_local_file(path, "track.wav")
+        second = stat_local_file(path, "track.wav")
+
+        assert first.size_bytes == 64
+        assert first.content_type in ("audio/wav", "audio/x-wav")
+        assert first.etag == second.etag
+        assert first.etag.startswith('"')
+
+    def test_stat_missing_file_raises(self, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            stat_local_file(tmp_path / "missing.mp3", "missing.mp3")
@@ -0,0 +1,47 @@
+"""Unit tests for binary WebSocket audio framing."""
+
+import pytest
+
+from src.infrastructure.websocket.audio_frames import (
+    HEADER_SIZE,
+    FrameFlag,
+    decode_audio_frame,
+    encode_audio_frame,
+)
+
+
+class TestAudioFrames:
+    """Audio frames carry raw PCM16 behind a fixed 8-byte header."""
+
+    def test_round_trip(self) -> None:
+        pcm = b"\x01\x00\xff\x7f" * 100
+
+        frame = encode_audio_frame(pcm, 24000, is_first=True)
+        decoded = decode_audio_frame(frame)
+
+        assert len(frame) == HEADER_SIZE + len(pcm)
+        assert decoded.sample_rate == 24000
+        assert decoded.is_first
+        assert not decoded.is_final
+        assert decoded.payload == pcm
+
+    def test_payload_is_a_view_not_a_copy(self) -> None:
+        frame = bytearray(encode_audio_frame(b"\x00\x00", 16000))
+
+        decoded = decode_audio_frame(frame)
+        frame[HEADER_SIZE] = 0x7F
+
+        assert decoded.payload[0] == 0x7F
+
+    def test_accepts_memoryview_payload(self) -> None:
+        pcm = memoryview(b"\x00\x01\x02\x03")[2:]
+
+        decoded = decode_audio_frame(encode_audio_frame(pcm, 16000, is_final=True))
+
+        assert decoded.payload == b"\x02\x03"
+        assert decoded.flags == FrameFlag.FINAL
+
+    @pytest.mark.parametrize("data", [b"", b"\x01\x00\x00", b"\x02\x00\x00\x00\x80\x3e\x00\x00"])
+    def test_rejects_truncated_or_unknown_frames(self, data: bytes) -> None:
+        with pytest.raises(ValueError):
+            decode_audio_frame(data)
@@ -0,0 +1,181 @@
+"""Unit tests for write-behind persistence of interaction sessions."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import (
+    ConversationTurn,
+    InteractionMode,
+    InteractionSession,
+    LatencyMetrics,
+    SessionStatus,
+)
+from src.infrastructure.persistence import interaction_write_behind
+from src.infrastructure.persistence.interaction_write_behind import InteractionWriteBehind
+from src.infrastructure.websocket.base_handler import MessageType, WebSocketMessage
+from src.infrastructure.websocket.interaction_handler import InteractionWebSocketHandler
+
+
+class FakeRepository:
+    """Records batches written by each flush."""
+
+    def __init__(self, calls: list[tuple[str, object]], fail: list[bool]) -> None:
+        self._calls = calls
+        self._fail = fail
+
+    async def create_session(self, session):
+        self._calls.append(("create_session", session.id))
+        return session
+
+    async def save_turns(self, turns):
+        if self._fail and self._fail.pop(0):
+            raise ConnectionError("database unavailable")
+        self._calls.append(("save_turns", [(t.turn_number, t.user_transcript) for t in turns]))
+
+    async def create_latency_metrics_batch(self, metrics):
+        self._calls.append(("create_latency_metrics_batch", [m.turn_id for m in metrics]))
+
+    async def update_session(self, session):
+        self._calls.append(("update_session", session.status))
+        return session
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> tuple[list, list, MagicMock]:
+    recorded: list[tuple[str, object]] = []
+    fail: list[bool] = []
+    monkeypatch.setattr(
+        interaction_write_behind,
+        "SQLAlchemyInteractionRepository",
+        lambda _db: FakeRepository(recorded, fail),
+    )
+    db = MagicMock()
+    db.__aenter__ = AsyncMock(return_value=db)
+    db.__aexit__ = AsyncMock(return_value=None)
+    db.commit = AsyncMock()
+    return recorded, fail, db
+
+
+def _turn(store: InteractionWriteBehind, session: InteractionSession) -> ConversationTurn:
+    return ConversationTurn(
+        session_id=session.id,
+        turn_number=store.next_turn_number(),
+        started_at=datetime.utcnow(),
+    )
+
+
+def _session() -> InteractionSession:
+    return InteractionSession(
+        user_id=uuid4(),
+        mode=InteractionMode.CASCADE,
+        provider_config={},
+        started_at=datetime.utcnow(),
+    )
+
+
+async def _store(db: MagicMock, **kwargs) -> tuple[InteractionWriteBehind, InteractionSession]:
+    store = InteractionWriteBehind(lambda: db, flush_interval_s=60, **kwargs)
+    session = await store.start_session(_session())
+    return store, session
+
+
+class TestInteractionWriteBehind:
+    """Writes are buffered, coalesced and flushed in batches."""
+
+    @pytest.mark.asyncio
+    async def test_turn_numbers_are_allocated_locally(self, calls) -> None:
+        recorded, _fail, db = calls
+        store, _session = await _store(db)
+
+        assert [store.next_turn_number() for _ in range(3)] == [1, 2, 3]
+        assert recorded == [("create_session", _session.id)]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_turn_updates_coalesce_into_one_write(self, calls) -> None:
+        recorded, _fail, db = calls
+        store, session = await _store(db)
+        turn = _turn(store, session)
+
+        store.save_turn(turn)
+        turn.set_user_input("hello")
+        store.save_turn(turn)
+        store.add_latency_metrics(LatencyMetrics(turn_id=turn.id, total_latency_ms=420))
+        session.end(SessionStatus.DISCONNECTED)
+        store.update_session(session)
+        assert recorded == [("create_session", session.id)]
+
+        await store.close()
+
+        assert recorded[1:] == [
+            ("save_turns", [(1, "hello")]),
+            ("create_latency_metrics_batch", [turn.id]),
+            ("update_session", SessionStatus.DISCONNECTED),
+        ]
+        assert store.pending_writes == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, calls) -> None:
+        recorded, fail, db = calls
+        store, session = await _store(db)
+        turn = _turn(store, session)
+        store.save_turn(turn)
+        fail.append(True)
+
+        with pytest.raises(ConnectionError):
+            await store.flush()
+        assert store.pending_writes == 1
+
+        await store.flush()
+        assert recorded[-2] == ("save_turns", [(1, None)])
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_threshold_triggers_background_flush(self, calls) -> None:
+        recorded, _fail, db = calls
+        store, session = await _store(db, flush_threshold=2)
+
+        for _ in range(2):
+            store.save_turn(_turn(store, session))
+        await asyncio.sleep(0)
+
+        assert ("save_turns", [(1, None), (2, None)]) in recorded
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_repeated_config_keeps_one_flush_loop(self, calls) -> None:
+        recorded, _fail, db = calls
+        store = InteractionWriteBehind(lambda: db, flush_interval_s=60)
+        mode_service = AsyncMock(mode_name="cascade")
+        handler = InteractionWebSocketHandler(
+            websocket=MagicMock(),
+            user_id=uuid4(),
+            mode_service=mode_service,
+            store=store,
+            audio_storage=MagicMock(ensure_session_dir=AsyncMock()),
+        )
+        config = WebSocketMessage(type=MessageType.CONFIG, data={"config": {}})
+
+        await handler._handle_config(config)
+        first = handler._session
+        store.save_turn(_turn(store, first))
+        await handler._handle_config(config)
+
+        flush_loops = [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__ == "InteractionWriteBehind._periodic_flush"
+        ]
+        assert flush_loops == [store._flush_task]
+        # The first session's pending turn was written before the second started
+        assert recorded == [
+            ("create_session", first.id),
+            ("save_turns", [(1, None)]),
+            ("create_latency_metrics_batch", []),
+            ("create_session", handler._session.id),
+        ]
+        await store.close()
@@ -0,0 +1,153 @@
+"""Unit tests for lazily imported providers."""
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+from src.application.services.provider_loading import load_provider
+from src.application.use_cases.synthesize_speech import SynthesizeSpeechFactory
+from src.infrastructure.providers import lazy
+from src.infrastructure.providers.lazy import (
+    LazyProvider,
+    LazyProviderMap,
+    import_attribute,
+    import_report,
+)
+
+created: list[str] = []
+
+
+class FakeProvider:
+    def __init__(self, name: str = "fake") -> None:
+        created.append(name)
+        self.name = name
+
+
+class BrokenProvider:
+    def __init__(self) -> None:
+        raise RuntimeError("missing credentials")
+
+
+slow_started = threading.Event()
+slow_release = threading.Event()
+
+
+class SlowProvider:
+    def __init__(self) -> None:
+        slow_started.set()
+        slow_release.wait(5)
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> None:
+    created.clear()
+
+
+def _map() -> LazyProviderMap[FakeProvider]:
+    return LazyProviderMap(
+        "TTS",
+        {
+            "a": LazyProvider(f"{__name__}:FakeProvider", {"name": "a"}),
+            "broken": LazyProvider(f"{__name__}:BrokenProvider"),
+            "b": LazyProvider(f"{__name__}:FakeProvider", {"name": "b"}),
+        },
+    )
+
+
+def test_providers_are_constructed_on_first_access() -> None:
+    providers = _map()
+
+    assert providers.configured() == ["a", "broken", "b"]
+    assert created == []
+
+    assert providers["a"] is providers["a"]
+    assert created == ["a"]
+    assert providers.loaded() == ["a"]
+
+
+def test_availability_does_not_load_providers() -> None:
+    providers = _map()
+
+    assert "a" in providers
+    assert "missing" not in providers
+    assert list(providers) == ["a", "broken", "b"]
+    assert len(providers) == 3
+    assert created == []
+
+
+def test_failed_providers_are_left_out() -> None:
+    providers = _map()
+
+    assert providers.get("broken") is None
+    assert "broken" not in providers
+    with pytest.raises(KeyError):
+        providers["missing"]
+    assert list(providers) == ["a", "b"]
+    assert len(providers) == 2
+
+
+async def test_load_runs_in_a_thread_with_a_lock_per_provider() -> None:
+    slow_started.clear()
+    slow_release.clear()
+    providers = LazyProviderMap(
+        "TTS",
+        {
+            "slow": LazyProvider(f"{__name__}:SlowProvider"),
+            "a": LazyProvider(f"{__name__}:FakeProvider", {"name": "a"}),
+        },
+    )
+
+    slow = asyncio.create_task(providers.load("slow"))
+    await asyncio.to_thread(slow_started.wait, 5)
+    # Neither the event loop nor the other provider waits for the slow import
+    fast = await load_provider(providers, "a")
+    assert not slow.done()
+    slow_release.set()
+
+    assert fast is providers["a"]
+    assert isinstance(await slow, SlowProvider)
+    assert await load_provider(providers, "missing") is None
+    assert await load_provider({"a": fast}, "a") is fast
+
+
+@pytest.mark.asyncio
+async def test_synthesize_factory_loads_lazy_provider() -> None:
+    providers = _map()
+
+    use_case = await SynthesizeSpeechFactory(providers).create("a")
+
+    assert use_case.provider is providers["a"]
+    with pytest.raises(ValueError):
+        await SynthesizeSpeechFactory(providers).create("missing")
+
+
+def test_warm_up_builds_all_providers() -> None:
+    providers = _map()
+
+    providers.warm_up()
+
+    assert providers.loaded() == ["a", "b"]
+
+
+def test_import_report_records_lazy_imports(monkeypatch) -> None:
+    module = "colorsys"
+    monkeypatch.delitem(sys.modules, module, raising=False)
+    monkeypatch.setattr(lazy, "_import_costs", {})
+
+    rgb_to_hsv = import_attribute(f"{module}:rgb_to_hsv")
+
+    assert rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)
+    [entry] = import_report()["lazy_imports"]
+    assert entry["module"] == module
+    assert entry["duration_ms"] >= 0
+
+
+def test_provider_packages_resolve_classes_on_access() -> None:
+    from src.infrastructure.providers import stt, tts
+
+    assert tts.GeminiTTSProvider.__name__ == "GeminiTTSProvider"
+    assert stt.WhisperSTTProvider.__name__ == "WhisperSTTProvider"
+    with pytest.raises(AttributeError):
+        _ = tts.UnknownProvider
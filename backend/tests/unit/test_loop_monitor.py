@@ -0,0 +1,99 @@
+"""Unit tests for the event loop lag and blocking-call monitor."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.services import loop_monitor
+from src.application.services.loop_monitor import (
+    LoopMonitor,
+    set_task_context,
+    task_context,
+)
+from src.application.services.metrics import get_metrics_registry
+from src.config import get_settings
+from src.presentation.api.routes import health
+
+
+def _block_loop(duration_s: float) -> None:
+    time.sleep(duration_s)
+
+
+@pytest.fixture
+async def monitor():
+    monitor = LoopMonitor(interval_s=0.01, block_threshold_s=0.05)
+    await monitor.start()
+    yield monitor
+    await monitor.stop()
+
+
+async def test_blocking_call_is_reported_with_stack_and_context(monitor) -> None:
+    async def request() -> None:
+        set_task_context(request_id="req-1", path="/api/v1/tts/synthesize")
+        # Spawned tasks inherit the request's context
+        await asyncio.create_task(handler())
+
+    async def handler() -> None:
+        _block_loop(0.15)
+
+    await asyncio.create_task(request())
+    await asyncio.sleep(0.05)
+
+    [event] = monitor.events
+    assert event.finished
+    assert event.blocked_ms >= 100
+    assert event.context == {"request_id": "req-1", "path": "/api/v1/tts/synthesize"}
+    assert any("_block_loop" in line for line in event.stack)
+    snapshot = monitor.snapshot()
+    assert snapshot["blocking_events"][0]["context"]["request_id"] == "req-1"
+    assert snapshot["max_lag_ms"] >= 100
+
+
+async def test_short_callbacks_are_not_reported(monitor) -> None:
+    for _ in range(5):
+        _block_loop(0.005)
+        await asyncio.sleep(0.01)
+
+    assert not monitor.events
+    assert "voicelab_event_loop_lag_seconds_count" in get_metrics_registry().render()
+
+
+async def test_stop_restores_task_factory() -> None:
+    loop = asyncio.get_running_loop()
+    monitor = LoopMonitor(interval_s=0.01)
+
+    await monitor.start()
+    assert loop.get_task_factory() is not None
+    await monitor.stop()
+
+    assert loop.get_task_factory() is None
+    assert not monitor.running
+
+
+async def test_task_context_is_scoped() -> None:
+    set_task_context(worker="jobs")
+
+    with task_context(job_id="42"):
+        assert loop_monitor._context_of(asyncio.current_task()) == {
+            "worker": "jobs",
+            "job_id": "42",
+        }
+
+    assert loop_monitor._context_of(asyncio.current_task()) == {"worker": "jobs"}
+
+
+async def test_loop_route_requires_profiling_token(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "profiling_token", "secret")
+    app = FastAPI()
+    app.include_router(health.router)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/metrics/loop")).status_code == 403
+        response = await client.get("/metrics/loop", headers={"X-Profile-Token": "secret"})
+
+    assert response.status_code == 200
+    assert "blocking_events" in response.json()
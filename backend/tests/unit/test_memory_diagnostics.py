@@ -0,0 +1,135 @@
+"""Unit tests for the on-demand memory diagnostics."""
+
+import asyncio
+import os
+from io import BytesIO
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.config import get_settings
+from src.domain.services.interaction.base import InteractionModeService
+from src.infrastructure.memory_diagnostics import MemoryDiagnostics, get_memory_diagnostics
+from src.presentation.api.routes import admin_memory
+
+TOKEN = "s3cret"
+
+
+class FakeSession(InteractionModeService):
+    def __init__(self) -> None:
+        self._session_id = uuid4()
+        self._audio_buffer = BytesIO(os.urandom(64 * 1024))
+        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._event_queue.put_nowait("event")
+
+    @property
+    def mode_name(self) -> str:
+        return "fake"
+
+    async def connect(self, session_id, config, system_prompt="") -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def send_audio(self, audio) -> None:
+        pass
+
+    async def end_turn(self) -> None:
+        pass
+
+    async def interrupt(self) -> None:
+        pass
+
+    async def events(self):
+        yield
+
+    def is_connected(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def diagnostics():
+    diagnostics = MemoryDiagnostics(max_snapshots=2)
+    yield diagnostics
+    diagnostics.stop()
+
+
+def test_snapshot_diff_shows_growth_by_line(diagnostics) -> None:
+    diagnostics.start()
+    base = diagnostics.take_snapshot("before")
+    retained = [bytearray(1024) for _ in range(200)]
+    target = diagnostics.take_snapshot("after")
+
+    changes = diagnostics.diff(base.id, target.id)
+
+    assert changes[0]["file"] == __file__
+    assert changes[0]["size_diff_bytes"] >= 200 * 1024
+    assert len(retained) == 200
+
+
+def test_snapshots_need_tracing_and_are_bounded(diagnostics) -> None:
+    with pytest.raises(RuntimeError):
+        diagnostics.take_snapshot()
+
+    diagnostics.start()
+    first = diagnostics.take_snapshot()
+    diagnostics.take_snapshot()
+    diagnostics.take_snapshot()
+    diagnostics.stop()
+
+    assert [info.id for info in diagnostics.snapshots()] == [first.id + 1, first.id + 2]
+    with pytest.raises(KeyError):
+        diagnostics.diff(first.id, first.id + 2)
+
+
+async def test_live_objects_report_buffers_and_sessions(diagnostics) -> None:
+    buffer = os.urandom(256 * 1024)
+    session = FakeSession()
+
+    report = diagnostics.live_objects()
+
+    assert report["bytes_buffers"]["total_bytes"] >= len(buffer)
+    [entry] = [s for s in report["sessions"] if s["session_id"] == str(session._session_id)]
+    assert entry["mode"] == "fake"
+    assert entry["audio_buffer_bytes"] >= 64 * 1024
+    assert entry["queued_events"] == 1
+
+
+async def test_routes_toggle_tracing_and_diff(diagnostics, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "profiling_token", TOKEN)
+    app = FastAPI()
+    app.include_router(admin_memory.router)
+    app.dependency_overrides[get_memory_diagnostics] = lambda: diagnostics
+    headers = {"X-Profile-Token": TOKEN}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/admin/memory")).status_code == 403
+        not_tracing = await client.post("/admin/memory/snapshots", json={}, headers=headers)
+        started = await client.post(
+            "/admin/memory/tracing", json={"enabled": True}, headers=headers
+        )
+        base = await client.post("/admin/memory/snapshots", json={"label": "a"}, headers=headers)
+        target = await client.post("/admin/memory/snapshots", json={"label": "b"}, headers=headers)
+        diff = await client.get(
+            "/admin/memory/diff",
+            params={"base": base.json()["id"], "target": target.json()["id"]},
+            headers=headers,
+        )
+        unknown = await client.get(
+            "/admin/memory/diff", params={"base": 999, "target": 1000}, headers=headers
+        )
+        stopped = await client.post(
+            "/admin/memory/tracing", json={"enabled": False}, headers=headers
+        )
+
+    assert not_tracing.status_code == 409
+    assert started.json()["tracing"] is True
+    assert base.status_code == 201
+    assert diff.json()["group_by"] == "lineno"
+    assert unknown.status_code == 404
+    assert stopped.json()["tracing"] is False
+    assert len(stopped.json()["snapshots"]) == 2
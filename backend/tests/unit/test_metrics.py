@@ -0,0 +1,119 @@
+"""Unit tests for the OpenMetrics registry and instrumentation helpers."""
+
+import pytest
+
+from src.application.services import metrics
+from src.application.services.metrics import MetricFamily, MetricsRegistry
+from src.infrastructure.concurrency import ConcurrencyManager, ProviderCircuitBreaker
+
+
+def _sample(text: str, line_prefix: str) -> str:
+    return next(line for line in text.splitlines() if line.startswith(line_prefix))
+
+
+class TestMetricsRegistry:
+    """Metrics render as OpenMetrics text."""
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", ("provider",), (0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.labels("azure").observe(value)
+
+        text = registry.render()
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{provider="azure",le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{provider="azure",le="1"} 3' in text
+        assert 'latency_seconds_bucket{provider="azure",le="+Inf"} 4' in text
+        assert 'latency_seconds_count{provider="azure"} 4' in text
+        assert _sample(text, "latency_seconds_sum").endswith(" 3.65")
+        assert text.endswith("# EOF\n")
+
+    def test_counters_gauges_and_collectors(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("errors", "Errors", ("kind",)).labels("tts").inc()
+        registry.gauge("in_flight", "In flight").labels().set(3)
+
+        def collect() -> list[MetricFamily]:
+            family = MetricFamily("hits", "counter", "Hits")
+            family.add(7, cache='a"b')
+            return [family]
+
+        registry.register_collector("hits", collect)
+        text = registry.render()
+
+        assert 'errors_total{kind="tts"} 1' in text
+        assert "in_flight 3" in text
+        assert 'hits_total{cache="a\\"b"} 7' in text
+
+    def test_reregistering_returns_same_metric(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("calls", "Calls", ("provider",))
+
+        assert registry.counter("calls", "Calls", ("provider",)) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("calls", "Calls", ("provider",))
+
+    def test_metric_types_must_implement_rendering(self) -> None:
+        class Unrendered(metrics._Metric[metrics._CounterChild]):
+            def _new_child(self) -> metrics._CounterChild:
+                return metrics._CounterChild()
+
+        with pytest.raises(TypeError):
+            Unrendered("calls", "Calls", ())
+
+
+class TestProviderInstrumentation:
+    """Provider calls record latency, errors and in-flight counts."""
+
+    def test_failed_call_is_counted_and_timed(self) -> None:
+        latency = metrics.PROVIDER_LATENCY.labels("tts", "test-fail", "total")
+        errors = metrics.PROVIDER_ERRORS.labels("tts", "test-fail")
+        count, error_count = latency.count, errors.value
+
+        with pytest.raises(RuntimeError), metrics.track_provider_call("tts", "test-fail"):
+            assert metrics.PROVIDER_IN_FLIGHT.labels("tts", "test-fail").value == 1
+            raise RuntimeError("boom")
+
+        assert latency.count == count + 1
+        assert errors.value == error_count + 1
+        assert metrics.PROVIDER_IN_FLIGHT.labels("tts", "test-fail").value == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_records_time_to_first_item(self) -> None:
+        async def stream():
+            for chunk in (b"a", b"b"):
+                yield chunk
+
+        chunks = [
+            c async for c in metrics.track_provider_stream("llm", "test-stream", stream(), "ttft")
+        ]
+
+        assert chunks == [b"a", b"b"]
+        assert metrics.PROVIDER_LATENCY.labels("llm", "test-stream", "ttft").count == 1
+        assert metrics.PROVIDER_LATENCY.labels("llm", "test-stream", "total").count == 1
+
+
+class TestComponentCollectors:
+    """Concurrency and circuit breaker state is exported on scrape."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_manager_reports_queue_and_slots(self) -> None:
+        manager = ConcurrencyManager()
+
+        async with manager.acquire("azure"):
+            families = {f.name: f for f in manager.collect_metrics()}
+
+        assert families["voicelab_synthesis_queue_depth"].samples == [({}, 1)]
+        assert families["voicelab_synthesis_slots_in_use"].samples == [({"provider": "azure"}, 1)]
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_reports_current_state(self) -> None:
+        breaker = ProviderCircuitBreaker(failure_threshold=1)
+        await breaker.record_failure("gemini")
+
+        state = breaker.collect_metrics()[0]
+
+        assert ({"provider": "gemini", "state": "open"}, 1) in state.samples
+        assert ({"provider": "gemini", "state": "closed"}, 0) in state.samples
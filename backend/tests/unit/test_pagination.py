@@ -0,0 +1,86 @@
+"""Unit tests for keyset pagination cursors and cached totals."""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.application.services.total_count_cache import TotalCountCache
+from src.domain.pagination import PageCursor
+from src.infrastructure.persistence.models import JobModel
+from src.infrastructure.persistence.pagination import paginate_after, split_page
+
+
+class TestPageCursor:
+    """Cursors are opaque, URL-safe and round-trip exactly."""
+
+    def test_round_trip(self) -> None:
+        cursor = PageCursor(timestamp=datetime(2024, 5, 6, 7, 8, 9, 123456, UTC), id=uuid.uuid4())
+
+        token = cursor.encode()
+
+        assert PageCursor.decode(token) == cursor
+        assert token.isascii()
+        assert "=" not in token and "/" not in token and "+" not in token
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJ4Il0", "WzEsMl0"])
+    def test_rejects_malformed_tokens(self, token: str) -> None:
+        with pytest.raises(ValueError):
+            PageCursor.decode(token)
+
+
+class TestKeysetQuery:
+    """Pages are selected with a row-value comparison, not OFFSET."""
+
+    def test_paginate_after_cursor(self) -> None:
+        cursor = PageCursor(timestamp=datetime(2024, 1, 1, tzinfo=UTC), id=uuid.uuid4())
+
+        stmt = paginate_after(select(JobModel), JobModel.created_at, JobModel.id, cursor, 20)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "(jobs.created_at, jobs.id) < (" in sql
+        assert "ORDER BY jobs.created_at DESC, jobs.id DESC" in sql
+        assert "OFFSET" not in sql
+        assert stmt._limit_clause.value == 21
+
+    def test_split_page(self) -> None:
+        rows = [(datetime(2024, 1, d, tzinfo=UTC), uuid.uuid4()) for d in (3, 2, 1)]
+
+        page, next_cursor = split_page(rows, 2, lambda row: row)
+        last_page, no_cursor = split_page(rows[2:], 2, lambda row: row)
+
+        assert page == rows[:2]
+        assert next_cursor == PageCursor(timestamp=rows[1][0], id=rows[1][1])
+        assert last_page == rows[2:]
+        assert no_cursor is None
+
+
+class TestTotalCountCache:
+    """Totals are counted once per key until the TTL expires."""
+
+    @pytest.mark.asyncio
+    async def test_counts_once_per_key(self) -> None:
+        cache = TotalCountCache()
+        count = AsyncMock(return_value=7)
+
+        assert await cache.get_or_count(("jobs", 1), count) == 7
+        assert await cache.get_or_count(("jobs", 1), count) == 7
+        assert await cache.get_or_count(("jobs", 2), count) == 7
+
+        assert count.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_and_invalidated_totals_are_recounted(self) -> None:
+        cache = TotalCountCache(ttl_s=0)
+        count = AsyncMock(side_effect=[1, 2, 3])
+
+        assert await cache.get_or_count("k", count) == 1
+        assert await cache.get_or_count("k", count) == 2
+
+        cache = TotalCountCache()
+        await cache.get_or_count("k", count)
+        cache.invalidate("k")
+        assert await cache.get_or_count("k", AsyncMock(return_value=9)) == 9
@@ -0,0 +1,255 @@
+"""Unit tests for background voice preview pre-generation."""
+
+import asyncio
+import dataclasses
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.voice_catalog import VoiceCatalog
+from src.domain.entities.voice import VoiceProfile
+from src.domain.entities.voice_sync_job import VoiceSyncJob, VoiceSyncJobType, VoiceSyncStatus
+from src.infrastructure.workers import preview_pregeneration
+from src.infrastructure.workers.preview_pregeneration import PreviewPregenerationWorker
+
+
+def _voice(provider: str, voice_id: str, **kwargs) -> VoiceProfile:
+    return VoiceProfile(
+        id=f"{provider}:{voice_id}",
+        provider=provider,
+        voice_id=voice_id,
+        display_name=voice_id,
+        language="zh-TW",
+        **kwargs,
+    )
+
+
+class FakeJobRepository:
+    """Keeps copies of jobs as they would be stored."""
+
+    def __init__(self, jobs: dict[str, VoiceSyncJob], heartbeats: dict[str, datetime]) -> None:
+        self._jobs = jobs
+        self._heartbeats = heartbeats
+
+    async def create(self, job):
+        self._jobs[job.id] = VoiceSyncJob(**_fields(job))
+        return job
+
+    async def update(self, job):
+        self._jobs[job.id] = VoiceSyncJob(**_fields(job))
+        return job
+
+    async def has_running_job(self, job_type=None):
+        return any(
+            j.status == VoiceSyncStatus.RUNNING and j.job_type == job_type
+            for j in self._jobs.values()
+        )
+
+    async def claim_stale_jobs(self, job_type, stale_after):
+        now = datetime.utcnow()
+        claimed = []
+        for job in self._jobs.values():
+            beat = self._heartbeats.get(job.id)
+            if job.status != VoiceSyncStatus.RUNNING or job.job_type != job_type:
+                continue
+            if beat is None or beat < now - stale_after:
+                self._heartbeats[job.id] = now
+                claimed.append(VoiceSyncJob(**_fields(job)))
+        return claimed
+
+    async def heartbeat(self, job_id):
+        self._heartbeats[job_id] = datetime.utcnow()
+
+    async def release(self, job_id):
+        self._heartbeats.pop(job_id, None)
+
+
+def _fields(job: VoiceSyncJob) -> dict:
+    return {
+        name: getattr(job, name)
+        for name in VoiceSyncJob.__dataclass_fields__
+        if name not in ("MAX_RETRIES", "RETRY_DELAYS")
+    }
+
+
+class FakeGenerateVoicePreview:
+    """Records syntheses and the peak concurrency per provider."""
+
+    def __init__(self, state: dict) -> None:
+        self._state = state
+
+    async def execute(self, voice_cache_id: str) -> str:
+        state = self._state
+        provider = voice_cache_id.split(":")[0]
+        if voice_cache_id in state["fail"]:
+            raise RuntimeError("synthesis failed")
+
+        state["active"][provider] = state["active"].get(provider, 0) + 1
+        state["peak"][provider] = max(state["peak"].get(provider, 0), state["active"][provider])
+        await asyncio.sleep(0.01)
+        state["active"][provider] -= 1
+
+        url = f"https://storage/{voice_cache_id}.mp3"
+        state["generated"].append(voice_cache_id)
+        voice = state["voices"][voice_cache_id]
+        state["voices"][voice_cache_id] = dataclasses.replace(voice, sample_audio_url=url)
+        return url
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch) -> dict:
+    voices = [
+        _voice("azure", "a1"),
+        _voice("azure", "a2"),
+        _voice("azure", "a3"),
+        _voice("azure", "done", sample_audio_url="https://storage/done.mp3"),
+        _voice("gemini", "g1"),
+        _voice("elevenlabs", "cdn", metadata={"preview_url": "https://cdn/rachel.mp3"}),
+        _voice("elevenlabs", "no-cdn"),
+    ]
+    state: dict = {
+        "jobs": {},
+        "heartbeats": {},
+        "voices": {v.id: v for v in voices},
+        "fail": set(),
+        "generated": [],
+        "active": {},
+        "peak": {},
+    }
+
+    voice_repo = MagicMock()
+    voice_repo.list_all = AsyncMock(side_effect=lambda **_kw: list(state["voices"].values()))
+    monkeypatch.setattr(preview_pregeneration, "VoiceCacheRepositoryImpl", lambda _db: voice_repo)
+    monkeypatch.setattr(
+        preview_pregeneration,
+        "VoiceSyncJobRepositoryImpl",
+        lambda _db: FakeJobRepository(state["jobs"], state["heartbeats"]),
+    )
+    monkeypatch.setattr(
+        preview_pregeneration,
+        "GenerateVoicePreview",
+        lambda *_args: FakeGenerateVoicePreview(state),
+    )
+    catalog = VoiceCatalog()
+    monkeypatch.setattr(preview_pregeneration, "get_voice_catalog", lambda: catalog)
+    return state
+
+
+def _worker() -> PreviewPregenerationWorker:
+    db = MagicMock()
+    db.__aenter__ = AsyncMock(return_value=db)
+    db.__aexit__ = AsyncMock(return_value=None)
+    db.commit = AsyncMock()
+    providers = {"azure": MagicMock(), "gemini": MagicMock()}
+    return PreviewPregenerationWorker(
+        lambda: db, providers, storage=MagicMock(), per_provider_concurrency=2
+    )
+
+
+async def _wait(worker: PreviewPregenerationWorker) -> None:
+    while worker.running_jobs:
+        await asyncio.sleep(0.01)
+
+
+class TestPreviewPregenerationWorker:
+    """Missing previews are generated in a tracked, resumable job."""
+
+    @pytest.mark.asyncio
+    async def test_generates_missing_previews_with_bounded_concurrency(self, env) -> None:
+        worker = _worker()
+
+        job = await worker.start_job()
+        await _wait(worker)
+
+        stored = env["jobs"][job.id]
+        assert stored.job_type == VoiceSyncJobType.PREVIEWS
+        assert stored.status == VoiceSyncStatus.COMPLETED
+        assert stored.voices_total == 5
+        assert stored.voices_synced == 5
+        # Stored previews and unconfigured providers without a CDN preview are skipped
+        assert sorted(env["generated"]) == [
+            "azure:a1",
+            "azure:a2",
+            "azure:a3",
+            "elevenlabs:cdn",
+            "gemini:g1",
+        ]
+        assert env["peak"]["azure"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_second_job_while_running(self, env) -> None:
+        worker = _worker()
+
+        await worker.start_job(["azure"])
+        with pytest.raises(ValueError):
+            await worker.start_job(["azure"])
+        await _wait(worker)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_and_rerun_resumes(self, env) -> None:
+        worker = _worker()
+        env["fail"].add("azure:a2")
+
+        job = await worker.start_job(["azure"])
+        await _wait(worker)
+
+        stored = env["jobs"][job.id]
+        assert stored.status == VoiceSyncStatus.FAILED
+        assert stored.voices_synced == 2
+        assert "1 of 3 previews failed" in (stored.error_message or "")
+
+        # A rerun only covers what is still missing
+        env["fail"].clear()
+        job = await worker.start_job(["azure"])
+        await _wait(worker)
+        assert env["jobs"][job.id].voices_total == 1
+        assert env["generated"].count("azure:a1") == 1
+
+    @pytest.mark.asyncio
+    async def test_resumes_jobs_interrupted_by_restart(self, env) -> None:
+        interrupted = VoiceSyncJob.create(["gemini"], job_type=VoiceSyncJobType.PREVIEWS).start()
+        interrupted.voices_synced = 4
+        env["jobs"][interrupted.id] = interrupted
+        worker = _worker()
+
+        assert await worker.resume_interrupted() == 1
+        await _wait(worker)
+
+        stored = env["jobs"][interrupted.id]
+        assert stored.status == VoiceSyncStatus.COMPLETED
+        assert stored.voices_synced == 5
+        assert stored.voices_total == 5
+        assert env["generated"] == ["gemini:g1"]
+
+    @pytest.mark.asyncio
+    async def test_resumes_only_jobs_with_stale_heartbeat(self, env) -> None:
+        live = VoiceSyncJob.create(["azure"], job_type=VoiceSyncJobType.PREVIEWS).start()
+        orphaned = VoiceSyncJob.create(["gemini"], job_type=VoiceSyncJobType.PREVIEWS).start()
+        env["jobs"].update({live.id: live, orphaned.id: orphaned})
+        env["heartbeats"][live.id] = datetime.utcnow()
+        env["heartbeats"][orphaned.id] = datetime.utcnow() - timedelta(hours=1)
+        worker = _worker()
+
+        assert await worker.resume_interrupted() == 1
+        assert worker.running_jobs == [orphaned.id]
+        # Another process starting now finds the job claimed
+        assert await _worker().resume_interrupted() == 0
+        await _wait(worker)
+
+        assert env["jobs"][live.id].status == VoiceSyncStatus.RUNNING
+        assert env["generated"] == ["gemini:g1"]
+
+    @pytest.mark.asyncio
+    async def test_stopped_job_is_released_for_next_process(self, env) -> None:
+        worker = _worker()
+        job = await worker.start_job(["azure"])
+        assert await _worker().resume_interrupted() == 0
+
+        await worker.stop()
+
+        assert env["jobs"][job.id].status == VoiceSyncStatus.RUNNING
+        successor = _worker()
+        assert await successor.resume_interrupted() == 1
+        await _wait(successor)
+        assert env["jobs"][job.id].status == VoiceSyncStatus.COMPLETED
@@ -0,0 +1,184 @@
+"""Unit tests for the on-demand sampling profiler."""
+
+import sys
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from src.config import get_settings
+from src.infrastructure.profiling import Profiler, collapse_stack, get_profiler
+from src.infrastructure.storage.local_storage import LocalStorage
+from src.presentation.api.middleware.profiling import ProfilingMiddleware
+from src.presentation.api.routes import admin_profiling
+
+TOKEN = "s3cret"
+
+
+def _busy_loop(duration_s: float) -> None:
+    deadline = time.perf_counter() + duration_s
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def profiler(tmp_path) -> Profiler:
+    return Profiler(storage=LocalStorage(str(tmp_path)), interval_s=0.001)
+
+
+def _read(tmp_path, key: str) -> str:
+    return (tmp_path / key).read_text()
+
+
+def test_collapse_stack_lists_outermost_frame_first() -> None:
+    def inner():
+        return collapse_stack(sys._getframe(), {})
+
+    stack = inner().split(";")
+
+    assert stack[-1].endswith("test_collapse_stack_lists_outermost_frame_first.<locals>.inner")
+    assert stack[-2].endswith(":test_collapse_stack_lists_outermost_frame_first")
+
+
+class TestProfiler:
+    async def test_profile_writes_collapsed_stacks(self, profiler, tmp_path) -> None:
+        async with profiler.profile("unit test") as key:
+            assert profiler.active == key
+            _busy_loop(0.05)
+
+        assert key is not None and key.startswith("profiles/") and "unit-test-" in key
+        assert profiler.active is None
+        lines = _read(tmp_path, key).splitlines()
+        assert any("_busy_loop" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        [info] = profiler.recent
+        assert info.key == key and info.samples == sum(int(x.rsplit(" ", 1)[1]) for x in lines)
+
+    async def test_only_one_profile_at_a_time(self, profiler) -> None:
+        async with profiler.profile("outer") as outer, profiler.profile("inner") as inner:
+            pass
+
+        assert outer is not None
+        assert inner is None
+
+    async def test_armed_targets_are_consumed(self, profiler) -> None:
+        profiler.arm("job", 2)
+
+        async with profiler.profile_if_armed("http", "request") as key:
+            assert key is None
+        for _ in range(2):
+            async with profiler.profile_if_armed("job", "job") as key:
+                assert key is not None
+        async with profiler.profile_if_armed("job", "job") as key:
+            assert key is None
+
+        assert profiler.armed() == {}
+        with pytest.raises(ValueError):
+            profiler.arm("cron")
+
+    async def test_window_profile(self, profiler, tmp_path) -> None:
+        key = profiler.start_window(0.05, "window")
+
+        assert key is not None
+        assert profiler.start_window(0.05) is None
+        info = await profiler._window_task
+        assert info is not None and info.key == key
+        assert (tmp_path / key).exists()
+
+
+def _app(profiler: Profiler) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, token=TOKEN, profiler=profiler)
+
+    @app.get("/work")
+    async def work():
+        _busy_loop(0.02)
+        return {"ok": True}
+
+    return app
+
+
+class TestProfilingMiddleware:
+    async def _get(self, profiler: Profiler, headers: dict[str, str] | None = None):
+        transport = httpx.ASGITransport(app=_app(profiler))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/work", headers=headers)
+
+    async def test_token_header_profiles_request(self, profiler, tmp_path) -> None:
+        response = await self._get(profiler, {"X-Profile": TOKEN})
+
+        key = response.headers["X-Profile-Key"]
+        assert "http-work-" in key
+        assert "_busy_loop" in _read(tmp_path, key)
+
+    async def test_wrong_token_and_no_header_are_not_profiled(self, profiler) -> None:
+        assert "X-Profile-Key" not in (await self._get(profiler, {"X-Profile": "x"})).headers
+        assert "X-Profile-Key" not in (await self._get(profiler)).headers
+        assert not profiler.recent
+
+    async def test_armed_request_is_profiled(self, profiler) -> None:
+        profiler.arm("http")
+
+        assert "X-Profile-Key" in (await self._get(profiler)).headers
+        assert "X-Profile-Key" not in (await self._get(profiler)).headers
+
+    def test_websocket_session_is_profiled(self, profiler) -> None:
+        app = FastAPI()
+        app.add_middleware(ProfilingMiddleware, token=TOKEN, profiler=profiler)
+
+        @app.websocket("/ws")
+        async def session(websocket: WebSocket):
+            await websocket.accept()
+            await websocket.receive_text()
+            await websocket.close()
+
+        with (
+            TestClient(app) as client,
+            client.websocket_connect("/ws", headers={"X-Profile": TOKEN}) as ws,
+        ):
+            ws.send_text("hello")
+
+        [info] = profiler.recent
+        assert info.label == "websocket-/ws"
+
+
+class TestAdminProfilingRoutes:
+    @pytest.fixture
+    def app(self, profiler, monkeypatch):
+        monkeypatch.setattr(get_settings(), "profiling_token", TOKEN)
+        app = FastAPI()
+        app.include_router(admin_profiling.router)
+        app.dependency_overrides[get_profiler] = lambda: profiler
+        return app
+
+    async def _client(self, app: FastAPI) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def test_requires_token(self, app, monkeypatch) -> None:
+        async with await self._client(app) as client:
+            assert (await client.get("/admin/profiling")).status_code == 403
+            monkeypatch.setattr(get_settings(), "profiling_token", "")
+            response = await client.get("/admin/profiling", headers={"X-Profile-Token": ""})
+            assert response.status_code == 404
+
+    async def test_arm_and_window(self, app, profiler) -> None:
+        headers = {"X-Profile-Token": TOKEN}
+        async with await self._client(app) as client:
+            armed = await client.post(
+                "/admin/profiling/arm", json={"target": "websocket", "count": 3}, headers=headers
+            )
+            window = await client.post(
+                "/admin/profiling/window", json={"duration_s": 0.02}, headers=headers
+            )
+            busy = await client.post(
+                "/admin/profiling/window", json={"duration_s": 0.02}, headers=headers
+            )
+            await profiler._window_task
+            status = (await client.get("/admin/profiling", headers=headers)).json()
+
+        assert armed.json() == {"websocket": 3}
+        assert window.status_code == 202
+        assert busy.status_code == 409
+        assert status["recent"][0]["key"] == window.json()["key"]
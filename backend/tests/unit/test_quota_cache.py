@@ -0,0 +1,74 @@
+"""Unit tests for the stale-while-revalidate quota cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services import quota_cache as quota_cache_module
+from src.application.services.quota_cache import QuotaCache
+
+
+class TestQuotaCache:
+    """Quota lookups are cached, refreshed in the background and coalesced."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self) -> None:
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"character_count": 1}
+
+        cache = QuotaCache()
+        lookups = [asyncio.create_task(cache.get("key", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*lookups)
+
+        assert calls == 1
+        assert results == [{"character_count": 1}] * 5
+        assert cache.fetched_at("key") is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self, monkeypatch) -> None:
+        now = [1000.0]
+        monkeypatch.setattr(quota_cache_module.time, "monotonic", lambda: now[0])
+        fetch = AsyncMock(side_effect=[{"v": 1}, {"v": 2}])
+        cache = QuotaCache(fresh_ttl_s=60, stale_ttl_s=600)
+
+        assert await cache.get("key", fetch) == {"v": 1}
+        assert await cache.get("key", fetch) == {"v": 1}
+        assert fetch.await_count == 1
+
+        now[0] += 120
+        assert await cache.get("key", fetch) == {"v": 1}
+        await asyncio.sleep(0)
+        assert fetch.await_count == 2
+        assert await cache.get("key", fetch) == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_are_not_cached(self) -> None:
+        fetch = AsyncMock(side_effect=[None, RuntimeError("boom"), {"v": 1}])
+        cache = QuotaCache()
+
+        assert await cache.get("key", fetch) is None
+        assert await cache.get("key", fetch) is None
+        assert await cache.get("key", fetch) == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_abandoned_lookup_still_fills_cache(self) -> None:
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return {"v": 1}
+
+        cache = QuotaCache()
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(cache.get("key", fetch), timeout=0.001)
+
+        await asyncio.sleep(0.05)
+        assert cache.fetched_at("key") is not None
@@ -0,0 +1,94 @@
+"""Unit tests for S3StorageService client reuse and multipart uploads."""
+
+import contextlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.storage.s3_storage import MIN_PART_SIZE, S3StorageService
+
+
+def _make_service(**kwargs) -> tuple[S3StorageService, AsyncMock, MagicMock]:
+    """Build a service whose session hands out a single fake client."""
+    service = S3StorageService(bucket_name="bucket", **kwargs)
+    client = AsyncMock()
+    client.generate_presigned_url.return_value = "https://signed"
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part.side_effect = lambda **kw: {"ETag": f'"etag-{kw["PartNumber"]}"'}
+
+    @contextlib.asynccontextmanager
+    async def fake_client(*_args, **_kwargs):
+        yield client
+
+    factory = MagicMock(side_effect=fake_client)
+    service._session = MagicMock(client=factory)
+    return service, client, factory
+
+
+class TestSharedClient:
+    """An opened service reuses one client for every call."""
+
+    @pytest.mark.asyncio
+    async def test_open_reuses_client(self) -> None:
+        service, client, factory = _make_service()
+
+        async with service:
+            await service.upload("a.mp3", b"abc", "audio/mpeg")
+            await service.get_url("a.mp3")
+            await service.exists("a.mp3")
+
+        assert factory.call_count == 1
+        client.put_object.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unopened_falls_back_to_per_call_client(self) -> None:
+        service, _, factory = _make_service()
+
+        await service.exists("a.mp3")
+        await service.exists("b.mp3")
+
+        assert factory.call_count == 2
+
+
+class TestMultipartUpload:
+    """Large uploads are split into concurrent parts."""
+
+    @pytest.mark.asyncio
+    async def test_large_upload_uses_multipart(self) -> None:
+        service, client, _ = _make_service(
+            multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE
+        )
+        data = b"x" * (MIN_PART_SIZE * 2 + 10)
+
+        async with service:
+            stored = await service.upload("big.wav", data, "audio/wav")
+
+        assert stored.size_bytes == len(data)
+        client.put_object.assert_not_awaited()
+        assert client.upload_part.await_count == 3
+        parts = client.complete_multipart_upload.await_args.kwargs["MultipartUpload"]["Parts"]
+        assert [p["PartNumber"] for p in parts] == [1, 2, 3]
+        assert parts[0]["ETag"] == '"etag-1"'
+
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_upload(self) -> None:
+        service, client, _ = _make_service(
+            multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE
+        )
+        client.upload_part.side_effect = RuntimeError("network down")
+
+        async with service:
+            with pytest.raises(RuntimeError):
+                await service.upload("big.wav", b"x" * MIN_PART_SIZE * 2)
+
+        client.abort_multipart_upload.assert_awaited_once()
+        client.complete_multipart_upload.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_small_upload_uses_put_object(self) -> None:
+        service, client, _ = _make_service()
+
+        await service.upload("small.mp3", b"abc")
+
+        client.put_object.assert_awaited_once()
+        client.create_multipart_upload.assert_not_awaited()
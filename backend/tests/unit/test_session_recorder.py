@@ -0,0 +1,117 @@
+"""Unit tests for the buffered interaction audio recorder."""
+
+import asyncio
+import wave
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.services.interaction.base import ResponseEvent
+from src.infrastructure.storage.session_recorder import SessionAudioRecorder, build_wav_header
+from src.infrastructure.websocket.interaction_handler import InteractionWebSocketHandler
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    return tmp_path / "interactions" / "session-1"
+
+
+def _recorder(session_dir, **kwargs) -> SessionAudioRecorder:
+    return SessionAudioRecorder(
+        session_dir=session_dir,
+        relative_to=session_dir.parent.parent,
+        **kwargs,
+    )
+
+
+class TestSessionAudioRecorder:
+    """Audio is buffered off the hot path and written as valid WAV."""
+
+    @pytest.mark.asyncio
+    async def test_append_does_no_io_below_threshold(self, session_dir) -> None:
+        recorder = _recorder(session_dir, flush_bytes=1024, flush_interval_s=60)
+
+        path = recorder.append(1, "user", b"\x00\x01" * 10, 16000)
+        await asyncio.sleep(0)
+
+        assert path == "interactions/session-1/turn_001_user.wav"
+        assert not session_dir.exists()
+        await recorder.close()
+
+    @pytest.mark.asyncio
+    async def test_threshold_triggers_background_flush(self, session_dir) -> None:
+        recorder = _recorder(session_dir, flush_bytes=64, flush_interval_s=60)
+
+        recorder.append(1, "ai", b"\x00" * 128, 24000)
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if (session_dir / "turn_001_ai.wav").exists():
+                break
+
+        path = session_dir / "turn_001_ai.wav"
+        assert path.stat().st_size == 44 + 128
+        await recorder.close()
+
+    @pytest.mark.asyncio
+    async def test_finalize_turn_writes_wav_headers(self, session_dir) -> None:
+        recorder = _recorder(session_dir, flush_interval_s=60)
+        user_pcm = b"\x01\x00" * 1600
+        ai_pcm = b"\x02\x00" * 2400
+
+        recorder.append(3, "user", user_pcm[:1600], 16000)
+        recorder.append(3, "user", memoryview(user_pcm)[1600:], 16000)
+        recorder.append(3, "ai", ai_pcm, 24000)
+        paths = recorder.finalize_turn(3)
+        await recorder.close()
+
+        assert paths == {
+            "user": "interactions/session-1/turn_003_user.wav",
+            "ai": "interactions/session-1/turn_003_ai.wav",
+        }
+        with wave.open(str(session_dir / "turn_003_user.wav")) as wav:
+            assert wav.getframerate() == 16000
+            assert wav.getsampwidth() == 2
+            assert wav.readframes(wav.getnframes()) == user_pcm
+        with wave.open(str(session_dir / "turn_003_ai.wav")) as wav:
+            assert wav.getframerate() == 24000
+            assert wav.getnframes() == 2400
+
+    @pytest.mark.asyncio
+    async def test_close_finalizes_open_streams_and_rejects_appends(self, session_dir) -> None:
+        recorder = _recorder(session_dir, flush_interval_s=60)
+        recorder.append(1, "user", b"\x00\x00" * 8, 16000)
+
+        await recorder.close()
+
+        with wave.open(str(session_dir / "turn_001_user.wav")) as wav:
+            assert wav.getnframes() == 8
+        with pytest.raises(RuntimeError):
+            recorder.append(2, "user", b"\x00\x00", 16000)
+
+    def test_build_wav_header(self) -> None:
+        header = build_wav_header(100, 16000)
+
+        assert len(header) == 44
+        assert header[:4] == b"RIFF"
+        assert int.from_bytes(header[40:44], "little") == 100
+
+
+@pytest.mark.asyncio
+async def test_lightweight_mode_still_records_ai_audio() -> None:
+    handler = InteractionWebSocketHandler(
+        websocket=MagicMock(),
+        user_id=uuid4(),
+        mode_service=AsyncMock(mode_name="realtime"),
+        store=MagicMock(),
+        audio_storage=MagicMock(),
+        lightweight_mode=True,
+    )
+    handler._recorder = MagicMock()
+    handler._current_turn = MagicMock(turn_number=3)
+
+    await handler._handle_mode_event(
+        ResponseEvent(type="audio", data={"audio": b"\x00\x01", "sample_rate": 24000})
+    )
+
+    handler._recorder.append.assert_called_once_with(3, "ai", b"\x00\x01", 24000)
@@ -0,0 +1,166 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import contextlib
+import dataclasses
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services.single_flight import SingleFlight
+from src.application.services.voice_catalog import VoiceCatalog
+from src.application.use_cases import generate_voice_preview
+from src.application.use_cases.generate_voice_preview import GenerateVoicePreview
+from src.domain.entities.voice import Gender, VoiceProfile
+
+
+class TestSingleFlight:
+    """Concurrent calls with the same key share one execution."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_result(self) -> None:
+        release = asyncio.Event()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        flights: SingleFlight[str] = SingleFlight()
+        waiters = [asyncio.create_task(flights.do("k", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert len(flights) == 1
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["done"] * 3
+        assert calls == 1
+        assert flights.coalesced == 2
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter_and_key_is_released(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+        failing = AsyncMock(side_effect=RuntimeError("provider down"))
+
+        results = await asyncio.gather(
+            flights.do("k", failing), flights.do("k", failing), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert failing.await_count == 1
+        assert await flights.do("k", AsyncMock(return_value="retry")) == "retry"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.create_task(flights.do("k", work))
+        second = asyncio.create_task(flights.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+
+@pytest.fixture
+def preview_env(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """A voice without a preview, its provider, storage and the preview's own repository."""
+    voice = VoiceProfile(
+        id="gemini:Kore",
+        provider="gemini",
+        voice_id="Kore",
+        display_name="Kore",
+        language="zh-TW",
+        gender=Gender.FEMALE,
+    )
+
+    async def synthesize(_request):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(audio=SimpleNamespace(data=b"mp3"))
+
+    provider = MagicMock()
+    provider.synthesize = AsyncMock(side_effect=synthesize)
+    storage = AsyncMock()
+    storage.upload = AsyncMock(return_value=SimpleNamespace(url="https://cdn/kore.mp3"))
+
+    written = AsyncMock()
+    opened: list[AsyncMock] = []
+
+    @contextlib.asynccontextmanager
+    async def open_repository():
+        opened.append(written)
+        yield written
+
+    catalog = VoiceCatalog()
+    catalog.load([voice])
+    monkeypatch.setattr(generate_voice_preview, "get_voice_catalog", lambda: catalog)
+
+    def use_case() -> GenerateVoicePreview:
+        # Each request brings its own request-scoped repository
+        repo = AsyncMock()
+        repo.get_by_id = AsyncMock(return_value=voice)
+        return GenerateVoicePreview({"gemini": provider}, storage, repo, open_repository)
+
+    return SimpleNamespace(
+        catalog=catalog,
+        provider=provider,
+        storage=storage,
+        opened=opened,
+        written=written,
+        use_case=use_case,
+    )
+
+
+class TestPreviewCoalescing:
+    """Concurrent preview requests for one voice synthesize once."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_previews_synthesize_once(self, preview_env) -> None:
+        use_case = preview_env.use_case()
+
+        urls = await asyncio.gather(*(use_case.execute("gemini:Kore") for _ in range(4)))
+
+        assert urls == ["https://cdn/kore.mp3"] * 4
+        preview_env.provider.synthesize.assert_awaited_once()
+        preview_env.storage.upload.assert_awaited_once()
+        preview_env.written.update_sample_audio_url.assert_awaited_once()
+        assert len(preview_env.opened) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_other_callers(self, preview_env) -> None:
+        leader_case = preview_env.use_case()
+        leader = asyncio.create_task(leader_case.execute("gemini:Kore"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(preview_env.use_case().execute("gemini:Kore"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "https://cdn/kore.mp3"
+        assert leader.cancelled()
+        # The shared write went through its own repository, not the leader's
+        leader_case._voice_cache_repo.update_sample_audio_url.assert_not_awaited()
+        preview_env.written.update_sample_audio_url.assert_awaited_once_with(
+            "gemini:Kore", "https://cdn/kore.mp3"
+        )
+        assert len(preview_env.opened) == 1
+
+    @pytest.mark.asyncio
+    async def test_preview_stored_elsewhere_is_not_regenerated(self, preview_env) -> None:
+        # Another worker stored a preview after this catalog snapshot was taken
+        use_case = preview_env.use_case()
+        stored = preview_env.catalog.get("gemini:Kore")
+        use_case._voice_cache_repo.get_by_id.return_value = dataclasses.replace(
+            stored, sample_audio_url="https://cdn/other.mp3"
+        )
+
+        assert await use_case.execute("gemini:Kore") == "https://cdn/other.mp3"
+        preview_env.provider.synthesize.assert_not_awaited()
+        assert preview_env.catalog.get("gemini:Kore").sample_audio_url == "https://cdn/other.mp3"
@@ -0,0 +1,146 @@
+"""Unit tests for SyncVoicesUseCase diffing and provider isolation."""
+
+import asyncio
+import dataclasses
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.use_cases.sync_voices import SyncVoicesInput, SyncVoicesUseCase
+from src.domain.entities.voice import Gender, VoiceProfile
+
+
+def _voice(voice_id: str, provider: str = "gemini", **kwargs) -> VoiceProfile:
+    return VoiceProfile(
+        id=f"{provider}:{voice_id}",
+        provider=provider,
+        voice_id=voice_id,
+        display_name=voice_id,
+        language=kwargs.pop("language", "multilingual"),
+        gender=kwargs.pop("gender", Gender.FEMALE),
+        **kwargs,
+    )
+
+
+def _provider(voices: list[VoiceProfile]) -> MagicMock:
+    provider = MagicMock()
+    provider.list_voices = AsyncMock(return_value=voices)
+    return provider
+
+
+def _use_case(existing: dict[str, list[VoiceProfile]], **providers) -> SyncVoicesUseCase:
+    voice_cache_repo = AsyncMock()
+    voice_cache_repo.get_by_provider = AsyncMock(
+        side_effect=lambda provider, **_kwargs: existing.get(provider, [])
+    )
+    voice_cache_repo.mark_deprecated = AsyncMock(side_effect=lambda ids: len(ids))
+    sync_job_repo = AsyncMock()
+    sync_job_repo.has_running_job = AsyncMock(return_value=False)
+    return SyncVoicesUseCase(
+        voice_cache_repo=voice_cache_repo,
+        sync_job_repo=sync_job_repo,
+        azure_fetcher=MagicMock(),
+        elevenlabs_fetcher=MagicMock(),
+        **providers,
+    )
+
+
+class TestSyncVoicesDiff:
+    """Only changed voices are written; missing voices are deprecated in bulk."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_only_new_and_changed_voices(self) -> None:
+        unchanged = _voice("Kore")
+        renamed = _voice("Puck")
+        existing = {"gemini": [unchanged, dataclasses.replace(renamed, display_name="Old")]}
+        new = _voice("Zephyr")
+        use_case = _use_case(existing, gemini_provider=_provider([unchanged, renamed, new]))
+
+        result = await use_case.execute(SyncVoicesInput(providers=["gemini"]))
+
+        upserted = use_case.voice_cache_repo.upsert_batch.await_args.args[0]
+        assert {v.voice_id for v in upserted} == {"Puck", "Zephyr"}
+        assert result.voices_synced == 3
+        use_case.voice_cache_repo.mark_deprecated.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_skips_upsert_when_nothing_changed(self) -> None:
+        voices = [_voice("Kore"), _voice("Puck", sample_audio_url="https://cdn/puck.mp3")]
+        # Providers don't report previews; a stored preview is not a change
+        fetched = [_voice("Kore"), _voice("Puck")]
+        use_case = _use_case({"gemini": voices}, gemini_provider=_provider(fetched))
+
+        await use_case.execute(SyncVoicesInput(providers=["gemini"]))
+
+        use_case.voice_cache_repo.upsert_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deprecates_missing_voices_in_one_call(self) -> None:
+        existing = {
+            "gemini": [
+                _voice("Kore"),
+                _voice("Gone1"),
+                _voice("Gone2"),
+                _voice("AlreadyGone", is_deprecated=True),
+            ]
+        }
+        use_case = _use_case(existing, gemini_provider=_provider([_voice("Kore")]))
+
+        result = await use_case.execute(SyncVoicesInput(providers=["gemini"]))
+
+        use_case.voice_cache_repo.mark_deprecated.assert_awaited_once()
+        (ids,) = use_case.voice_cache_repo.mark_deprecated.await_args.args
+        assert sorted(ids) == ["gemini:Gone1", "gemini:Gone2"]
+        assert result.voices_deprecated == 2
+
+    @pytest.mark.asyncio
+    async def test_language_filter_limits_deprecation_scope(self) -> None:
+        existing = {
+            "voai": [
+                _voice("tw-old", provider="voai", language="zh-TW"),
+                _voice("us-voice", provider="voai", language="en-US"),
+            ]
+        }
+        use_case = _use_case(existing, voai_provider=_provider([]))
+
+        await use_case.execute(SyncVoicesInput(providers=["voai"], language="zh-TW"))
+
+        (ids,) = use_case.voice_cache_repo.mark_deprecated.await_args.args
+        assert list(ids) == ["voai:tw-old"]
+
+
+class TestSyncVoicesProviders:
+    """Providers are fetched concurrently and fail independently."""
+
+    @pytest.mark.asyncio
+    async def test_providers_fetch_concurrently(self) -> None:
+        both_started = asyncio.Barrier(2)
+
+        async def list_voices(*_args):
+            # Deadlocks (and times out) unless both fetches are in flight
+            await both_started.wait()
+            return []
+
+        voai, gemini = MagicMock(), MagicMock()
+        voai.list_voices = list_voices
+        gemini.list_voices = list_voices
+        use_case = _use_case({}, voai_provider=voai, gemini_provider=gemini)
+
+        result = await asyncio.wait_for(
+            use_case.execute(SyncVoicesInput(providers=["voai", "gemini"])), timeout=1
+        )
+
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_does_not_block_others(self) -> None:
+        # VoAI is not configured, so its fetch raises
+        use_case = _use_case({}, gemini_provider=_provider([_voice("Kore")]))
+
+        result = await use_case.execute(SyncVoicesInput(providers=["voai", "gemini"]))
+
+        assert result.voices_synced == 1
+        assert len(result.errors) == 1
+        assert "voai" in result.errors[0]
+        upserted = use_case.voice_cache_repo.upsert_batch.await_args.args[0]
+        assert [v.voice_id for v in upserted] == ["Kore"]
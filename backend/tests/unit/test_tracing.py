@@ -0,0 +1,193 @@
+"""Unit tests for request-scoped tracing and OTLP export."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.services import tracing
+from src.application.services.metrics import track_provider_call, track_provider_stream
+from src.application.services.tracing import (
+    Trace,
+    create_detached_task,
+    parse_traceparent,
+    record_span,
+    span,
+    start_trace,
+)
+from src.infrastructure.otlp_exporter import OTLPSpanExporter, span_to_otlp
+from src.presentation.api.middleware.error_handler import RequestIdMiddleware
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class _CollectingExporter:
+    def __init__(self) -> None:
+        self.traces: list[Trace] = []
+
+    def export(self, trace: Trace) -> None:
+        self.traces.append(trace)
+
+
+@pytest.fixture
+def exporter():
+    collecting = _CollectingExporter()
+    tracing.set_span_exporter(collecting)
+    yield collecting
+    tracing.set_span_exporter(None)
+
+
+class TestSpans:
+    """Spans nest through the context and are no-ops outside a trace."""
+
+    def test_spans_nest_under_the_current_span(self, exporter) -> None:
+        with start_trace() as trace, span("outer", provider="azure") as outer:
+            with span("inner") as inner:
+                record_span("db.query", 0.002, operation="SELECT")
+
+        assert outer is not None and inner is not None
+        by_name = {s.name: s for s in trace.spans}
+        assert inner.parent_id == outer.span_id
+        assert by_name["db.query"].parent_id == inner.span_id
+        assert by_name["db.query"].duration_ms == pytest.approx(2.0)
+        assert outer.attributes == {"provider": "azure"}
+        assert exporter.traces == [trace]
+
+    def test_errors_are_recorded(self) -> None:
+        with start_trace() as trace:
+            with pytest.raises(RuntimeError), span("failing"):
+                raise RuntimeError("boom")
+
+        assert trace.spans[0].error == "RuntimeError"
+
+    def test_no_trace_is_a_noop(self) -> None:
+        with span("orphan") as s:
+            record_span("db.query", 0.001)
+
+        assert s is None
+        assert tracing.current_trace() is None
+
+    def test_span_count_is_bounded(self) -> None:
+        with start_trace() as trace:
+            for _ in range(tracing.MAX_SPANS_PER_TRACE + 5):
+                record_span("db.query", 0.0)
+
+        assert len(trace.spans) == tracing.MAX_SPANS_PER_TRACE
+        assert trace.dropped_spans == 5
+
+    async def test_provider_helpers_add_spans(self) -> None:
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        with start_trace() as trace:
+            with track_provider_call("tts", "azure"):
+                pass
+            async for _ in track_provider_stream("llm", "openai", chunks(), "ttft"):
+                pass
+
+        assert [s.name for s in trace.spans] == ["provider.tts", "provider.llm"]
+        assert trace.spans[1].error is None
+        assert trace.spans[1].attributes["ttft_ms"] is not None
+
+    async def test_detached_tasks_leave_the_request_trace(self) -> None:
+        async def background() -> tracing.Trace | None:
+            record_span("db.query", 0.001)
+            return tracing.current_trace()
+
+        with start_trace() as trace:
+            inherited = await asyncio.create_task(background())
+            detached = await create_detached_task(background())
+
+        assert inherited is trace
+        assert detached is None
+        assert len(trace.spans) == 1
+
+
+class TestTraceparent:
+    def test_parses_valid_header(self) -> None:
+        header = f"00-{TRACE_ID}-{PARENT_ID}-01"
+
+        assert parse_traceparent(header) == (TRACE_ID, PARENT_ID)
+
+    @pytest.mark.parametrize("header", [None, "", "garbage", f"00-{'0' * 32}-{PARENT_ID}-01"])
+    def test_rejects_invalid_header(self, header) -> None:
+        assert parse_traceparent(header) is None
+
+    def test_continues_remote_trace(self) -> None:
+        with start_trace(f"00-{TRACE_ID}-{PARENT_ID}-01") as trace, span("root") as root:
+            pass
+
+        assert trace.trace_id == TRACE_ID
+        assert root is not None and root.parent_id == PARENT_ID
+
+
+def test_server_timing_sums_repeated_spans() -> None:
+    with start_trace() as trace, span("http.request") as root:
+        record_span("db.query", 0.001)
+        record_span("db.query", 0.002)
+        record_span("provider.tts", 0.1)
+
+    header = trace.server_timing(root)
+
+    assert header.startswith('db.query;dur=3.0;desc="2 calls", provider.tts;dur=100.0, total;dur=')
+
+
+async def test_middleware_sets_server_timing_header(exporter) -> None:
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/work")
+    async def work():
+        record_span("db.query", 0.004)
+        return {"ok": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/work", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+        )
+
+    assert response.headers["Server-Timing"].startswith("db.query;dur=4.0, total;dur=")
+    [trace] = exporter.traces
+    root = next(s for s in trace.spans if s.name == "http.request")
+    assert trace.trace_id == TRACE_ID
+    assert root.attributes["status_code"] == 200
+
+
+class TestOTLPExport:
+    def test_span_encoding(self) -> None:
+        with start_trace(f"00-{TRACE_ID}-{PARENT_ID}-01") as trace, span("http.request"):
+            with pytest.raises(ValueError), span("storage.upload", backend="s3", size=3):
+                raise ValueError
+
+        child, root = trace.spans
+        encoded_root = span_to_otlp(root, trace.remote_parent_id)
+        encoded_child = span_to_otlp(child, trace.remote_parent_id)
+
+        assert encoded_root["kind"] == 2
+        assert encoded_root["parentSpanId"] == PARENT_ID
+        assert encoded_child["kind"] == 1
+        assert encoded_child["status"] == {"code": 2, "message": "ValueError"}
+        assert {"key": "size", "value": {"intValue": "3"}} in encoded_child["attributes"]
+        assert int(encoded_child["endTimeUnixNano"]) >= int(encoded_child["startTimeUnixNano"])
+
+    async def test_flush_posts_batches(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        exporter = OTLPSpanExporter("http://collector:4318/", "voicelab", max_batch_size=2)
+        exporter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with start_trace() as trace:
+            for _ in range(3):
+                record_span("db.query", 0.001)
+        exporter.export(trace)
+
+        await exporter.close()
+
+        assert [str(r.url) for r in requests] == ["http://collector:4318/v1/traces"] * 2
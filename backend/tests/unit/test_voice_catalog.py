@@ -0,0 +1,192 @@
+"""Unit tests for the in-memory voice catalog."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services import voice_catalog as voice_catalog_module
+from src.application.services.voice_catalog import VoiceCatalog
+from src.application.use_cases.list_voices import ListVoicesUseCase, VoiceFilter
+from src.domain.entities.voice import AgeGroup, Gender, VoiceProfile
+from src.domain.entities.voice_customization import VoiceCustomization
+
+
+def _voice(
+    provider: str,
+    voice_id: str,
+    language: str,
+    gender: Gender | None = None,
+    age_group: AgeGroup | None = None,
+    styles: tuple[str, ...] = (),
+    is_deprecated: bool = False,
+) -> VoiceProfile:
+    return VoiceProfile(
+        id=f"{provider}:{voice_id}",
+        provider=provider,
+        voice_id=voice_id,
+        display_name=voice_id,
+        language=language,
+        gender=gender,
+        age_group=age_group,
+        styles=styles,
+        is_deprecated=is_deprecated,
+    )
+
+
+VOICES = [
+    _voice("azure", "zh-TW-HsiaoChen", "zh-TW", Gender.FEMALE, AgeGroup.ADULT, ("cheerful",)),
+    _voice("azure", "zh-TW-YunJhe", "zh-TW", Gender.MALE, AgeGroup.ADULT, ("news",)),
+    _voice("azure", "zh-CN-Xiaoxiao", "zh-CN", Gender.FEMALE, AgeGroup.YOUNG, ("Cheerful",)),
+    _voice("azure", "en-US-Old", "en-US", Gender.MALE, is_deprecated=True),
+    _voice("gemini", "Kore", "multilingual", Gender.FEMALE),
+    _voice("elevenlabs", "rachel", "en-US", Gender.FEMALE, AgeGroup.YOUNG),
+]
+
+
+@pytest.fixture
+def catalog() -> VoiceCatalog:
+    catalog = VoiceCatalog()
+    catalog.load(VOICES)
+    return catalog
+
+
+class TestVoiceCatalogQuery:
+    """Queries are answered from prebuilt indexes."""
+
+    def test_id_lookups(self, catalog: VoiceCatalog) -> None:
+        assert catalog.get("gemini:Kore") is VOICES[4]
+        assert catalog.get_voice("azure", "zh-TW-YunJhe") is VOICES[1]
+        assert catalog.get_voice("gemini", "zh-TW-YunJhe") is None
+
+    def test_excludes_deprecated_by_default(self, catalog: VoiceCatalog) -> None:
+        assert VOICES[3] not in catalog.query(provider="azure")
+        assert VOICES[3] in catalog.query(provider="azure", include_deprecated=True)
+
+    def test_language_prefix_includes_multilingual(self, catalog: VoiceCatalog) -> None:
+        ids = {v.id for v in catalog.query(language="zh")}
+        assert ids == {
+            "azure:zh-TW-HsiaoChen",
+            "azure:zh-TW-YunJhe",
+            "azure:zh-CN-Xiaoxiao",
+            "gemini:Kore",
+        }
+        assert {v.id for v in catalog.query(language="zh-TW", provider="azure")} == {
+            "azure:zh-TW-HsiaoChen",
+            "azure:zh-TW-YunJhe",
+        }
+
+    def test_combined_filters(self, catalog: VoiceCatalog) -> None:
+        result = catalog.query(gender="female", age_group=AgeGroup.YOUNG, language="zh")
+        assert result == [VOICES[2]]
+
+        assert catalog.query(style="CHEERFUL", provider="azure") == [VOICES[2], VOICES[0]]
+
+    def test_results_ordered_by_provider_and_name(self, catalog: VoiceCatalog) -> None:
+        result = catalog.query()
+        assert result == sorted(result, key=lambda v: (v.provider, v.display_name))
+
+    def test_facets_count_active_voices(self, catalog: VoiceCatalog) -> None:
+        facets = catalog.facets()
+        assert facets.providers == {"azure": 3, "gemini": 1, "elevenlabs": 1}
+        assert facets.genders == {"female": 4, "male": 1}
+        assert facets.styles == {"cheerful": 2, "news": 1}
+
+    def test_set_sample_audio_url(self, catalog: VoiceCatalog) -> None:
+        catalog.set_sample_audio_url("gemini:Kore", "https://cdn/kore.mp3")
+
+        assert catalog.get("gemini:Kore").sample_audio_url == "https://cdn/kore.mp3"
+        assert len(catalog) == len(VOICES)
+
+
+class TestListVoicesFromCatalog:
+    """Voices served from the catalog keep their cache ID as ``id``."""
+
+    @pytest.mark.asyncio
+    async def test_ids_are_voice_cache_ids(self, catalog: VoiceCatalog) -> None:
+        use_case = ListVoicesUseCase({"azure": MagicMock(), "gemini": MagicMock()}, catalog)
+
+        voices = await use_case.execute(VoiceFilter(provider="azure", language="zh-TW"))
+        voice = await use_case.get_voice_by_id("azure", "azure:zh-TW-YunJhe")
+
+        assert {v.id for v in voices} == {"azure:zh-TW-HsiaoChen", "azure:zh-TW-YunJhe"}
+        assert voice is not None and voice.id == "azure:zh-TW-YunJhe"
+        assert await use_case.get_voice_by_id("gemini", "azure:zh-TW-YunJhe") is None
+
+
+class TestVoiceCatalogLoading:
+    """The catalog pages through voice_cache once."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_pages_once(self, monkeypatch) -> None:
+        monkeypatch.setattr(voice_catalog_module, "LOAD_PAGE_SIZE", 4)
+        repo = AsyncMock()
+        repo.list_all = AsyncMock(side_effect=[VOICES[:4], VOICES[4:]])
+        catalog = VoiceCatalog()
+
+        await catalog.ensure_loaded(repo)
+        await catalog.ensure_loaded(repo)
+
+        assert catalog.is_loaded
+        assert len(catalog) == len(VOICES)
+        assert repo.list_all.await_count == 2
+        assert repo.list_all.await_args.kwargs == {
+            "include_deprecated": True,
+            "limit": 4,
+            "offset": 4,
+        }
+
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_reloads_expired_snapshot(self, monkeypatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr(voice_catalog_module.time, "monotonic", lambda: now[0])
+        repo = AsyncMock()
+        repo.list_all = AsyncMock(side_effect=[VOICES[:1], VOICES])
+        catalog = VoiceCatalog(ttl_s=300)
+
+        await catalog.ensure_loaded(repo)
+        now[0] += 299
+        await catalog.ensure_loaded(repo)
+        assert len(catalog) == 1
+
+        now[0] += 2
+        await catalog.ensure_loaded(repo)
+        assert len(catalog) == len(VOICES)
+        assert repo.list_all.await_count == 2
+
+
+class TestVoiceCatalogCustomizations:
+    """Customizations are cached with the catalog and refreshed by TTL."""
+
+    @pytest.mark.asyncio
+    async def test_customizations_cached_until_expired(self, monkeypatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr(voice_catalog_module.time, "monotonic", lambda: now[0])
+        repo = AsyncMock()
+        repo.list_all = AsyncMock(return_value=[VoiceCustomization("gemini:Kore", "Kore!")])
+        catalog = VoiceCatalog(customization_ttl_s=60)
+
+        first = await catalog.customizations(repo)
+        await catalog.customizations(repo)
+        assert repo.list_all.await_count == 1
+        assert first["gemini:Kore"].custom_name == "Kore!"
+
+        now[0] += 61
+        await catalog.customizations(repo)
+        assert repo.list_all.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_local_edits_apply_without_reload(self) -> None:
+        repo = AsyncMock()
+        repo.list_all = AsyncMock(return_value=[VoiceCustomization("gemini:Kore", "Kore!")])
+        catalog = VoiceCatalog()
+        await catalog.customizations(repo)
+
+        catalog.set_customization(VoiceCustomization("azure:zh-TW-YunJhe", is_favorite=True))
+        catalog.remove_customization("gemini:Kore")
+
+        assert list(await catalog.customizations(repo)) == ["azure:zh-TW-YunJhe"]
+        assert repo.list_all.await_count == 1
+
+        catalog.invalidate_customizations()
+        await catalog.customizations(repo)
+        assert repo.list_all.await_count == 2
@@ -8,9 +8,10 @@ T041: Unit tests for hidden toggle logic (auto-unfavorite)
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.application.use_cases.bulk_update_voice_customization import (
     BulkUpdateInput,
@@ -25,6 +26,9 @@ from src.application.use_cases.update_voice_customization import (
     UpdateVoiceCustomizationUseCase,
 )
 from src.domain.entities.voice_customization import VoiceCustomization
+from src.infrastructure.persistence.voice_customization_repository_impl import (
+    VoiceCustomizationRepositoryImpl,
+)
 
 # =============================================================================
 # Domain Entity Tests
@@ -523,3 +527,32 @@ class TestBulkUpdateVoiceCustomizationUseCase:
         entity = call_args[0]
         assert entity.is_hidden is True
         assert entity.is_favorite is False  # Auto-unfavorited
+
+
+class TestVoiceCustomizationRepositoryBulkUpdate:
+    """bulk_update writes every valid item in one statement."""
+
+    @pytest.mark.asyncio
+    async def test_single_upsert_reports_unknown_and_invalid(self):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["gemini:Puck"]
+        session.execute = AsyncMock(return_value=result)
+        repo = VoiceCustomizationRepositoryImpl(session)
+
+        updated, failures = await repo.bulk_update(
+            [
+                VoiceCustomization(voice_cache_id="gemini:Puck", custom_name="first"),
+                VoiceCustomization(voice_cache_id="gemini:Puck", custom_name="second"),
+                VoiceCustomization(voice_cache_id="gemini:Missing", is_favorite=True),
+                VoiceCustomization(voice_cache_id="gemini:Kore", custom_name="x" * 51),
+            ]
+        )
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "unnest" in sql
+        assert "ON CONFLICT (voice_cache_id) DO UPDATE" in sql
+        assert updated == 1
+        assert [vid for vid, _ in failures] == ["gemini:Kore", "gemini:Missing"]
+        assert failures[1][1] == "Voice not found"
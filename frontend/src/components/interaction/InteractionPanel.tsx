@@ -30,6 +30,7 @@ import { useWebSocket } from '@/hooks/useWebSocket'
 import { useMicrophone } from '@/hooks/useMicrophone'
 import { useAudioPlayback } from '@/hooks/useAudioPlayback'
 import { buildWebSocketUrl } from '@/services/interactionApi'
+import { encodeAudioFrame } from '@/lib/audioFrames'
 import type { ConnectionStatus, InteractionState, WSMessage } from '@/types/interaction'
 
 interface InteractionPanelProps {
@@ -343,27 +344,20 @@ export function InteractionPanel({ userId, wsUrl, className = '' }: InteractionP
           appendAIResponse((data.delta as string) || (data.text as string) || '')
           break
 
-        case 'audio':
-          // Decode base64 audio and queue for playback
-          if (data.audio) {
+        case 'audio': {
+          // Raw PCM16 from a binary audio frame; queue for playback
+          const audio = data.audio as ArrayBuffer
+          if (audio && audio.byteLength > 0) {
             // Record first audio timing
             if (!firstAudioReceivedRef.current) {
               firstAudioReceivedRef.current = true
               setTurnTiming((prev) => ({ ...prev, firstAudioAt: Date.now() }))
               console.log('[Turn] First audio received')
             }
-            try {
-              const binaryString = atob(data.audio as string)
-              const bytes = new Uint8Array(binaryString.length)
-              for (let i = 0; i < binaryString.length; i++) {
-                bytes[i] = binaryString.charCodeAt(i)
-              }
-              queueAudioChunk(bytes.buffer, 'pcm16')
-            } catch (e) {
-              console.error('Failed to decode audio:', e)
-            }
+            queueAudioChunk(audio, 'pcm16')
           }
           break
+        }
 
         case 'response_ended': {
           // Record response end timing
@@ -492,19 +486,8 @@ export function InteractionPanel({ userId, wsUrl, className = '' }: InteractionP
         // Convert Float32 to PCM16
         const pcm16Buffer = float32ToPCM16(chunk)
 
-        // Binary format: [4 bytes sample_rate (uint32 LE)] + [PCM16 audio data]
-        // This is more efficient than Base64 JSON (~33% smaller, no encode/decode overhead)
-        const headerSize = 4
-        const binaryMessage = new ArrayBuffer(headerSize + pcm16Buffer.byteLength)
-        const view = new DataView(binaryMessage)
-
-        // Write sample rate as uint32 little-endian
-        view.setUint32(0, actualSampleRate, true)
-
-        // Copy PCM16 audio data after header
-        new Uint8Array(binaryMessage, headerSize).set(new Uint8Array(pcm16Buffer))
-
-        sendBinary(binaryMessage)
+        // Binary audio frame: typed header + PCM16 (no base64 encode/decode overhead)
+        sendBinary(encodeAudioFrame(pcm16Buffer, actualSampleRate))
       }
     },
     onVolumeChange: (vol: number) => {
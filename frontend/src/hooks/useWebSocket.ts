@@ -8,6 +8,7 @@
 
 import { useCallback, useEffect, useRef, useState } from 'react'
 
+import { decodeAudioFrame } from '@/lib/audioFrames'
 import type { ConnectionStatus, WSMessage, WSMessageType } from '@/types/interaction'
 
 // =============================================================================
@@ -153,6 +154,8 @@ export function useWebSocket(options: UseWebSocketOptions): UseWebSocketReturn {
 
     try {
       const ws = new WebSocket(url)
+      // Receive binary audio frames as ArrayBuffer (no async Blob conversion)
+      ws.binaryType = 'arraybuffer'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -185,13 +188,22 @@ export function useWebSocket(options: UseWebSocketOptions): UseWebSocketReturn {
 
       ws.onmessage = (event) => {
         try {
-          // Handle binary messages
-          if (event.data instanceof Blob) {
-            event.data.arrayBuffer().then((buffer) => {
-              onMessage?.({
-                type: 'audio',
-                data: { audio: buffer, format: 'pcm16' },
-              })
+          // Handle binary audio frames
+          if (event.data instanceof ArrayBuffer) {
+            const frame = decodeAudioFrame(event.data)
+            if (!frame) {
+              console.warn('Dropping unrecognized binary WebSocket frame')
+              return
+            }
+            onMessage?.({
+              type: 'audio',
+              data: {
+                audio: frame.audio,
+                format: 'pcm16',
+                sample_rate: frame.sampleRate,
+                is_first: frame.isFirst,
+                is_final: frame.isFinal,
+              },
             })
             return
           }
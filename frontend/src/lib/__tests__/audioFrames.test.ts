@@ -0,0 +1,40 @@
+/**
+ * Audio Frame Tests
+ *
+ * Tests for the binary WebSocket audio framing shared with the backend.
+ */
+
+import { describe, it, expect } from 'vitest'
+
+import { AUDIO_FRAME_HEADER_SIZE, decodeAudioFrame, encodeAudioFrame } from '../audioFrames'
+
+describe('audioFrames', () => {
+  it('round-trips PCM16 audio with sample rate and flags', () => {
+    const pcm = new Int16Array([1, -2, 3, -4]).buffer
+
+    const frame = encodeAudioFrame(pcm, 24000, { isFirst: true })
+    const decoded = decodeAudioFrame(frame)
+
+    expect(frame.byteLength).toBe(AUDIO_FRAME_HEADER_SIZE + pcm.byteLength)
+    expect(decoded).not.toBeNull()
+    expect(decoded?.sampleRate).toBe(24000)
+    expect(decoded?.isFirst).toBe(true)
+    expect(decoded?.isFinal).toBe(false)
+    expect(Array.from(new Int16Array(decoded!.audio))).toEqual([1, -2, 3, -4])
+  })
+
+  it('encodes an empty final frame', () => {
+    const decoded = decodeAudioFrame(encodeAudioFrame(new ArrayBuffer(0), 16000, { isFinal: true }))
+
+    expect(decoded?.isFinal).toBe(true)
+    expect(decoded?.audio.byteLength).toBe(0)
+  })
+
+  it('rejects truncated and unknown frames', () => {
+    expect(decodeAudioFrame(new ArrayBuffer(4))).toBeNull()
+
+    const unknown = encodeAudioFrame(new ArrayBuffer(2), 16000)
+    new DataView(unknown).setUint8(0, 99)
+    expect(decodeAudioFrame(unknown)).toBeNull()
+  })
+})
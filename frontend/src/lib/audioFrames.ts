@@ -0,0 +1,68 @@
+/**
+ * Binary WebSocket audio framing
+ * Feature: 004-interaction-module
+ *
+ * Audio is exchanged with the interaction WebSocket as binary frames in both
+ * directions; JSON is reserved for control events. Mirrors
+ * backend/src/infrastructure/websocket/audio_frames.py.
+ *
+ * Header (8 bytes, little-endian), followed by PCM16 samples:
+ *   offset 0  uint8   frame type (1 = audio)
+ *   offset 1  uint8   flags (1 = first chunk, 2 = final chunk)
+ *   offset 2  uint16  reserved (0)
+ *   offset 4  uint32  sample rate in Hz
+ */
+
+export const AUDIO_FRAME_HEADER_SIZE = 8
+
+const FRAME_TYPE_AUDIO = 1
+const FLAG_FIRST = 1
+const FLAG_FINAL = 2
+
+export interface AudioFrame {
+  /** Raw PCM16 payload */
+  audio: ArrayBuffer
+  sampleRate: number
+  isFirst: boolean
+  isFinal: boolean
+}
+
+/**
+ * Encode PCM16 audio into a binary audio frame.
+ */
+export function encodeAudioFrame(
+  pcm16: ArrayBuffer,
+  sampleRate: number,
+  options: { isFirst?: boolean; isFinal?: boolean } = {}
+): ArrayBuffer {
+  const frame = new ArrayBuffer(AUDIO_FRAME_HEADER_SIZE + pcm16.byteLength)
+  const view = new DataView(frame)
+  let flags = 0
+  if (options.isFirst) flags |= FLAG_FIRST
+  if (options.isFinal) flags |= FLAG_FINAL
+
+  view.setUint8(0, FRAME_TYPE_AUDIO)
+  view.setUint8(1, flags)
+  view.setUint16(2, 0, true)
+  view.setUint32(4, sampleRate, true)
+  new Uint8Array(frame, AUDIO_FRAME_HEADER_SIZE).set(new Uint8Array(pcm16))
+  return frame
+}
+
+/**
+ * Decode a binary audio frame. Returns null for malformed or non-audio frames.
+ */
+export function decodeAudioFrame(frame: ArrayBuffer): AudioFrame | null {
+  if (frame.byteLength < AUDIO_FRAME_HEADER_SIZE) return null
+
+  const view = new DataView(frame)
+  if (view.getUint8(0) !== FRAME_TYPE_AUDIO) return null
+
+  const flags = view.getUint8(1)
+  return {
+    audio: frame.slice(AUDIO_FRAME_HEADER_SIZE),
+    sampleRate: view.getUint32(4, true),
+    isFirst: (flags & FLAG_FIRST) !== 0,
+    isFinal: (flags & FLAG_FINAL) !== 0,
+  }
+}
@@ -27,6 +27,7 @@ import { useCueList } from '@/hooks/useCueList'
 import { useWebSocket } from '@/hooks/useWebSocket'
 import { useMicrophone } from '@/hooks/useMicrophone'
 import { buildWebSocketUrl } from '@/services/interactionApi'
+import { encodeAudioFrame } from '@/lib/audioFrames'
 import type { PromptTemplate } from '@/types/magic-dj'
 
 // =============================================================================
@@ -153,19 +154,11 @@ export function MagicDJPage() {
       if (message.type === 'response_started') {
         stopAIWaiting()
       } else if (message.type === 'audio') {
-        // Decode base64 PCM16 audio from Gemini and queue for playback
+        // Raw PCM16 from a binary audio frame; queue for playback
         const data = message.data as Record<string, unknown>
-        if (data.audio) {
-          try {
-            const binaryString = atob(data.audio as string)
-            const bytes = new Uint8Array(binaryString.length)
-            for (let i = 0; i < binaryString.length; i++) {
-              bytes[i] = binaryString.charCodeAt(i)
-            }
-            queueAudioChunk(bytes.buffer, 'pcm16')
-          } catch (e) {
-            console.error('Failed to decode AI audio:', e)
-          }
+        const audio = data.audio as ArrayBuffer
+        if (audio && audio.byteLength > 0) {
+          queueAudioChunk(audio, 'pcm16')
         }
       } else if (message.type === 'response_ended') {
         // Response complete
@@ -212,14 +205,8 @@ export function MagicDJPage() {
       // Convert Float32 to PCM16
       const pcm16Buffer = float32ToPCM16(chunk)
 
-      // Binary format: [4 bytes sample_rate (uint32 LE)] + [PCM16 audio data]
-      const headerSize = 4
-      const binaryMessage = new ArrayBuffer(headerSize + pcm16Buffer.byteLength)
-      const view = new DataView(binaryMessage)
-      view.setUint32(0, actualSampleRate, true)
-      new Uint8Array(binaryMessage, headerSize).set(new Uint8Array(pcm16Buffer))
-
-      sendBinary(binaryMessage)
+      // Binary audio frame: typed header + PCM16
+      sendBinary(encodeAudioFrame(pcm16Buffer, actualSampleRate))
     },
     onVolumeChange: (vol: number) => {
       setMicVolume(vol)
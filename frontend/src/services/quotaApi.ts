@@ -22,6 +22,7 @@ export interface ProviderQuotaStatus {
   remaining_characters: number | null
   usage_percent: number | null
   tier: string | null
+  quota_fetched_at?: string | null
   // Tracked usage
   minute_requests: number
   hour_requests: number
@@ -56,6 +57,7 @@ export interface QuotaDashboardResponse {
   providers: ProviderQuotaStatus[]
   app_rate_limits: AppRateLimitStatus
   fetched_at: string
+  partial?: boolean
 }
 
 export const quotaApi = {
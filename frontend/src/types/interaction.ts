@@ -179,8 +179,9 @@ export interface TextDeltaMessageData {
 }
 
 export interface AudioMessageData {
-  audio: string // base64 encoded
+  audio: ArrayBuffer // raw PCM16 from a binary audio frame
   format: 'pcm16' | 'mp3'
+  sample_rate?: number
   is_first?: boolean
   is_final?: boolean
 }
@@ -237,6 +238,8 @@ export interface SessionListResponse {
   total: number
   page: number
   page_size: number
+  /** Cursor for the next page (pass as `cursor` to skip OFFSET paging) */
+  next_cursor?: string | null
 }
 
 // =============================================================================
@@ -109,6 +109,8 @@ export interface TranscriptionHistoryPage {
   page: number
   page_size: number
   total_pages: number
+  /** Cursor for the next page (pass as `cursor` to skip OFFSET paging) */
+  next_cursor?: string | null
 }
 
 export interface TranscriptionDetail extends TranscriptionResponse {